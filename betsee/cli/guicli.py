@@ -93,12 +93,20 @@ Concrete subclasses defining this application's command line interface (CLI).
 # * Never raise exceptions on importation (e.g., due to module-level logic).
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
+from betse.exceptions import BetseCLIArgException
+from betse.science.enum.enumphase import SimPhaseKind
 from betse.util.app.meta import appmetaone
 from betse.util.cli.cliabc import CLIABC
 from betse.util.cli.cliopt import CLIOptionArgEnum, CLIOptionArgStr
 from betse.util.io.log import logs
-from betse.util.type.types import type_check, SequenceTypes
+from betse.util.type import enums
+from betse.util.type.types import type_check, EnumType, SequenceTypes
+from betsee.gui.simtab.run.guisimrunenum import SweepSampling
+from betsee.gui.simtab.run.work.guisimrunworkenum import SimmerPhaseSubkind
 from betsee.lib.pyside2.cache.guipsdcache import CachePolicy
+from betsee.util.app import guiappstartup
+from betsee.util.io.log import guilogconf
+import os
 
 # ....................{ SUBCLASS                          }....................
 class BetseeCLI(CLIABC):
@@ -107,13 +115,51 @@ class BetseeCLI(CLIABC):
 
     Attributes
     ----------
+    _batch_conf_filenames : SequenceOrNoneTypes
+        Sequence of the absolute or relative filenames of all simulation
+        configuration files to be headlessly run in batch *without* displaying
+        this application's GUI if any *or* ``None`` otherwise (i.e., if this
+        application's GUI is to be displayed as usual). This sequence is
+        parsed from command-line options passed by the current user.
+    _batch_phase_kinds : SequenceOrNoneTypes
+        Sequence of all :class:`SimPhaseKind` members to be run in batch if
+        a headless batch run or sweep was requested *or* ``None`` otherwise.
+    _batch_phase_subkinds : SequenceOrNoneTypes
+        Sequence of all :class:`SimmerPhaseSubkind` members to be run in batch
+        if a headless batch run or sweep was requested *or* ``None``
+        otherwise.
+    _batch_worker_count_max : int
+        Maximum number of simulator workers concurrently run in batch, where 0
+        implies the number of logical processors.
     _cache_policy : CachePolicy
         Type of :mod:`PySide2`-based submodule caching to be performed.
+    _profile_startup_filename : StrOrNoneTypes
+        Absolute or relative filename of the startup profile report to be
+        written on this application's startup if any *or* ``None`` otherwise.
+        This filename is parsed from command-line options passed by the
+        current user.
     _sim_conf_filename : StrOrNoneTypes
         Absolute or relative filename of the initial YAML-formatted simulation
         configuration file to be initially opened by this application's GUI if
         any *or* ``None`` otherwise. This filename is parsed from command-line
         options passed by the current user.
+    _sweep_conf_filename : StrOrNoneTypes
+        Absolute or relative filename of the base simulation configuration
+        file to be swept headlessly *without* displaying this application's
+        GUI if any *or* ``None`` otherwise. This filename is parsed from
+        command-line options passed by the current user.
+    _sweep_dirname : StrOrNoneTypes
+        Absolute or relative dirname of the directory to which the sweep
+        derives simulation configurations if any *or* ``None`` otherwise, in
+        which case a default directory is defaulted to.
+    _sweep_param_specs : SequenceOrNoneTypes
+        Sequence of the specifications of all parameters to be swept if
+        :attr:`_sweep_conf_filename` is non-``None`` *or* ``None`` otherwise.
+    _sweep_sample_count : int
+        Number of parameter tuples to be sampled under Latin hypercube
+        sampling.
+    _sweep_sampling : EnumMemberType
+        Type of sampling expanding swept parameters into parameter tuples.
     '''
 
     # ..................{ INITIALIZERS                      }..................
@@ -123,8 +169,18 @@ class BetseeCLI(CLIABC):
         super().__init__()
 
         # Nullify all instance variables for safety.
+        self._batch_conf_filenames = None
+        self._batch_phase_kinds = None
+        self._batch_phase_subkinds = None
+        self._batch_worker_count_max = 0
         self._cache_policy = None
+        self._profile_startup_filename = None
         self._sim_conf_filename = None
+        self._sweep_conf_filename = None
+        self._sweep_dirname = None
+        self._sweep_param_specs = None
+        self._sweep_sample_count = 0
+        self._sweep_sampling = None
 
     # ..................{ SUPERCLASS ~ property             }..................
     @property
@@ -138,7 +194,13 @@ seed, initialize, and then simulate such a simulation in the current directory:
 ;    betse seed sim_config.yaml
 ;    betse init sim_config.yaml
 ;    betse  sim sim_config.yaml
-'''
+
+Alternately, to headlessly run such simulations through the same simulator
+workers run by this GUI *without* displaying this GUI (e.g., on cluster nodes
+lacking a display server), printing progress as one JSON object per line:
+
+;    betsee --batch-conf-files=a/sim_config.yaml{pathsep}b/sim_config.yaml
+'''.format(pathsep=os.pathsep)
 
     # ..................{ SUPERCLASS ~ property : options   }..................
     @property
@@ -167,6 +229,124 @@ seed, initialize, and then simulate such a simulation in the current directory:
                 var_name='sim_conf_filename',
                 default_value=None,
             ),
+
+            CLIOptionArgStr(
+                long_name='--profile-startup',
+                synopsis=(
+                    'file to write a startup profile report to, '
+                    'timing each startup phase:'
+                    '\n;* if suffixed by ".{}", in flame graph '
+                    '"folded stack" format'
+                    '\n;* else, in JSON format'.format(
+                        guiappstartup.REPORT_FOLDED_FILETYPE)
+                ),
+                var_name='profile_startup_filename',
+                default_value=None,
+            ),
+
+            CLIOptionArgStr(
+                long_name='--batch-conf-files',
+                synopsis=(
+                    'simulation configuration files to run headlessly '
+                    '(i.e., without displaying this GUI), delimited by "{}"'
+                    .format(os.pathsep)
+                ),
+                var_name='batch_conf_filenames',
+                default_value=None,
+            ),
+
+            CLIOptionArgStr(
+                long_name='--batch-phases',
+                synopsis=(
+                    'comma-delimited simulation phases to run headlessly '
+                    '(defaults to "{default}")'
+                ),
+                var_name='batch_phase_names',
+                default_value=','.join(
+                    enums.get_member_names_lowercase(SimPhaseKind)),
+            ),
+
+            CLIOptionArgStr(
+                long_name='--batch-subkinds',
+                synopsis=(
+                    'comma-delimited types of work to perform for each '
+                    'simulation phase run headlessly (defaults to "{default}")'
+                ),
+                var_name='batch_phase_subkind_names',
+                default_value='modelling,exporting',
+            ),
+
+            CLIOptionArgStr(
+                long_name='--batch-jobs',
+                synopsis=(
+                    'maximum number of simulation phases to run headlessly '
+                    'in parallel (defaults to the number of processors)'
+                ),
+                var_name='batch_worker_count_max',
+                default_value='0',
+            ),
+
+            CLIOptionArgStr(
+                long_name='--sweep-conf-file',
+                synopsis=(
+                    'simulation configuration file to sweep headlessly '
+                    '(i.e., without displaying this GUI), deriving one '
+                    'configuration per parameter tuple and running these '
+                    'configurations as with "--batch-conf-files"'
+                ),
+                var_name='sweep_conf_filename',
+                default_value=None,
+            ),
+
+            CLIOptionArgStr(
+                long_name='--sweep-params',
+                synopsis=(
+                    'semicolon-delimited parameters to sweep, each of the '
+                    'form:'
+                    '\n;* "alias=value1,value2,...", sweeping these values'
+                    '\n;* "alias=min:max:count", sweeping this many evenly '
+                    'spaced values'
+                    '\n;* "alias=min:max", sweeping this range (Latin '
+                    'hypercube sampling only)'
+                    '\n;where "alias" is the name of a simulation '
+                    'configuration attribute (e.g., "sim_time_total")'
+                ),
+                var_name='sweep_param_specs',
+                default_value=None,
+            ),
+
+            CLIOptionArgEnum(
+                long_name='--sweep-sampling',
+                synopsis=(
+                    'type of sweep sampling (defaults to "{default}"):'
+                    '\n;* "cartesian", sweeping all parameter combinations'
+                    '\n;* "latin_hypercube", sweeping "--sweep-samples" '
+                    'stratified parameter combinations'
+                ),
+                enum_type=SweepSampling,
+                enum_default=SweepSampling.CARTESIAN,
+            ),
+
+            CLIOptionArgStr(
+                long_name='--sweep-samples',
+                synopsis=(
+                    'number of parameter combinations to sweep under Latin '
+                    'hypercube sampling'
+                ),
+                var_name='sweep_sample_count',
+                default_value='0',
+            ),
+
+            CLIOptionArgStr(
+                long_name='--sweep-dir',
+                synopsis=(
+                    'directory to derive swept simulation configurations '
+                    'into (defaults to the "sweep" subdirectory of the '
+                    'directory containing "--sweep-conf-file")'
+                ),
+                var_name='sweep_dirname',
+                default_value=None,
+            ),
         ]
 
 
@@ -182,6 +362,142 @@ seed, initialize, and then simulate such a simulation in the current directory:
         # Initial simulation configuration file parsed from the passed options.
         self._sim_conf_filename = self._args.sim_conf_filename
 
+        # Startup profile report file parsed from the passed options.
+        self._profile_startup_filename = self._args.profile_startup_filename
+
+        # If the caller requested startup profiling, enable this profiler
+        # *BEFORE* initializing all mandatory runtime dependencies below.
+        if self._profile_startup_filename is not None:
+            guiappstartup.init(report_filename=self._profile_startup_filename)
+
+        # If the caller requested both a headless batch run *AND* sweep,
+        # raise an exception. Since both run in batch, these are exclusive.
+        if (self._args.batch_conf_filenames is not None and
+            self._args.sweep_conf_filename is not None):
+            raise BetseCLIArgException(
+                'Options "--batch-conf-files" and "--sweep-conf-file" '
+                'mutually exclusive.')
+
+        # If the caller requested a headless batch run or sweep, parse all
+        # options configuring this run.
+        if self._args.batch_conf_filenames is not None:
+            self._parse_options_top_batch_confs()
+            self._parse_options_top_batch()
+        elif self._args.sweep_conf_filename is not None:
+            self._parse_options_top_sweep()
+            self._parse_options_top_batch()
+
+
+    def _parse_options_top_batch_confs(self) -> None:
+        '''
+        Parse the top-level ``--batch-conf-files`` option.
+
+        Raises
+        ----------
+        BetseCLIArgException
+            If this option specifies no files.
+        '''
+
+        # Sequence of all simulation configuration filenames to be run.
+        self._batch_conf_filenames = [
+            conf_filename
+            for conf_filename in self._args.batch_conf_filenames.split(
+                os.pathsep)
+            if conf_filename
+        ]
+
+        # If no such filenames were passed, raise an exception.
+        if not self._batch_conf_filenames:
+            raise BetseCLIArgException(
+                'Option "--batch-conf-files" specifies no files.')
+
+
+    def _parse_options_top_sweep(self) -> None:
+        '''
+        Parse all top-level options configuring a headless sweep.
+
+        Raises
+        ----------
+        BetseCLIArgException
+            If any such option is invalid.
+        '''
+
+        # Base simulation configuration file and sweep directory.
+        self._sweep_conf_filename = self._args.sweep_conf_filename
+        self._sweep_dirname = self._args.sweep_dirname
+
+        # Sequence of all swept parameter specifications, parsed later into
+        # swept parameters *AFTER* initializing all mandatory dependencies.
+        self._sweep_param_specs = [
+            param_spec.strip()
+            for param_spec in (self._args.sweep_param_specs or '').split(';')
+            if param_spec.strip()
+        ]
+
+        # If no such specifications were passed, raise an exception.
+        if not self._sweep_param_specs:
+            raise BetseCLIArgException(
+                'Option "--sweep-conf-file" requires option "--sweep-params".')
+
+        # Sweep sampling, converted from a lowercase string into an
+        # enumeration member. See the _parse_options_top() method.
+        self._sweep_sampling = SweepSampling[
+            self._args.sweep_sampling.upper()]
+
+        # Number of Latin hypercube samples.
+        try:
+            self._sweep_sample_count = int(self._args.sweep_sample_count)
+        except ValueError:
+            self._sweep_sample_count = -1
+        if self._sweep_sample_count < 0:
+            raise BetseCLIArgException(
+                'Option "--sweep-samples" value "{}" not a non-negative '
+                'integer.'.format(self._args.sweep_sample_count))
+
+
+    def _parse_options_top_batch(self) -> None:
+        '''
+        Parse all top-level options configuring a headless batch run or sweep.
+
+        Raises
+        ----------
+        BetseCLIArgException
+            If any such option is invalid.
+        '''
+
+        # Sequences of all phase kinds and subkinds to be run, converted from
+        # comma-delimited lowercase strings into enumeration members.
+        self._batch_phase_kinds = _parse_enum_members(
+            enum_type=SimPhaseKind,
+            enum_names=self._args.batch_phase_names,
+            option_name='--batch-phases',
+        )
+        self._batch_phase_subkinds = _parse_enum_members(
+            enum_type=SimmerPhaseSubkind,
+            enum_names=self._args.batch_phase_subkind_names,
+            option_name='--batch-subkinds',
+        )
+
+        # Maximum number of concurrently running workers.
+        try:
+            self._batch_worker_count_max = int(
+                self._args.batch_worker_count_max)
+        except ValueError:
+            self._batch_worker_count_max = -1
+        if self._batch_worker_count_max < 0:
+            raise BetseCLIArgException(
+                'Option "--batch-jobs" value "{}" not a non-negative '
+                'integer.'.format(self._args.batch_worker_count_max))
+
+        # Render all Qt widgets to an offscreen buffer rather than a display
+        # server *BEFORE* the "QApplication" singleton is instantiated, which
+        # otherwise fails on headless hosts. Respect explicit user overrides.
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+        # Redirect log messages otherwise printed to standard output to
+        # standard error instead, reserving the former for the progress stream.
+        guilogconf.log_stdout_to_stderr()
+
 
     @property
     def _matplotlib_backend_name_forced(self) -> bool:
@@ -209,17 +525,27 @@ seed, initialize, and then simulate such a simulation in the current directory:
         # matplotlib complicates the initialization of both.
         #
         # See the AppMetaABC.init_libs() method for further details.
-        appmetaone.get_app_meta().init_libs(cache_policy=self._cache_policy)
+        with guiappstartup.profiling_phase('init_libs'):
+            appmetaone.get_app_meta().init_libs(
+                cache_policy=self._cache_policy)
 
 
     def _do(self) -> object:
         '''
-        Implement this command-line interface (CLI) by unconditionally running
-        this application's graphical user interface (GUI), returning this
-        interface to be memory profiled when the ``--profile-type=size`` CLI
-        option is passed.
+        Implement this command-line interface (CLI) by either running the
+        headless batch requested by the ``--batch-conf-files`` CLI option if
+        passed *or* this application's graphical user interface (GUI)
+        otherwise, returning this batch or interface to be memory profiled
+        when the ``--profile-type=size`` CLI option is passed.
         '''
 
+        # If the caller requested a headless batch run or sweep, do so
+        # instead.
+        if self._batch_conf_filenames is not None:
+            return self._do_batch()
+        elif self._sweep_conf_filename is not None:
+            return self._do_sweep()
+
         # Defer imports *NOT* guaranteed to exist at this module's top-level.
         from betsee.gui.guimain import BetseeGUI
 
@@ -238,12 +564,94 @@ seed, initialize, and then simulate such a simulation in the current directory:
         return app_gui
 
 
+    def _do_batch(self) -> object:
+        '''
+        Headlessly run all simulation phases requested by the
+        ``--batch-conf-files`` and related CLI options through the same
+        simulator workers run by this application's GUI *without* displaying
+        this GUI, returning this batch to be memory profiled when the
+        ``--profile-type=size`` CLI option is passed.
+        '''
+
+        # Defer imports *NOT* guaranteed to exist at this module's top-level.
+        from betsee.gui.simtab.run.guisimrunbatch import QBetseeSimmerBatch
+
+        # Simulator batch running these phases.
+        sim_batch = QBetseeSimmerBatch(
+            conf_filenames=self._batch_conf_filenames,
+            phase_kinds=self._batch_phase_kinds,
+            phase_subkinds=self._batch_phase_subkinds,
+            worker_count_max=self._batch_worker_count_max,
+        )
+
+        # Run this batch, propagating its exit status as this application's.
+        self._exit_status = sim_batch.run()
+
+        # Return this batch for optional profiling purposes.
+        return sim_batch
+
+
+    def _do_sweep(self) -> object:
+        '''
+        Headlessly sweep the simulation configuration requested by the
+        ``--sweep-conf-file`` and related CLI options, deriving one
+        configuration per parameter tuple and running all simulation phases
+        requested by the ``--batch-*`` CLI options on these configurations
+        through the same simulator workers run by this application's GUI,
+        returning this sweep to be memory profiled when the
+        ``--profile-type=size`` CLI option is passed.
+        '''
+
+        # Defer imports *NOT* guaranteed to exist at this module's top-level.
+        from betsee.gui.simtab.run.guisimrunbatch import QBetseeSimmerBatch
+        from betsee.gui.simtab.run.guisimrunsweep import (
+            SimmerSweep, SimmerSweepParam)
+
+        # Sweep deriving configurations from this base configuration.
+        sim_sweep = SimmerSweep(
+            conf_filename=self._sweep_conf_filename,
+            params=[
+                SimmerSweepParam(spec=param_spec)
+                for param_spec in self._sweep_param_specs
+            ],
+            sampling=self._sweep_sampling,
+            sample_count=self._sweep_sample_count,
+            sweep_dirname=self._sweep_dirname,
+        )
+
+        # Derive these configurations.
+        sim_sweep.make_confs()
+
+        # Simulator batch running these configurations.
+        sim_batch = QBetseeSimmerBatch(
+            conf_filenames=sim_sweep.conf_filenames,
+            phase_kinds=self._batch_phase_kinds,
+            phase_subkinds=self._batch_phase_subkinds,
+            worker_count_max=self._batch_worker_count_max,
+        )
+
+        # Run this batch, propagating its exit status as this application's.
+        self._exit_status = sim_batch.run()
+
+        # Record the outcome of each run in the sweep index.
+        sim_sweep.write_index(
+            conf_filenames_failed=sim_batch.conf_filenames_failed)
+        logs.log_info('Sweep index written to "%s".', sim_sweep.index_filename)
+
+        # Return this sweep for optional profiling purposes.
+        return sim_sweep
+
+
     @type_check
     def _handle_exception(self, exception: Exception) -> None:
 
         # Defer to superclass handling, which typically logs this exception.
         super()._handle_exception(exception)
 
+        # Write a startup profile report for the portion of startup preceding
+        # this exception if startup profiling was requested.
+        guiappstartup.deinit()
+
         # Additionally attempt to...
         try:
             # Import PySide2.
@@ -256,3 +664,50 @@ seed, initialize, and then simulate such a simulation in the current directory:
         # exception. Why? Because we have more significant fish to fry.
         except ImportError as import_error:
             logs.log_error(str(import_error))
+
+# ....................{ PRIVATE ~ parsers                 }....................
+@type_check
+def _parse_enum_members(
+    enum_type: EnumType, enum_names: str, option_name: str) -> list:
+    '''
+    List of all members of the passed enumeration whose lowercase names are
+    delimited by commas in the passed string, parsed from the CLI option with
+    the passed name.
+
+    Raises
+    ----------
+    BetseCLIArgException
+        If any such name is unrecognized *or* no names are passed.
+    '''
+
+    # List of all such members.
+    enum_members = []
+
+    # For each such name ignoring ignorable whitespace...
+    for enum_name in enum_names.split(','):
+        enum_name = enum_name.strip()
+
+        # If this name is empty (e.g., due to a trailing comma), ignore it.
+        if not enum_name:
+            continue
+
+        # If this name is unrecognized, raise an exception.
+        if enum_name not in enums.get_member_names_lowercase(enum_type):
+            raise BetseCLIArgException(
+                'Option "{}" value "{}" unrecognized '
+                '(i.e., not one of {}).'.format(
+                    option_name,
+                    enum_name,
+                    ', '.join(enums.get_member_names_lowercase(enum_type)),
+                ))
+
+        # Append the member with this name.
+        enum_members.append(enum_type[enum_name.upper()])
+
+    # If no such members were passed, raise an exception.
+    if not enum_members:
+        raise BetseCLIArgException(
+            'Option "{}" specifies no values.'.format(option_name))
+
+    # Return this list.
+    return enum_members
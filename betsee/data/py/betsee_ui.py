@@ -2521,8 +2521,56 @@ class Ui_main_window(object):
         self.verticalLayout_3.addWidget(self.sim_run_player_toolbar )
         self.verticalLayout.addWidget(self.sim_run_player_toolbar_frame)
         self.gridLayout_30.addWidget(self.sim_run_player, 0, 0, 1, 1)
+        self.sim_run_live = QtWidgets.QGroupBox(self.sim_cmd_tab_run)
+        self.sim_run_live.setObjectName("sim_run_live")
+        self.sim_run_live_layout = QtWidgets.QGridLayout(self.sim_run_live)
+        self.sim_run_live_layout.setObjectName("sim_run_live_layout")
+        self.sim_run_live_field_label = QtWidgets.QLabel(self.sim_run_live)
+        self.sim_run_live_field_label.setObjectName("sim_run_live_field_label")
+        self.sim_run_live_layout.addWidget(self.sim_run_live_field_label, 0, 0, 1, 1)
+        self.sim_run_live_field = QtWidgets.QComboBox(self.sim_run_live)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.sim_run_live_field.sizePolicy().hasHeightForWidth())
+        self.sim_run_live_field.setSizePolicy(sizePolicy)
+        self.sim_run_live_field.setObjectName("sim_run_live_field")
+        self.sim_run_live_layout.addWidget(self.sim_run_live_field, 0, 1, 1, 1)
+        self.sim_run_live_decimation_label = QtWidgets.QLabel(self.sim_run_live)
+        self.sim_run_live_decimation_label.setObjectName("sim_run_live_decimation_label")
+        self.sim_run_live_layout.addWidget(self.sim_run_live_decimation_label, 0, 2, 1, 1)
+        self.sim_run_live_decimation = QtWidgets.QSpinBox(self.sim_run_live)
+        self.sim_run_live_decimation.setMinimum(1)
+        self.sim_run_live_decimation.setMaximum(10000)
+        self.sim_run_live_decimation.setProperty("value", 1)
+        self.sim_run_live_decimation.setObjectName("sim_run_live_decimation")
+        self.sim_run_live_layout.addWidget(self.sim_run_live_decimation, 0, 3, 1, 1)
+        self.sim_run_live_view = QBetseeSimmerLiveView(self.sim_run_live)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(1)
+        sizePolicy.setHeightForWidth(self.sim_run_live_view.sizePolicy().hasHeightForWidth())
+        self.sim_run_live_view.setSizePolicy(sizePolicy)
+        self.sim_run_live_view.setMinimumSize(QtCore.QSize(0, 240))
+        self.sim_run_live_view.setObjectName("sim_run_live_view")
+        self.sim_run_live_layout.addWidget(self.sim_run_live_view, 1, 0, 1, 4)
+        self.gridLayout_30.addWidget(self.sim_run_live, 3, 0, 1, 1)
+        self.sim_run_history = QtWidgets.QGroupBox(self.sim_cmd_tab_run)
+        self.sim_run_history.setObjectName("sim_run_history")
+        self.sim_run_history_layout = QtWidgets.QVBoxLayout(self.sim_run_history)
+        self.sim_run_history_layout.setObjectName("sim_run_history_layout")
+        self.sim_run_history_view = QBetseeSimmerHistoryView(self.sim_run_history)
+        self.sim_run_history_view.setMinimumSize(QtCore.QSize(0, 160))
+        self.sim_run_history_view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.sim_run_history_view.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.sim_run_history_view.setAlternatingRowColors(True)
+        self.sim_run_history_view.setObjectName("sim_run_history_view")
+        self.sim_run_history_view.setColumnCount(0)
+        self.sim_run_history_view.setRowCount(0)
+        self.sim_run_history_layout.addWidget(self.sim_run_history_view)
+        self.gridLayout_30.addWidget(self.sim_run_history, 4, 0, 1, 1)
         spacerItem41 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.gridLayout_30.addItem(spacerItem41, 4, 0, 1, 1)
+        self.gridLayout_30.addItem(spacerItem41, 5, 0, 1, 1)
         self.sim_run_queue_group = QtWidgets.QGroupBox(self.sim_cmd_tab_run)
         self.sim_run_queue_group.setObjectName("sim_run_queue_group")
         self.gridLayout_5 = QtWidgets.QGridLayout(self.sim_run_queue_group)
@@ -2951,6 +2999,9 @@ class Ui_main_window(object):
         icon33.addFile(":/icon/open_iconic/media-stop.svg", QtCore.QSize(), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.action_sim_run_stop_work.setIcon(icon33)
         self.action_sim_run_stop_work.setObjectName("action_sim_run_stop_work")
+        self.action_sim_run_clear_cache = QtWidgets.QAction(main_window)
+        self.action_sim_run_clear_cache.setIcon(icon30)
+        self.action_sim_run_clear_cache.setObjectName("action_sim_run_clear_cache")
         self.action_sim_run_toggle_work = QtWidgets.QAction(main_window)
         self.action_sim_run_toggle_work.setCheckable(True)
         icon34 = QtGui.QIcon()
@@ -2962,6 +3013,8 @@ class Ui_main_window(object):
         self.sim_conf_tree_toolbar.addAction(self.action_sim_conf_tree_item_remove)
         self.sim_run_player_toolbar .addAction(self.action_sim_run_toggle_work)
         self.sim_run_player_toolbar .addAction(self.action_sim_run_stop_work)
+        self.sim_run_player_toolbar .addSeparator()
+        self.sim_run_player_toolbar .addAction(self.action_sim_run_clear_cache)
         self.menu_file.addAction(self.action_make_sim)
         self.menu_file.addAction(self.action_open_sim)
         self.menu_file.addAction(self.action_close_sim)
@@ -2990,6 +3043,8 @@ class Ui_main_window(object):
         self.toolbar.addAction(self.action_copy)
         self.toolbar.addAction(self.action_paste)
         self.toolbar.addSeparator()
+        self.sim_run_live_field_label.setBuddy(self.sim_run_live_field)
+        self.sim_run_live_decimation_label.setBuddy(self.sim_run_live_decimation)
 
         self.retranslateUi(main_window)
         self.sim_conf_stack.setCurrentIndex(6)
@@ -3482,6 +3537,15 @@ class Ui_main_window(object):
         self.sim_run_player_substatus_group.setToolTip(QtWidgets.QApplication.translate("main_window", "Details of the currently queued simulation phase (if any).", None, -1))
         self.sim_run_player_substatus.setText(QtWidgets.QApplication.translate("main_window", "[insert phase substatus here]", None, -1))
         self.sim_run_player_toolbar .setToolTip(QtWidgets.QApplication.translate("main_window", "Control the state of the currently queued simulation phase.", None, -1))
+        self.sim_run_live.setToolTip(QtWidgets.QApplication.translate("main_window", "Display the per-cell fields (e.g., transmembrane voltage, ion concentrations) of the currently modelled simulation phase while that phase is modelled.", None, -1))
+        self.sim_run_live.setTitle(QtWidgets.QApplication.translate("main_window", "Live View", None, -1))
+        self.sim_run_live_field_label.setText(QtWidgets.QApplication.translate("main_window", "Field:", None, -1))
+        self.sim_run_live_field.setToolTip(QtWidgets.QApplication.translate("main_window", "Per-cell field to be displayed.", None, -1))
+        self.sim_run_live_decimation_label.setText(QtWidgets.QApplication.translate("main_window", "Every:", None, -1))
+        self.sim_run_live_decimation.setToolTip(QtWidgets.QApplication.translate("main_window", "Number of sampled time steps per displayed frame, applied to subsequently modelled phases. Frames modelled faster than they can be displayed are skipped rather than slowing modelling.", None, -1))
+        self.sim_run_live_decimation.setSuffix(QtWidgets.QApplication.translate("main_window", " sampled step(s)", None, -1))
+        self.sim_run_history.setToolTip(QtWidgets.QApplication.translate("main_window", "Outcome and performance of all simulation phases previously modelled or exported. Runs significantly slower than prior runs of the same simulation configuration are highlighted.", None, -1))
+        self.sim_run_history.setTitle(QtWidgets.QApplication.translate("main_window", "Run History", None, -1))
         self.sim_run_queue_group.setToolTip(QtWidgets.QApplication.translate("main_window", "<html><head/><body><p>Queue (i.e., ordered list) of all simulation phases to be iteratively modelled and/or exported when the <img src=\":/icon/open_iconic/media-play.svg\"/> button is clicked. </p></body></html>", None, -1))
         self.sim_run_queue_group.setTitle(QtWidgets.QApplication.translate("main_window", "Phase Playlist", None, -1))
         self.sim_run_queue_init.setToolTip(QtWidgets.QApplication.translate("main_window", "<html><head/><body><p>The <span style=\" text-decoration: underline;\">initialization</span> phase calculates steady-state ion concentrations needed by the following <span style=\" text-decoration: underline;\">simulation</span> phase from the cell cluster generated by the prior <span style=\" text-decoration: underline;\">seed</span> phase.</p></body></html>", None, -1))
@@ -3563,20 +3627,24 @@ class Ui_main_window(object):
         self.action_sim_conf_tree_item_remove.setToolTip(QtWidgets.QApplication.translate("main_window", "Remove the current item (e.g., tissue, plot, animation) from the current list.", None, -1))
         self.action_sim_run_stop_work.setText(QtWidgets.QApplication.translate("main_window", "Stop", None, -1))
         self.action_sim_run_stop_work.setToolTip(QtWidgets.QApplication.translate("main_window", "Prematurely halt the currently running simulation phase. Once stopped, rerunning this phase necessarily restarts this phase from the beginning (e.g., first sampled time step).", None, -1))
+        self.action_sim_run_clear_cache.setText(QtWidgets.QApplication.translate("main_window", "Clear Cache", None, -1))
+        self.action_sim_run_clear_cache.setToolTip(QtWidgets.QApplication.translate("main_window", "Discard all cached results of previously modelled simulation phases for this simulation. Once discarded, rerunning any phase necessarily remodels that phase rather than restoring its results from cache.", None, -1))
         self.action_sim_run_toggle_work.setText(QtWidgets.QApplication.translate("main_window", "Work", None, -1))
         self.action_sim_run_toggle_work.setToolTip(QtWidgets.QApplication.translate("main_window", "<html><head/><body><p>Start, pause, or unpause the currently queued simulation phase. Clicking this button either:</p><ul style=\"margin-top: 0px; margin-bottom: 0px; margin-left: 0px; margin-right: 0px; -qt-list-indent: 1;\"><li style=\" margin-top:12px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">Starts this phase if currently unstarted.</li><li style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">Pauses this phase if currently started at its current position (e.g., sampled time step).</li><li style=\" margin-top:0px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">Unpauses this phase if currently paused from its current position (e.g., sampled time step).</li></ul></body></html>", None, -1))
 
+from betsee.gui.simconf.stack.widget.guisimconflineedit import QBetseeSimConfPathnameSubdirLineEdit, QBetseeSimConfLineEdit, QBetseeSimConfPathnameImageLineEdit
+from betsee.gui.simconf.stack.widget.guisimconfspinbox import QBetseeSimConfIntSpinBox, QBetseeSimConfDoubleSpinBox
+from betsee.gui.simtab.run.hist.guisimrunhistview import QBetseeSimmerHistoryView
+from betsee.gui.simconf.tree.guisimconftree import QBetseeSimConfTreeWidget
+from betsee.util.widget.stock.label.guilabelimage import QBetseeLabelImage
 from betsee.util.widget.stock.guitextedit import QBetseePlainTextEdit
+from betsee.gui.simconf.stack.widget.guisimconfcheckbox import QBetseeSimConfCheckBox
+from betsee.gui.simconf.stack.widget.guisimconfcombobox import QBetseeSimConfComboBoxEnum, QBetseeSimConfComboBoxSequence
 from betsee.util.widget.stock.guiprogressbar import QBetseeProgressBar
+from betsee.gui.simtab.run.live.guisimrunliveview import QBetseeSimmerLiveView
 from betsee.gui.simtab.guisimtab import QBetseeSimmerTabWidget
-from betsee.gui.simconf.stack.widget.guisimconflineedit import QBetseeSimConfPathnameSubdirLineEdit, QBetseeSimConfLineEdit, QBetseeSimConfPathnameImageLineEdit
-from betsee.gui.simconf.stack.widget.guisimconfcombobox import QBetseeSimConfComboBoxSequence, QBetseeSimConfComboBoxEnum
 from betsee.gui.simconf.stack.guisimconfstack import QBetseeSimConfStackedWidget
-from betsee.gui.simconf.stack.widget.guisimconfcheckbox import QBetseeSimConfCheckBox
-from betsee.gui.simconf.stack.widget.guisimconfspinbox import QBetseeSimConfDoubleSpinBox, QBetseeSimConfIntSpinBox
-from betsee.util.widget.stock.label.guilabelimage import QBetseeLabelImage
-from betsee.gui.simconf.tree.guisimconftree import QBetseeSimConfTreeWidget
-import betsee_rc
+
 
 from PySide2.QtWidgets import QMainWindow
 __BETSEE_BASE_CLASSES = (Ui_main_window, QMainWindow)
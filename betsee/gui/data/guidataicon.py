@@ -46,3 +46,25 @@ def get_icon_dot() -> QIcon:
     '''
 
     return guiicon.make_icon(resource_name='://icon/entypo+/dot-single.svg')
+
+
+@func_cached
+def get_icon_fresh() -> QIcon:
+    '''
+    **Fresh export** (i.e., icon signifying an export item whose previously
+    exported artifact reflects the current simulation configuration and
+    modelled results).
+    '''
+
+    return guiicon.make_icon(resource_name='://icon/open_iconic/image.svg')
+
+
+@func_cached
+def get_icon_stale() -> QIcon:
+    '''
+    **Stale export** (i.e., icon signifying an export item whose previously
+    exported artifact no longer reflects the current simulation configuration
+    or modelled results and hence requires re-exporting).
+    '''
+
+    return guiicon.make_icon(resource_name='://icon/open_iconic/clock.svg')
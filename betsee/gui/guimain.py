@@ -232,11 +232,12 @@ Root-level classes defining this application's graphical user interface (GUI).
 #Annnnnnd we are done.
 
 # ....................{ IMPORTS                           }....................
-from PySide2.QtCore import QCoreApplication
+from PySide2.QtCore import QCoreApplication, QTimer
 from betse.util.io.log import logs
 from betse.util.type.types import type_check, StrOrNoneTypes
 from betsee import guimetadata
-from betsee.util.app import guiapp, guiappstatus, guiappwindow
+from betsee.util.app import (
+    guiapp, guiappstartup, guiappstatus, guiappwindow)
 from betsee.util.io import guierror
 
 # ....................{ CLASSES                           }....................
@@ -316,9 +317,10 @@ class BetseeGUI(object):
         # subclasses the custom user interface (UI) base class defined by a
         # module generated at runtime above, this importation is deferred until
         # *AFTER* this module is guaranteed to be importable.
-        from betsee.gui.guimainsettings import QBetseeSettings
-        from betsee.gui.guimainsignaler import QBetseeSignaler
-        from betsee.gui.window.guiwindow import QBetseeMainWindow
+        with guiappstartup.profiling_phase('import_main_window'):
+            from betsee.gui.guimainsettings import QBetseeSettings
+            from betsee.gui.guimainsignaler import QBetseeSignaler
+            from betsee.gui.window.guiwindow import QBetseeMainWindow
 
         # Log this initialization.
         logs.log_info('Initiating PySide2 UI...')
@@ -336,10 +338,11 @@ class BetseeGUI(object):
         # variable, this variable is exposed as a public attribute of the
         # singleton application widget rather than this less accessible object.
         # See the "guiapp" submodule for further details.
-        main_window = QBetseeMainWindow(
-            signaler=self._signaler,
-            sim_conf_filename=self._sim_conf_filename,
-        )
+        with guiappstartup.profiling_phase('main_window'):
+            main_window = QBetseeMainWindow(
+                signaler=self._signaler,
+                sim_conf_filename=self._sim_conf_filename,
+            )
         # logs.log_debug('Main window parent: %r', main_window.parentWidget())
 
         # Publicize this main window for use elsewhere in the codebase.
@@ -356,7 +359,8 @@ class BetseeGUI(object):
 
         # Restore previously stored application-wide settings *AFTER*
         # initializing but *BEFORE* displaying this window.
-        self._settings.restore_settings()
+        with guiappstartup.profiling_phase('restore_settings'):
+            self._settings.restore_settings()
 
         # Finalize this window *AFTER* restoring settings, which modifies
         # critical window properties.
@@ -365,6 +369,11 @@ class BetseeGUI(object):
         # event loop required to do so has yet to be run by the GUI_APP.exec_()
         # call. In this case, this method merely toggles this window's internal
         # state in preparation for that call. (Why, Qt. Why.)
+        #
+        # If startup is being profiled, profile the time to first paint of this
+        # window as a distinct phase, stopped on the first iteration of this
+        # GUI's event loop by the guiappstartup.deinit() call scheduled below.
+        guiappstartup.start_phase('first_paint')
         main_window.show()
         # main_window.showMaximized()
 
@@ -385,5 +394,12 @@ class BetseeGUI(object):
         # Application singleton, guaranteed to have been instantiated.
         gui_app = guiapp.get_app()
 
+        # If startup is being profiled, stop profiling on the first iteration
+        # of this GUI's event loop (i.e., immediately *AFTER* this window is
+        # first displayed), thus including this display in both the root and
+        # "first_paint" phases.
+        if guiappstartup.is_enabled():
+            QTimer.singleShot(0, guiappstartup.deinit)
+
         # Display this GUI.
         return gui_app.exec_()
@@ -45,20 +45,57 @@ configuration files) functionality.
 #sane. In other words, the noop-based lazy approach may be the correct approach.
 
 # ....................{ IMPORTS                           }....................
-from PySide2.QtCore import QCoreApplication, Signal, Slot
-from PySide2.QtWidgets import QMessageBox
+from PySide2.QtCore import QCoreApplication, QEventLoop, QTimer, Signal, Slot
+from PySide2.QtWidgets import QMessageBox, QProgressBar
 from betse.science.parameters import Parameters
 from betse.util.app.meta import appmetaone
 from betse.util.io.log import logs
 from betse.util.path import pathnames
-from betse.util.path.dirs import DirOverwritePolicy
 from betse.util.type.types import type_check, StrOrNoneTypes
-from betsee.guiexception import BetseeSimConfException
+from betsee.guiexception import (
+    BetseeSimConfException, BetseeSimConfPatchException)
+from betsee.gui.simconf.guisimconfbind import QBetseeSimConfBinder
+from betsee.gui.simconf import guisimconfsave
+from betsee.gui.simconf.guisimconfload import QBetseeSimConfLoadWorker
+from betsee.gui.simconf.guisimconfpatch import SimConfPatcher
+from betsee.gui.simconf.guisimconfsave import (
+    JOURNAL_INTERVAL_MILLISECONDS,
+    QBetseeSimConfWriteWorker,
+    SAVE_WRITE_KINDS,
+    SimConfWriteJob,
+    SimConfWriteKind,
+)
 from betsee.gui.window.guiwindow import QBetseeMainWindow
 from betsee.util.app import guiappstatus
-from betsee.util.io import guimessage
+from betsee.util.io import guimessage, guisettings
 from betsee.util.path import guifile
+from betsee.util.thread.pool import guipoolthread
 from betsee.util.widget.abc.control.guictlabc import QBetseeControllerABC
+import copy
+
+# ....................{ CONSTANTS                         }....................
+DIRTY_COALESCE_MILLISECONDS = 100
+'''
+Number of milliseconds that the :meth:`QBetseeSimConf.set_dirty_deferred`
+method defers updating the dirty state of the currently open simulation
+configuration by, coalescing all requests to do so within this window into a
+single emission of the :attr:`QBetseeSimConf.set_dirty_signal` signal.
+
+Since each such emission synchronously updates the state of numerous widgets
+(e.g., actions, the main window title), emitting this signal on each edit of
+each widget would needlessly degrade responsiveness during rapid successive
+edits (e.g., scrubbing a spin box).
+'''
+
+
+JOURNAL_SETTING_NAME = 'sim_conf/journal_conf_filename'
+'''
+Name of the application-wide setting whose value is the absolute filename of
+the simulation configuration file whose autosave journal was most recently
+written if that journal has yet to be discarded *or* the empty string
+otherwise, permitting that journal to be offered for recovery on the next
+application startup.
+'''
 
 # ....................{ CLASSES                           }....................
 class QBetseeSimConf(QBetseeControllerABC):
@@ -73,8 +110,55 @@ class QBetseeSimConf(QBetseeControllerABC):
     * Whether or not a simulation configuration is currently open.
     * Whether or not an open simulation configuration has unsaved changes.
 
+    Loading
+    ----------
+    Simulation configurations are loaded asynchronously in two stages, both
+    preserving the responsiveness of the GUI:
+
+    #. The YAML-formatted file is deserialized into the :attr:`p` singleton by
+       a :class:`QBetseeSimConfLoadWorker` in a pooled thread. For safety, all
+       widgets accessing that singleton are disabled until that worker
+       finishes. At most one such worker runs at a time. If the user requests
+       another file be opened while a prior file is still being deserialized,
+       the result of the prior worker is discarded *and* a new worker is
+       started for the most recently requested file on the prior worker
+       finishing.
+    #. All editable widgets are repopulated from that singleton by the
+       :attr:`binder` in time-sliced batches on the main event thread,
+       repopulating visible widgets first.
+
+    Saving
+    ----------
+    Simulation configurations are saved asynchronously. Each save deep-copies
+    the :attr:`p` singleton on the main event thread *and* queues a job
+    atomically serializing that snapshot to be performed by a
+    :class:`QBetseeSimConfWriteWorker` in a pooled thread. These jobs are
+    performed in the order queued, one at a time; the user is free to continue
+    editing this configuration meanwhile.
+
+    While this configuration has unsaved changes, a snapshot of this
+    configuration is also periodically written to an **autosave journal**
+    (i.e., hidden sibling file of the simulation configuration file) by the
+    same queue. This journal is discarded on saving or discarding these
+    changes. If this application instead crashes, this journal survives and
+    is offered for recovery on subsequently opening that file.
+
+    Where feasible, both saves and journals are **incremental.** The
+    :attr:`patcher` tracks each option changed since the last save; rather
+    than snapshotting this entire configuration, each save then merely
+    patches these options into the text of the saved file. Saves fall back to
+    full snapshots where these changes are untrackable (e.g., appending a
+    tissue profile) or unpatchable (e.g., the saved file having been
+    externally modified).
+
     Attributes (Public)
     ----------
+    binder : QBetseeSimConfBinder
+        Binder repopulating all editable simulation configuration widgets from
+        this configuration on each opening and closing of this configuration.
+    patcher : SimConfPatcher
+        Patcher tracking all options of this configuration changed since this
+        configuration was last saved or loaded.
     p : Parameters
         High-level simulation configuration encapsulating a low-level
         dictionary parsed from an even lower-level YAML-formatted file. Since
@@ -92,6 +176,42 @@ class QBetseeSimConf(QBetseeControllerABC):
     _is_dirty : bool
         ``True`` only if a simulation configuration is currently open *and*
         this configuration is **dirty** (i.e., has unsaved changes).
+    _dirty_timer : QTimer
+        Single-shot timer coalescing all requests to update the dirty state of
+        this configuration via the :meth:`set_dirty_deferred` method into a
+        single emission of the :attr:`set_dirty_signal` signal.
+    _journal_timer : QTimer
+        Periodic timer writing the autosave journal of this configuration
+        every :data:`JOURNAL_INTERVAL_MILLISECONDS` while this configuration
+        is dirty.
+    _journal_undo_index : {int, NoneType}
+        Index of the undo stack when the autosave journal of this
+        configuration was last queued to be written if any *or* ``None``
+        otherwise, avoiding rewriting an unchanged journal.
+    _load_journal_filename : StrOrNoneTypes
+        Absolute filename of the simulation configuration file whose autosave
+        journal the :attr:`_load_worker` is currently recovering if any *or*
+        ``None`` otherwise.
+    _load_filename_pending : StrOrNoneTypes
+        Absolute filename of the file most recently requested to be loaded
+        while the :attr:`_load_worker` was still working if any *or* ``None``
+        otherwise.
+    _load_worker : {QBetseeSimConfLoadWorker, NoneType}
+        Pooled worker currently deserializing a file into the :attr:`p`
+        singleton if any *or* ``None`` otherwise.
+    _load_workers : set
+        Set of all pooled workers started by this configurator that have yet
+        to finish. Since pooled workers are *not* deletable until finished,
+        these workers are preserved here until finished.
+    _write_jobs : list
+        List of all jobs queued to be written after the :attr:`_write_worker`
+        finishes, in queued order.
+    _write_worker : {QBetseeSimConfWriteWorker, NoneType}
+        Pooled worker currently performing a queued write job if any *or*
+        ``None`` otherwise.
+    _write_workers : set
+        Set of all pooled write workers started by this configurator that
+        have yet to finish.
 
     Attributes (Private: Widgets)
     ----------
@@ -105,6 +225,10 @@ class QBetseeSimConf(QBetseeControllerABC):
         Alias of the :attr:`QBetseeMainWindow.action_save_sim` action.
     _action_save_sim_as : QAction
         Alias of the :attr:`QBetseeMainWindow.action_save_sim_as` action.
+    _load_progress : QProgressBar
+        Progress bar permanently embedded in the status bar, displaying the
+        progress of loading this configuration if loading *or* hidden
+        otherwise.
     _sim_conf_changed_signal : QSignal
         Alias of the :attr:`QBetseeMainWindow.sim_conf_changed_signal` signal.
     _sim_conf_stack : QBetseeSimConfStackedWidget
@@ -141,14 +265,43 @@ class QBetseeSimConf(QBetseeControllerABC):
         self._sim_conf_tree = None
         self._sim_conf_tree_frame = None
         self._sim_tab = None
+        self._load_filename_pending = None
+        self._load_progress = None
+        self._load_journal_filename = None
+        self._load_worker = None
+        self._load_workers = set()
+        self._journal_undo_index = None
+        self._write_jobs = []
+        self._write_worker = None
+        self._write_workers = set()
 
         # High-level simulation configuration, defaulting to the unload state.
         self.p = Parameters()
 
+        # Patcher tracking changes to this configuration.
+        self.patcher = SimConfPatcher()
+
+        # Binder repopulating all editable widgets from this configuration,
+        # whose parent is this controller object.
+        self.binder = QBetseeSimConfBinder(self)
+
         # Undo stack for this simulation configuration, whose parent is this
         # controller object.
         self.undo_stack = QBetseeSimConfUndoStack(self)
 
+        # Single-shot timer coalescing dirty state updates, whose parent is
+        # this controller object.
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(DIRTY_COALESCE_MILLISECONDS)
+        self._dirty_timer.timeout.connect(self._set_dirty_from_changes)
+
+        # Periodic timer writing the autosave journal, whose parent is this
+        # controller object.
+        self._journal_timer = QTimer(self)
+        self._journal_timer.setInterval(JOURNAL_INTERVAL_MILLISECONDS)
+        self._journal_timer.timeout.connect(self._write_journal)
+
 
     @type_check
     def init(self, main_window: QBetseeMainWindow) -> None:
@@ -225,6 +378,17 @@ class QBetseeSimConf(QBetseeControllerABC):
         # Finalize the initialization of this undo stack.
         self.undo_stack.init(main_window=main_window)
 
+        # Progress bar displaying the progress of loading this configuration,
+        # hidden until such a load is requested.
+        self._load_progress = QProgressBar()
+        self._load_progress.setMaximumWidth(160)
+        self._load_progress.setTextVisible(False)
+        self._load_progress.hide()
+        main_window.status_bar.addPermanentWidget(self._load_progress)
+
+        # Finalize the initialization of this binder.
+        self.binder.init(progress_bar=self._load_progress)
+
 
     @type_check
     def _init_connections(self, main_window: QBetseeMainWindow) -> None:
@@ -251,6 +415,7 @@ class QBetseeSimConf(QBetseeControllerABC):
         # connections be deterministically established *BEFORE* these signals
         # are emitted.
         self.set_filename_signal.connect(self._on_filename_set)
+        self.set_filename_signal.connect(self.binder.bind)
         self.set_dirty_signal.connect(self._on_dirty_set)
 
         #FIXME: The "QBetseeMainWindow" widget should establish this connection
@@ -258,14 +423,61 @@ class QBetseeSimConf(QBetseeControllerABC):
         #preventing this from previously happening; see to it now, please.
         self.set_dirty_signal.connect(main_window.set_sim_conf_dirty)
 
+        # Periodically write the autosave journal of this configuration.
+        self._journal_timer.start()
+
     # ..................{ PROPERTIES ~ bool                 }..................
     @property
     def is_open(self) -> bool:
         '''
-        ``True`` only if a simulation configuration file is currently open.
+        ``True`` only if a simulation configuration file is currently open
+        (i.e., has been fully deserialized).
+        '''
+
+        return self._load_worker is None and self.p.is_loaded
+
+
+    @property
+    def is_loading(self) -> bool:
+        '''
+        ``True`` only if a simulation configuration file is currently being
+        deserialized by a pooled worker.
+        '''
+
+        return self._load_worker is not None
+
+
+    @property
+    def is_writing(self) -> bool:
+        '''
+        ``True`` only if one or more jobs serializing this configuration (or
+        its autosave journal) have yet to be performed.
+        '''
+
+        return self._write_worker is not None
+
+
+    @property
+    def is_copying(self) -> bool:
+        '''
+        ``True`` only if one or more jobs copying the requisite subdirectories
+        of this configuration into the directory of a new file (e.g., on the
+        user selecting either "New..." or "Save As...") have yet to be
+        performed.
+
+        While this is the case, this configuration is already associated with
+        that file but relative pathnames in this configuration (e.g., of input
+        images) refer to files that may *not* have been copied into that
+        directory yet. Callers reading such files should either defer doing
+        so until the :attr:`set_copying_signal` is emitted with ``False`` *or*
+        call the :meth:`wait_writes` method beforehand.
         '''
 
-        return self.p.is_loaded
+        return (
+            (self._write_worker is not None and
+             bool(self._write_worker.job.subdir_basenames)) or
+            any(job.subdir_basenames for job in self._write_jobs)
+        )
 
     # ..................{ PROPERTIES ~ dirty                }..................
     @property
@@ -328,6 +540,84 @@ class QBetseeSimConf(QBetseeControllerABC):
                 'QBetseeSimConf',
                 'No simulation configuration currently open.'))
 
+    # ..................{ DIRTIERS                          }..................
+    def set_dirty_deferred(self) -> None:
+        '''
+        Update the dirty state of the currently open simulation configuration
+        from the options changed since this configuration was last saved
+        after a brief delay, coalescing all such requests within this delay
+        into a single update.
+
+        Editable widgets should call this method rather than emitting the
+        :attr:`set_dirty_signal` signal directly on each user edit. See the
+        :data:`DIRTY_COALESCE_MILLISECONDS` constant for further details.
+        '''
+
+        # If this timer is *NOT* already pending, start this timer. Else, this
+        # timer is already pending, in which case this request is coalesced
+        # into the pending update. Note that this timer is intentionally *NOT*
+        # restarted, guaranteeing this update to be performed at least once
+        # per delay regardless of the rate of user edits.
+        if not self._dirty_timer.isActive():
+            self._dirty_timer.start()
+
+
+    def flush_edits(self) -> None:
+        '''
+        Synchronously apply all pending edits to the currently open simulation
+        configuration *and* all pending updates to the dirty state of this
+        configuration.
+
+        Editable widgets defer applying user edits to this configuration to
+        coalesce rapid successive edits. This method should thus be called
+        immediately *before* any operation requiring this configuration and
+        its undo stack to reflect all user edits (e.g., saving this
+        configuration, undoing or redoing the last edit).
+        '''
+
+        # Apply all pending edits *BEFORE* updating the dirty state, as doing
+        # so typically pushes undo commands onto the undo stack and hence
+        # requests yet another dirty state update.
+        self.flush_edits_signal.emit()
+
+        # If a dirty state update is pending, perform this update immediately.
+        if self._dirty_timer.isActive():
+            self._dirty_timer.stop()
+            self._set_dirty_from_changes()
+
+
+    @Slot()
+    def _set_dirty_from_changes(self) -> None:
+        '''
+        Slot signalled on the timeout of the :attr:`_dirty_timer`, updating
+        the dirty state of the currently open simulation configuration from
+        the options changed since this configuration was last saved.
+
+        This state is derived from the set of changed options tracked by the
+        :attr:`patcher` rather than from the index of the undo stack, which
+        only returns to the clean index by undoing or redoing commands. Since
+        that set forgets each option restored to its saved value, editing an
+        option and then manually restoring its prior value (or undoing all
+        edits since the last save) clears this state in constant time.
+        '''
+
+        # If no configuration is open (e.g., due to this configuration having
+        # been closed while this update was pending), silently noop.
+        if not self.is_open:
+            return
+
+        # True only if this configuration differs from the saved file.
+        is_dirty = self.patcher.is_changed
+
+        # If this configuration is identical to the saved file, mark the
+        # current index of the undo stack as clean, synchronizing the clean
+        # state of that stack (e.g., as displayed by undo views) with ours.
+        if not is_dirty:
+            self.undo_stack.setClean()
+
+        # Update this dirty state.
+        self.is_dirty = is_dirty
+
     # ..................{ SIGNALS                           }..................
     set_filename_signal = Signal(str)
     '''
@@ -343,6 +633,24 @@ class QBetseeSimConf(QBetseeControllerABC):
     '''
 
 
+    flush_edits_signal = Signal()
+    '''
+    Signal signalled by the :meth:`flush_edits` method, instructing all
+    editable widgets to synchronously apply all pending edits to the currently
+    open simulation configuration.
+    '''
+
+
+    set_copying_signal = Signal(bool)
+    '''
+    Signal passed a single boolean on the :meth:`is_copying` property of this
+    object changing (i.e., on either queueing the first job copying the
+    requisite subdirectories of this configuration, in which case this boolean
+    is ``True``, *or* on the last such job being performed, in which case
+    this boolean is ``False``).
+    '''
+
+
     #FIXME: Refactor all calls to set_dirty_signal.emit() to instead set the
     #"is_dirty" property.
     set_dirty_signal = Signal(bool)
@@ -381,6 +689,10 @@ class QBetseeSimConf(QBetseeControllerABC):
               empty string.
         '''
 
+        # Discard any pending dirty state update, which pertains to the prior
+        # simulation configuration if any.
+        self._dirty_timer.stop()
+
         # Notify all interested slots that no unsaved changes remain regardless
         # of whether a simulation configuration has just been opened or closed.
         self.is_dirty = False
@@ -479,31 +791,47 @@ class QBetseeSimConf(QBetseeControllerABC):
         # Close the currently open simulation configuration if any.
         self._close_sim()
 
-        # Copy the default simulation configuration to this target file.
-        self.p.copy_default(
-           trg_conf_filename=conf_filename,
-
-           # Silently overwrite this target file *AND* all subdirectories of
-           # this target file's directory. Since the prior call to the
-           # "guifile" function has already forced the end user to
-           # interactively confirm these overwrites, doing so is "safe" to the
-           # extent that the user has already accepted the consequences.
-           is_conf_file_overwritable=True,
-           conf_subdir_overwrite_policy=DirOverwritePolicy.OVERWRITE,
-        )
+        # Deserialize the default simulation configuration. Since this file is
+        # both small and bundled with BETSE, doing so on the main event thread
+        # is negligible. Serializing this configuration *AND* copying all
+        # requisite subdirectories (often hundreds of megabytes of images) is
+        # deferred to the writer queued below.
+        self.p.load(self.p.conf_default_filename)
+
+        # Queue this configuration to be serialized to this target file *AND*
+        # all requisite subdirectories to be copied into this target file's
+        # directory. Since the prior call to the "guifile" function has
+        # already forced the end user to interactively confirm these
+        # overwrites, the writer silently does so.
+        self._queue_save(conf_filename, kind=SimConfWriteKind.CREATE)
+
+        # Associate this configuration with this file immediately rather than
+        # on this snapshot being written, permitting the user to begin editing
+        # this configuration as this file. Until this job has copied all
+        # requisite subdirectories into this file's directory, the
+        # "is_copying" property remains true; readers of files relative to
+        # this configuration (e.g., the simulator, image previews) defer
+        # reading these files until then. If writing this snapshot fails, the
+        # _handle_write_worker_failed() slot closes this configuration.
+        self.p._set_conf_filename(conf_filename)
 
         # Update relevant Qt objects in response to these operations.
         #
         # Note that the _handle_load() rather than load() method is called.
-        # Since the call to the self.p.save() method has already saved and
-        # hence loaded this configuration, calling the load() method which
-        # calls the self.p.load() method would be entirely superfluous and
-        # hence inefficient (albeit presumably harmless).
+        # Since this configuration has already been loaded above, calling the
+        # load() method which calls the self.p.load() method would be entirely
+        # superfluous and hence inefficient (albeit presumably harmless).
         self._handle_load()
 
-        # Update the status bar *AFTER* successfully completing this action.
+        # Since the document model of this configuration was deserialized from
+        # the default rather than this target file, subsequent changes are
+        # unpatchable into the latter.
+        self.patcher.reset(is_patchable=False)
+
+        # Update the status bar. The _handle_write_worker() slot subsequently
+        # updates this status on successfully writing this snapshot.
         guiappstatus.show_status(QCoreApplication.translate(
-            'QBetseeSimConf', 'Simulation created.'))
+            'QBetseeSimConf', 'Creating simulation...'))
 
 
     @Slot()
@@ -528,16 +856,17 @@ class QBetseeSimConf(QBetseeControllerABC):
             return
         # Else, the user confirmed this dialog.
 
-        # Close the currently open simulation configuration if any.
-        self._close_sim()
+        # If another simulation configuration is still being loaded, no
+        # simulation configuration is currently open. In this case, supersede
+        # that load by this load.
+        #
+        # Else, close the currently open simulation configuration if any.
+        if not self.is_loading:
+            self._close_sim()
 
         # Deserialize this low-level file into a high-level configuration.
         self.load(conf_filename)
 
-        # Update the status bar *AFTER* successfully completing this action.
-        guiappstatus.show_status(QCoreApplication.translate(
-            'QBetseeSimConf', 'Simulation opened.'))
-
 
     @Slot()
     def _close_sim(self) -> None:
@@ -574,15 +903,21 @@ class QBetseeSimConf(QBetseeControllerABC):
         contents of this file.
         '''
 
-        # Reserialize this configuration back to the same file.
-        self.p.save_inplace()
+        # Apply all pending edits to this configuration *BEFORE* saving.
+        self.flush_edits()
 
-        # Notify all interested slots of this event.
+        # Queue this configuration to be reserialized back to the same file.
+        self._queue_save(self.p.conf_filename)
+
+        # Notify all interested slots of this event. Since the snapshot
+        # queued above already captures all changes, this configuration is
+        # no longer dirty even though that snapshot has yet to be written.
         self.set_dirty_signal.emit(False)
 
-        # Update the status bar *AFTER* successfully completing this action.
+        # Update the status bar. The _handle_write_worker() slot subsequently
+        # updates this status on successfully writing this snapshot.
         guiappstatus.show_status(QCoreApplication.translate(
-            'QBetseeSimConf', 'Simulation saved.'))
+            'QBetseeSimConf', 'Saving simulation...'))
 
 
     @Slot()
@@ -616,29 +951,33 @@ class QBetseeSimConf(QBetseeControllerABC):
             return
         # Else, the user confirmed this dialog.
 
-        # Reserialize this configuration into this new file.
+        # Apply all pending edits to this configuration *BEFORE* saving.
+        self.flush_edits()
+
+        # Queue this configuration to be reserialized into this new file.
         #
         # Since the user confirmed this dialog and hence explicitly requested
         # that this file *AND* all subdirectories of this file's directory be
-        # silently overwritten, we instruct this method to do so.
-        self.p.save(
-            conf_filename=conf_filename,
-
-            # Silently overwrite this target file *AND* all subdirectories of
-            # this target file's directory. Since the prior call to the
-            # "guifile" function has already forced the end user to
-            # interactively confirm these overwrites, doing so is "safe" to the
-            # extent that the user has already accepted the consequences.
-            is_conf_file_overwritable=True,
-            conf_subdir_overwrite_policy=DirOverwritePolicy.OVERWRITE,
-        )
+        # silently overwritten, the writer silently does so.
+        self._queue_save(conf_filename)
+
+        # Associate this configuration with this file immediately rather than
+        # on this snapshot being written, permitting the user to continue
+        # editing this configuration as this file. Until this job has copied
+        # all requisite subdirectories into this file's directory, the
+        # "is_copying" property remains true; readers of files relative to
+        # this configuration (e.g., the simulator, image previews) defer
+        # reading these files until then. If writing this snapshot fails, the
+        # _handle_write_worker_failed() slot reverts this association.
+        self.p._set_conf_filename(conf_filename)
 
         # Notify all interested slots of this event.
-        self.set_filename_signal.emit(conf_filename)
+        self.set_filename_signal.emit(self.p.conf_filename)
 
-        # Update the status bar *AFTER* successfully completing this action.
+        # Update the status bar. The _handle_write_worker() slot subsequently
+        # updates this status on successfully writing this snapshot.
         guiappstatus.show_status(QCoreApplication.translate(
-            'QBetseeSimConf', 'Simulation saved.'))
+            'QBetseeSimConf', 'Saving simulation...'))
 
     # ..................{ (UN)LOADERS                       }..................
     @type_check
@@ -658,18 +997,288 @@ class QBetseeSimConf(QBetseeControllerABC):
         declared throughout the Qt API (e.g., :meth:`QDialog.open`,
         :meth:`QFile.open`), this method is intentionally *not* named ``open``.
 
+        Asynchronicity
+        ----------
+        This method returns immediately, deserializing this file in a pooled
+        thread *and* subsequently signalling all connected slots of this event
+        from the main event thread. If another file is still being
+        deserialized, this file is deserialized after that file instead, whose
+        result is then silently discarded.
+
+        Recovery
+        ----------
+        If this file has a recoverable autosave journal (e.g., due to this
+        application having previously crashed while this file had unsaved
+        changes), the user is first interactively prompted to recover that
+        journal. If the user accepts, that journal rather than this file is
+        deserialized *and* then associated with this file as unsaved changes;
+        else, that journal is discarded.
+
         Parameters
         ----------
         conf_filename : str
             Absolute filename of this file.
         '''
 
-        # Deserialize this low-level file into a high-level configuration.
-        self.p.load(conf_filename)
+        # If another file is still being deserialized, defer deserializing
+        # this file until that file has been deserialized. Since YAML parsing
+        # is *NOT* interruptible, that deserialization cannot be stopped.
+        if self.is_loading:
+            logs.log_debug(
+                'Deferring simulation configuration "%s" load...',
+                conf_filename)
+            self._load_filename_pending = conf_filename
+            return
+        # Else, no other file is being deserialized.
+
+        # Deserialize this file in a pooled thread.
+        self._start_load_worker(conf_filename)
+
+
+    def _start_load_worker(self, conf_filename: str) -> None:
+        '''
+        Start a pooled worker deserializing the YAML-formatted simulation
+        configuration file with the passed filename into the :attr:`p`
+        singleton.
+
+        Parameters
+        ----------
+        conf_filename : str
+            Absolute or relative filename of this file.
+        '''
+
+        # Absolute filename of this file, comparable to the filenames of
+        # autosave journals and the filename associated with this
+        # configuration.
+        conf_filename = pathnames.canonicalize(conf_filename)
+
+        # Absolute filename of the file to be deserialized, defaulting to
+        # this file.
+        load_filename = conf_filename
+
+        # If this file has a recoverable autosave journal...
+        self._load_journal_filename = None
+        if guisimconfsave.is_journal_recoverable(conf_filename):
+            # If the user accepts recovering this journal, deserialize this
+            # journal instead *AND* associate this journal with this file on
+            # finishing doing so.
+            if self._is_journal_recovery_confirmed(conf_filename):
+                self._load_journal_filename = conf_filename
+                load_filename = guisimconfsave.get_journal_filename(
+                    conf_filename)
+            # Else, discard this journal.
+            else:
+                self._queue_journal_discard(conf_filename)
+
+        # Log this deserialization.
+        logs.log_debug(
+            'Loading simulation configuration "%s" asynchronously...',
+            load_filename)
+
+        # Disable all widgets accessing this configuration *BEFORE* starting
+        # this worker, which mutates this configuration in a pooled thread.
+        self._set_widgets_loading()
+
+        # Display indeterminate progress, as YAML parsing reports none.
+        self._load_progress.setRange(0, 0)
+        self._load_progress.show()
+        guiappstatus.show_status(QCoreApplication.translate(
+            'QBetseeSimConf', 'Opening simulation...'))
+
+        # Pooled worker deserializing this file.
+        self._load_worker = QBetseeSimConfLoadWorker(
+            p=self.p, conf_filename=load_filename)
+
+        # Connect all relevant signals emitted by this worker to slots.
+        self._load_worker.signals.succeeded.connect(self._handle_load_worker)
+        self._load_worker.signals.failed.connect(
+            self._handle_load_worker_failed)
+        self._load_worker.signals.finished.connect(
+            self._handle_load_worker_finished)
+
+        # Preserve this worker until finished *AND* start this worker.
+        self._load_workers.add(self._load_worker)
+        guipoolthread.start_worker(self._load_worker)
+
+
+    def _set_widgets_loading(self) -> None:
+        '''
+        Disable all widgets accessing the :attr:`p` singleton (excluding the
+        action opening simulation configurations, which supersedes the
+        current load) while that singleton is being deserialized.
+        '''
+
+        self._action_make_sim   .setEnabled(False)
+        self._action_close_sim  .setEnabled(False)
+        self._action_save_sim   .setEnabled(False)
+        self._action_save_sim_as.setEnabled(False)
+        self._sim_conf_stack     .setEnabled(False)
+        self._sim_conf_tree_frame.setEnabled(False)
+        self._sim_tab            .setEnabled(False)
+
+
+    def _finish_load_worker(self) -> bool:
+        '''
+        Finalize the deserialization performed by the current pooled worker,
+        starting a new worker deserializing the most recently requested file
+        if that deserialization has been superseded by such a request.
+
+        Returns
+        ----------
+        bool
+            ``True`` only if that deserialization has been superseded, in
+            which case the caller should silently discard its result.
+        '''
+
+        # This worker has now ceased accessing this configuration.
+        self._load_worker = None
+
+        # Re-enable the action creating simulation configurations.
+        self._action_make_sim.setEnabled(True)
+
+        # If no other file has since been requested, report this worker to
+        # *NOT* have been superseded.
+        if self._load_filename_pending is None:
+            return False
+        # Else, another file has since been requested.
+
+        # Filename of this file, which is no longer pending.
+        conf_filename = self._load_filename_pending
+        self._load_filename_pending = None
+
+        # Log this supersession.
+        logs.log_debug(
+            'Discarding simulation configuration "%s" load superseded by '
+            '"%s"...', self.p.conf_filename, conf_filename)
+
+        # Deserialize this file instead.
+        self._start_load_worker(conf_filename)
+
+        # Report this worker to have been superseded.
+        return True
+
+
+    # ..................{ SLOTS ~ load                      }..................
+    @Slot(object)
+    def _handle_load_worker(self, conf_filename: str) -> None:
+        '''
+        Slot signalled on the current pooled worker successfully deserializing
+        a file into the :attr:`p` singleton, updating relevant Qt objects in
+        response to this deserialization if *not* superseded.
+
+        Parameters
+        ----------
+        conf_filename : str
+            Absolute filename of the deserialized file.
+        '''
+
+        # If this deserialization has been superseded, discard this result.
+        if self._finish_load_worker():
+            return
+
+        # Hide indeterminate progress. Binding progress is subsequently
+        # displayed by the binder.
+        self._load_progress.hide()
+
+        # If an autosave journal was deserialized, associate this
+        # configuration with the file this journal was recorded for. Since
+        # this journal resides in the same directory as that file, all
+        # relative pathnames resolved on deserializing this journal remain
+        # valid.
+        journal_conf_filename = self._load_journal_filename
+        if journal_conf_filename is not None:
+            self._load_journal_filename = None
+            self.p._set_conf_filename(journal_conf_filename)
 
         # Update relevant Qt objects in response to this deserialization.
         self._handle_load()
 
+        # Track subsequent changes. Since the document model of this
+        # configuration was deserialized from this journal rather than this
+        # file if recovering a journal, these changes are then unpatchable
+        # into this file.
+        self.patcher.reset(is_patchable=journal_conf_filename is None)
+
+        # If an autosave journal was deserialized, mark all changes recorded
+        # by this journal as unsaved. Since neither the patcher nor this undo
+        # stack recorded these changes, both are permanently marked as unclean
+        # until the next save.
+        if journal_conf_filename is not None:
+            self.patcher.invalidate()
+            self.undo_stack.resetClean()
+            self.is_dirty = True
+
+            # Update the status bar *AFTER* successfully completing this
+            # action.
+            guiappstatus.show_status(QCoreApplication.translate(
+                'QBetseeSimConf', 'Simulation recovered.'))
+        # Else, update the status bar *AFTER* successfully completing this
+        # action.
+        else:
+            guiappstatus.show_status(QCoreApplication.translate(
+                'QBetseeSimConf', 'Simulation opened.'))
+
+
+    @Slot(Exception)
+    def _handle_load_worker_failed(self, exception: Exception) -> None:
+        '''
+        Slot signalled on the current pooled worker failing to deserialize a
+        file into the :attr:`p` singleton, reverting this configuration to the
+        unloaded state *and* reraising this exception if *not* superseded.
+
+        Parameters
+        ----------
+        exception : Exception
+            Exception raised by that worker.
+        '''
+
+        # If this deserialization has been superseded, discard this failure.
+        if self._finish_load_worker():
+            return
+
+        # Preserve the autosave journal that failed to be deserialized if any,
+        # which the user may still manually recover.
+        self._load_journal_filename = None
+
+        # Hide indeterminate progress.
+        self._load_progress.hide()
+        guiappstatus.clear_status()
+
+        # Revert this configuration to the unloaded state, as this
+        # deserialization may have been partially performed.
+        self.unload()
+
+        # Reraise this exception as a human-readable translated exception,
+        # displayed to the end user by the default exception handler.
+        raise BetseeSimConfException(
+            synopsis=QCoreApplication.translate(
+                'QBetseeSimConf', 'Simulation configuration unopenable:'),
+            exegesis=str(exception),
+        ) from exception
+
+
+    @Slot(bool)
+    def _handle_load_worker_finished(self, is_success: bool) -> None:
+        '''
+        Slot signalled on a pooled worker started by this configurator
+        finishing (either successfully or not), releasing that worker.
+
+        Parameters
+        ----------
+        is_success : bool
+            ``True`` only if that worker successfully deserialized its file.
+        '''
+
+        # Signals emitting this signal.
+        worker_signals = self.sender()
+
+        # For each unfinished worker, release the worker emitting this signal.
+        for worker in tuple(self._load_workers):
+            if worker.signals is worker_signals:
+                worker.delete_later()
+                self._load_workers.discard(worker)
+                break
+
 
     def _handle_load(self) -> None:
         '''
@@ -711,6 +1320,7 @@ class QBetseeSimConf(QBetseeControllerABC):
 
         # Revert this configuration to the unloaded state.
         self.p.unload()
+        self.patcher.reset(is_patchable=False)
 
         # Notify all interested slots of this event.
         #
@@ -735,7 +1345,9 @@ class QBetseeSimConf(QBetseeControllerABC):
 
         This method should typically be called immediately *before* the
         currently open simulation configuration (if any) is closed, preventing
-        unsaved changes from being irrevocably lost.
+        unsaved changes from being irrevocably lost. Since these changes are
+        written asynchronously, callers exiting this application should
+        subsequently call the :meth:`finalize_writes` method.
 
         Returns
         ----------
@@ -750,6 +1362,10 @@ class QBetseeSimConf(QBetseeControllerABC):
             * ``True`` in *all* other cases.
         '''
 
+        # Apply all pending edits to this configuration *BEFORE* testing
+        # whether this configuration is dirty.
+        self.flush_edits()
+
         # If this configuration is *NOT* dirty (i.e., has unsaved changes),
         # report success as no changes remain to be saved.
         if not self._is_dirty:
@@ -781,12 +1397,618 @@ class QBetseeSimConf(QBetseeControllerABC):
         if button_clicked == QMessageBox.Cancel:
             return False
 
-        # If the "Save" button was clicked, save these changes. Namely,
-        # reserialize this configuration back to the same file.
+        # If the "Save" button was clicked, save these changes. Namely, queue
+        # this configuration to be reserialized back to the same file.
         if button_clicked == QMessageBox.Save:
-            self.p.save_inplace()
+            self._queue_save(self.p.conf_filename)
         # Else, the "Discard" button was clicked. Discard these changes by
-        # doing absolutely nothing.
+        # discarding the autosave journal recording these changes if any.
+        else:
+            self._queue_journal_discard(self.p.conf_filename)
 
         # In either case, report success.
         return True
+
+
+    def save_if_dirty_before_run(self) -> bool:
+        '''
+        Write all unsaved changes for the currently open simulation
+        configuration to the external YAML-formatted file underlying this
+        configuration if this configuration is dirty (i.e., has unsaved
+        changes) *and* the user interactively confirms saving these changes
+        before running this configuration.
+
+        Design
+        ----------
+        Although low-level, this method is publicly accessible to permit the
+        simulator to guarantee that each simulation runs the file underlying
+        this configuration rather than unsaved in-memory changes, preserving
+        the reproducibility of all results exported by that simulation from
+        that file. Since these changes are written asynchronously, the
+        simulator should subsequently call the :meth:`wait_writes` method
+        *before* reading that file.
+
+        Returns
+        ----------
+        bool
+            Either:
+
+            * ``False`` only if this configuration is dirty and the user
+              cancels the dialog prompting for confirmation. In this case, the
+              caller should *not* run this configuration.
+            * ``True`` in *all* other cases.
+        '''
+
+        # Apply all pending edits to this configuration *BEFORE* testing
+        # whether this configuration is dirty.
+        self.flush_edits()
+
+        # If this configuration is *NOT* dirty (i.e., has unsaved changes),
+        # report success as no changes remain to be saved.
+        if not self._is_dirty:
+            return True
+        # Else, this configuration is dirty.
+
+        # Interactively prompt the user to save these changes and store the
+        # bit value of the "QMessageBox.StandardButton" enumeration member
+        # signifying the button clicked by the user. Since simulations run
+        # only saved configurations, these changes are *NOT* discardable here.
+        button_clicked = guimessage.show_warning(
+            title=QCoreApplication.translate(
+                'QBetseeSimConf', 'Unsaved Simulation Configuration'),
+            synopsis=QCoreApplication.translate(
+                'QBetseeSimConf',
+                'The currently open simulation configuration has '
+                'unsaved changes.'
+            ),
+            exegesis=QCoreApplication.translate(
+                'QBetseeSimConf',
+                'Simulations run the saved simulation configuration. '
+                'Would you like to save these changes and run this simulation?'
+            ),
+            buttons=QMessageBox.Save | QMessageBox.Cancel,
+            button_default=QMessageBox.Save,
+        )
+
+        # If the "Cancel" button was clicked, report failure.
+        if button_clicked == QMessageBox.Cancel:
+            return False
+        # Else, the "Save" button was clicked.
+
+        # Save these changes *AND* report success.
+        self._save_sim()
+        return True
+
+    # ..................{ WRITERS                           }..................
+    def finalize_writes(self) -> None:
+        '''
+        Cease periodically writing the autosave journal of the currently open
+        simulation configuration if any *and* block until all queued writes
+        have been performed.
+
+        Design
+        ----------
+        Although low-level, this method is publicly accessible to permit the
+        :class:`QBetseeMainWindow` class to guarantee that all saves queued
+        on window closure (e.g., by the user electing to save unsaved changes)
+        are written *before* this application exits.
+        '''
+
+        # Cease periodically writing this journal.
+        self._journal_timer.stop()
+
+        # Block until all queued writes have been performed.
+        self.wait_writes()
+
+
+    def wait_writes(self) -> None:
+        '''
+        Block until all queued writes have been performed, processing all
+        events excluding user input in the interim.
+
+        Design
+        ----------
+        Although low-level, this method is publicly accessible to permit the
+        simulator to guarantee that the file underlying the currently open
+        simulation configuration *and* all requisite subdirectories of that
+        file have been written before running that configuration. Unlike the
+        :meth:`finalize_writes` method, this method preserves the periodic
+        writing of the autosave journal.
+        '''
+
+        # If no writes are queued, reduce to a noop.
+        if not self.is_writing:
+            return
+
+        # Log this wait.
+        logs.log_info('Waiting for simulation configuration writes...')
+
+        # Process events until all queued writes have been performed. Since
+        # each pooled worker signals completion via queued signals handled by
+        # this event loop, merely sleeping here would deadlock. User input is
+        # excluded, preventing the user from modifying this configuration
+        # while waiting (e.g., by editing or closing this configuration).
+        while self.is_writing:
+            QCoreApplication.processEvents(
+                QEventLoop.ExcludeUserInputEvents |
+                QEventLoop.WaitForMoreEvents)
+
+
+    def _queue_save(
+        self,
+        conf_filename: str,
+        kind: SimConfWriteKind = SimConfWriteKind.SAVE,
+    ) -> None:
+        '''
+        Queue a job atomically serializing a snapshot of the currently open
+        simulation configuration to the YAML-formatted file with the passed
+        filename *and* discarding the autosave journal of this configuration.
+
+        Parameters
+        ----------
+        conf_filename : str
+            Absolute or relative filename of the target file, which is either
+            the current file associated with this configuration (i.e., "Save")
+            or an arbitrary file (i.e., "Save As..." or "New...").
+        kind : SimConfWriteKind
+            Type of this job, which is either :attr:`SimConfWriteKind.SAVE` or
+            :attr:`SimConfWriteKind.CREATE`. In the latter case, the source
+            file is the default simulation configuration, whose journal (which
+            should *never* exist) is preserved as is. Defaults to
+            :attr:`SimConfWriteKind.SAVE`.
+        '''
+
+        # Absolute filenames of the source and target files and dirnames of
+        # the directories containing these files, canonicalized to permit
+        # comparison below.
+        src_filename = self.p.conf_filename
+        trg_filename = pathnames.canonicalize(conf_filename)
+        src_dirname = pathnames.canonicalize(self.p.conf_dirname)
+        trg_dirname = pathnames.get_dirname(trg_filename)
+
+        # If these directories differ, the basenames of all requisite
+        # subdirectories of the source directory to be copied into the target
+        # directory. Note that this private method is the same method iterated
+        # by the Parameters.save() method; since that iteration must be
+        # performed on the main event thread, this method is called here.
+        subdir_basenames = ()
+        if src_dirname != trg_dirname:
+            subdir_basenames = tuple(self.p._iter_conf_subdir_basenames())
+
+        # Patches serializing only the options changed since the last save if
+        # these changes are patchable *OR* "None" otherwise.
+        patches = self.patcher.get_patches_or_none()
+
+        # Queue this snapshot to be serialized. If these changes are
+        # unpatchable, the full snapshot is serialized instead. Since this
+        # configuration is subsequently editable while this snapshot is still
+        # being serialized, this configuration is then deep-copied.
+        self._queue_write(SimConfWriteJob(
+            kind=kind,
+            filename=trg_filename,
+            container=(
+                copy.deepcopy(self.p.conf) if patches is None else None),
+            src_filename=src_filename,
+            subdir_basenames=subdir_basenames,
+            patches=patches,
+        ))
+
+        # Track subsequent changes. Since a full snapshot is serialized by a
+        # different formatter than the text of the original file, the
+        # document model of this configuration then no longer describes the
+        # text of this file and subsequent changes are unpatchable.
+        self.patcher.reset(is_patchable=patches is not None)
+
+        # Mark the current index of the undo stack as clean, such that undoing
+        # or redoing back to this index restores the saved state.
+        self.undo_stack.setClean()
+
+        # Queue the autosave journal of the source file to be discarded
+        # *AFTER* this snapshot has been serialized. Since writes are
+        # performed in the order queued, journals written after this save
+        # (i.e., recording subsequent changes) are preserved.
+        if kind is SimConfWriteKind.SAVE:
+            self._queue_journal_discard(src_filename)
+
+        # Rewrite the journal of this configuration on the next change.
+        self._journal_undo_index = None
+
+
+    def _queue_journal_discard(self, conf_filename: str) -> None:
+        '''
+        Queue a job removing the autosave journal of the simulation
+        configuration file with the passed filename if any.
+
+        Parameters
+        ----------
+        conf_filename : str
+            Absolute filename of this simulation configuration file.
+        '''
+
+        # Queue this journal to be removed.
+        self._queue_write(SimConfWriteJob(
+            kind=SimConfWriteKind.DISCARD,
+            filename=guisimconfsave.get_journal_filename(conf_filename),
+            container=None,
+            src_filename=None,
+            subdir_basenames=(),
+            patches=None,
+        ))
+
+        # If this journal was the most recently written journal, cease
+        # offering this journal for recovery on application startup.
+        if guisettings.get_setting_or_none(
+            JOURNAL_SETTING_NAME) == conf_filename:
+            guisettings.set_setting(
+                setting_name=JOURNAL_SETTING_NAME, setting_value='')
+
+
+    def _queue_write(self, job: SimConfWriteJob) -> None:
+        '''
+        Queue the passed job to be performed by a pooled worker *after* all
+        previously queued jobs have been performed.
+
+        Parameters
+        ----------
+        job : SimConfWriteJob
+            Job to be queued.
+        '''
+
+        # Discard all previously queued jobs (excluding the job currently
+        # being performed) superseded by this job.
+        self._write_jobs = [
+            job_queued for job_queued in self._write_jobs
+            if not guisimconfsave.is_write_job_superseded(
+                job_queued=job_queued, job=job)
+        ]
+
+        # True only if requisite subdirectories were being copied before
+        # queueing this job.
+        is_copying_old = self.is_copying
+
+        # Queue this job.
+        self._write_jobs.append(job)
+
+        # If no job is currently being performed, perform this job now.
+        if not self.is_writing:
+            self._start_write_worker()
+
+        # If this job is the first job copying requisite subdirectories,
+        # notify all interested slots of this event.
+        if not is_copying_old and self.is_copying:
+            self.set_copying_signal.emit(True)
+
+
+    def _start_write_worker(self) -> None:
+        '''
+        Start a pooled worker performing the first queued job.
+        '''
+
+        # Pooled worker performing the first queued job, dequeued.
+        self._write_worker = QBetseeSimConfWriteWorker(
+            job=self._write_jobs.pop(0))
+
+        # Connect all relevant signals emitted by this worker to slots.
+        self._write_worker.signals.succeeded.connect(self._handle_write_worker)
+        self._write_worker.signals.failed.connect(
+            self._handle_write_worker_failed)
+        self._write_worker.signals.finished.connect(
+            self._handle_write_worker_finished)
+
+        # If this job copies requisite subdirectories, report the progress of
+        # this copy in the status bar.
+        if self._write_worker.job.subdir_basenames:
+            self._write_worker.signals.progressed.connect(
+                self._handle_write_worker_progress)
+
+        # Preserve this worker until finished *AND* start this worker.
+        self._write_workers.add(self._write_worker)
+        guipoolthread.start_worker(self._write_worker)
+
+
+    def _finish_write_worker(self) -> None:
+        '''
+        Finalize the job performed by the current pooled worker, starting a
+        new worker performing the next queued job if any.
+        '''
+
+        # True only if requisite subdirectories were being copied before
+        # finalizing this job.
+        is_copying_old = self.is_copying
+
+        # This worker has now ceased writing.
+        self._write_worker = None
+
+        # If one or more jobs remain queued, perform the next such job.
+        if self._write_jobs:
+            self._start_write_worker()
+
+        # If this job was the last job copying requisite subdirectories,
+        # notify all interested slots of this event.
+        if is_copying_old and not self.is_copying:
+            self.set_copying_signal.emit(False)
+
+    # ..................{ SLOTS ~ write                     }..................
+    @Slot()
+    def _write_journal(self) -> None:
+        '''
+        Slot signalled on each timeout of the :attr:`_journal_timer`, queuing
+        a snapshot of the currently open simulation configuration to be
+        written to the autosave journal of this configuration if this
+        configuration is dirty *and* has changed since last journalled.
+        '''
+
+        # If no configuration is open or this configuration has no unsaved
+        # changes, silently noop.
+        if not (self.is_open and self._is_dirty):
+            return
+
+        # If this configuration has not changed since last journalled,
+        # silently noop.
+        undo_index = self.undo_stack.index()
+        if undo_index == self._journal_undo_index:
+            return
+        self._journal_undo_index = undo_index
+
+        # Log this journalling.
+        logs.log_debug(
+            'Journalling simulation configuration "%s"...', self.filename)
+
+        # Patches serializing only the options changed since the last save if
+        # these changes are patchable *OR* "None" otherwise.
+        patches = self.patcher.get_patches_or_none()
+
+        # Queue a snapshot of this configuration to be serialized to this
+        # journal, patched into the text of the saved file if feasible. Note
+        # that pending edits are intentionally *NOT* flushed, as doing so
+        # would interrupt the user's edit in progress; these edits are
+        # journalled on the next timeout instead.
+        self._queue_write(SimConfWriteJob(
+            kind=SimConfWriteKind.JOURNAL,
+            filename=guisimconfsave.get_journal_filename(self.filename),
+            container=(
+                copy.deepcopy(self.p.conf) if patches is None else None),
+            src_filename=self.filename,
+            subdir_basenames=(),
+            patches=patches,
+        ))
+
+        # Offer this journal for recovery on the next application startup.
+        guisettings.set_setting(
+            setting_name=JOURNAL_SETTING_NAME, setting_value=self.filename)
+
+
+    @Slot(object)
+    def _handle_write_worker(self, job: SimConfWriteJob) -> None:
+        '''
+        Slot signalled on the current pooled worker successfully performing
+        its job.
+
+        Parameters
+        ----------
+        job : SimConfWriteJob
+            Job performed by that worker.
+        '''
+
+        # Perform the next queued job if any.
+        self._finish_write_worker()
+
+        # If this job saved or created a configuration, update the status bar
+        # *AFTER* successfully completing this action.
+        if job.kind is SimConfWriteKind.SAVE:
+            guiappstatus.show_status(QCoreApplication.translate(
+                'QBetseeSimConf', 'Simulation saved.'))
+        elif job.kind is SimConfWriteKind.CREATE:
+            guiappstatus.show_status(QCoreApplication.translate(
+                'QBetseeSimConf', 'Simulation created.'))
+
+
+    @Slot(int)
+    def _handle_write_worker_progress(self, progress: int) -> None:
+        '''
+        Slot signalled on the current pooled worker copying requisite
+        subdirectories of the currently saved simulation configuration,
+        displaying the progress of this copy in the status bar.
+
+        Parameters
+        ----------
+        progress : int
+            Percentage of all bytes to be copied copied so far.
+        '''
+
+        guiappstatus.show_status(QCoreApplication.translate(
+            'QBetseeSimConf', 'Copying simulation data ({0}%)...').format(
+                progress))
+
+
+    @Slot(Exception)
+    def _handle_write_worker_failed(self, exception: Exception) -> None:
+        '''
+        Slot signalled on the current pooled worker failing to perform its
+        job, restoring the unsaved state of the currently open simulation
+        configuration *and* reraising this exception if that job saved this
+        configuration.
+
+        Parameters
+        ----------
+        exception : Exception
+            Exception raised by that worker.
+        '''
+
+        # Job performed by this worker.
+        job = self._write_worker.job
+
+        # If this job failed to patch changes into the saved file *AND* this
+        # job still pertains to the currently open configuration, serialize a
+        # full snapshot of this configuration instead *BEFORE* any other
+        # queued job (e.g., discarding the journal superseded by this save).
+        if (
+            isinstance(exception, BetseeSimConfPatchException) and
+            self._is_write_job_current(job)
+        ):
+            # Log this fallback.
+            logs.log_debug(
+                'Falling back to full simulation configuration write: %s',
+                exception)
+
+            # If this job saved this configuration, the full snapshot requeued
+            # below captures all changes made since this job was queued. These
+            # changes are then saved *AND* subsequent changes are unpatchable.
+            # Else, this job merely journalled this configuration, in which
+            # case the patcher remains unaffected.
+            if job.kind is SimConfWriteKind.SAVE:
+                self.patcher.reset(is_patchable=False)
+                self.undo_stack.setClean()
+                self.is_dirty = False
+
+            # Requeue this job with a full snapshot first.
+            self._write_jobs.insert(0, job._replace(
+                container=copy.deepcopy(self.p.conf), patches=None))
+            self._finish_write_worker()
+            return
+
+        # Perform the next queued job if any *BEFORE* reraising this exception
+        # below, as subsequent jobs are independent of this job.
+        self._finish_write_worker()
+
+        # If this job merely wrote or removed an autosave journal, log this
+        # failure as a non-fatal warning. Journals are a convenience; failing
+        # to write a journal should *NOT* interrupt the user.
+        if job.kind not in SAVE_WRITE_KINDS:
+            logs.log_warning(
+                'Simulation configuration journal "%s" unwritable: %s',
+                job.filename, exception)
+            return
+        # Else, this job saved or created a configuration.
+
+        # If the currently open configuration is the configuration this job
+        # failed to create, no prior file remains to associate this
+        # configuration with. Close this configuration, as if this
+        # configuration had never been opened.
+        if (self.is_open and self.filename == job.filename and
+            job.kind is SimConfWriteKind.CREATE):
+            self.unload()
+        # Else if the currently open configuration is the configuration this
+        # job failed to save, the changes captured by this job remain unsaved.
+        elif self.is_open and self.filename == job.filename:
+            # If this job saved this configuration to a different file (i.e.,
+            # "Save As..."), revert the association of this configuration
+            # with that file performed by the _save_sim_as() slot.
+            if job.src_filename != job.filename:
+                self.p._set_conf_filename(job.src_filename)
+                self.set_filename_signal.emit(self.p.conf_filename)
+
+            # Mark these changes as unsaved *AND* rewrite the journal of this
+            # configuration on the next timeout, as the journal recording
+            # these changes was discarded after this save was queued. Since
+            # the patcher ceased tracking these changes on queueing this save,
+            # subsequent changes are unpatchable.
+            self.patcher.invalidate()
+            self.undo_stack.resetClean()
+            self.is_dirty = True
+            self._journal_undo_index = None
+
+        # Clear the "Saving simulation..." status.
+        guiappstatus.clear_status()
+
+        # Reraise this exception as a human-readable translated exception,
+        # displayed to the end user by the default exception handler.
+        raise BetseeSimConfException(
+            synopsis=QCoreApplication.translate(
+                'QBetseeSimConf', 'Simulation configuration unsavable:'),
+            exegesis=str(exception),
+        ) from exception
+
+
+    def _is_write_job_current(self, job: SimConfWriteJob) -> bool:
+        '''
+        ``True`` only if the passed job writes either the file or autosave
+        journal associated with the currently open simulation configuration.
+        '''
+
+        return self.is_open and job.filename in (
+            self.filename,
+            guisimconfsave.get_journal_filename(self.filename),
+        )
+
+
+    @Slot(bool)
+    def _handle_write_worker_finished(self, is_success: bool) -> None:
+        '''
+        Slot signalled on a pooled write worker started by this configurator
+        finishing (either successfully or not), releasing that worker.
+
+        Parameters
+        ----------
+        is_success : bool
+            ``True`` only if that worker successfully performed its job.
+        '''
+
+        # Signals emitting this signal.
+        worker_signals = self.sender()
+
+        # For each unfinished worker, release the worker emitting this signal.
+        for worker in tuple(self._write_workers):
+            if worker.signals is worker_signals:
+                worker.delete_later()
+                self._write_workers.discard(worker)
+                break
+
+    # ..................{ RECOVERERS                        }..................
+    def get_journal_conf_filename_or_none(self) -> StrOrNoneTypes:
+        '''
+        Absolute filename of the simulation configuration file whose autosave
+        journal was most recently written by a prior instance of this
+        application if that journal is still recoverable (e.g., due to that
+        instance having crashed) *or* ``None`` otherwise.
+
+        Design
+        ----------
+        Although low-level, this method is publicly accessible to permit the
+        :class:`QBetseeMainWindow` class to offer this journal for recovery on
+        application startup.
+        '''
+
+        # Absolute filename of this file if any *OR* "None" otherwise.
+        conf_filename = guisettings.get_setting_or_none(JOURNAL_SETTING_NAME)
+
+        # Return this filename only if this journal is still recoverable.
+        return (
+            conf_filename
+            if conf_filename and guisimconfsave.is_journal_recoverable(
+                conf_filename) else
+            None
+        )
+
+
+    def _is_journal_recovery_confirmed(self, conf_filename: str) -> bool:
+        '''
+        ``True`` only if the user interactively confirms recovering the
+        autosave journal of the simulation configuration file with the passed
+        filename.
+
+        Parameters
+        ----------
+        conf_filename : str
+            Absolute filename of this simulation configuration file.
+        '''
+
+        # Interactively prompt the user to recover this journal and store the
+        # bit value of the "QMessageBox.StandardButton" enumeration member
+        # signifying the button clicked by the user.
+        button_clicked = guimessage.show_query(
+            title=QCoreApplication.translate(
+                'QBetseeSimConf', 'Recover Simulation Configuration'),
+            synopsis=QCoreApplication.translate(
+                'QBetseeSimConf',
+                'The simulation configuration "{0}" has unsaved changes '
+                'recorded before this application last exited unexpectedly.'
+            ).format(pathnames.get_basename(conf_filename)),
+            exegesis=QCoreApplication.translate(
+                'QBetseeSimConf', 'Would you like to recover these changes?'),
+            buttons=QMessageBox.Yes | QMessageBox.No,
+            button_default=QMessageBox.Yes,
+        )
+
+        # Return true only if the "Yes" button was clicked.
+        return button_clicked == QMessageBox.Yes
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+:mod:`PySide2`-based object binding editable simulation configuration widgets
+to the currently open simulation configuration in time-sliced batches.
+'''
+
+# ....................{ IMPORTS                           }....................
+from PySide2.QtCore import QObject, QTimer, Slot
+from PySide2.QtWidgets import QProgressBar
+from betse.util.io.log import logs
+from betse.util.type.types import type_check
+import time
+
+# ....................{ CONSTANTS                         }....................
+BIND_SLICE_MILLISECONDS = 8
+'''
+Maximum number of milliseconds that each batch of widget bindings performed by
+the :class:`QBetseeSimConfBinder` object blocks the main event loop for.
+
+This budget is roughly half of a single frame at 60Hz, ensuring that the GUI
+remains responsive while binding all widgets of a large configuration.
+'''
+
+# ....................{ CLASSES                           }....................
+class QBetseeSimConfBinder(QObject):
+    '''
+    :class:`QObject`-based **simulation configuration binder** (i.e., object
+    repopulating all editable simulation configuration widgets from the
+    currently open simulation configuration in time-sliced batches).
+
+    Previously, each such widget directly connected its
+    :meth:`QBetseeSimConfEditWidgetMixin._set_filename` slot to the
+    :attr:`QBetseeSimConf.set_filename_signal` signal. Emitting that signal
+    then synchronously repopulated *all* such widgets, blocking the main event
+    loop for the duration. Instead, each such widget now registers itself with
+    this binder, which repopulates these widgets in batches each blocking the
+    main event loop for at most :data:`BIND_SLICE_MILLISECONDS`.
+
+    Binding Order
+    ----------
+    Each batch first binds all unbound widgets that are currently visible
+    (e.g., on the currently displayed page of the top-level stack widget),
+    *then* binds unbound invisible widgets until the time budget of this batch
+    is exhausted. The page the user is viewing is thus always bound first,
+    even if the user switches pages while binding is underway.
+
+    Attributes
+    ----------
+    _bind_filename : str
+        Filename passed to the :meth:`bind` method on the most recent call to
+        that method, passed as is to the ``_set_filename`` slot of each widget.
+    _bind_timer : QTimer
+        Zero-timeout timer scheduling each batch of bindings *after* all
+        pending events (e.g., repaints, user input) have been processed.
+    _progress_bar : {QProgressBar, NoneType}
+        Progress bar displaying the number of widgets bound so far if any *or*
+        ``None`` otherwise.
+    _widgets : dict
+        Dictionary whose keys are all registered widgets in registration order
+        (i.e., an ordered set).
+    _widgets_unbound : list
+        List of all registered widgets yet to be bound to the simulation
+        configuration passed to the most recent call to the :meth:`bind`
+        method.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, *args, **kwargs) -> None:
+        '''
+        Initialize this binder.
+        '''
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+        # Nullify all remaining instance variables for safety.
+        self._bind_filename = ''
+        self._progress_bar = None
+        self._widgets = {}
+        self._widgets_unbound = []
+
+        # Zero-timeout timer scheduling each batch, whose parent is this
+        # binder. A zero timeout fires as soon as the event queue is empty.
+        self._bind_timer = QTimer(self)
+        self._bind_timer.setInterval(0)
+        self._bind_timer.timeout.connect(self._bind_batch)
+
+
+    @type_check
+    def init(self, progress_bar: QProgressBar) -> None:
+        '''
+        Finalize this binder's initialization.
+
+        Parameters
+        ----------
+        progress_bar : QProgressBar
+            Progress bar displaying the number of widgets bound so far.
+        '''
+
+        self._progress_bar = progress_bar
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def is_binding(self) -> bool:
+        '''
+        ``True`` only if one or more registered widgets have yet to be bound
+        to the simulation configuration passed to the most recent call to the
+        :meth:`bind` method.
+        '''
+
+        return bool(self._widgets_unbound)
+
+    # ..................{ REGISTRARS                        }..................
+    def register_widget(
+        self,
+        widget: 'betsee.gui.simconf.stack.widget.mixin.guisimconfwdgedit.'
+                'QBetseeSimConfEditWidgetMixin',
+    ) -> None:
+        '''
+        Register the passed editable simulation configuration widget with this
+        binder, repopulating this widget on each subsequent call to the
+        :meth:`bind` method.
+
+        Registering the same widget multiple times (e.g., due to a dynamic
+        widget being repeatedly reinitialized) is safe and reduces to a noop.
+        '''
+
+        self._widgets[widget] = None
+
+    # ..................{ BINDERS                           }..................
+    @type_check
+    def bind(self, filename: str) -> None:
+        '''
+        Schedule all registered widgets to be repopulated from the simulation
+        configuration with the passed filename in time-sliced batches,
+        discarding all bindings scheduled by prior calls to this method.
+
+        Parameters
+        ----------
+        filename : str
+            Either:
+
+            * If the user opened a new simulation configuration file, the
+              non-empty absolute filename of that file.
+            * If the user closed an open simulation configuration file, the
+              empty string.
+        '''
+
+        # Log this binding.
+        logs.log_debug(
+            'Scheduling %d simulation configuration widget bindings...',
+            len(self._widgets))
+
+        # Discard all prior bindings, which pertain to the prior simulation
+        # configuration if any, *AND* schedule all widgets to be bound.
+        self._bind_filename = filename
+        self._widgets_unbound = list(self._widgets)
+
+        # Display binding progress.
+        if self._progress_bar is not None:
+            self._progress_bar.setRange(0, len(self._widgets_unbound))
+            self._progress_bar.setValue(0)
+            self._progress_bar.setVisible(self.is_binding)
+
+        # Bind the first batch immediately, permitting the visible page to be
+        # populated *BEFORE* the next repaint, and all remaining batches as
+        # soon as the event queue is empty.
+        self._bind_batch()
+
+
+    def flush(self) -> None:
+        '''
+        Synchronously bind all registered widgets yet to be bound, typically
+        *before* reading the current values of these widgets (e.g., prior to
+        saving the current simulation configuration).
+        '''
+
+        # If all widgets have already been bound, reduce to a noop.
+        if not self.is_binding:
+            return
+
+        # Log this flush.
+        logs.log_debug(
+            'Flushing %d simulation configuration widget bindings...',
+            len(self._widgets_unbound))
+
+        # Bind all such widgets.
+        for widget in self._widgets_unbound:
+            widget._set_filename(self._bind_filename)
+        self._widgets_unbound = []
+
+        # Finalize this binding.
+        self._bind_done()
+
+
+    @Slot()
+    def _bind_batch(self) -> None:
+        '''
+        Slot signalled on each timeout of the :attr:`_bind_timer`, binding the
+        next batch of unbound widgets *and* rescheduling this slot if any
+        unbound widgets remain.
+        '''
+
+        # Monotonic time in fractional seconds at which this batch expires.
+        time_expired = time.monotonic() + BIND_SLICE_MILLISECONDS * 1e-3
+
+        # Partition all unbound widgets into visible and invisible widgets,
+        # preserving registration order within each partition.
+        widgets_visible = []
+        widgets_invisible = []
+        for widget in self._widgets_unbound:
+            if widget.isVisible():
+                widgets_visible.append(widget)
+            else:
+                widgets_invisible.append(widget)
+
+        # Bind all visible widgets regardless of this time budget, as the user
+        # is currently viewing these widgets.
+        for widget in widgets_visible:
+            widget._set_filename(self._bind_filename)
+
+        # Bind invisible widgets until this time budget is exhausted.
+        widget_index = 0
+        while (
+            widget_index < len(widgets_invisible) and
+            time.monotonic() < time_expired
+        ):
+            widgets_invisible[widget_index]._set_filename(self._bind_filename)
+            widget_index += 1
+
+        # Unbound widgets remaining for subsequent batches.
+        self._widgets_unbound = widgets_invisible[widget_index:]
+
+        # If one or more widgets remain unbound, update binding progress and
+        # schedule the next batch.
+        if self._widgets_unbound:
+            if self._progress_bar is not None:
+                self._progress_bar.setValue(
+                    len(self._widgets) - len(self._widgets_unbound))
+            self._bind_timer.start()
+        # Else, all widgets have been bound.
+        else:
+            self._bind_done()
+
+
+    def _bind_done(self) -> None:
+        '''
+        Finalize the binding of all registered widgets.
+        '''
+
+        # Log this completion.
+        logs.log_debug('Simulation configuration widgets bound.')
+
+        # Cease scheduling batches *AND* hide binding progress.
+        self._bind_timer.stop()
+        if self._progress_bar is not None:
+            self._progress_bar.hide()
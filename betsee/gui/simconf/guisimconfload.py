@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Simulation configuration loader** (i.e., pooled worker deserializing
+YAML-formatted simulation configuration files in a non-blocking manner)
+facilities.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.science.parameters import Parameters
+from betse.util.type.types import type_check
+from betsee.util.thread.pool.guipoolwork import QBetseeThreadPoolWorker
+
+# ....................{ CLASSES                           }....................
+class QBetseeSimConfLoadWorker(QBetseeThreadPoolWorker):
+    '''
+    **Simulation configuration loader** (i.e., pooled worker deserializing a
+    single YAML-formatted simulation configuration file into the high-level
+    simulation configuration singleton in a pooled thread).
+
+    Deserializing large configurations (e.g., configurations embedding
+    numerous tissue profiles or gene regulatory networks) is dominated by
+    YAML parsing, which previously blocked the main event loop for the
+    duration.
+
+    Return Value
+    ----------
+    On success, this worker emits the :attr:`signals.succeeded` signal with
+    the absolute filename of the deserialized file.
+
+    Caveats
+    ----------
+    **This worker mutates the passed simulation configuration in a pooled
+    thread.** Since that configuration is a singleton shared with the main
+    event thread, the caller is responsible for guaranteeing that the main
+    event thread neither reads nor writes that configuration until this
+    worker emits either the :attr:`signals.succeeded` or
+    :attr:`signals.failed` signals. The :class:`QBetseeSimConf` class does so
+    by starting at most one such worker at a time *and* disabling all widgets
+    accessing that configuration until that worker finishes.
+
+    Since YAML parsing is *not* interruptible, this worker is *not*
+    cancellable. Requests superseding this worker (e.g., the user opening
+    another file while this file is still being deserialized) are instead
+    deferred until this worker finishes, whereupon the result of this worker
+    is silently discarded.
+
+    Attributes
+    ----------
+    _conf_filename : str
+        Absolute filename of the file to be deserialized.
+    _p : Parameters
+        Simulation configuration singleton to deserialize this file into.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, p: Parameters, conf_filename: str) -> None:
+        '''
+        Initialize this simulation configuration loader.
+
+        Parameters
+        ----------
+        p : Parameters
+            Simulation configuration singleton to deserialize this file into.
+        conf_filename : str
+            Absolute filename of the file to be deserialized.
+        '''
+
+        # Initialize our superclass.
+        super().__init__()
+
+        # Classify all passed parameters.
+        self._p = p
+        self._conf_filename = conf_filename
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def conf_filename(self) -> str:
+        '''
+        Absolute filename of the file deserialized by this worker.
+        '''
+
+        return self._conf_filename
+
+    # ..................{ WORKERS                           }..................
+    def _work(self) -> str:
+
+        # Deserialize this low-level file into this high-level configuration.
+        self._p.load(self._conf_filename)
+
+        # Return this filename, identifying the request performed by this
+        # worker to slots connected to the "succeeded" signal.
+        return self._conf_filename
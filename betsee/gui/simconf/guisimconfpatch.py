@@ -0,0 +1,660 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Simulation configuration patcher** (i.e., object tracking the simulation
+configuration options changed since the last save at alias granularity *and*
+patching only these options into the YAML-formatted text of the saved file)
+facilities.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.util.io.log import logs
+from betse.util.type.iterable import tuples
+from betse.util.type.types import (
+    type_check, IterableTypes, SequenceOrNoneTypes)
+from betsee.guiexception import BetseeSimConfPatchException
+from contextlib import contextmanager
+from enum import Enum
+from io import StringIO
+
+# ....................{ CONSTANTS                         }....................
+PATCH_VALUE_TYPES = (bool, int, float, str)
+'''
+Tuple of all types of simulation configuration option values patchable into
+the YAML-formatted text of a saved file.
+
+Options of all other types (e.g., lists, mappings) are saved by rewriting the
+entire file instead.
+'''
+
+# ....................{ TYPES                             }....................
+SimConfPatch = tuples.make_named_subclass(
+    class_name='SimConfPatch',
+    item_names=(
+        'key',
+        'key_line',
+        'key_column',
+        'value_line',
+        'value_column',
+        'value_saved',
+        'value_new',
+    ),
+    doc='''
+    Named tuple describing the replacement of the value of a single scalar
+    simulation configuration option in the YAML-formatted text of a saved
+    file, created by the :meth:`SimConfPatcher.get_patches_or_none` method.
+
+    Attributes
+    ----------
+    key : str
+        Key of this option in its parent mapping.
+    key_line : int
+        0-based line number of this key in this text.
+    key_column : int
+        0-based column number of this key on this line.
+    value_line : int
+        0-based line number of the value of this option in this text.
+    value_column : int
+        0-based column number of this value on this line.
+    value_saved : object
+        Value of this option in this text (i.e., when last saved or loaded),
+        validated against this text *before* patching.
+    value_new : object
+        Value of this option to be patched into this text.
+    '''
+)
+
+# ....................{ CLASSES                           }....................
+class SimConfPatcher(object):
+    '''
+    **Simulation configuration patcher** (i.e., object tracking the simulation
+    configuration options changed since the last save at alias granularity).
+
+    Each editable scalar widget sets the simulation configuration option
+    edited by that widget through a YAML-backed expression alias. Each such
+    alias aliases a single key of a single mapping of the round-trippable
+    :mod:`ruamel.yaml` document model deserialized from the saved file, which
+    additionally records the line and column of that key and its value in
+    the text of that file. Saving these changes thus only requires replacing
+    the text of each changed value, an operation proportional to the number
+    of changes rather than the size of this document.
+
+    Since expression aliases do *not* publicly expose the keys they alias,
+    these keys are discovered by evaluating each alias against a probe
+    recording all keys looked up by that alias.
+
+    Patchability
+    ----------
+    This patcher falls back to rewriting the entire file (i.e., reports
+    these changes to be unpatchable) if *any* of the following conditions
+    apply since that file was loaded:
+
+    * A change was made without an alias (e.g., appending or removing a
+      tissue profile), whose extent this patcher cannot track.
+    * A change was made through an alias whose key this patcher failed to
+      discover or whose change this patcher failed to observe.
+    * This file was rewritten in its entirety, invalidating all recorded
+      lines and columns.
+
+    Clean State
+    ----------
+    Since each change restoring the saved value of an option (e.g., undoing
+    all prior edits of that option) forgets that option, the set of changed
+    options is empty *only* when the simulation configuration is identical to
+    the saved file. The :class:`QBetseeSimConf` class thus derives its dirty
+    state from this set in constant time rather than from the index of the
+    undo stack, which fails to detect redundant edits (e.g., editing an
+    option and then manually restoring its prior value). Untrackable changes
+    (i.e., any of the first two conditions above) conservatively report the
+    simulation configuration to be changed until the next save.
+
+    Attributes
+    ----------
+    _changes : dict
+        Dictionary mapping from the 2-tuple ``(id(mapping), key)`` uniquely
+        identifying each changed option to the 3-tuple ``(mapping, key,
+        value_saved)``, where ``mapping`` is the :mod:`ruamel.yaml` mapping
+        containing that option and ``value_saved`` the value of that option
+        when last saved.
+    _is_patchable : bool
+        ``True`` only if these changes are patchable into the saved file.
+    _is_trackable : bool
+        ``True`` only if these changes comprise *all* changes made since the
+        last save (i.e., no untrackable change has been made since then).
+    _revision : int
+        Number of changes to the simulation configuration observed by this
+        patcher. See the :attr:`revision` property.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self) -> None:
+        '''
+        Initialize this patcher.
+        '''
+
+        # Default this patcher to the unloaded state.
+        self._changes = {}
+        self._is_patchable = False
+        self._is_trackable = False
+        self._revision = 0
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def is_patchable(self) -> bool:
+        '''
+        ``True`` only if all changes tracked by this patcher are patchable
+        into the saved file.
+        '''
+
+        return self._is_patchable
+
+
+    @property
+    def is_changed(self) -> bool:
+        '''
+        ``True`` only if the simulation configuration differs from the saved
+        file *or* this patcher cannot decide whether this is the case (i.e.,
+        an untrackable change was made since the last call to the
+        :meth:`reset` method).
+
+        Since each tracked change restoring the saved value of an option
+        forgets that option, this property is decidable in constant time
+        regardless of the number or order of the edits and undos performed.
+        '''
+
+        return not self._is_trackable or bool(self._changes)
+
+
+    @property
+    def revision(self) -> int:
+        '''
+        Number of changes to the simulation configuration observed by this
+        patcher, incremented on each tracked change, untracked change, load,
+        and save.
+
+        Since every change to the simulation configuration passes through this
+        patcher, callers may cache values derived from that configuration
+        (e.g., hashes) keyed by this revision, recomputing these values only
+        when this revision differs from the revision these values were
+        computed at.
+        '''
+
+        return self._revision
+
+    # ..................{ RESETTERS                         }..................
+    @type_check
+    def reset(self, is_patchable: bool) -> None:
+        '''
+        Discard all tracked changes, typically on loading or saving the
+        simulation configuration.
+
+        Parameters
+        ----------
+        is_patchable : bool
+            ``True`` only if the saved file is the file the document model of
+            this configuration was deserialized from (or an exact patched
+            copy of that file), in which case the lines and columns recorded
+            by that model remain valid.
+        '''
+
+        self._changes = {}
+        self._is_patchable = is_patchable
+        self._is_trackable = True
+        self._revision += 1
+
+
+    def invalidate(self) -> None:
+        '''
+        Report all subsequent changes to be both unpatchable and untrackable
+        until the next call to the :meth:`reset` method, typically on a change
+        this patcher cannot track (e.g., appending or removing a list item).
+        '''
+
+        # Log this invalidation.
+        if self._is_patchable:
+            logs.log_debug(
+                'Disabling incremental simulation configuration saves...')
+
+        self._is_patchable = False
+        self._is_trackable = False
+        self._revision += 1
+
+    # ..................{ TRACKERS                          }..................
+    @contextmanager
+    def tracking_alias(self, alias_parent: object, alias: object):
+        '''
+        Context manager tracking the change to the simulation configuration
+        option aliased by the passed alias bound to the passed parent
+        performed by the body of the ``with`` statement using this context
+        manager.
+
+        Parameters
+        ----------
+        alias_parent : YamlABC
+            Simulation configuration or subconfiguration (e.g., tissue profile)
+            owning this alias.
+        alias : YamlAliasABC
+            Expression alias data descriptor setting this option.
+        '''
+
+        # Mapping and key of this option if discoverable *OR* "None".
+        mapping_key = _get_alias_mapping_key_or_none(
+            alias_parent=alias_parent, alias=alias)
+
+        # If this option is undiscoverable, perform this change untracked.
+        if mapping_key is None:
+            self.invalidate()
+            yield
+            self._revision += 1
+            return
+        # Else, this option is discoverable.
+
+        # Mapping and key of this option *AND* value of this option prior to
+        # this change.
+        mapping, key = mapping_key
+        value_old = mapping[key]
+
+        # Perform this change.
+        yield
+
+        # Value of this option subsequent to this change.
+        value_new = mapping.get(key)
+
+        # If this alias no longer evaluates to this value, this patcher
+        # misidentified this option. Since the option actually changed is
+        # unknown, these changes are now neither patchable nor trackable.
+        if not _is_alias_value(
+            alias_parent=alias_parent, alias=alias, value=value_new):
+            self.invalidate()
+            return
+        # Else, this alias evaluates to this value.
+
+        # If this option remains unchanged (e.g., due to a widget
+        # programmatically setting this option to its current value), this
+        # change is a noop. Ignore this change.
+        if type(value_new) is type(value_old) and value_new == value_old:
+            return
+        # Else, this option was changed.
+        self._revision += 1
+
+        # 2-tuple uniquely identifying this option.
+        change_key = (id(mapping), key)
+
+        # If this option was previously changed *AND* this change restores the
+        # saved value of this option (e.g., by undoing all prior changes to
+        # this option), this option is no longer changed. Forget this option.
+        if change_key in self._changes:
+            if _is_value_equal(value_new, self._changes[change_key][2]):
+                del self._changes[change_key]
+        # Else, this option was unchanged. Record this change, preserving the
+        # saved value of this option on successive changes.
+        else:
+            self._changes[change_key] = (mapping, key, value_old)
+
+    # ..................{ GETTERS                           }..................
+    def get_patches_or_none(self) -> SequenceOrNoneTypes:
+        '''
+        Tuple of one :class:`SimConfPatch` for each change tracked by this
+        patcher if these changes are patchable into the saved file *or*
+        ``None`` otherwise.
+
+        Since this tuple captures the current values of these options, this
+        tuple is safely passable to pooled threads while this configuration
+        continues to be edited.
+        '''
+
+        # If these changes are unpatchable, report this to be the case.
+        if not self._is_patchable:
+            return None
+
+        # Tuple of all patches to be returned.
+        patches = []
+
+        # For each tracked change...
+        for mapping, key, value_saved in self._changes.values():
+            # Value of this option to be patched.
+            value_new = mapping.get(key)
+
+            # If either value is non-scalar *OR* this mapping is flow-style
+            # (i.e., embeds multiple keys on the same line), this change is
+            # unpatchable.
+            if not (
+                isinstance(value_saved, PATCH_VALUE_TYPES) and
+                isinstance(value_new, PATCH_VALUE_TYPES) and
+                not mapping.fa.flow_style()
+            ):
+                return None
+
+            # Lines and columns of this key and value in the saved file. If
+            # this key was added after loading (and hence has no position),
+            # this change is unpatchable.
+            try:
+                key_line, key_column = mapping.lc.key(key)
+                value_line, value_column = mapping.lc.value(key)
+            except (KeyError, TypeError):
+                return None
+
+            # Describe this change as a patch.
+            patches.append(SimConfPatch(
+                key=key,
+                key_line=key_line,
+                key_column=key_column,
+                value_line=value_line,
+                value_column=value_column,
+                value_saved=value_saved,
+                value_new=value_new,
+            ))
+
+        # Return these patches as a tuple.
+        return tuple(patches)
+
+# ....................{ PATCHERS                          }....................
+@type_check
+def patch_text(text: str, patches: IterableTypes) -> str:
+    '''
+    Patch the passed YAML-formatted text of a saved simulation configuration
+    file with the passed patches.
+
+    This function is safely callable from pooled threads.
+
+    Parameters
+    ----------
+    text : str
+        YAML-formatted text to be patched.
+    patches : IterableTypes
+        Iterable of :class:`SimConfPatch` instances to be applied.
+
+    Returns
+    ----------
+    str
+        Patched YAML-formatted text.
+
+    Raises
+    ----------
+    BetseeSimConfPatchException
+        If this text no longer contains the key or saved value of any patch
+        at the recorded line and column (e.g., due to this file having been
+        externally modified), in which case the caller should rewrite this
+        file in its entirety instead.
+    '''
+
+    # Avoid circular import dependencies.
+    from ruamel.yaml import YAML
+
+    # Lines of this text, each suffixed by its original newline if any.
+    lines = text.splitlines(keepends=True)
+
+    # Safe parser validating saved values *AND* roundtripping parser
+    # formatting new values.
+    yaml_safe = YAML(typ='safe')
+    yaml_format = YAML()
+    yaml_format.width = 4096
+
+    # Set of the line numbers of all values patched so far.
+    value_lines_patched = set()
+
+    # For each patch...
+    for patch in patches:
+        # If this line does *NOT* exist or was already patched (implying two
+        # values to reside on the same line), this text is unpatchable.
+        if not (
+            patch.key_line < len(lines) and
+            patch.value_line < len(lines) and
+            patch.value_line not in value_lines_patched
+        ):
+            _die_unpatchable(patch, 'line not found')
+        value_lines_patched.add(patch.value_line)
+
+        # If the key of this option is *NOT* at the expected position,
+        # this text is unpatchable.
+        key_text = lines[patch.key_line][patch.key_column:].lstrip('\'"')
+        if not key_text.startswith(str(patch.key)):
+            _die_unpatchable(patch, 'key not found')
+
+        # Line containing this value excluding its newline *AND* this newline.
+        line = lines[patch.value_line]
+        line_body = line.rstrip('\r\n')
+        line_newline = line[len(line_body):]
+
+        # 0-based column of the first character following this value.
+        value_column_end = _get_scalar_end(line_body, patch.value_column)
+
+        # Saved value, parsed from this text.
+        try:
+            value_saved = yaml_safe.load(
+                line_body[patch.value_column:value_column_end])
+        except Exception:
+            _die_unpatchable(patch, 'value unparsable')
+
+        # If this value differs from the expected saved value, this text is
+        # unpatchable.
+        if not _is_value_equal(value_saved, patch.value_saved):
+            _die_unpatchable(patch, 'value {!r} not {!r}'.format(
+                value_saved, patch.value_saved))
+
+        # Patch this line with this new value.
+        lines[patch.value_line] = (
+            line_body[:patch.value_column] +
+            _format_scalar(yaml_format, patch) +
+            line_body[value_column_end:] +
+            line_newline
+        )
+
+    # Return this patched text.
+    return ''.join(lines)
+
+# ....................{ PRIVATE ~ getters                 }....................
+_alias_keys_cache = {}
+'''
+Dictionary mapping from each expression alias probed by the
+:func:`_get_alias_keys_or_none` function to the tuple of keys aliased by that
+alias if discoverable *or* ``None`` otherwise.
+'''
+
+
+def _get_alias_mapping_key_or_none(
+    alias_parent: object, alias: object) -> SequenceOrNoneTypes:
+    '''
+    2-tuple ``(mapping, key)`` of the :mod:`ruamel.yaml` mapping and key of the
+    simulation configuration option aliased by the passed alias bound to the
+    passed parent if discoverable *or* ``None`` otherwise.
+    '''
+
+    # Keys aliased by this alias if discoverable *OR* "None" otherwise.
+    keys = _get_alias_keys_or_none(alias)
+    if keys is None:
+        return None
+
+    # Mapping containing this option, found by looking up all keys except the
+    # last from the document model underlying this parent.
+    mapping = alias_parent.conf
+    try:
+        for key in keys[:-1]:
+            mapping = mapping[key]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+    # If this is *NOT* a roundtripped mapping containing this key, this
+    # option is undiscoverable.
+    if not (hasattr(mapping, 'lc') and hasattr(mapping, 'fa') and
+            keys[-1] in mapping):
+        return None
+
+    # Return this mapping and key.
+    return mapping, keys[-1]
+
+
+def _get_alias_keys_or_none(alias: object) -> SequenceOrNoneTypes:
+    '''
+    Tuple of all keys successively looked up by the passed expression alias
+    if discoverable *or* ``None`` otherwise, cached on the first call.
+    '''
+
+    # If this alias has already been probed, return the cached result.
+    if alias in _alias_keys_cache:
+        return _alias_keys_cache[alias]
+
+    # List of all keys looked up by this alias.
+    keys = []
+
+    # Evaluate this alias against a probe recording these keys. Since the
+    # value this alias evaluates to is a probe rather than a valid value,
+    # this alias typically raises a type exception after these lookups.
+    try:
+        alias.__get__(_AliasProbe(keys), None)
+    except Exception:
+        pass
+
+    # If this alias looked up one or more string keys, these keys are
+    # discoverable; else, these keys are undiscoverable.
+    keys = (
+        tuple(keys)
+        if keys and all(isinstance(key, str) for key in keys) else
+        None
+    )
+
+    # Cache and return these keys.
+    _alias_keys_cache[alias] = keys
+    return keys
+
+
+def _get_scalar_end(line: str, column: int) -> int:
+    '''
+    0-based column of the first character following the YAML scalar starting
+    at the passed column of the passed line, excluding trailing comments and
+    whitespace.
+    '''
+
+    # First character of this scalar.
+    quote = line[column:column + 1]
+
+    # If this scalar is single-quoted, find the closing quote, skipping all
+    # escaped quotes (i.e., pairs of single quotes).
+    if quote == "'":
+        index = column + 1
+        while index < len(line):
+            if line[index] == "'":
+                if line[index + 1:index + 2] == "'":
+                    index += 2
+                    continue
+                return index + 1
+            index += 1
+        return len(line)
+    # If this scalar is double-quoted, find the closing quote, skipping all
+    # backslash-escaped characters.
+    elif quote == '"':
+        index = column + 1
+        while index < len(line):
+            if line[index] == '\\':
+                index += 2
+                continue
+            if line[index] == '"':
+                return index + 1
+            index += 1
+        return len(line)
+
+    # Else, this scalar is plain and hence terminated by either a comment
+    # (i.e., a "#" preceded by whitespace) or the end of this line.
+    comment_index = line.find(' #', column)
+    if comment_index == -1:
+        comment_index = len(line)
+    return len(line[:comment_index].rstrip())
+
+# ....................{ PRIVATE ~ testers                 }....................
+def _is_alias_value(
+    alias_parent: object, alias: object, value: object) -> bool:
+    '''
+    ``True`` only if the passed expression alias bound to the passed parent
+    evaluates to the passed low-level option value.
+
+    Since aliases may cast this value (e.g., enumeration aliases mapping
+    lowercase strings to enumeration members), these casts are reversed.
+    '''
+
+    # Value this alias evaluates to if evaluable *OR* fail otherwise.
+    try:
+        alias_value = alias.__get__(alias_parent, None)
+    except Exception:
+        return False
+
+    # If this alias evaluates to an enumeration member, compare this value
+    # against the lowercase name of this member.
+    if isinstance(alias_value, Enum):
+        return isinstance(value, str) and alias_value.name.lower() == value
+
+    # Else, compare this value against the value of this alias as is.
+    return _is_value_equal(alias_value, value)
+
+
+def _is_value_equal(value_a: object, value_b: object) -> bool:
+    '''
+    ``True`` only if the passed option values are equal, distinguishing
+    booleans from equal numbers (e.g., ``True`` from ``1``) but *not* integers
+    from equal floats (e.g., ``1`` from ``1.0``).
+    '''
+
+    return (
+        value_a == value_b and
+        isinstance(value_a, bool) == isinstance(value_b, bool))
+
+# ....................{ PRIVATE ~ formatters              }....................
+def _format_scalar(yaml_format: object, patch: SimConfPatch) -> str:
+    '''
+    YAML-formatted text of the new value of the passed patch, formatted by the
+    passed roundtripping :mod:`ruamel.yaml` parser.
+    '''
+
+    # Serialize this value as the value of a single-key block mapping.
+    text_stream = StringIO()
+    yaml_format.dump({'_': patch.value_new}, text_stream)
+    text = text_stream.getvalue()
+
+    # If this value spans multiple lines, this value is unpatchable.
+    if not text.startswith('_: ') or text.count('\n') != 1:
+        _die_unpatchable(patch, 'value {!r} multiline'.format(
+            patch.value_new))
+
+    # Return this value's text.
+    return text[3:].rstrip('\n')
+
+# ....................{ PRIVATE ~ exceptions              }....................
+def _die_unpatchable(patch: SimConfPatch, reason: str) -> None:
+    '''
+    Raise an exception describing the passed patch to be unpatchable for the
+    passed reason.
+    '''
+
+    raise BetseeSimConfPatchException(
+        'Simulation configuration option "{}" on line {} unpatchable '
+        '({}).'.format(patch.key, patch.value_line + 1, reason))
+
+# ....................{ PRIVATE ~ classes                 }....................
+class _AliasProbe(object):
+    '''
+    Object standing in for the parent simulation configuration of an
+    expression alias, recording all keys looked up by that alias.
+
+    YAML-backed expression aliases evaluate expressions of the form
+    ``self._conf['key1']['key2']``, looking up these keys into the ``_conf``
+    attribute of their parent.
+    '''
+
+    def __init__(self, keys: list) -> None:
+        self._conf = _KeyRecorder(keys)
+
+
+class _KeyRecorder(object):
+    '''
+    Object recording each key looked up by subscripting this object into the
+    passed list *and* returning another such object.
+    '''
+
+    def __init__(self, keys: list) -> None:
+        self._keys = keys
+
+    def __getitem__(self, key: object) -> '_KeyRecorder':
+        self._keys.append(key)
+        return _KeyRecorder(self._keys)
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Simulation configuration writer** (i.e., pooled worker serializing
+snapshots of simulation configurations to YAML-formatted files in a
+non-blocking manner) facilities.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.lib.yaml import yamls
+from betse.util.io.log import logs
+from betse.util.path import pathnames
+from betse.util.type.enums import make_enum
+from betse.util.type.iterable import tuples
+from betse.util.type.types import type_check
+from betsee.guiexception import BetseeSimConfPatchException
+from betsee.gui.simconf import guisimconfpatch
+from betsee.util.path import guidircopy
+from betsee.util.path.guifileatomic import writing_file_atomic
+from betsee.util.thread.pool.guipoolwork import QBetseeThreadPoolWorker
+import os
+
+# ....................{ CONSTANTS                         }....................
+JOURNAL_INTERVAL_MILLISECONDS = 30000
+'''
+Number of milliseconds between successive snapshots of the currently open
+simulation configuration written to its autosave journal while that
+configuration has unsaved changes.
+'''
+
+
+JOURNAL_BASENAME_SUFFIX = '.autosave'
+'''
+Substring inserted between the stem and filetype of the basename of each
+simulation configuration file to produce the basename of the autosave journal
+of that file (e.g., from ``sim_config.yaml`` to
+``.sim_config.autosave.yaml``).
+'''
+
+# ....................{ ENUMS                             }....................
+SimConfWriteKind = make_enum(
+    class_name='SimConfWriteKind',
+    member_names=('SAVE', 'CREATE', 'JOURNAL', 'DISCARD',),
+    doc='''
+    Enumeration of all supported types of **simulation configuration write**
+    (i.e., filesystem operation performed by a single
+    :class:`QBetseeSimConfWriteWorker`).
+
+    Attributes
+    ----------
+    SAVE : enum
+        **Save,** atomically serializing a configuration snapshot to the
+        user-selected simulation configuration file *and* copying all
+        requisite subdirectories of the source configuration into the
+        directory of that file if these directories differ.
+    CREATE : enum
+        **Create,** performing the same operation as :attr:`SAVE` for a
+        configuration newly copied from the default simulation configuration
+        (i.e., "New..."). Unlike failed saves, failed creations leave no
+        prior file to revert that configuration to.
+    JOURNAL : enum
+        **Journal,** atomically serializing a configuration snapshot to the
+        autosave journal of a simulation configuration file.
+    DISCARD : enum
+        **Discard,** removing the autosave journal of a simulation
+        configuration file if any.
+    ''',
+)
+
+# ....................{ SETS                              }....................
+SAVE_WRITE_KINDS = frozenset((SimConfWriteKind.SAVE, SimConfWriteKind.CREATE))
+'''
+Frozen set of all types of simulation configuration write serializing a
+configuration snapshot to a user-selected simulation configuration file (as
+opposed to an autosave journal), whose failure is reported to the user.
+'''
+
+# ....................{ TYPES                             }....................
+SimConfWriteJob = tuples.make_named_subclass(
+    class_name='SimConfWriteJob',
+    item_names=(
+        'kind',
+        'filename',
+        'container',
+        'src_filename',
+        'subdir_basenames',
+        'patches',
+    ),
+    doc='''
+    Named tuple describing a single filesystem operation to be performed by a
+    :class:`QBetseeSimConfWriteWorker`.
+
+    Attributes
+    ----------
+    kind : SimConfWriteKind
+        Type of this operation.
+    filename : str
+        Absolute filename of the file to be written or removed.
+    container : MappingOrSequenceTypes
+        If this operation serializes a full snapshot, a deep copy of the
+        low-level container underlying the simulation configuration to be
+        serialized taken on the main event thread; else, ``None``. Since this
+        copy is shared with no other object, the main event thread is free to
+        continue editing that configuration while this copy is serialized.
+    src_filename : StrOrNoneTypes
+        If this operation is :attr:`SimConfWriteKind.SAVE`,
+        :attr:`SimConfWriteKind.CREATE`, or :attr:`SimConfWriteKind.JOURNAL`,
+        the absolute filename of the
+        simulation configuration file this snapshot was loaded from (i.e., the
+        file associated with that configuration *before* this save); else,
+        ``None``.
+    subdir_basenames : tuple
+        Tuple of the basenames of all requisite subdirectories of the
+        directory containing the ``src_filename`` file to be recursively
+        copied into the directory containing this file. If this operation is
+        neither :attr:`SimConfWriteKind.SAVE` nor
+        :attr:`SimConfWriteKind.CREATE` or these directories are the same,
+        this tuple is empty.
+    patches : SequenceOrNoneTypes
+        If this operation serializes only the options changed since the
+        ``src_filename`` file was last saved, the tuple of
+        :class:`guisimconfpatch.SimConfPatch` instances patching these changes
+        into the text of that file; else, ``None``.
+    '''
+)
+
+# ....................{ GETTERS                           }....................
+@type_check
+def get_journal_filename(conf_filename: str) -> str:
+    '''
+    Absolute filename of the **autosave journal** (i.e., hidden sibling file
+    periodically snapshotting unsaved changes) of the simulation configuration
+    file with the passed filename.
+
+    Since this journal resides in the same directory as this file, all
+    relative pathnames embedded in this journal remain valid on recovering
+    this journal.
+
+    Parameters
+    ----------
+    conf_filename : str
+        Absolute filename of this simulation configuration file.
+
+    Returns
+    ----------
+    str
+        Absolute filename of this journal.
+    '''
+
+    # Absolute dirname, stem, and filetype of this file.
+    conf_dirname = os.path.dirname(conf_filename)
+    conf_stem, conf_filetype = os.path.splitext(
+        os.path.basename(conf_filename))
+
+    # Return this journal's filename, prefixed by "." to hide this journal
+    # under POSIX-compatible platforms.
+    return pathnames.join(
+        conf_dirname,
+        '.' + conf_stem + JOURNAL_BASENAME_SUFFIX + conf_filetype)
+
+# ....................{ TESTERS                           }....................
+@type_check
+def is_journal_recoverable(conf_filename: str) -> bool:
+    '''
+    ``True`` only if the autosave journal of the simulation configuration file
+    with the passed filename exists *and* is at least as recent as this file
+    (i.e., this journal records changes not saved to this file).
+
+    Parameters
+    ----------
+    conf_filename : str
+        Absolute filename of this simulation configuration file.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this journal is recoverable.
+    '''
+
+    # Absolute filename of this journal.
+    journal_filename = get_journal_filename(conf_filename)
+
+    # If this journal does *NOT* exist, this journal is unrecoverable.
+    if not os.path.isfile(journal_filename):
+        return False
+    # Else, this journal exists.
+
+    # If this file no longer exists, this journal is the only remaining copy
+    # of this configuration and hence recoverable.
+    if not os.path.isfile(conf_filename):
+        return True
+    # Else, this file still exists.
+
+    # Return true only if this journal was modified no earlier than this file.
+    # Journals older than this file are stale leftovers of changes since
+    # saved by another process (e.g., an external editor).
+    return os.path.getmtime(journal_filename) >= os.path.getmtime(
+        conf_filename)
+
+
+@type_check
+def is_write_job_superseded(
+    job_queued: SimConfWriteJob, job: SimConfWriteJob) -> bool:
+    '''
+    ``True`` only if the passed previously queued job is superseded by the
+    passed subsequently queued job and hence safely discardable *without*
+    being performed.
+
+    A queued job is superseded by a subsequent job writing or removing the
+    same file *unless* the queued job either:
+
+    * Saves and additionally copies subdirectories, as the subsequent job may
+      copy no subdirectories.
+    * Patches the text of the file written by a prior job while the subsequent
+      job also patches. Since the patcher is reset on each save, the patches
+      of a subsequent save only record changes made since the queued save and
+      hence assume the file written by the queued save. Discarding the queued
+      save would silently discard all changes recorded only by its patches.
+      Since a full snapshot records all changes, a subsequent job serializing
+      a full snapshot safely supersedes a queued patching job.
+
+    Parameters
+    ----------
+    job_queued : SimConfWriteJob
+        Previously queued job *not* yet being performed.
+    job : SimConfWriteJob
+        Subsequently queued job.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if the former job is superseded by the latter job.
+    '''
+
+    return (
+        job_queued.filename == job.filename and (
+            job_queued.kind not in SAVE_WRITE_KINDS or
+            not job_queued.subdir_basenames
+        ) and (
+            job_queued.patches is None or
+            job.patches is None
+        )
+    )
+
+# ....................{ CLASSES                           }....................
+class QBetseeSimConfWriteWorker(QBetseeThreadPoolWorker):
+    '''
+    **Simulation configuration writer** (i.e., pooled worker performing a
+    single filesystem operation on a simulation configuration file or its
+    autosave journal in a pooled thread).
+
+    Previously, saving a simulation configuration serialized that
+    configuration (and, on "Save As...", copied all requisite subdirectories
+    of that configuration) on the main event thread, blocking the GUI for the
+    duration on slow filesystems (e.g., network-mounted home directories).
+    Instead, the :class:`QBetseeSimConf` class snapshots that configuration on
+    the main event thread *and* queues a job serializing that snapshot to be
+    performed by this worker.
+
+    Patching
+    ----------
+    If the job performed by this worker provides patches rather than a full
+    snapshot, this worker patches these changes into the text of the source
+    file instead, preserving that text (including comments, whitespace, and
+    numeric formatting) verbatim elsewhere. If that text no longer matches
+    these patches (e.g., due to that file having been externally modified),
+    this worker raises a :class:`BetseeSimConfPatchException` without writing
+    anything, in which case the caller should queue a full snapshot instead.
+
+    Copying
+    ----------
+    Requisite subdirectories (e.g., geometry images, pickled data) are copied
+    by the :func:`guidircopy.copy_dirs_into_dir` function, which either
+    reflinks or streams each file in parallel by the cheapest means
+    supported by the underlying filesystems. Since these subdirectories
+    commonly comprise hundreds of megabytes, this worker emits the
+    :attr:`signals.progressed` signal with the percentage of bytes copied so
+    far in the range emitted by the :attr:`signals.progress_ranged` signal.
+
+    Atomicity
+    ----------
+    Each file is serialized to a temporary file in the same directory, which
+    is flushed to disk *and* then atomically renamed over the target file.
+    Crashes (e.g., power loss) at any point thus preserve either the prior or
+    current contents of that file, but never a truncated mixture of the two.
+
+    Return Value
+    ----------
+    On success, this worker emits the :attr:`signals.succeeded` signal with
+    the :class:`SimConfWriteJob` performed by this worker.
+
+    Caveats
+    ----------
+    **Jobs writing the same files must be serialized.** The
+    :class:`QBetseeSimConf` class does so by starting at most one such worker
+    at a time in the order these jobs were queued.
+
+    Attributes
+    ----------
+    _job : SimConfWriteJob
+        Job performed by this worker.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, job: SimConfWriteJob) -> None:
+        '''
+        Initialize this simulation configuration writer.
+
+        Parameters
+        ----------
+        job : SimConfWriteJob
+            Job performed by this worker.
+        '''
+
+        # Initialize our superclass.
+        super().__init__()
+
+        # Classify all passed parameters.
+        self._job = job
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def job(self) -> SimConfWriteJob:
+        '''
+        Job performed by this worker.
+        '''
+
+        return self._job
+
+    # ..................{ WORKERS                           }..................
+    def _work(self) -> SimConfWriteJob:
+
+        # If this job removes an autosave journal, do so if this journal
+        # exists and return this job.
+        if self._job.kind is SimConfWriteKind.DISCARD:
+            logs.log_debug(
+                'Removing simulation configuration journal "%s"...',
+                self._job.filename)
+            if os.path.isfile(self._job.filename):
+                os.remove(self._job.filename)
+            return self._job
+        # Else, this job serializes a configuration snapshot.
+
+        # If this job patches the source file, patch the text of this file
+        # *BEFORE* creating the temporary file, preserving the target file if
+        # this text is unpatchable.
+        text_patched = None
+        if self._job.patches is not None:
+            logs.log_debug(
+                'Patching %d simulation configuration option(s) into "%s"...',
+                len(self._job.patches), self._job.filename)
+            text_patched = self._patch_src_file()
+        # Else, this job serializes a full snapshot.
+        else:
+            logs.log_debug(
+                'Writing simulation configuration "%s"...', self._job.filename)
+
+        # Serialize this snapshot to a temporary file, which the
+        # writing_file_atomic() context manager flushes to disk *BEFORE*
+        # atomically renaming this file over the target file.
+        with writing_file_atomic(self._job.filename) as filename_temp:
+            if text_patched is None:
+                yamls.save(
+                    container=self._job.container,
+                    filename=filename_temp,
+                    is_overwritable=True,
+                )
+            else:
+                with open(
+                    filename_temp, 'w', encoding='utf-8', newline='',
+                ) as file_temp:
+                    file_temp.write(text_patched)
+
+        # If this job copies requisite subdirectories, do so.
+        if self._job.subdir_basenames:
+            self._copy_subdirs()
+
+        # Return this job, identifying the request performed by this worker
+        # to slots connected to the "succeeded" signal.
+        return self._job
+
+
+    def _copy_subdirs(self) -> None:
+        '''
+        Recursively copy all requisite subdirectories of the directory
+        containing the source file of this job into the directory containing
+        the target file of this job, emitting progress while doing so.
+        '''
+
+        # Absolute dirnames of the directories containing the source and
+        # target files.
+        src_dirname = os.path.dirname(self._job.src_filename)
+        trg_dirname = os.path.dirname(self._job.filename)
+
+        # Log this copy.
+        logs.log_debug(
+            'Copying simulation configuration subdirectories "%s" -> "%s"...',
+            src_dirname, trg_dirname)
+
+        # Report progress as the percentage of bytes copied so far.
+        self.signals.emit_progress_range(progress_min=0, progress_max=100)
+
+        # Recursively copy from the old into the new subdirectories, mimicking
+        # the Parameters.save() method. Since the user has already
+        # interactively confirmed overwriting the target file, silently
+        # overwrite all existing target subdirectories as well.
+        guidircopy.copy_dirs_into_dir(
+            src_dirnames=tuple(
+                pathnames.join(src_dirname, subdir_basename)
+                for subdir_basename in self._job.subdir_basenames
+            ),
+            trg_dirname=trg_dirname,
+
+            # Ignore all empty ".gitignore" placeholder files.
+            ignore_basename_globs=('.gitignore',),
+            progress_callback=self._emit_copy_progress,
+        )
+
+
+    def _emit_copy_progress(
+        self, byte_count_copied: int, byte_count_total: int) -> None:
+        '''
+        Emit the percentage of the passed total number of bytes to be copied
+        by the :meth:`_copy_subdirs` method copied so far.
+        '''
+
+        self.signals.emit_progress(progress=(
+            100 * byte_count_copied // byte_count_total
+            if byte_count_total else 100))
+
+
+    def _patch_src_file(self) -> str:
+        '''
+        Text of the source file of this job patched by the patches of this job.
+
+        Raises
+        ----------
+        BetseeSimConfPatchException
+            If this file is unreadable or unpatchable.
+        '''
+
+        # Text of this file, preserving newlines verbatim.
+        try:
+            with open(
+                self._job.src_filename, 'r', encoding='utf-8', newline='',
+            ) as src_file:
+                text = src_file.read()
+        except (OSError, UnicodeDecodeError) as exception:
+            raise BetseeSimConfPatchException(
+                'Simulation configuration "{}" unreadable: {}'.format(
+                    self._job.src_filename, exception)) from exception
+
+        # Return this text patched.
+        return guisimconfpatch.patch_text(text, self._job.patches)
@@ -35,7 +35,7 @@
 #for this undo stack to explicitly do so as well.
 
 # ....................{ IMPORTS                           }....................
-from PySide2.QtCore import QCoreApplication, QSize  # Signal, Slot
+from PySide2.QtCore import QCoreApplication, QSize, Slot  # Signal
 from PySide2.QtGui import QIcon, QKeySequence
 from PySide2.QtWidgets import QUndoCommand, QUndoStack
 from betse.util.io.log import logs
@@ -167,6 +167,17 @@ class QBetseeSimConfUndoStack(QUndoStack):
         self._undo_action.setObjectName('action_undo')
         self._undo_action.setShortcuts(QKeySequence.Undo)
 
+        # Replace the default connections from these actions to the undo() and
+        # redo() slots of this stack with connections to slots first applying
+        # all pending edits. Since editable widgets defer pushing undo
+        # commands onto this stack to coalesce rapid successive edits, undoing
+        # or redoing without doing so would silently undo or redo the wrong
+        # command.
+        self._redo_action.triggered.disconnect()
+        self._undo_action.triggered.disconnect()
+        self._redo_action.triggered.connect(self._redo_flushed)
+        self._undo_action.triggered.connect(self._undo_flushed)
+
 
     @type_check
     def _init_menu_edit(self, main_window: QBetseeMainWindow) -> None:
@@ -247,6 +258,30 @@ class QBetseeSimConfUndoStack(QUndoStack):
         main_window.toolbar.insertAction(first_separator, self._undo_action)
         main_window.toolbar.insertAction(first_separator, self._redo_action)
 
+    # ..................{ SLOTS                             }..................
+    @Slot()
+    def _redo_flushed(self) -> None:
+        '''
+        Slot signalled on the user triggering the redo action, applying all
+        pending edits to the currently open simulation configuration *before*
+        redoing the next undo command on this stack.
+        '''
+
+        self._sim_conf.flush_edits()
+        self.redo()
+
+
+    @Slot()
+    def _undo_flushed(self) -> None:
+        '''
+        Slot signalled on the user triggering the undo action, applying all
+        pending edits to the currently open simulation configuration *before*
+        undoing the current undo command on this stack.
+        '''
+
+        self._sim_conf.flush_edits()
+        self.undo()
+
     # ..................{ PUSHERS                           }..................
     @type_check
     def push_undo_cmd_if_safe(
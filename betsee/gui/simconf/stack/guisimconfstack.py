@@ -12,13 +12,14 @@ configuration) facilities.
 
 # ....................{ IMPORTS                           }....................
 from PySide2.QtCore import QCoreApplication, Slot
-from PySide2.QtWidgets import QMainWindow, QStackedWidget, QTreeWidgetItem
+from PySide2.QtWidgets import (
+    QMainWindow, QStackedWidget, QTreeWidgetItem, QWidget)
 from betse.util.io.log import logs
 from betse.util.type.iterable.mapping import mappings
 from betse.util.type.obj import objects, objtest
 from betse.util.type.types import type_check, MappingType
 from betsee.guiexception import BetseePySideStackedWidgetException
-from betsee.util.app import guiappwindow
+from betsee.util.app import guiappstartup, guiappwindow
 from betsee.util.widget.mixin.guiwdgmixin import QBetseeObjectMixin
 from betsee.util.widget.abc.control.guictlpageabc import (
     QBetseePagerItemizedMixin)
@@ -58,10 +59,41 @@ class QBetseeSimConfStackedWidget(QBetseeObjectMixin, QStackedWidget):
     :attr:`SIM_CONF_STACK_PAGE_NAME_PREFIX` substring. No other widgets should
     have such names. Failure to comply may be met with an unutterable anguish.
 
+    Lazy Initialization
+    ----------
+    For responsiveness, the pager controlling each page of this stack widget is
+    initialized *only* on the first switch to that page (i.e., on the first
+    call to the :meth:`switch_page_to_tree_item` slot selecting that page)
+    rather than at application startup. Initializing a pager initializes all
+    editable widgets on that page, each of which then binds itself to the
+    corresponding simulation configuration setting *and* repopulates itself on
+    every subsequent load of a simulation configuration. Since most users only
+    ever visit a small subset of these pages, deferring this work reduces both
+    the time to first paint of the main window (profiled as the
+    ``first_paint`` phase of the ``--profile-startup`` report) *and* the time
+    to load each simulation configuration.
+
+    Since the :meth:`QBetseeSimConfEditWidgetMixin._init_safe` method
+    immediately populates each widget initialized while a simulation
+    configuration is already open, pages initialized lazily are guaranteed to
+    be populated *before* being displayed.
+
+    Note that this stack widget necessarily continues to *construct* all pages
+    eagerly. All pages are constructed by the :meth:`setupUi` method of the
+    main window, generated from a single XML-formatted UI file by the
+    :mod:`betsee.lib.pyside2.cache.guipsdcacheui` submodule. Constructing
+    pages lazily would require splitting this file into one file per page and
+    hence abandoning the single Qt (Creator|Designer) workflow currently
+    editing this window.
+
     Attributes
     ----------
     _sim_conf : QBetseeSimConf
         High-level object controlling simulation configuration state.
+    _stack_page_names_initted : set
+        Set of the object names of all page widgets of this stack widget whose
+        pagers have already been initialized (i.e., whose pages have already
+        been switched to at least once).
 
     Attributes (Container)
     ----------
@@ -115,6 +147,7 @@ class QBetseeSimConfStackedWidget(QBetseeObjectMixin, QStackedWidget):
         self._sim_conf = None
         self._stack_page_name_to_page = None
         self._stack_page_name_to_pager = None
+        self._stack_page_names_initted = None
         self._tree_item_static_to_stack_page = None
         self._tree_item_list_root_to_stack_page_list_leaf = None
 
@@ -233,10 +266,69 @@ class QBetseeSimConfStackedWidget(QBetseeObjectMixin, QStackedWidget):
             for stack_page_name in self._stack_page_name_to_pager.keys()
         }
 
-        # Initialize each pager controlling each page widget of this stack
-        # widget *AFTER* finalizing all other initialization above.
-        for stack_pager in self._stack_page_name_to_pager.values():
-            stack_pager.init(main_window)
+        # Set of the object names of all pages whose pagers have already been
+        # initialized, defaulting to the empty set.
+        self._stack_page_names_initted = set()
+
+        # Initialize the pager controlling the page displayed at application
+        # startup *AFTER* finalizing all other initialization above. All other
+        # pagers are lazily initialized on the first switch to their pages.
+        self._init_stack_page_pager_if_needed(
+            stack_page=self.currentWidget(), main_window=main_window)
+
+
+    @type_check
+    def _init_stack_page_pager_if_needed(
+        self, stack_page: QWidget, main_window: QMainWindow) -> None:
+        '''
+        Initialize the pager controlling the passed page of this stack widget
+        against the passed parent main window if this page is controlled by a
+        pager *and* this pager has yet to be initialized *or* reduce to a noop
+        otherwise.
+
+        Parameters
+        ----------
+        stack_page : QWidget
+            Page widget of this stack widget to initialize the pager of.
+        main_window: QBetseeMainWindow
+            Initialized application-specific parent :class:`QMainWindow` widget
+            against which to initialize this pager.
+        '''
+
+        # Name of this stack page.
+        stack_page_name = stack_page.objectName()
+
+        # If this page's pager has already been initialized, reduce to a noop.
+        if stack_page_name in self._stack_page_names_initted:
+            return
+        # Else, this page's pager has yet to be initialized.
+
+        # Record this page's pager as initialized *BEFORE* doing so, preventing
+        # a failed initialization from being repeatedly reattempted.
+        self._stack_page_names_initted.add(stack_page_name)
+
+        # Pager controlling this stack page if any *OR* "None" otherwise.
+        stack_page_pager = self._stack_page_name_to_pager.get(
+            stack_page_name, None)
+
+        # If this page is controlled by *NO* pager (e.g., due to being a
+        # placeholder page), reduce to a noop.
+        if stack_page_pager is None:
+            return
+        # Else, this page is controlled by a pager.
+
+        # Log this initialization.
+        logs.log_debug(
+            'Lazily initializing stacked page "%s" pager "%s"...',
+            stack_page_name,
+            objects.get_class_name_unqualified(stack_page_pager),
+        )
+
+        # Initialize this pager, profiling this initialization as a distinct
+        # startup phase when profiling startup (e.g., for the page displayed
+        # at application startup) *OR* reducing to a noop otherwise.
+        with guiappstartup.profiling_phase('pager:' + stack_page_name):
+            stack_page_pager.init(main_window)
 
     # ..................{ SLOTS                             }..................
     # Public slots connected to from other widgets.
@@ -266,6 +358,9 @@ class QBetseeSimConfStackedWidget(QBetseeObjectMixin, QStackedWidget):
             placeholder container for child items for which pages do exist).
         '''
 
+        # Parent main window of this stack widget.
+        main_window = guiappwindow.get_main_window()
+
         # Stack page associated with this tree item if this item is static *OR*
         # "None" otherwise.
         stack_page = self._tree_item_static_to_stack_page.get(
@@ -335,6 +430,12 @@ class QBetseeSimConfStackedWidget(QBetseeObjectMixin, QStackedWidget):
             objtest.die_unless_instance(
                 obj=stack_page_pager, cls=QBetseePagerItemizedMixin)
 
+            # Initialize this pager if this pager has yet to be initialized
+            # *BEFORE* reinitializing this pager below, which assumes the
+            # former to have already been performed.
+            self._init_stack_page_pager_if_needed(
+                stack_page=stack_page, main_window=main_window)
+
             # 0-based index of the currently selected tree item in the dynamic
             # list of all children of the parent tree item of this item.
             tree_item_list_leaf_index = tree_item_list_root.indexOfChild(
@@ -345,8 +446,14 @@ class QBetseeSimConfStackedWidget(QBetseeObjectMixin, QStackedWidget):
             # current value of the corresponding setting in the currently open
             # simulation configuration.
             stack_page_pager.reinit(
-                main_window=guiappwindow.get_main_window(),
+                main_window=main_window,
                 list_item_index=tree_item_list_leaf_index)
+        # Else, this page is static. In this case, initialize this page's pager
+        # if this pager has yet to be initialized *BEFORE* switching to this
+        # page, populating all editable widgets on this page.
+        else:
+            self._init_stack_page_pager_if_needed(
+                stack_page=stack_page, main_window=main_window)
 
         # Switch to this page, which is now guaranteed to both exist *AND* have
         # been reinitialized (if needed).
@@ -251,6 +251,12 @@ class QBetseeSimConfPathnameImageLineEdit(QBetseeSimConfPathnameLineEditABC):
         # variadic arguments.
         super()._init_safe(*args, **kwargs)
 
+        # On the requisite subdirectories of the currently open simulation
+        # configuration being copied into the directory containing this
+        # configuration (e.g., after "Save As..."), preview this image again.
+        self._sim_conf.set_copying_signal.connect(
+            self._preview_image_if_copied)
+
 
     @type_check
     def _init_label(self, image_label: QBetseeLabelImage) -> None:
@@ -343,6 +349,18 @@ class QBetseeSimConfPathnameImageLineEdit(QBetseeSimConfPathnameLineEditABC):
             return
         # Else, a simulation configuration is open.
 
+        # If the requisite subdirectories of this configuration are still
+        # being copied into the directory containing this configuration (e.g.,
+        # after "Save As..."), this image may have yet to be copied. In this
+        # case, display a placeholder message *AND* defer this preview to the
+        # _preview_image_if_copied() slot.
+        if self._sim_conf.is_copying:
+            self._image_label.setText(QCoreApplication.translate(
+                'QBetseeSimConfPathnameImageLineEdit',
+                'Copying simulation data...'))
+            return
+        # Else, these subdirectories have been copied.
+
         # Absolute filename of this image. If relative, this filename is
         # converted into an absolute filename relative to the directory
         # containing this simulation configuration.
@@ -353,6 +371,25 @@ class QBetseeSimConfPathnameImageLineEdit(QBetseeSimConfPathnameLineEditABC):
         # Load this image as the pixmap of the label buddied to this line edit.
         self._image_label.load_image(image_filename_absolute)
 
+    # ..................{ SLOTS                             }..................
+    @Slot(bool)
+    def _preview_image_if_copied(self, is_copying: bool) -> None:
+        '''
+        Slot signalled on the requisite subdirectories of the currently open
+        simulation configuration either beginning or ceasing to be copied,
+        previewing the image whose filename is the text displayed by this line
+        edit if these subdirectories have now been copied.
+
+        Parameters
+        ----------
+        is_copying : bool
+            ``True`` only if these subdirectories are still being copied.
+        '''
+
+        # If these subdirectories have now been copied, preview this image.
+        if not is_copying:
+            self._preview_image_if_sim_open(self.widget_value)
+
     # ..................{ SUPERCLASS ~ selectors            }..................
     @type_check
     def _select_pathname(self, init_pathname: str) -> StrOrNoneTypes:
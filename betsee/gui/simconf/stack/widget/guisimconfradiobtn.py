@@ -75,6 +75,20 @@ class QBetseeSimConfEnumRadioButtonGroup(
                         'value of "enum_member_to_widget_value".'.format(
                             radio_btn.objectName(), self.objectName())))
 
+    # ..................{ TESTERS                           }..................
+    def isVisible(self) -> bool:
+        '''
+        ``True`` only if one or more radio buttons in this button group are
+        currently visible.
+
+        Since :class:`QButtonGroup` is a :class:`QObject` rather than a
+        :class:`QWidget`, this group is otherwise *not* visible in the sense
+        of the :meth:`QWidget.isVisible` method called by the simulation
+        configuration binder to bind visible widgets first.
+        '''
+
+        return any(radio_btn.isVisible() for radio_btn in self.buttons())
+
     # ..................{ MIXIN ~ property : read-only      }..................
     @property
     def undo_synopsis(self) -> str:
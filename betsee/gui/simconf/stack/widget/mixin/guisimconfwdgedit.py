@@ -43,6 +43,9 @@ class QBetseeSimConfEditWidgetMixin(QBetseeEditWidgetMixin):
         high-level object wrapping the low-level data descriptor of the
         :class:`betse.science.parameters.Parameters` class, itself wrapping the
         lower-level simulation configuration option edited by this widget.
+    _sim_conf_alias_parent : YamlABC
+        Simulation configuration or subconfiguration (e.g., tissue profile)
+        to which the :attr:`_sim_conf_alias` is bound.
     _sim_conf_alias_type : ClassOrNoneTypes
         Class or tuple of classes that the value to which
         :attr:`_sim_conf_alias` evaluates is required to be an instance of if
@@ -58,6 +61,7 @@ class QBetseeSimConfEditWidgetMixin(QBetseeEditWidgetMixin):
         # Nullify all instance variables for safety.
         self._sim_conf = None
         self._sim_conf_alias = None
+        self._sim_conf_alias_parent = None
         self._sim_conf_alias_type = None
 
 
@@ -126,6 +130,7 @@ class QBetseeSimConfEditWidgetMixin(QBetseeEditWidgetMixin):
         # bound to this parent simulation subconfiguration.
         self._sim_conf_alias = DataDescriptorBound(
             obj=sim_conf_alias_parent, data_desc=sim_conf_alias)
+        self._sim_conf_alias_parent = sim_conf_alias_parent
 
         # Type(s) required by this data descriptor if any or "None" otherwise.
         self._sim_conf_alias_type = sim_conf_alias.expr_alias_cls
@@ -134,30 +139,38 @@ class QBetseeSimConfEditWidgetMixin(QBetseeEditWidgetMixin):
         # exception.
         self._die_if_sim_conf_alias_type_invalid()
 
-        # Populate this widget when opening a simulation configuration.
-        self._sim_conf.set_filename_signal.connect(self._set_filename)
+        # Populate this widget when opening a simulation configuration. Rather
+        # than connecting the "set_filename_signal" signal directly to the
+        # _set_filename() slot of this widget, which would synchronously
+        # populate all such widgets on each such opening, register this widget
+        # with the binder populating these widgets in time-sliced batches.
+        self._sim_conf.binder.register_widget(self)
 
         # If this simulation configuration is already open, immediately
-        # populate this widget. Equivalently, if this widget is:
+        # populate this widget. If this widget is:
         #
-        # * Static (i.e., initialized at application startup and hence
-        #   associated with only one data descriptor for the lifetime of this
-        #   application), this simulation configuration is guaranteed to *NOT*
-        #   be open here, in which case this branch is ignored.
+        # * Static (i.e., associated with only one data descriptor for the
+        #   lifetime of this application) *AND* resides on:
+        #   * The stack page displayed at application startup, this widget is
+        #     initialized at startup *BEFORE* any simulation configuration is
+        #     opened, in which case this branch is ignored.
+        #   * Any other stack page, this widget is lazily initialized on the
+        #     first switch to that page (see the "QBetseeSimConfStackedWidget"
+        #     class), by which time this simulation configuration is likely to
+        #     already be open, in which case this branch is taken.
         # * Dynamic (i.e., repeatedly reinitialized during application runtime
         #   and hence associated with multiple data descriptors over the
         #   lifetime of this application), this simulation configuration is
         #   likely to already be open here, in which case this branch is taken.
         #
-        # Equivalently, if this widget is dynamic, populate this widget.
-        #
         # Note that "self._sim_conf.set_filename_signal" is intentionally *NOT*
         # signalled here, as doing so would incur negative side effects
         # throughout the codebase unrelated to this widget's population.
         if self._sim_conf.is_open:
             # Log this population.
             logs.log_debug(
-                'Repopulating dynamic editable widget "%s"...', self.obj_name)
+                'Populating editable widget "%s" from open configuration...',
+                self.obj_name)
 
             # Populate this widget.
             self._set_filename(self._sim_conf.filename)
@@ -259,6 +272,10 @@ class QBetseeSimConfEditWidgetMixin(QBetseeEditWidgetMixin):
         Slot signalled on the opening of a new simulation configuration *and*
         closing of an open simulation configuration.
 
+        This slot is called by the :class:`QBetseeSimConfBinder` object in
+        time-sliced batches rather than connected directly to the
+        :attr:`QBetseeSimConf.set_filename_signal` signal.
+
         Design
         ----------
         Subclasses are recommended to override this method by (in order):
@@ -292,19 +309,21 @@ class QBetseeSimConfEditWidgetMixin(QBetseeEditWidgetMixin):
         user edits to the contents of this widget. In response, this method
         notifies all connected slots that this simulation configuration has
         received new unsaved changes.
+
+        For responsiveness, this update is deferred and coalesced with all
+        other updates requested by any widget within a brief window. See the
+        :meth:`QBetseeSimConf.set_dirty_deferred` method for further details.
         '''
 
         # If this widget has yet to be initialized, silently noop.
         if self._sim_conf is None:
             return
 
-        # "True" only if the undo stack is in the dirty state.
-        is_dirty = self._is_undo_stack_dirty()
-
-        # Log this initialization *AFTER* storing this name.
+        # Log this update.
         logs.log_debug(
-            'Setting simulation configuration dirty bit from '
-            'editable widget "%s" to "%r"...', self.obj_name, is_dirty)
+            'Updating simulation configuration dirty bit from '
+            'editable widget "%s"...', self.obj_name)
 
-        # Update the dirty state for this simulation configuration.
-        self._sim_conf.set_dirty_signal.emit(is_dirty)
+        # Update the dirty state for this simulation configuration from the
+        # options changed since the last save after a brief delay.
+        self._sim_conf.set_dirty_deferred()
@@ -24,7 +24,7 @@ subclasses instantiated in pages of the top-level stack.
 #  * If not, raise BetseMethodUnimplementedException().
 
 # ....................{ IMPORTS                           }....................
-from PySide2.QtCore import Signal, Slot  # QCoreApplication
+from PySide2.QtCore import QTimer, Signal, Slot  # QCoreApplication
 from PySide2.QtWidgets import QUndoCommand
 from betse.exceptions import BetseMethodUnimplementedException
 from betse.util.io.log import logs
@@ -33,6 +33,31 @@ from betsee.guiexception import BetseePySideWidgetException
 from betsee.gui.simconf.stack.widget.mixin.guisimconfwdgedit import (
     QBetseeSimConfEditWidgetMixin)
 from betsee.util.widget.abc.guiundocmdabc import QBetseeWidgetUndoCommandABC
+import time
+
+# ....................{ CONSTANTS                         }....................
+EDIT_DEBOUNCE_MILLISECONDS = 150
+'''
+Number of milliseconds that each editable scalar widget defers setting the
+simulation configuration alias associated with that widget by after each
+finalized user edit of that widget.
+
+Each subsequent edit of that widget within this window restarts this delay,
+coalescing rapid successive edits (e.g., scrubbing a spin box) into a single
+alias write *and* a single undo command.
+'''
+
+
+UNDO_MERGE_WINDOW_SECONDS = 1.0
+'''
+Maximum number of fractional seconds between two successive undo commands
+pushed by the same editable scalar widget for these commands to be merged into
+a single undo command.
+
+Successive edits of the same widget separated by a longer duration are
+preserved as distinct undo commands, permitting the user to undo each such
+edit independently.
+'''
 
 # ....................{ MIXINS                            }....................
 class QBetseeSimConfEditScalarWidgetMixin(QBetseeSimConfEditWidgetMixin):
@@ -51,6 +76,11 @@ class QBetseeSimConfEditScalarWidgetMixin(QBetseeSimConfEditWidgetMixin):
         Previously displayed value of this widget cached on the completion of
         the most recent user edit (i.e., :meth:`editingFinished` signal),
         possibly but *not* necessarily reflecting this widget's current state.
+    _alias_set_timer : QTimer
+        Single-shot timer deferring the setting of the simulation configuration
+        alias associated with this widget to this widget's displayed value
+        until :data:`EDIT_DEBOUNCE_MILLISECONDS` have elapsed since the most
+        recent finalized user edit of this widget.
     '''
 
     # ..................{ INITIALIZERS                      }..................
@@ -65,6 +95,13 @@ class QBetseeSimConfEditScalarWidgetMixin(QBetseeSimConfEditWidgetMixin):
         # Nullify all remaining instance variables for safety.
         self._widget_value_last = None
 
+        # Single-shot timer debouncing user edits, whose parent is this widget.
+        self._alias_set_timer = QTimer(self)
+        self._alias_set_timer.setSingleShot(True)
+        self._alias_set_timer.setInterval(EDIT_DEBOUNCE_MILLISECONDS)
+        self._alias_set_timer.timeout.connect(
+            self._set_alias_to_widget_value_if_safe)
+
 
     def _init_safe(self, *args, **kwargs) -> bool:
 
@@ -76,9 +113,15 @@ class QBetseeSimConfEditScalarWidgetMixin(QBetseeSimConfEditWidgetMixin):
         #
         # On each finalized change to the value displayed by this widget, set
         # the current value of the simulation configuration alias associated
-        # with this widget to this widget's displayed value.
+        # with this widget to this widget's displayed value after a brief
+        # delay coalescing rapid successive changes.
         self._finalize_widget_change_signal.connect(
-            self._set_alias_to_widget_value_if_safe)
+            self._set_alias_to_widget_value_deferred)
+
+        # On each request to apply all pending edits (e.g., before saving this
+        # configuration), immediately apply this widget's pending edit if any.
+        self._sim_conf.flush_edits_signal.connect(
+            self._set_alias_to_widget_value_if_pending)
 
     # ..................{ SUBCLASS ~ mandatory : property   }..................
     # Subclasses are required to implement the following properties.
@@ -220,6 +263,10 @@ class QBetseeSimConfEditScalarWidgetMixin(QBetseeSimConfEditWidgetMixin):
             no such file is open).
         '''
 
+        # Discard this widget's pending edit if any, which pertains to the
+        # prior simulation configuration if any.
+        self._alias_set_timer.stop()
+
         # If a simulation configuration is currently open...
         if filename and self._is_sim_open:
             # Set this widget's displayed value from this alias' current value.
@@ -266,6 +313,39 @@ class QBetseeSimConfEditScalarWidgetMixin(QBetseeSimConfEditWidgetMixin):
 
     # ..................{ CONVERTERS ~ widget -> alias      }..................
     # Called on each user edit of this widget's value.
+    @Slot()
+    def _set_alias_to_widget_value_deferred(self) -> None:
+        '''
+        Slot signalled on each finalized interactive user edit of the value
+        displayed by this widget, deferring the setting of the simulation
+        configuration alias associated with this widget to this value until
+        :data:`EDIT_DEBOUNCE_MILLISECONDS` have elapsed without another such
+        edit.
+
+        Rapid successive edits (e.g., scrubbing a spin box) thus reduce to a
+        single call to the :meth:`_set_alias_to_widget_value_if_safe` method
+        and hence a single alias write and undo command.
+        '''
+
+        # (Re)start this timer, discarding the prior pending timeout if any.
+        self._alias_set_timer.start()
+
+
+    @Slot()
+    def _set_alias_to_widget_value_if_pending(self) -> None:
+        '''
+        Slot signalled on each request to apply all pending edits to the
+        currently open simulation configuration, immediately setting the
+        simulation configuration alias associated with this widget to this
+        widget's displayed value if this widget has a pending edit *or*
+        silently reducing to a noop otherwise.
+        '''
+
+        # If this widget has a pending edit, apply this edit immediately.
+        if self._alias_set_timer.isActive():
+            self._set_alias_to_widget_value_if_safe()
+
+
     @Slot()
     def _set_alias_to_widget_value_if_safe(self) -> None:
         '''
@@ -289,6 +369,9 @@ class QBetseeSimConfEditScalarWidgetMixin(QBetseeSimConfEditWidgetMixin):
 
         # logs.log_debug('In _set_alias_to_widget_value_if_safe()...')
 
+        # Discard this widget's pending edit if any, which this call applies.
+        self._alias_set_timer.stop()
+
         # Value currently displayed by this widget.
         widget_value = self.widget_value
 
@@ -310,8 +393,13 @@ class QBetseeSimConfEditScalarWidgetMixin(QBetseeSimConfEditWidgetMixin):
             'Setting widget "%s" alias value to %r...',
             self.obj_name, alias_value)
 
-        # Set this alias' current value to this coerced value.
-        self._sim_conf_alias.set(alias_value)
+        # Set this alias' current value to this coerced value, tracking this
+        # change for incremental saves.
+        with self._sim_conf.patcher.tracking_alias(
+            alias_parent=self._sim_conf_alias_parent,
+            alias=self._sim_conf_alias.data_desc,
+        ):
+            self._sim_conf_alias.set(alias_value)
 
         # If this widget has a prior value to be undone...
         if self._widget_value_last is not None:
@@ -321,10 +409,12 @@ class QBetseeSimConfEditScalarWidgetMixin(QBetseeSimConfEditWidgetMixin):
                 widget=self, value_old=self._widget_value_last)
             self._push_undo_cmd_if_safe(undo_cmd)
 
-            # Notify all connected slots that the currently open simulation
-            # configuration has received new unsaved changes *AFTER* pushing an
-            # undo command onto the stack. Why? Because this method detects
-            # unsaved changes by deferring to the stack state.
+            # Update the dirty state of the currently open simulation
+            # configuration *AFTER* pushing an undo command onto the stack.
+            # This state derives from whether the patcher tracked above still
+            # reports changed options (i.e., "SimConfPatcher.is_changed");
+            # if this edit restored the saved value of every changed option,
+            # that update also marks the index of this new command as clean.
             self._update_sim_conf_dirty()
 
         # Cache this widget's current value in preparation for the next change.
@@ -380,10 +470,15 @@ class QBetseeSimConfEditScalarWidgetUndoCommand(QBetseeWidgetUndoCommandABC):
     This subclass provides functionality specific to scalar widgets, including:
 
     * Automatic merging of adjacent undo commands associated with the same
-      scalar widget.
+      scalar widget pushed within :data:`UNDO_MERGE_WINDOW_SECONDS` of one
+      another.
 
     Attributes
     ----------
+    _time_last : float
+        Time in fractional seconds (as reported by the monotonic clock) of the
+        most recent push of this undo command *or* any subsequent undo command
+        merged into this undo command.
     _value_new : object
         New value replacing the prior value of the scalar widget associated
         with this undo command.
@@ -420,6 +515,9 @@ class QBetseeSimConfEditScalarWidgetUndoCommand(QBetseeWidgetUndoCommandABC):
         self._value_old = value_old
         self._value_new = widget.widget_value
 
+        # Record the time of this edit for subsequent merging.
+        self._time_last = time.monotonic()
+
     # ..................{ SUPERCLASS ~ mandatory            }..................
     # Mandatory superclass methods required to be redefined by each subclass.
 
@@ -433,6 +531,12 @@ class QBetseeSimConfEditScalarWidgetUndoCommand(QBetseeWidgetUndoCommandABC):
         with self._widget.ignoring_undo_cmds():
             self._widget.widget_value = self._value_old
 
+            # Set this widget's alias to this value immediately. Since setting
+            # this value programmatically emits no finalized change signal for
+            # most widgets (e.g., spin boxes, line edits), this alias would
+            # otherwise remain unchanged and hence dirty.
+            self._widget._set_alias_to_widget_value_if_safe()
+
             #FIXME: This focus attempt almost certainly fails across pages. If
             #this is the case, a sane general-purpose solution would be to
             #iteratively search up from the parent of this widget to the
@@ -450,31 +554,33 @@ class QBetseeSimConfEditScalarWidgetUndoCommand(QBetseeWidgetUndoCommandABC):
         # Redo the prior edit. See the undo() method for further details.
         with self._widget.ignoring_undo_cmds():
             self._widget.widget_value = self._value_new
+            self._widget._set_alias_to_widget_value_if_safe()
             # self._widget.setFocus(Qt.OtherFocusReason)
 
     # ..................{ SUPERCLASS ~ optional             }..................
     # Optional superclass methods permitted to be redefined by each subclass.
 
-    def mergeWith(self, prior_undo_cmd: QUndoCommand) -> bool:
+    def mergeWith(self, next_undo_cmd: QUndoCommand) -> bool:
         '''
-        Attempt to merge this undo command with the passed undo command
-        immediately preceding this undo command on the parent undo stack,
+        Attempt to merge the passed undo command immediately succeeding this
+        undo command on the parent undo stack into this undo command,
         returning ``True`` only if this method performed this merge.
 
         Specifically, this method returns:
 
-        * ``True`` if this method successfully merged both the undo and redo
-          operations applied by the prior undo command into those applied by
-          this undo command, in which case the prior undo command is safely
-          removable from the parent undo stack.
-        * ``False`` otherwise, in which case both the prior undo command and
-          this undo command *must* be preserved as is the parent undo stack.
+        * ``True`` if this method successfully merged the redo operation
+          applied by the passed undo command into that applied by this undo
+          command, in which case the passed undo command is safely removable
+          from the parent undo stack.
+        * ``False`` otherwise, in which case both this undo command and the
+          passed undo command *must* be preserved as is on the parent undo
+          stack.
 
         Parameters
         ----------
-        prior_undo_cmd : QUndoCommand
-            Undo command immediately preceding this undo command on the parent
-            undo stack.
+        next_undo_cmd : QUndoCommand
+            Undo command immediately succeeding this undo command on the parent
+            undo stack (i.e., the undo command currently being pushed).
 
         Returns
         ----------
@@ -482,21 +588,35 @@ class QBetseeSimConfEditScalarWidgetUndoCommand(QBetseeWidgetUndoCommandABC):
             ``True`` only if these undo commands were successfully merged.
         '''
 
-        # If this prior undo command is either of a different type *OR*
-        # associated with a different widget than this undo command, these
-        # commands cannot be safely merged and failure is reported.
+        # If this next undo command is either of a different type, associated
+        # with a different widget than this undo command, *OR* pushed too long
+        # after this undo command, these commands cannot be safely merged and
+        # failure is reported.
         if not (
-            self.id() == prior_undo_cmd.id() and
-            self._widget == prior_undo_cmd._widget
+            self.id() == next_undo_cmd.id() and
+            self._widget == next_undo_cmd._widget and
+            next_undo_cmd._time_last - self._time_last <=
+                UNDO_MERGE_WINDOW_SECONDS
         ):
             return False
 
-        #FIXME: Log this to determine whether this actually works as desired.
+        # Log this merge.
+        logs.log_debug(
+            'Merging widget "%s" undo commands...', self._widget.obj_name)
+
+        # Else, these commands are safely mergeable. Replace the new value of
+        # this scalar widget stored with this undo command by the new value of
+        # this scalar widget stored with this next undo command, preserving
+        # the prior value stored with this undo command.
+        self._value_new = next_undo_cmd._value_new
+
+        # Extend the merge window of this undo command from this next push.
+        self._time_last = next_undo_cmd._time_last
 
-        # Else, these commands are safely mergeable. Replace the prior value of
-        # this scalar widget stored with this undo command by the prior value
-        # of this scalar widget stored with this prior undo command.
-        self._value_old = prior_undo_cmd._value_old
+        # If this merged undo command now reduces to a noop (e.g., due to the
+        # user scrubbing a spin box back to its prior value), instruct the
+        # parent undo stack to silently remove this command.
+        self.setObsolete(self._value_new == self._value_old)
 
         # Report success.
         return True
@@ -94,7 +94,7 @@ simulation configuration.
 #this tree widget. (Everything has its price.)
 
 # ....................{ IMPORTS                           }....................
-from PySide2.QtCore import QCoreApplication, Slot
+from PySide2.QtCore import QCoreApplication, QTimer, Slot
 from PySide2.QtWidgets import QMainWindow, QTreeWidgetItem
 from betse.lib.yaml.abc.yamllistabc import YamlList
 from betse.lib.yaml.abc.yamlmixin import YamlNamedMixin
@@ -105,9 +105,20 @@ from betse.util.type.obj import objtest
 from betse.util.type.types import type_check
 from betsee.guiexception import BetseePySideTreeWidgetItemException
 from betsee.gui.data import guidataicon
+from betsee.gui.simtab.run.work.guisimrunworkenum import ExportItemFreshness
+from betsee.gui.simtab.run.work.guisimrunworkexpman import (
+    EXPORT_PHASE_KINDS, SimmerExportManifest, hash_conf_shared)
 from betsee.util.widget.stock.tree import guitreeitem
 from betsee.util.widget.stock.tree.guitreewdg import QBetseeTreeWidget
 
+# ....................{ CONSTANTS                         }....................
+EXPORT_MARKERS_COALESCE_MILLISECONDS = 250
+'''
+Number of milliseconds to defer refreshing the export freshness markers of
+this tree after each edit to the current simulation configuration, coalescing
+bursts of edits (e.g., typing into a text widget) into a single refresh.
+'''
+
 # ....................{ SUBCLASSES                        }....................
 class QBetseeSimConfTreeWidget(QBetseeTreeWidget):
     '''
@@ -121,9 +132,27 @@ class QBetseeSimConfTreeWidget(QBetseeTreeWidget):
     * Integration with the corresponding :class:`QStackedWidget`, exposing all
       low-level configuration settings for the high-level simulation feature
       currently selected from this tree.
+    * Export freshness markers, decorating each export item with an icon
+      signifying whether that item has yet to be exported, was exported from
+      the current configuration, or was exported from a prior configuration
+      and hence requires re-exporting.
 
     Attributes (Private)
     ----------
+    _export_markers_timer : QTimer
+        Single-shot timer coalescing bursts of edits to the current simulation
+        configuration into a single refresh of all export freshness markers.
+    _export_shared_hash : {str, NoneType}
+        SHA-256 hash of the shared export settings of the current simulation
+        configuration at the :attr:`_export_shared_hash_revision` if hashed
+        *or* ``None`` otherwise, shared between all export manifests created
+        by the :meth:`sync_export_markers` slot.
+    _export_shared_hash_revision : {int, NoneType}
+        Revision of the :attr:`QBetseeSimConf.patcher` at which the
+        :attr:`_export_shared_hash` was computed if hashed *or* ``None``
+        otherwise. Since this hash serializes the entire configuration, this
+        hash is recomputed only on this revision changing rather than on each
+        refresh of all export freshness markers.
     _sim_conf : QBetseeSimConf
         High-level object controlling simulation configuration state.
 
@@ -146,6 +175,10 @@ class QBetseeSimConfTreeWidget(QBetseeTreeWidget):
         Set of all tree items masquerading as **dynamic lists** (i.e., abstract
         containers permitting child tree items to be interactively added to
         *and* removed from the :attr:`_items_list_leaf` set at runtime).
+    _items_list_root_export : set
+        Subset of the :attr:`_items_list_root` set containing only tree items
+        masquerading as **export lists** (i.e., dynamic lists whose items are
+        exported by the export simulation phases).
 
     Attributes (Private: Widgets)
     ----------
@@ -172,10 +205,14 @@ class QBetseeSimConfTreeWidget(QBetseeTreeWidget):
         self._item_list_root_to_yaml_list = {}
         self._items_list_leaf = set()
         self._items_list_root = set()
+        self._items_list_root_export = set()
 
         # Nullify all remaining instance variables for safety.
         self._action_sim_conf_tree_item_append = None
         self._action_sim_conf_tree_item_remove = None
+        self._export_markers_timer = None
+        self._export_shared_hash = None
+        self._export_shared_hash_revision = None
         self._sim_conf = None
 
 
@@ -241,6 +278,12 @@ class QBetseeSimConfTreeWidget(QBetseeTreeWidget):
             main_window.action_sim_conf_tree_item_remove)
         self._sim_conf = main_window.sim_conf
 
+        # Timer coalescing edits into export freshness marker refreshes.
+        self._export_markers_timer = QTimer(self)
+        self._export_markers_timer.setSingleShot(True)
+        self._export_markers_timer.setInterval(
+            EXPORT_MARKERS_COALESCE_MILLISECONDS)
+
         # Define all containers containing items of this tree widget *AFTER*
         # classifying requisite instance variables of this main window.
         #
@@ -274,6 +317,13 @@ class QBetseeSimConfTreeWidget(QBetseeTreeWidget):
         main_window.sim_conf.set_filename_signal.connect(
             self._set_sim_conf_filename)
 
+        # On each edit to the current simulation configuration (including
+        # undoing and redoing prior edits), refresh all export freshness
+        # markers *AFTER* this burst of edits subsides.
+        main_window.sim_conf.undo_stack.indexChanged.connect(
+            self._export_markers_timer.start)
+        self._export_markers_timer.timeout.connect(self.sync_export_markers)
+
         # When an item of this tree widget is clicked:
         #
         # * Perform simulation-specific logic implemented by this subclass.
@@ -369,6 +419,14 @@ class QBetseeSimConfTreeWidget(QBetseeTreeWidget):
         # Set of all such items.
         self._items_list_root = set(self._item_list_root_to_yaml_list.keys())
 
+        # Subset of all such items whose list items are exported.
+        self._items_list_root_export = {
+            item_export_anim_cells,
+            item_export_csv,
+            item_export_plot_cell,
+            item_export_plot_cells,
+        }
+
         # ................{ STACK                             }................
         # Finalizes the initialization of the simulation configuration-specific
         # stack widget associated with this tree widget. Specifically, this
@@ -554,9 +612,118 @@ class QBetseeSimConfTreeWidget(QBetseeTreeWidget):
         # tree items masquerading as a dynamic lists.
         if sim_conf_filename:
             self._init_items_list_leaf()
+
+            # Mark these items with their export freshness *AFTER* creating
+            # these items.
+            self.sync_export_markers()
         # Else, the user closed an open simulation configuration file. In this
         # case, no further work remains to be done.
 
+    # ..................{ SLOTS ~ export                    }..................
+    @Slot()
+    def sync_export_markers(self) -> None:
+        '''
+        Slot refreshing the export freshness marker (i.e., first-column icon
+        and tooltip) of each child tree item masquerading as an export item
+        against the export manifests of the currently open simulation
+        configuration if any *or* reducing to a noop otherwise.
+
+        This slot is signalled both on editing this configuration *and* on
+        completing each export simulation phase. An item is marked as:
+
+        * **Stale** if any export phase previously exported this item from
+          different inputs (e.g., a since-modified configuration).
+        * **Fresh** if some export phase previously exported this item from
+          the current inputs *and* no export phase marks this item as stale.
+        * **Unexported** otherwise.
+        '''
+
+        # If no simulation configuration is open, silently reduce to a noop.
+        if not self._sim_conf.is_open:
+            return
+
+        # Log this slot.
+        logs.log_debug('Synchronizing export freshness markers...')
+
+        # Tuple of the export manifests of all export phases, sharing the
+        # hash of the shared export settings of this configuration.
+        export_shared_hash = self._get_export_shared_hash()
+        export_manifests = tuple(
+            SimmerExportManifest(
+                p=self._sim_conf.p,
+                phase_kind=phase_kind,
+                shared_hash=export_shared_hash,
+            )
+            for phase_kind in EXPORT_PHASE_KINDS
+        )
+
+        # For each parent tree item masquerading as an export list...
+        for item_list_root in self._items_list_root_export:
+            # YAML-backed list subconfiguration underlying this parent.
+            yaml_list = self._item_list_root_to_yaml_list[item_list_root]
+
+            # For each child tree item of this parent and the YAML-backed list
+            # item underlying this child, mark this child.
+            for yaml_list_item_index, yaml_list_item in enumerate(yaml_list):
+                self._mark_item_list_leaf_export(
+                    item_list_leaf=item_list_root.child(yaml_list_item_index),
+                    item_freshnesses={
+                        export_manifest.get_item_freshness(yaml_list_item)
+                        for export_manifest in export_manifests
+                    },
+                )
+
+
+    def _get_export_shared_hash(self) -> str:
+        '''
+        SHA-256 hash of the shared export settings of the currently open
+        simulation configuration, recomputed only if this configuration has
+        changed since this hash was last computed.
+
+        Since every change to this configuration increments the revision of
+        the patcher of this configuration, this hash is recomputed at most
+        once per change rather than on each refresh (e.g., on completing each
+        export simulation phase, which changes only the export manifests).
+        '''
+
+        # Current revision of this configuration.
+        revision = self._sim_conf.patcher.revision
+
+        # If this configuration has changed since last hashed, rehash.
+        if revision != self._export_shared_hash_revision:
+            self._export_shared_hash = hash_conf_shared(self._sim_conf.p)
+            self._export_shared_hash_revision = revision
+
+        # Return this hash.
+        return self._export_shared_hash
+
+
+    @type_check
+    def _mark_item_list_leaf_export(
+        self, item_list_leaf: QTreeWidgetItem, item_freshnesses: set) -> None:
+        '''
+        Mark the passed child tree item masquerading as an export item with
+        the passed set of the freshnesses of this item across all export
+        phases.
+        '''
+
+        # Set the first-column icon and tooltip of this item.
+        if ExportItemFreshness.STALE in item_freshnesses:
+            item_list_leaf.setIcon(0, guidataicon.get_icon_stale())
+            item_list_leaf.setToolTip(0, QCoreApplication.translate(
+                'QBetseeSimConfTreeWidget',
+                'Changed since last exported. '
+                'Re-exported on the next export.'))
+        elif ExportItemFreshness.FRESH in item_freshnesses:
+            item_list_leaf.setIcon(0, guidataicon.get_icon_fresh())
+            item_list_leaf.setToolTip(0, QCoreApplication.translate(
+                'QBetseeSimConfTreeWidget',
+                'Unchanged since last exported. '
+                'Skipped on the next export.'))
+        else:
+            item_list_leaf.setIcon(0, guidataicon.get_icon_dot())
+            item_list_leaf.setToolTip(0, '')
+
     # ..................{ SLOTS ~ item                      }..................
     @Slot(QTreeWidgetItem, QTreeWidgetItem)
     def _select_tree_item(
@@ -696,7 +863,10 @@ class QBetseeSimConfTreeWidget(QBetseeTreeWidget):
 
         # Notify interested slots that the current simulation configuration is
         # now dirty (i.e., has unsaved changes) *AFTER* successfully appending
-        # this child tree item.
+        # this child tree item. Since list items are added and removed rather
+        # than edited through aliases, this change is untrackable by the
+        # patcher and subsequent saves rewrite this configuration in full.
+        self._sim_conf.patcher.invalidate()
         self._sim_conf.is_dirty = True
 
 
@@ -828,7 +998,10 @@ class QBetseeSimConfTreeWidget(QBetseeTreeWidget):
 
         # Notify interested slots that the current simulation configuration is
         # now dirty (i.e., has unsaved changes) *AFTER* successfully removing
-        # this child tree item.
+        # this child tree item. Since list items are added and removed rather
+        # than edited through aliases, this change is untrackable by the
+        # patcher and subsequent saves rewrite this configuration in full.
+        self._sim_conf.patcher.invalidate()
         self._sim_conf.is_dirty = True
 
     # ..................{ MAKERS                            }..................
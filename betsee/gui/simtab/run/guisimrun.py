@@ -17,11 +17,6 @@ High-level **simulator** (i.e., :mod:`PySide2`-based object both displaying
 #     are currently running, a warning dialog should be displayed to the user
 #     confirming this action.
 
-#FIXME: When the user attempts to run a dirty simulation (i.e., a simulation
-#with unsaved changes), the GUI should prompt the user as to whether or not
-#they would like to save those changes *BEFORE* running the simulation. In
-#theory, we should be able to reuse existing "sim_conf" functionality to do so.
-
 #FIXME: Note in a more appropriate docstring somewhere that the text overlaid
 #onto the progress bar is only conditionally displayed depending on the current
 #style associated with this bar. Specifically, the official documentation notes:
@@ -52,9 +47,11 @@ from betsee.gui.simtab.run.guisimrunstate import (
     SIM_PHASE_KIND_TO_NAME,
     SIMMER_STATES_IDLE,
     SIMMER_STATE_TO_PROACTOR_STATUS,
+    SIMMER_PROACTOR_SUBSTATUS_TELEMETRY,
     SIMMER_STATE_TO_PROACTOR_SUBSTATUS,
     SIMMER_STATES_HALTING,
 )
+from betsee.gui.simtab.run.work.guisimrunworkmetric import format_duration
 from betsee.util.widget.abc.control.guictlabc import QBetseeControllerABC
 
 # ....................{ CLASSES                           }....................
@@ -85,6 +82,9 @@ class QBetseeSimmer(QBetseeControllerABC):
 
     Attributes (Private: Widgets)
     ----------
+    _action_clear_cache : QAction
+        Alias of the :attr:`QBetseeMainWindow.action_sim_run_clear_cache`
+        action.
     _action_stop_workers : QAction
         Alias of the :attr:`QBetseeMainWindow.action_sim_run_stop_workers`
         action.
@@ -119,6 +119,7 @@ class QBetseeSimmer(QBetseeControllerABC):
 
         # Nullify all remaining instance variables for safety.
         self._action_toggle_work = None
+        self._action_clear_cache = None
         self._action_stop_workers = None
         self._player_toolbar = None
         self._progress_bar = None
@@ -180,6 +181,7 @@ class QBetseeSimmer(QBetseeControllerABC):
         # Classify variables of this main window required by this simulator.
         self._action_toggle_work  = main_window.action_sim_run_toggle_work
         self._action_stop_workers = main_window.action_sim_run_stop_work
+        self._action_clear_cache  = main_window.action_sim_run_clear_cache
         self._player_toolbar      = main_window.sim_run_player_toolbar_frame
         self._progress_bar        = main_window.sim_run_player_progress
         self._progress_status     = main_window.sim_run_player_status
@@ -208,6 +210,8 @@ class QBetseeSimmer(QBetseeControllerABC):
             self._proactor.toggle_work)
         self._action_stop_workers.triggered.connect(
             self._proactor.stop_workers)
+        self._action_clear_cache.triggered.connect(
+            self._proactor.clear_phase_cache)
 
         # Connect widget signals to corresponding slots of this simulator.
         # Specifically:
@@ -363,7 +367,17 @@ class QBetseeSimmer(QBetseeControllerABC):
         #   working worker successfully stops resulting in the "_is_worker"
         #   property yielding "False". Ergo, the simulator state takes
         #   precedence for UI purposes.
-        self._action_stop_workers.setEnabled(self._proactor.is_working)
+        #
+        # Simulator stopping is also enabled while the simulator is stopping,
+        # permitting the user to forcefully stop workers failing to reach
+        # their next stop point (e.g., due to a hung child process).
+        self._action_stop_workers.setEnabled(
+            self._proactor.is_working or
+            self._proactor.state is SimmerState.STOPPING)
+
+        # Enable phase cache clearing only if the simulator is *NOT* currently
+        # working, as working workers may be reading or writing that cache.
+        self._action_clear_cache.setEnabled(not self._proactor.is_working)
 
 
     def _sync_progress(self) -> None:
@@ -458,6 +472,10 @@ class QBetseeSimmer(QBetseeControllerABC):
         # conditionally defined below in a state-dependent manner.
         substatus_text_template = None
 
+        # Telemetry of the lead worker if this worker is currently modelling
+        # time steps *OR* "None" otherwise, conditionally defined below.
+        worker_telemetry = None
+
         # If the proactor is currently modelling...
         if self._proactor.state is SimmerState.MODELLING:
             # Type of simulaton phase currently being modelled.
@@ -497,6 +515,7 @@ class QBetseeSimmer(QBetseeControllerABC):
             # steps and hence is in the in-processing state.
             else:
                 model_state = SimmerModelState.MODELLING
+                worker_telemetry = self._proactor.get_worker_telemetry_lead()
 
             # Dictionary mapping from from each type of simulator modelling
             # state to an unformatted string template detailing the current
@@ -540,5 +559,23 @@ class QBetseeSimmer(QBetseeControllerABC):
             substatus_prior=substatus_text_prior,
         )
 
+        # If the lead worker is modelling time steps...
+        if worker_telemetry is not None:
+            # Throughput of this worker if measured *OR* the baseline
+            # throughput of prior runs of this phase if any *OR* "None".
+            steps_per_second = (
+                worker_telemetry.steps_per_second
+                if worker_telemetry.steps_per_second is not None else
+                worker_telemetry.steps_per_second_prior)
+
+            # If this throughput is known, suffix these details by this
+            # throughput and the time remaining.
+            if steps_per_second is not None:
+                substatus_text = SIMMER_PROACTOR_SUBSTATUS_TELEMETRY.format(
+                    substatus=substatus_text,
+                    steps_per_second=steps_per_second,
+                    eta=format_duration(worker_telemetry.eta_seconds),
+                )
+
         # Set the text of the label displaying these details to this text.
         self._progress_substatus.setText(substatus_text)
@@ -13,7 +13,7 @@ functionality.
 #"betse plot seed") to perform routine progress callbacks.
 
 # ....................{ IMPORTS                           }....................
-from PySide2.QtCore import QCoreApplication, QObject, Slot  #, Signal
+from PySide2.QtCore import QCoreApplication, QObject, Signal, Slot
 from PySide2.QtWidgets import QProgressBar, QLabel
 from betse.exceptions import BetseSimUnstableException
 from betse.util.io.log import logs
@@ -24,7 +24,8 @@ from betse.util.type.types import type_check, BoolOrNoneTypes
 from betsee.guiexception import (
     BetseeSimmerException, BetseeSimmerBetseException)
 from betsee.gui.window.guiwindow import QBetseeMainWindow
-from betsee.gui.simtab.run.guisimrunenum import SimmerState
+from betsee.gui.simtab.run.guisimrunenum import (
+    SimmerRunOutcome, SimmerState)
 from betsee.gui.simtab.run.guisimrunstate import (
     SIMMER_STATES_IDLE,
     SIMMER_STATES_INTO_FIXED,
@@ -34,12 +35,24 @@ from betsee.gui.simtab.run.guisimrunstate import (
     SIMMER_STATES_UNWORKABLE,
 )
 from betsee.gui.simtab.run.guisimrunabc import QBetseeSimmerStatefulABC
+from betsee.gui.simtab.run.live.guisimrunlivering import LIVE_PHASE_KINDS
 from betsee.gui.simtab.run.phase.guisimrunphase import QBetseeSimmerPhase
 from betsee.gui.simtab.run.phase.guisimrunphaser import QBetseeSimmerPhaser
-from betsee.gui.simtab.run.work.guisimrunwork import QBetseeSimmerPhaseWorker
+from betsee.gui.simtab.run.work.guisimrunwork import (
+    QBetseeSimmerPhaseWorker,
+    QBetseeSimmerPhaseWorkerOrNoneTypes,
+    get_workers_startable,
+)
+from betsee.gui.simtab.run.work.guisimrunworkcache import SimmerPhaseCache
+from betsee.gui.simtab.run.work.guisimrunworkconf import (
+    SimmerConfSnapshot, hash_conf_file)
+from betsee.gui.simtab.run.work.guisimrunworkenum import SimmerPhaseSubkind
+from betsee.gui.simtab.run.work.guisimrunworkmetric import (
+    SimmerWorkerMetrics, SimmerWorkerTelemetryOrNoneTypes)
 from betsee.util.thread import guithread
 from betsee.util.thread.pool import guipoolthread
 from collections import deque
+from copy import deepcopy
 
 # ....................{ CLASSES                           }....................
 class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
@@ -88,14 +101,33 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
     .. _reactor design pattern:
        https://en.wikipedia.org/wiki/Reactor_pattern
 
+    Scheduling
+    ----------
+    This proactor schedules workers in a dependency-aware manner rather than
+    strictly one worker at a time. On each iteration, *every* enqueued worker
+    whose dependencies (as decided by the
+    :meth:`QBetseeSimmerPhaseWorker.is_dependent_on` tester) have all completed
+    is started in the compute thread pool (see the
+    :func:`guipoolthread.get_thread_pool_compute` function), up to the maximum
+    number of workers concurrently workable in that pool. Independent work (e.g.,
+    exporting the initialization phase while modelling the simulation phase)
+    thus runs concurrently on multi-core systems.
+
+    Of the one or more concurrently working workers, only the **lead worker**
+    (i.e., the earliest started worker that has yet to complete) drives the
+    state of this proactor and hence the progress widgets displayed to the end
+    user. The most recent progress emitted by all other working workers is
+    preserved and replayed onto these widgets when each such worker becomes the
+    lead worker.
+
     Caveats
     ----------
     For simplicity, this proactor internally assumes the active Python
     interpreter to prohibit Python-based multithreading via a Global
     Interpreter Lock (GIL). Specifically, all worker-centric attributes (e.g.,
-    :attr:`_worker`, :attr:`_workers_queued`) are assumed to be implicitly
-    synchronized despite access to these attributes *not* being explicitly
-    locked behind a Qt-based mutual exclusion primitive.
+    :attr:`_workers_queued`, :attr:`_workers_working`) are assumed to be
+    implicitly synchronized despite access to these attributes *not* being
+    explicitly locked behind a Qt-based mutual exclusion primitive.
 
     GIL-less Python interpreters violate this simplistic assumption. For
     example, the :meth:`stop_workers` and :meth:`_handle_worker_completion`
@@ -112,11 +144,38 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
 
     Attributes (Private)
     ----------
+    _conf_hash : StrOrNoneTypes
+        Hexadecimal SHA-256 hash of the simulation configuration run by all
+        simulator workers enqueued by the most recent call to the
+        :meth:`_enqueue_workers` method if any *or* ``None`` otherwise,
+        keying the runs of these workers in the run history.
+    _conf_snapshot : {SimmerConfSnapshot, NoneType}
+        Snapshot of the simulation configuration shared by all simulator
+        workers enqueued by the most recent call to the
+        :meth:`_enqueue_workers` method if these workers have yet to finish
+        *or* ``None`` otherwise. For efficiency, this configuration is
+        deserialized from disk at most once per run rather than once per
+        worker.
+    _history_view : QBetseeSimmerHistoryView
+        Alias of the :attr:`QBetseeMainWindow.sim_run_history_view` widget,
+        owning the run history each finished worker is recorded to.
+    _live_view : QBetseeSimmerLiveView
+        Alias of the :attr:`QBetseeMainWindow.sim_run_live_view` widget,
+        owning the live ring each worker modelling a phase streams to.
     _p : Parameters
         Simulation configuration singleton.
+    _sim_conf : QBetseeSimConf
+        Simulation configuration state object, whose dirty state governs
+        whether the cache of modelled phase results is consulted.
 
     Attributes (Private: Thread)
     ----------
+    _is_pause_requested : bool
+        ``True`` only if the user requested the simulator be paused *and* has
+        yet to resume or stop the simulator. Since this request outlives the
+        workers it paused (e.g., a worker that never blocks on pause requests
+        finishing while paused), this flag rather than the current state of
+        this proactor decides whether enqueued workers may be started.
     _thread : QBetseeWorkerThread
         Thread controller owning all simulator workers (i.e.,
         :class:`QBetseeSimmerWorkerABC` instances responsible for running
@@ -127,7 +186,28 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         proactor to run a simulation subcommand whose corresponding checkbox
         was checked at the time this queue was instantiated) if this simulator
         has started one or more such workers *or* ``None`` otherwise (i.e., if
-        no such workers have been started).
+        no such workers have been started). Workers are popped from this queue
+        on being started and pushed onto the :attr:`_workers_working` queue.
+    _workers_working : QueueType
+        **Simulator working queue** (i.e., double-ended queue of each simulator
+        worker previously started but *not* yet completed, in start order). The
+        head worker of this queue is the lead worker.
+    _worker_to_progress : MappingType
+        Dictionary mapping from each working simulator worker to a mutable
+        list ``[progress_min, progress_max, progress, status]`` of the most
+        recent progress signalled by that worker (where each item defaults to
+        ``None`` until signalled), replayed onto the progress widgets when that
+        worker becomes the lead worker.
+
+    Attributes (Private: Metrics)
+    ----------
+    _metrics_finished : list
+        List of the metrics of each simulator worker enqueued by the most
+        recent call to the :meth:`_enqueue_workers` method that has since
+        finished, in finishing order.
+    _worker_to_metrics : MappingType
+        Dictionary mapping from each working simulator worker to the metrics
+        collected for that worker.
 
     Attributes (Private: Widgets)
     ----------
@@ -142,6 +222,16 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         Alias of the :attr:`QBetseeMainWindow.sim_run_player_substatus` label.
     '''
 
+    # ..................{ SIGNALS                           }..................
+    exported_signal = Signal()
+    '''
+    Signal signalled on the completion of each exporting simulator worker
+    (regardless of whether that worker succeeded, failed, or was prematurely
+    stopped), notifying interested slots (e.g., the export freshness markers
+    of the simulation configuration tree) that the export manifests of the
+    current simulation configuration may have changed.
+    '''
+
     # ..................{ INITIALIZERS                      }..................
     def __init__(self, *args, **kwargs) -> None:
         '''
@@ -160,12 +250,26 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
 
         # Nullify all remaining instance variables for safety.
         self._p = None
+        self._sim_conf = None
         self._action_toggle_work = None
         self._progress_bar = None
         self._progress_status = None
         self._workers_queued = None
+        self._is_pause_requested = False
+        self._conf_hash = None
+        self._conf_snapshot = None
+        self._history_view = None
+        self._live_view = None
+
+        # Queue of all working workers and their most recent progress.
+        self._workers_working = deque()
+        self._worker_to_progress = {}
+
+        # Metrics of all working and finished workers.
+        self._worker_to_metrics = {}
+        self._metrics_finished = []
 
-        # Container of allsSimulator phase controllers.
+        # Container of all simulator phase controllers.
         self.phaser = QBetseeSimmerPhaser(self)
 
 
@@ -199,12 +303,21 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
 
         # Classify variables of this main window required by this simulator.
         self._p = main_window.sim_conf.p
+        self._sim_conf = main_window.sim_conf
 
         # Classify variables of this main window required by this simulator.
         self._action_toggle_work  = main_window.action_sim_run_toggle_work
         self._progress_bar        = main_window.sim_run_player_progress
         self._progress_status     = main_window.sim_run_player_status
         self._progress_substatus  = main_window.sim_run_player_substatus
+        self._live_view           = main_window.sim_run_live_view
+        self._history_view        = main_window.sim_run_history_view
+
+        # Initialize the live view displaying modelled phases.
+        self._live_view.init(main_window)
+
+        # Initialize the history view displaying previously run phases.
+        self._history_view.init(main_window)
 
         # Initialize the container of all simulator phase controllers.
         self.phaser.init(
@@ -212,10 +325,17 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
             set_state_from_phase=self._set_state_from_phase,
         )
 
+        # Refresh the export freshness markers of the simulation configuration
+        # tree on completing each export. Since that tree is initialized
+        # *AFTER* this simulator, connect to that tree without calling that
+        # tree in any way here.
+        self.exported_signal.connect(
+            main_window.sim_conf_tree.sync_export_markers)
+
     # ..................{ FINALIZERS                        }..................
     def halt_workers(self) -> None:
         '''
-        Coercively (i.e., non-gracefully) halt the current simulator worker if
+        Coercively (i.e., non-gracefully) halt all current simulator workers if
         any *and* dequeue all subsequently queued workers in a thread-safe
         manner, reverting the simulator to the idle state... **by any means
         necessary.**
@@ -224,11 +344,12 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         slot by (in order):
 
         #. If no worker is currently working, silently reducing to a noop.
-        #. Attempting to gracefully halt the currently working worker, dequeue
-           all subsequently queued workers if any, and unblock this worker's
-           parent thread if currently blocked.
-        #. If this worker fails to gracefully halt within a reasonable window
-           of time (e.g., 30 seconds), coerce this worker to immediately halt.
+        #. Attempting to gracefully halt all currently working workers, dequeue
+           all subsequently queued workers if any, and unblock the parent
+           threads of these workers if currently blocked.
+        #. If these workers fail to gracefully halt within a reasonable window
+           of time (e.g., 30 seconds), coerce these workers to immediately
+           halt.
 
         Design
         ----------
@@ -259,21 +380,27 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
             return
         # Else, some worker is currently working.
 
-        # Currently working simulator worker. For safety, this property is
-        # localized *BEFORE* this worker's stop() pseudo-slot (which
-        # internally dequeues this worker and hence implicitly modifies the
-        # worker returned by the "_worker" property) is called.
-        worker = self.worker
-
-        # Attempt to gracefully halt this worker, dequeue all subsequently
-        # queued workers if any, and unblock this worker's parent thread if
-        # currently blocked.
-        self.stop_workers()
-
-        # If this worker fails to gracefully halt within a reasonable window
-        # of time (e.g., 30 seconds), coerce this worker to immediately halt.
+        # Currently working simulator workers. For safety, this queue is
+        # copied *BEFORE* the stop() pseudo-slots of these workers (which
+        # internally dequeue these workers and hence implicitly modify this
+        # queue) are called.
+        workers = tuple(self._workers_working)
+
+        # Attempt to gracefully halt these workers, dequeue all subsequently
+        # queued workers if any, and unblock the parent threads of these
+        # workers if currently blocked. If these workers are already stopping,
+        # avoid doing so; repeatedly stopping these workers would forcefully
+        # halt these workers *WITHOUT* waiting below.
+        if self.state is not SimmerState.STOPPING:
+            self.stop_workers()
+
+        # If these workers fail to gracefully halt within a reasonable window
+        # of time (e.g., 30 seconds), coerce these workers to immediately halt.
         guipoolthread.halt_workers(
-            workers=(worker,), milliseconds=WAIT_MAX_MILLISECONDS)
+            workers=workers,
+            milliseconds=WAIT_MAX_MILLISECONDS,
+            thread_pool=guipoolthread.get_thread_pool_compute(),
+        )
 
     # ..................{ PROPERTIES ~ bool                 }..................
     @property
@@ -288,8 +415,8 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         '''
         ``True`` only if one or more simulator workers currently exist.
 
-        Equivalently, this property returns ``True`` only if the simulator
-        worker queue is currently non-empty.
+        Equivalently, this property returns ``True`` only if either the
+        simulator worker queue or working queue is currently non-empty.
 
         Design
         ----------
@@ -309,11 +436,14 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         #   starting a new queue of simulator workers.
         # * The stop_workers() slot reverts this queue back to "None".
         #
-        # For efficiency, return this queue reduced to a boolean -- equivalent
-        # to this less efficient (but more readable) pair of tests:
+        # For efficiency, return these queues reduced to booleans -- equivalent
+        # to this less efficient (but more readable) set of tests:
         #
-        #    return self._workers_cls is not None and len(self._workers_cls)
-        return bool(self._workers_queued)
+        #    return (
+        #        (self._workers_queued is not None and
+        #         len(self._workers_queued)) or
+        #        len(self._workers_working))
+        return bool(self._workers_working) or bool(self._workers_queued)
 
     # ..................{ PROPERTIES ~ bool : state         }..................
     @property
@@ -396,10 +526,15 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
     @property
     def worker(self) -> QBetseeSimmerPhaseWorker:
         '''
-        **Currently working worker** (i.e., :class:`QRunnable` instance
+        **Lead worker** (i.e., earliest started :class:`QRunnable` instance
         currently modelling or exporting a previously queued simulation phase
-        in another thread) if any *or* raise an exception otherwise (i.e., if
-        no workers are currently working).
+        in another thread) if any, the next worker to be started if no worker
+        has been started yet, *or* raise an exception otherwise (i.e., if no
+        workers are currently working).
+
+        When multiple workers are concurrently working, only this worker drives
+        the state of this proactor and hence the progress widgets displayed to
+        the end user.
 
         Raises
         ----------
@@ -410,19 +545,60 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         # If no worker is working, raise an exception.
         self._die_unless_working()
 
-        # Return the head worker of the worker queue.
-        return self._workers_queued[0]
+        # Return the head worker of the working queue if any *OR* the head
+        # worker of the worker queue otherwise.
+        return (
+            self._workers_working[0] if self._workers_working else
+            self._workers_queued[0])
+
+
+    # ..................{ GETTERS ~ metrics                 }..................
+    def get_worker_telemetry(self) -> tuple:
+        '''
+        Tuple of named tuples snapshotting the metrics of each simulator worker
+        started by the most recent run of this proactor, listing all finished
+        workers (in finishing order) *before* all working workers (in starting
+        order).
+
+        This getter is intended to be called from the main event thread,
+        typically to export these metrics (e.g., by serializing the dictionary
+        returned by the :meth:`SimmerWorkerTelemetry._asdict` method of each
+        item of this tuple).
+        '''
+
+        return tuple(
+            metrics.get_telemetry()
+            for metrics in self._metrics_finished + [
+                self._worker_to_metrics[worker]
+                for worker in self._workers_working
+            ]
+        )
+
+
+    def get_worker_telemetry_lead(self) -> SimmerWorkerTelemetryOrNoneTypes:
+        '''
+        Named tuple snapshotting the metrics of the lead worker if any *or*
+        ``None`` otherwise.
+        '''
+
+        return (
+            self._worker_to_metrics[self.worker].get_telemetry()
+            if self._workers_working else None)
 
     # ..................{ PROPERTIES ~ private : bool       }..................
     @property
     def _is_paused(self) -> bool:
         '''
-        ``True`` only if the simulator is **paused** (i.e., some simulator
-        worker is currently paused while previously modelling or exporting some
-        queued simulator phase and hence is neither running nor finished).
+        ``True`` only if the simulator is **paused** (i.e., the user requested
+        the simulator be paused while previously modelling or exporting some
+        queued simulator phase *and* has yet to resume or stop the simulator).
+
+        Since workers may finish while paused, the simulator may be paused
+        even when no worker is currently working (i.e., when only enqueued
+        workers remain).
         '''
 
-        return self.state is SimmerState.PAUSED
+        return self._is_pause_requested
 
     # ..................{ PROPERTIES ~ private : phase      }..................
     @property
@@ -487,8 +663,33 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
             :attr:`_workers_cls` is either ``None`` or empty).
         '''
 
-        # Currently working phase, localized purely for negligible efficiency.
-        worker_phase = self.worker.phase
+        # Defer to this lower-level setter.
+        self._set_worker_phase_state(worker=self.worker, state=state)
+
+
+    @type_check
+    def _set_worker_phase_state(
+        self, worker: QBetseeSimmerPhaseWorker, state: SimmerState) -> None:
+        '''
+        Set the state of the simulator phase run by the passed worker to the
+        passed state.
+
+        If this worker is the lead worker (i.e., :attr:`worker`), this setter
+        additionally sets the state of this proactor from the state of this
+        phase. Else, the state of this proactor is preserved as is. The states
+        of phases run by non-lead workers are thus reflected only by the
+        widgets specific to those phases (e.g., phase status labels).
+
+        Parameters
+        ----------
+        worker : QBetseeSimmerPhaseWorker
+            Simulator worker running the phase whose state is to be set.
+        state : SimmerState
+            New state to set this phase to.
+        '''
+
+        # Phase run by this worker, localized purely for negligible efficiency.
+        worker_phase = worker.phase
 
         # Log this setting.
         logs.log_debug(
@@ -497,11 +698,13 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
             enums.get_member_name_lowercase(worker_phase.state),
             enums.get_member_name_lowercase(state))
 
-        # Set the state of the currently running phase to this state.
+        # Set the state of this phase to this state.
         worker_phase.state = state
 
-        # Possibly set the state of this proactor to the same state.
-        self._set_state_from_phase(worker_phase)
+        # If this worker is the lead worker, possibly set the state of this
+        # proactor to the same state.
+        if worker is self.worker:
+            self._set_state_from_phase(worker_phase)
 
 
     @Slot(QObject)
@@ -778,12 +981,29 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         # If no simulator phase is currently queued, raise an exception.
         self._die_unless_queued()
 
-        # If one or more workers are already working, raise an exception.
-        guipoolthread.die_if_working()
+        # If one or more simulator workers are already working, raise an
+        # exception. Note that only this proactor's workers are tested rather
+        # than the singleton thread pool, which also runs unrelated short-lived
+        # workers (e.g., saving simulation configurations, decoding previews).
+        self._die_if_working()
+
+        # If the simulation configuration has unsaved changes, prompt the user
+        # to save these changes. Since simulations run the saved file, results
+        # exported by this run then remain reproducible from that file. If
+        # the user cancels this prompt, uncheck the action toggling work
+        # (which the user just checked) *AND* silently noop. Since that action
+        # is connected to the toggle_work() slot via its "triggered" rather
+        # than "toggled" signal, doing so avoids recursively calling that slot.
+        if not self._sim_conf.save_if_dirty_before_run():
+            self._action_toggle_work.setChecked(False)
+            return
 
         # Initialize the queue of simulator phases to be run.
         self._enqueue_workers()
 
+        # Clear any pause request pertaining to a prior run.
+        self._is_pause_requested = False
+
         # Initiate iteration by starting the first enqueued worker and
         # connecting the stop signal emitted by that worker to a slot
         # iteratively repeating this process.
@@ -794,9 +1014,10 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         '''
         Pause the currently running simulator.
 
-        This method temporarily pauses the current simulator worker in a
+        This method temporarily pauses all current simulator workers in a
         thread-safe manner safely resumable at any time by calling the
-        :meth:`_resume_worker` method.
+        :meth:`_resume_worker` method. While paused, no enqueued workers are
+        started.
 
         Raises
         ----------
@@ -811,22 +1032,30 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         # If the simulator is *not* currently running, raise an exception.
         self._die_unless_running()
 
-        # Set both this proactor and the currently working phase to the paused
-        # state *BEFORE* successfully pausing this worker. See the
-        # stop_workers() method for related commentary on this order of logic.
-        self._worker_phase_state = SimmerState.PAUSED
+        # Record this request *BEFORE* pausing these workers, preventing the
+        # _loop_worker() method from starting enqueued workers until resumed.
+        self._is_pause_requested = True
 
-        # Pause the currently running proactor worker.
-        self.worker.pause()
+        # For each currently working worker...
+        for worker in self._workers_working:
+            # Set both this proactor and the phase run by this worker to the
+            # paused state *BEFORE* successfully pausing this worker. See the
+            # stop_workers() method for related commentary on this order.
+            self._set_worker_phase_state(
+                worker=worker, state=SimmerState.PAUSED)
+
+            # Pause this worker.
+            worker.pause()
 
 
     def _resume_worker(self) -> None:
         '''
         Resume the currently paused simulator.
 
-        This method resumes the current simulator worker in a thread-safe
+        This method resumes all current simulator workers in a thread-safe
         manner after having been previously paused by a call to the
-        :meth:`_pause_worker` method.
+        :meth:`_pause_worker` method *and* then starts all enqueued workers
+        whose dependencies completed while paused.
 
         Raises
         ----------
@@ -841,14 +1070,23 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         # If the simulator is *not* currently paused, raise an exception.
         self._die_unless_paused()
 
-        # Revert both this proactor and the currently working phase to the
-        # worker-specific running state *BEFORE* successfully resuming this
-        # worker. See the stop_workers() method for related commentary on this
-        # order of logic.
-        self._worker_phase_state = self.worker.simmer_state
+        # Withdraw the prior pause request.
+        self._is_pause_requested = False
+
+        # For each currently paused worker...
+        for worker in self._workers_working:
+            # Revert both this proactor and the phase run by this worker to the
+            # worker-specific running state *BEFORE* successfully resuming this
+            # worker. See the stop_workers() method for related commentary on
+            # this order of logic.
+            self._set_worker_phase_state(
+                worker=worker, state=worker.simmer_state)
 
-        # Resume the currently paused simulator worker.
-        self.worker.resume()
+            # Resume this worker.
+            worker.resume()
+
+        # Start all enqueued workers whose dependencies completed while paused.
+        self._loop_worker()
 
     # ..................{ SLOTS ~ action : stop             }..................
     @Slot()
@@ -861,10 +1099,15 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         This method effectively reverts the simulator to the idle state in a
         thread-safe manner by (in order):
 
-        #. Unpausing the current simulator worker if currently paused, thus
-           unblocking this worker's parent thread if currently blocked.
-        #. Gracefully halting this worker.
         #. Dequeueing all subsequently queued workers.
+        #. Unpausing all current simulator workers if currently paused, thus
+           unblocking the parent threads of these workers if currently
+           blocked.
+        #. Gracefully halting these workers.
+
+        If the simulator is already stopping (i.e., this slot was previously
+        signalled but these workers have yet to stop), this method instead
+        forcefully halts these workers.
 
         Raises
         ----------
@@ -876,18 +1119,31 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         guithread.log_debug_thread_main(
             'Stopping simulator work by user request...')
 
+        # If the simulator is already stopping, the user has requested that
+        # all currently working workers stop again while still waiting for
+        # these workers to reach their next stop point. Since each
+        # process-backed worker responds to a repeated stop request by
+        # non-gracefully terminating its child process, forward this request
+        # to these workers and return. See the "QBetseeProcessPoolWorker"
+        # class docstring for further details.
+        if self.state is SimmerState.STOPPING:
+            for worker in tuple(self._workers_working):
+                worker.stop()
+            return
+        # Else, the simulator is *NOT* already stopping.
+
         # If no worker is currently working, raise an exception.
         self._die_unless_working()
 
-        # Currently working simulator worker. For safety, this property is
-        # localized *BEFORE* this worker's stop() pseudo-slot (which
-        # implicitly signals the _handle_worker_completion() slot, which
-        # internally dequeues this worker and hence implicitly modifies the
-        # worker returned by the "_worker" property) is called.
-        worker = self.worker
+        # Currently working simulator workers. For safety, this queue is
+        # copied *BEFORE* the stop() pseudo-slots of these workers (which
+        # implicitly signal the _handle_worker_completion() slot, which
+        # internally dequeues these workers and hence implicitly modifies the
+        # worker returned by the "worker" property) are called.
+        workers = tuple(self._workers_working)
 
-        # Set both this proactor and the currently working phase to the
-        # stopping state *BEFORE* successfully stopping this worker.
+        # Set both this proactor and each currently working phase to the
+        # stopping state *BEFORE* successfully stopping these workers.
         #
         # Doing so enforces mutual exclusivity from the end user perspective
         # with respect to proactor state. Specifically, setting this state
@@ -900,31 +1156,40 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         # state), a window of time would exist in which the UI failed to
         # reflect this request to stop and hence permitted the user to issue
         # subsequent actions at odds with that request. In short, this is sane.
-        self._worker_phase_state = SimmerState.STOPPING
+        for worker in workers:
+            self._set_worker_phase_state(
+                worker=worker, state=SimmerState.STOPPING)
 
         # Dequeue *ALL* currently enqueued simulator workers scheduled to work
-        # following the currently working worker. While the latter could
+        # following the currently working workers. While the latter could
         # theoretically be dequeued as well, doing so would prevent the
-        # _handle_worker_completion() slot transitively called by the call to
-        # the stop() pseudo-slot below from setting the state of the phase
-        # associated with the currently working worker. In short, this works.
-        #
-        # For negligible efficiency, this queue is recreated from scratch to
-        # contain only this worker rather than iteratively popping all items
-        # except the first from this queue (e.g., by calling the
-        # queues.pop_left() function).
-        self._workers_queued = deque((worker,))
+        # _handle_worker_completion() slot transitively called by the calls to
+        # the stop() pseudo-slot below from setting the states of the phases
+        # associated with the currently working workers. In short, this works.
+        self._workers_queued.clear()
 
-        # Stop this worker *AFTER* dequeueing all currently enqueued workers
+        # Stop these workers *AFTER* dequeueing all currently enqueued workers
         # and setting this simulator state.
         #
         # While feasible, reversing this order of operations invites subtle
         # race conditions between this slot and the _handle_worker_completion()
-        # slot signalled by this call, which calls the _loop_worker() method,
-        # which calls the _dequeue_workers() method. Since the stop() method
-        # called here signals the _handle_worker_completion() slot in a
-        # multithreaded and hence non-deterministic manner, badness ensues.
-        worker.stop()
+        # slot signalled by these calls, which calls the _loop_worker() method,
+        # which starts all enqueued workers. Since the stop() method called
+        # here signals the _handle_worker_completion() slot in a multithreaded
+        # and hence non-deterministic manner, badness ensues.
+        for worker in workers:
+            worker.stop()
+
+        # Withdraw any prior pause request, which this request supersedes.
+        self._is_pause_requested = False
+
+        # If no worker was working (i.e., all workers working when the user
+        # paused the simulator have since finished), no worker remains to
+        # signal the _handle_worker_completion() slot and hence finish this
+        # proactor. Do so manually.
+        if not workers:
+            self.state = SimmerState.FINISHED
+            self._dequeue_workers()
 
     # ..................{ QUEUERS                           }..................
     def _enqueue_workers(self) -> None:
@@ -936,10 +1201,9 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         This method enqueues (i.e., pushes onto this queue) workers in
         simulation phase order, defined as the ordering of the members of the
         :class:`betse.science.enum.enumphase.SimPhaseKind` enumeration.
-        Callers may safely run the simulation phases performed by these workers
-        merely by sequentially assigning each worker enqueued in this queue to
-        a thread via the
-        :func:`betsee.util.thread.pool.guipoolthread.start_worker` function.
+        The :meth:`_loop_worker` method then starts each worker enqueued in
+        this queue as soon as all prior workers that worker depends on have
+        completed.
 
         For example:
 
@@ -971,36 +1235,196 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         # Queue of all simulator workers to be subsequently run.
         self._workers_queued = self.phaser.enqueue_phase_workers()
 
+        # Snapshot the simulation configuration shared by these workers.
+        self._snapshot_conf()
+
+        # Consult the cache of modelled phase results, permitting modelling
+        # workers whose results are cached to finish instantly.
+        self._enqueue_workers_cached()
+
+        # Stream the fields of all modelled phases to the live view.
+        self._enqueue_workers_live()
+
+        # Reset the queue of all working workers, their progress, and all
+        # metrics collected by the prior run if any.
+        self._workers_working.clear()
+        self._worker_to_progress.clear()
+        self._worker_to_metrics.clear()
+        self._metrics_finished = []
+
+
+    def _snapshot_conf(self) -> None:
+        '''
+        Snapshot the currently open simulation configuration into the
+        :attr:`_conf_snapshot` variable shared by all enqueued workers *and*
+        hash that configuration into the :attr:`_conf_hash` variable.
+
+        This snapshot is of the on-disk file underlying that configuration
+        rather than of the in-memory configuration displayed to the user. The
+        caller should thus have previously prompted the user to save all
+        unsaved changes (e.g., by calling the
+        :meth:`QBetseeSimConf.save_if_dirty_before_run` method).
+        '''
+
+        # Block until all queued writes of this configuration have been
+        # performed, including the save of all unsaved changes confirmed by
+        # the user above. Since relative pathnames in this configuration
+        # (e.g., of input images) refer to the directory containing the file
+        # this configuration is currently associated with, a pending job
+        # copying the requisite subdirectories of this configuration into that
+        # directory (e.g., after "New..." or "Save As...") would otherwise
+        # leave these workers reading files that have yet to be copied.
+        self._sim_conf.wait_writes()
+
+        # Snapshot of the file underlying this configuration, deserialized at
+        # most once per run by the first worker to be started rather than once
+        # per worker *AND* redeserialized only if this file changes.
+        self._conf_snapshot = SimmerConfSnapshot(
+            conf_filename=self._p.conf_filename)
+
+        # Hash of this file, keying these runs in the run history.
+        self._conf_hash = hash_conf_file(self._p.conf_filename)
+
+
+    def _enqueue_workers_cached(self) -> None:
+        '''
+        Enable the cache of modelled phase results for all enqueued workers
+        modelling phases, each of which restores its result from this cache
+        if cached rather than remodelling that phase.
+
+        This cache is keyed by the same saved simulation configuration run by
+        these workers (i.e., :attr:`_conf_snapshot`) and hence *must* be
+        enabled only after creating that snapshot. Since this cache is keyed
+        lazily by the first worker consulting this cache and then shared as
+        is with all other workers (including child processes spawned by
+        process-backed workers), the keys tested by these workers are
+        guaranteed to be the keys stored to by these workers. Since keying
+        hashes all external files referenced by this configuration, keying is
+        intentionally deferred to these workers rather than performed here in
+        the main event thread.
+        '''
+
+        # Cache of modelled phase results keyed by a deep copy of the open
+        # configuration, which the _start_workers() method guarantees to have
+        # been saved to the file deserialized by this snapshot. Copying this
+        # configuration rather than calling the make_p() method of this
+        # snapshot avoids deserializing that file in the main event thread.
+        # Since this copy is owned by this cache and has yet to be
+        # reconfigured in-memory for the simulator, this cache safely keys
+        # this copy on first use.
+        phase_cache = SimmerPhaseCache(deepcopy(self._p))
+
+        # Enable caching for each enqueued worker modelling a phase.
+        for worker in self._workers_queued:
+            if worker.phase_subkind is SimmerPhaseSubkind.MODELLING:
+                worker.enable_phase_cache(phase_cache)
+
+
+    def _enqueue_workers_live(self) -> None:
+        '''
+        Enable streaming to the live view for all enqueued workers modelling
+        phases displayable by that view, silently reducing to a noop if the
+        active Python interpreter does *not* support the live view.
+        '''
+
+        # Name of the live ring owned by the live view if supported *OR*
+        # "None" otherwise.
+        live_ring_name = self._live_view.get_ring_name()
+
+        # If the live view is unsupported, silently reduce to a noop.
+        if live_ring_name is None:
+            return
+
+        # For each enqueued worker modelling a displayable phase, enable
+        # streaming for this worker at the decimation selected by the user.
+        for worker in self._workers_queued:
+            if (worker.phase_subkind is SimmerPhaseSubkind.MODELLING and
+                worker.phase.kind in LIVE_PHASE_KINDS):
+                worker.enable_live_view(
+                    ring_name=live_ring_name,
+                    decimation=self._live_view.decimation)
+
+
+    @Slot()
+    def clear_phase_cache(self) -> None:
+        '''
+        Slot removing *all* cached results of modelled phases for the current
+        simulation configuration, forcing all subsequently enqueued workers to
+        remodel their phases.
+
+        Raises
+        ----------
+        BetseeSimmerException
+            If one or more workers are currently working.
+        '''
+
+        # If some simulator worker is currently working, raise an exception.
+        # Workers may be restoring or storing results in this cache.
+        self._die_if_working()
+
+        # Remove all cached results for this configuration. Since this cache
+        # is keyed lazily and invalidation requires no keys, doing so hashes
+        # nothing and is thus safely performed in the main event thread.
+        SimmerPhaseCache(self._p).invalidate()
+
 
     def _dequeue_workers(self) -> None:
         '''
-        Revert the :attr:`_workers_queued` to ``None``, effectively dequeueing
-        (i.e., popping) all previously queued simulator workers.
+        Revert the :attr:`_workers_queued` to ``None`` and release all state
+        shared by the workers of the current run, including the simulation
+        configuration snapshot (i.e., :attr:`_conf_snapshot`) deep copied for
+        these workers.
+
+        This method is intended to be called only on the current run either
+        completing *or* being stopped (i.e., after all workers of this run
+        have finished), after which no worker of this run remains to
+        reference this snapshot.
+
+        Raises
+        ----------
+        BetseeSimmerException
+            If some simulator worker is still working.
         '''
 
         # Log this action.
         guithread.log_debug_thread_main('Dequeueing simulator workers...')
 
-        # If no simulator worker is currently working, raise an exception.
-        self._die_unless_working()
+        # If some simulator worker is still working, raise an exception.
+        self._die_if_working()
 
-        # Clear this queue, implicitly scheduling all previously queued workers
-        # for garbage collection *AND* disconnecting all external slots
+        # Clear these queues, implicitly scheduling all previously queued
+        # workers for garbage collection *AND* disconnecting all external slots
         # previously connected to signals defined by these workers.
         self._workers_queued = None
+        self._workers_working.clear()
+        self._worker_to_progress.clear()
+        self._worker_to_metrics.clear()
+
+        # Release the simulation configuration shared by these workers.
+        self._conf_snapshot = None
 
     # ..................{ WORKERS ~ loop                    }..................
     def _loop_worker(self) -> None:
         '''
-        Iteratively run the next enqueued simulator worker if any *or* cleanup
-        after this iteration otherwise (i.e., if no workers remain to be run).
+        Iteratively start all enqueued simulator workers whose dependencies
+        have all completed if any *or* cleanup after this iteration otherwise
+        (i.e., if no workers remain to be run).
 
         This method perform the equivalent of the body of the abstract loop
         iteratively starting and running all enqueued simulator workers.
-        Specifically, this method iteratively starts the next simulator worker
-        (i.e., head item of the :attr:`_workers_queued`) enqueued by a prior call
-        to the :meth:`_enqueue_workers` method if this queue is non-empty
-        *or* garbage-collects this queue otherwise (i.e., if already empty).
+        Specifically, this method pops each simulator worker enqueued by a
+        prior call to the :meth:`_enqueue_workers` method that is startable
+        (i.e., dependent on no prior worker that has yet to complete) from the
+        :attr:`_workers_queued` queue onto the :attr:`_workers_working` queue
+        *and* starts that worker, until either:
+
+        * No startable workers remain.
+        * The number of working workers is the maximum number of workers
+          concurrently workable in the compute thread pool.
+
+        This method silently reduces to a noop if this proactor is either
+        paused or stopping, in which case no additional workers should be
+        started until this proactor is resumed.
 
         Design
         ----------
@@ -1019,7 +1443,7 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
 
         # If no workers remain to be run, gracefully halt this iteration by
         # silently reducing to a noop.
-        if not self.is_worker:
+        if not self._workers_queued:
             # Log this halt.
             guithread.log_debug_thread_main(
                 'Ceasing simulator worker iteration...')
@@ -1028,28 +1452,282 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
             return
         # Else, one or more workers remain to be run.
 
-        # Next worker to be run, localized for negligible efficiency.
-        worker = self.worker
+        # If the user requested this proactor be paused *OR* this proactor is
+        # stopping, avoid starting new workers. Note that the pause request
+        # rather than the state of this proactor is tested, as the latter
+        # reverts to finished on the last working worker finishing while
+        # paused (e.g., an exporter ignoring pause requests).
+        if self._is_pause_requested or self.state is SimmerState.STOPPING:
+            return
+        # Else, this proactor is neither paused nor stopping.
 
         # Log this work attempt.
-        guithread.log_debug_thread_main('Iterating simulator worker...')
+        guithread.log_debug_thread_main('Iterating simulator workers...')
+
+        # Maximum number of concurrently working workers, bounded by the size
+        # of the compute thread pool these workers are started in.
+        worker_count_max = guipoolthread.get_worker_count_max(
+            guipoolthread.get_thread_pool_compute())
+
+        # Start each startable worker in enqueued order.
+        for worker in get_workers_startable(
+            workers_queued=self._workers_queued,
+            workers_working=self._workers_working,
+            worker_count_max=worker_count_max,
+            is_dependent_on=QBetseeSimmerPhaseWorker.is_dependent_on,
+        ):
+            self._start_worker(worker)
 
-        # Set the state of both this proactor and the currently working phase
-        # *BEFORE* successfully starting this worker. See the stop_workers()
-        # method for related commentary on this order of logic.
-        self._worker_phase_state = worker.simmer_state
 
-        # Finalize this worker's initialization.
+    @type_check
+    def _start_worker(self, worker: QBetseeSimmerPhaseWorker) -> None:
+        '''
+        Pop the passed simulator worker from the :attr:`_workers_queued` queue
+        onto the :attr:`_workers_working` queue *and* start this worker.
+
+        Parameters
+        ----------
+        worker : QBetseeSimmerPhaseWorker
+            Enqueued simulator worker to be started.
+        '''
+
+        # Log this start.
+        guithread.log_debug_thread_main(
+            'Starting simulator phase "%s" worker...', worker.phase.name)
+
+        # Move this worker from the worker queue onto the working queue
+        # *BEFORE* setting this worker's state, which tests whether this worker
+        # is the lead worker.
+        self._workers_queued.remove(worker)
+        self._workers_working.append(worker)
+
+        # Default this worker's most recent progress to nothing.
+        self._worker_to_progress[worker] = [None, None, None, None]
+
+        # Begin collecting metrics for this worker, estimating the time
+        # remaining from prior runs of this phase until this worker has
+        # progressed enough to measure its own throughput.
+        self._worker_to_metrics[worker] = SimmerWorkerMetrics(
+            phase_kind=worker.phase.kind,
+            phase_subkind=worker.phase_subkind,
+            steps_per_second_prior=(
+                self._history_view.history.get_steps_per_second_baseline(
+                    conf_hash=self._conf_hash,
+                    phase_kind=worker.phase.kind,
+                    phase_subkind=worker.phase_subkind,
+                )),
+        )
+
+        # Set the state of both this proactor (if this is the lead worker) and
+        # the phase run by this worker *BEFORE* successfully starting this
+        # worker. See the stop_workers() method for related commentary.
+        self._set_worker_phase_state(worker=worker, state=worker.simmer_state)
+
+        # Finalize this worker's initialization. Rather than connecting the
+        # progress signals emitted by this worker directly to the progress
+        # widgets, connect these signals to slots of this proactor forwarding
+        # only the progress of the lead worker to these widgets.
         worker.init(
-            conf_filename=self._p.conf_filename,
-            progress_bar=self._progress_bar,
-            progress_label=self._progress_substatus,
+            conf_snapshot=self._conf_snapshot,
             handler_failed=self._handle_worker_exception,
             handler_finished=self._handle_worker_completion,
         )
+        worker.signals.progress_ranged.connect(
+            self._handle_worker_progress_ranged)
+        worker.signals.progressed.connect(self._handle_worker_progressed)
+        worker.signals.progress_stated.connect(
+            self._handle_worker_progress_stated)
+        worker.signals.paused.connect(self._handle_worker_paused)
+        worker.signals.resumed.connect(self._handle_worker_resumed)
+
+        # Start this worker in the compute thread pool *AFTER* establishing
+        # all signal-slot connections, preserving the singleton thread pool
+        # for short-lived workers (e.g., saving simulation configurations).
+        guipoolthread.start_worker(
+            worker, thread_pool=guipoolthread.get_thread_pool_compute())
+
+    # ..................{ WORKERS ~ getter                  }..................
+    def _get_worker_signalling(self) -> QBetseeSimmerPhaseWorkerOrNoneTypes:
+        '''
+        Working simulator worker whose signals collection emitted the signal
+        connected to the slot currently being called if any *or* ``None``
+        otherwise (e.g., if that worker has since been dequeued).
+
+        This getter is intended to be called *only* from slots of this
+        proactor connected to signals emitted by working simulator workers.
+        '''
+
+        # Signals collection emitting the signal calling the current slot.
+        signals = self.sender()
+
+        # Return the first working worker owning this collection if any.
+        for worker in self._workers_working:
+            if worker.signals is signals:
+                return worker
+
+        # Else, no working worker owns this collection.
+        return None
+
+    # ..................{ WORKERS ~ progress                }..................
+    def _replay_worker_progress(self) -> None:
+        '''
+        Replay the most recent progress signalled by the lead worker onto the
+        progress widgets, typically on that worker becoming the lead worker.
+        '''
+
+        # If no worker is working, silently reduce to a noop.
+        if not self._workers_working:
+            return
+
+        # Most recent progress signalled by the lead worker.
+        progress_min, progress_max, progress, status = (
+            self._worker_to_progress[self.worker])
+
+        # Replay this progress onto these widgets (in signalling order).
+        if progress_min is not None:
+            self._progress_bar.set_range_and_value_minimum(
+                progress_min, progress_max)
+        if progress is not None:
+            self._progress_bar.setValue(progress)
+        if status is not None:
+            self._progress_substatus.setText(status)
 
-        # Start this worker *AFTER* establishing all signal-slot connections.
-        guipoolthread.start_worker(worker)
+
+    @Slot(int, int)
+    def _handle_worker_progress_ranged(
+        self, progress_min: int, progress_max: int) -> None:
+        '''
+        Slot signalled on any working simulator worker emitting the
+        :attr:`QBetseeThreadPoolWorkerSignals.progress_ranged` signal.
+
+        This slot records this progress range for that worker and, if that
+        worker is the lead worker, forwards this range to the progress bar.
+        '''
+
+        # Worker emitting this signal if still working *OR* "None" otherwise.
+        worker = self._get_worker_signalling()
+
+        # If this worker is no longer working, silently reduce to a noop.
+        if worker is None:
+            return
+
+        # Record this progress range.
+        worker_progress = self._worker_to_progress[worker]
+        worker_progress[0] = progress_min
+        worker_progress[1] = progress_max
+        self._worker_to_metrics[worker].record_progress_range(
+            progress_min, progress_max)
+
+        # If this is the lead worker, forward this range to the progress bar.
+        if worker is self.worker:
+            self._progress_bar.set_range_and_value_minimum(
+                progress_min, progress_max)
+
+
+    @Slot(int)
+    def _handle_worker_progressed(self, progress: int) -> None:
+        '''
+        Slot signalled on any working simulator worker emitting the
+        :attr:`QBetseeThreadPoolWorkerSignals.progressed` signal.
+
+        This slot records this progress value for that worker and, if that
+        worker is the lead worker, forwards this value to the progress bar.
+        '''
+
+        # Worker emitting this signal if still working *OR* "None" otherwise.
+        worker = self._get_worker_signalling()
+
+        # If this worker is no longer working, silently reduce to a noop.
+        if worker is None:
+            return
+
+        # Record this progress value and the resource usage most recently
+        # reported by the child process running this worker if any.
+        self._worker_to_progress[worker][2] = progress
+        self._record_worker_metrics_usage(worker)
+        self._worker_to_metrics[worker].record_progress(progress)
+
+        # If this is the lead worker, forward this value to the progress bar.
+        if worker is self.worker:
+            self._progress_bar.setValue(progress)
+
+
+    @Slot(str)
+    def _handle_worker_progress_stated(self, status: str) -> None:
+        '''
+        Slot signalled on any working simulator worker emitting the
+        :attr:`QBetseeThreadPoolWorkerSignals.progress_stated` signal.
+
+        This slot records this progress status for that worker and, if that
+        worker is the lead worker, forwards this status to the progress
+        substatus label.
+        '''
+
+        # Worker emitting this signal if still working *OR* "None" otherwise.
+        worker = self._get_worker_signalling()
+
+        # If this worker is no longer working, silently reduce to a noop.
+        if worker is None:
+            return
+
+        # Record this progress status.
+        self._worker_to_progress[worker][3] = status
+
+        # If this is the lead worker, forward this status to this label.
+        if worker is self.worker:
+            self._progress_substatus.setText(status)
+
+    @Slot()
+    def _handle_worker_paused(self) -> None:
+        '''
+        Slot signalled on any working simulator worker emitting the
+        :attr:`QBetseeThreadPoolWorkerSignals.paused` signal (i.e., blocking
+        in pause), recording this pause in the metrics of that worker.
+        '''
+
+        # Worker emitting this signal if still working *OR* "None" otherwise.
+        worker = self._get_worker_signalling()
+
+        # If this worker is still working, record this pause.
+        if worker is not None:
+            self._worker_to_metrics[worker].record_paused()
+
+
+    @Slot()
+    def _handle_worker_resumed(self) -> None:
+        '''
+        Slot signalled on any working simulator worker emitting the
+        :attr:`QBetseeThreadPoolWorkerSignals.resumed` signal (i.e.,
+        unblocking from pause), recording this resumption in the metrics of
+        that worker.
+        '''
+
+        # Worker emitting this signal if still working *OR* "None" otherwise.
+        worker = self._get_worker_signalling()
+
+        # If this worker is still working, record this resumption.
+        if worker is not None:
+            self._worker_to_metrics[worker].record_resumed()
+
+    # ..................{ WORKERS ~ metrics                 }..................
+    def _record_worker_metrics_usage(
+        self, worker: QBetseeSimmerPhaseWorker) -> None:
+        '''
+        Record the resource usage most recently reported by the child process
+        running the passed working simulator worker into the metrics of that
+        worker if that process has reported its usage *or* silently reduce to
+        a noop otherwise.
+        '''
+
+        # Resource usage of this process if reported *OR* "None" otherwise.
+        child_usage = worker.child_usage
+
+        # If this process reported its usage, record this usage.
+        if child_usage is not None:
+            self._worker_to_metrics[worker].record_usage(
+                cpu_seconds=child_usage.cpu_seconds,
+                rss_peak_bytes=child_usage.rss_peak_bytes,
+            )
 
     # ..................{ WORKERS ~ slot                    }..................
     # Slots connected to signals emitted by "QRunnable" workers.
@@ -1111,13 +1789,16 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
     @Slot(bool)
     def _handle_worker_completion(self, is_success: bool) -> None:
         '''
-        Handle the completion of the most recently working simulator worker.
+        Handle the completion of the simulator worker emitting the signal
+        calling this slot.
 
         Specifically, this method:
 
         * Sets the state of the corresponding simulator phase to finished.
-        * Pops this worker from the :attr:`_workers_queued`.
-        * If this queue is non-empty, starts the next enqueued worker.
+        * Removes this worker from the :attr:`_workers_working` queue.
+        * If other workers are still working, sets the state of this proactor
+          from the state of the phase run by the new lead worker.
+        * Starts all enqueued workers whose dependencies have now completed.
 
         Parameters
         ----------
@@ -1125,35 +1806,46 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
             ``True`` only if this worker completed successfully.
         '''
 
-        # If the most recently working worker is no longer working, silently
-        # reduce to a noop. Ideally, a worker would *ALWAYS* be working when
-        # this slot is signalled. In practice, edge cases resulting from the
-        # non-determinism implicit in multithreaded logic can induce this. For
-        # example, the stop_workers() slot dequeueing all workers *BEFORE*
-        # calling the QBetseeSimmerPhaseWorker.stop() pseudo-slot signalling
-        # this slot reliably induces this case.
-        if not self.is_worker:
+        # Worker emitting this signal if still working *OR* "None" otherwise.
+        worker = self._get_worker_signalling()
+
+        # If this worker is no longer working, silently reduce to a noop.
+        # Ideally, a worker would *ALWAYS* be working when this slot is
+        # signalled. In practice, edge cases resulting from the
+        # non-determinism implicit in multithreaded logic can induce this.
+        if worker is None:
             # Log this edge case.
             guithread.log_debug_thread_main(
                 'Ignoring simulator worker closure...')
 
             # Reduce to a noop.
             return
-        # Else, one or more workers remain to be run.
+        # Else, this worker is still working.
 
         # Log this slot.
-        guithread.log_debug_thread_main('Handling simulator worker closure...')
-
-        # If this worker is still technically working, set the state of both
-        # this simulator *AND* the previously working phase to finished. This
-        # ensures that the simulator reliably returns to the finished state on
-        # completing all possible work, regardless of whether that worker
-        # halted gracefully or prematurely (e.g., due to the user prematurely
-        # stopping all work).
+        guithread.log_debug_thread_main(
+            'Handling simulator phase "%s" worker closure...',
+            worker.phase.name)
+
+        # Manner in which this worker finished, decided *BEFORE* setting the
+        # state of this worker's phase to finished below. A worker stopped by
+        # the user typically reports success, as halting is *NOT* an error.
+        if worker.phase.state is SimmerState.STOPPING:
+            run_outcome = SimmerRunOutcome.STOPPED
+        elif is_success:
+            run_outcome = SimmerRunOutcome.SUCCEEDED
+        else:
+            run_outcome = SimmerRunOutcome.FAILED
+
+        # Set the state of both this simulator (if this is the lead worker)
+        # *AND* the phase run by this worker to finished. This ensures that the
+        # simulator reliably returns to the finished state on completing all
+        # possible work, regardless of whether that worker halted gracefully
+        # or prematurely (e.g., due to the user prematurely stopping all work).
         #
         # For safety, do so *BEFORE* this method dequeues this worker and hence
-        # internally modifies the worker yielded by the "_worker" property.
-        self._worker_phase_state = SimmerState.FINISHED
+        # internally modifies the worker yielded by the "worker" property.
+        self._set_worker_phase_state(worker=worker, state=SimmerState.FINISHED)
 
         # Schedule this worker for immediate deletion. On doing so, all signals
         # owned by this worker will be disconnected from connected slots.
@@ -1162,12 +1854,60 @@ class QBetseeSimmerProactor(QBetseeSimmerStatefulABC):
         # nullification of the worker owning these signals should already
         # signal this deletion. As doing so has no harmful side effects,
         # however, do so regardless for additional safety.
-        self.worker.delete_later()
+        worker.delete_later()
 
-        # Dequeue this worker (i.e., remove this worker's subclass from
-        # the queue of worker subclasses to be instantiated and run).
-        self._workers_queued.popleft()
+        # Finalize the metrics of this worker, including the final resource
+        # usage reported by the child process running this worker.
+        self._record_worker_metrics_usage(worker)
+        worker_metrics = self._worker_to_metrics.pop(worker)
+        worker_metrics.record_finished(is_success)
+        self._metrics_finished.append(worker_metrics)
 
-        # Start the next worker in the current queue of workers to be run
-        # if any or reduce to a noop otherwise.
+        # Log these metrics.
+        guithread.log_debug_thread_main(
+            'Simulator phase "%s" worker metrics: %r',
+            worker.phase.name, worker_metrics.get_telemetry())
+
+        # If this worker ran this phase rather than restoring its cached
+        # result, record this run in the run history *AND* redisplay that
+        # history. Since restorations are effectively instantaneous, recording
+        # restorations would only skew the throughput of subsequent runs.
+        if not worker.is_phase_cache_hit:
+            self._history_view.history.record_run(
+                conf_filename=self._p.conf_filename,
+                conf_hash=self._conf_hash,
+                telemetry=worker_metrics.get_telemetry(),
+                outcome=run_outcome,
+            )
+            self._history_view.refresh()
+
+        # Dequeue this worker and its most recent progress.
+        self._workers_working.remove(worker)
+        del self._worker_to_progress[worker]
+
+        # If this worker exported, notify interested slots that the export
+        # manifests of this phase may have changed. Since partial exports
+        # record each successfully exported item, do so unconditionally.
+        if worker.phase_subkind is SimmerPhaseSubkind.EXPORTING:
+            self.exported_signal.emit()
+
+        # If one or more other workers are still working, the new lead worker
+        # now drives the state of this proactor and hence progress widgets.
+        # Synchronize this proactor and these widgets to that worker.
+        if self._workers_working:
+            self._set_state_from_phase(self.worker.phase)
+            self._replay_worker_progress()
+        # Else if the user paused this proactor *AND* enqueued workers remain,
+        # this proactor remains paused rather than finished until the user
+        # resumes or stops this proactor.
+        elif self._is_pause_requested and self._workers_queued:
+            self.state = SimmerState.PAUSED
+
+        # Start all enqueued workers whose dependencies have now completed if
+        # any or reduce to a noop otherwise.
         self._loop_worker()
+
+        # If no workers remain to be run, this run has completed or been
+        # stopped. Release all state shared by the workers of this run.
+        if not self.is_worker:
+            self._dequeue_workers()
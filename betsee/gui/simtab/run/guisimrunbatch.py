@@ -0,0 +1,609 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **simulator batch** (i.e., headless object running simulation
+phases of one or more simulation configurations through the same pooled
+workers run by the simulator tab, reporting progress as a machine-readable
+stream) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from PySide2.QtCore import QCoreApplication, QObject, QTimer, Slot
+from betse.science.enum.enumphase import SimPhaseKind
+from betse.util.io.log import logs
+from betse.util.os.command.cmdexit import FAILURE_DEFAULT, SUCCESS
+from betse.util.type import enums
+from betse.util.type.types import type_check, SequenceTypes
+from betsee.gui.simtab.run.work.guisimrunwork import (
+    QBetseeSimmerPhaseProcessWorker,
+    QBetseeSimmerPhaseWorker,
+    get_workers_startable,
+)
+from betsee.gui.simtab.run.work.guisimrunworkconf import SimmerConfSnapshot
+from betsee.gui.simtab.run.work.guisimrunworkenum import SimmerPhaseSubkind
+from betsee.gui.simtab.run.work.guisimrunworkphase import SimmerPhaseHeadless
+from betsee.util.thread import guithread
+from betsee.util.thread.pool import guipoolthread
+from collections import deque
+import json, os, signal, sys
+
+# ....................{ CONSTANTS                         }....................
+SIGNAL_POLL_MILLISECONDS = 200
+'''
+Number of milliseconds between each wakeup of the Python interpreter from the
+Qt event loop run by each simulator batch, permitting the Python-level POSIX
+signal handlers installed by that batch (e.g., for ``SIGINT``) to be run in a
+timely manner.
+
+Since the Qt event loop is implemented in C++, Python-level signal handlers
+are otherwise deferred until that loop next calls Python code -- which, for a
+long-running headless batch, may be never.
+'''
+
+# ....................{ CLASSES                           }....................
+class QBetseeSimmerBatch(QObject):
+    '''
+    **Simulator batch** (i.e., headless object running simulation phases of
+    one or more simulation configurations through the same pooled workers run
+    by the simulator tab, reporting progress as a machine-readable stream).
+
+    This batch schedules workers in the same manner as the
+    :class:`QBetseeSimmerProactor` underlying the simulator tab: workers are
+    enqueued in simulation phase order and started as soon as all prior
+    workers they depend on have completed, up to the maximum number of
+    concurrently working workers. Workers running different simulation
+    configurations are independent of one another and thus concurrently
+    runnable *except* exporting workers, which are serialized across all
+    configurations for the reasons detailed by the
+    :meth:`QBetseeSimmerPhaseWorker.is_dependent_on` method.
+
+    If any worker fails, all subsequently enqueued workers running the same
+    configuration are skipped; workers running other configurations continue.
+
+    Progress Stream
+    ----------
+    This batch writes one JSON object per line to the passed progress stream
+    (defaulting to standard output) on each worker event. Each such object
+    provides the following keys:
+
+    * ``event``, the type of this event as one of ``started``, ``ranged``,
+      ``progressed``, ``stated``, ``failed``, ``finished``, ``skipped``, or
+      ``done`` (the last event emitted by this batch).
+    * ``conf``, the absolute filename of the simulation configuration run by
+      the worker emitting this event.
+    * ``phase``, the lowercase name of the simulation phase run by this worker
+      (e.g., ``seed``).
+    * ``subkind``, the lowercase type of work performed by this worker (i.e.,
+      ``modelling`` or ``exporting``).
+
+    Events additionally provide event-specific keys (e.g., ``progress`` for
+    ``progressed`` events). The ``done`` event provides *only* the ``event``,
+    ``succeeded``, ``failed``, and ``skipped`` keys, the latter three of which
+    are the number of workers that succeeded, failed, and were skipped.
+
+    Attributes
+    ----------
+    _conf_filenames_failed : set
+        Set of the absolute filenames of all simulation configurations for
+        which one or more workers either failed or were skipped.
+    _is_stopping : bool
+        ``True`` only if this batch has been requested to stop (e.g., due to
+        the user sending the ``SIGINT`` signal).
+    _progress_stream : object
+        Text stream to which progress events are written.
+    _signal_timer : QTimer
+        Timer periodically waking the Python interpreter from the Qt event
+        loop. See :data:`SIGNAL_POLL_MILLISECONDS`.
+    _worker_count_failed : int
+        Number of workers that have failed.
+    _worker_count_max : int
+        Maximum number of concurrently working workers.
+    _worker_count_skipped : int
+        Number of workers skipped due to prior failures or stop requests.
+    _worker_count_succeeded : int
+        Number of workers that have succeeded.
+    _worker_to_conf_filename : dict
+        Dictionary mapping from each worker enqueued by this batch to the
+        absolute filename of the simulation configuration run by that worker.
+    _workers_queued : QueueType
+        Double-ended queue of all workers that have yet to be started.
+    _workers_working : QueueType
+        Double-ended queue of all workers that are currently working.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+
+        # Mandatory parameters.
+        conf_filenames: SequenceTypes,
+        phase_kinds: SequenceTypes,
+        phase_subkinds: SequenceTypes,
+
+        # Optional parameters.
+        worker_count_max: int = 0,
+        progress_stream: object = None,
+    ) -> None:
+        '''
+        Initialize this simulator batch.
+
+        Parameters
+        ----------
+        conf_filenames : SequenceTypes
+            Sequence of the absolute or relative filenames of all
+            YAML-formatted simulation configuration files to be run.
+        phase_kinds : SequenceTypes
+            Sequence of all :class:`SimPhaseKind` members to be run for each
+            such configuration. Phases are run in simulation phase order
+            regardless of the order of this sequence.
+        phase_subkinds : SequenceTypes
+            Sequence of all :class:`SimmerPhaseSubkind` members to be run for
+            each such phase.
+        worker_count_max : int
+            Maximum number of concurrently working workers. Defaults to 0, in
+            which case the maximum number of threads in the compute thread
+            pool (typically, the number of logical processors) is defaulted
+            to.
+        progress_stream : object
+            Text stream to which progress events are written. Defaults to
+            ``None``, in which case standard output is defaulted to.
+        '''
+
+        # Initialize our superclass.
+        super().__init__()
+
+        # If the caller explicitly limited concurrency, apply this limit to
+        # the compute thread pool *BEFORE* querying that pool below.
+        if worker_count_max > 0:
+            guipoolthread.get_thread_pool_compute().setMaxThreadCount(
+                worker_count_max)
+
+        # Classify all passed parameters.
+        self._progress_stream = (
+            progress_stream if progress_stream is not None else sys.stdout)
+        self._worker_count_max = guipoolthread.get_worker_count_max(
+            guipoolthread.get_thread_pool_compute())
+
+        # Default all remaining instance variables.
+        self._conf_filenames_failed = set()
+        self._is_stopping = False
+        self._worker_count_failed = 0
+        self._worker_count_skipped = 0
+        self._worker_count_succeeded = 0
+        self._worker_to_conf_filename = {}
+        self._workers_queued = deque()
+        self._workers_working = deque()
+
+        # Timer periodically waking the Python interpreter from the Qt event
+        # loop, parented to this batch and hence deleted with this batch.
+        self._signal_timer = QTimer(self)
+        self._signal_timer.setInterval(SIGNAL_POLL_MILLISECONDS)
+        self._signal_timer.timeout.connect(lambda: None)
+
+        # Enqueue all workers to be run by this batch.
+        self._enqueue_workers(
+            conf_filenames=conf_filenames,
+            phase_kinds=phase_kinds,
+            phase_subkinds=phase_subkinds,
+        )
+
+
+    def _enqueue_workers(
+        self,
+        conf_filenames: SequenceTypes,
+        phase_kinds: SequenceTypes,
+        phase_subkinds: SequenceTypes,
+    ) -> None:
+        '''
+        Enqueue one worker for each passed simulation phase and subkind of
+        each passed simulation configuration in simulation phase order.
+
+        See the :meth:`__init__` method for further details.
+        '''
+
+        # For each passed simulation configuration file...
+        for conf_filename in conf_filenames:
+            # Absolute filename of this file.
+            conf_filename = os.path.abspath(conf_filename)
+
+            # Snapshot shared between all workers running this configuration,
+            # as with the simulator proactor.
+            conf_snapshot = SimmerConfSnapshot(conf_filename=conf_filename)
+
+            # For each phase kind in simulation phase order...
+            for phase_kind in SimPhaseKind:
+                # If this phase is not to be run, continue to the next.
+                if phase_kind not in phase_kinds:
+                    continue
+
+                # Widget-free description of this phase.
+                phase = SimmerPhaseHeadless(kind=phase_kind)
+
+                # For each subkind in modelling-then-exporting order...
+                for phase_subkind in SimmerPhaseSubkind:
+                    # If this subkind is not to be run, continue to the next.
+                    if phase_subkind not in phase_subkinds:
+                        continue
+
+                    # Worker running this subkind of this phase in a child
+                    # process, mirroring the simulator phaser.
+                    worker = QBetseeSimmerPhaseProcessWorker(
+                        phase=phase, phase_subkind=phase_subkind)
+
+                    # Finalize this worker's initialization *NOW* rather than
+                    # on starting this worker, as this batch has no widgets
+                    # to be synchronized to this worker's state.
+                    worker.init(
+                        conf_snapshot=conf_snapshot,
+                        handler_failed=self._handle_worker_exception,
+                        handler_finished=self._handle_worker_completion,
+                    )
+                    worker.signals.progress_ranged.connect(
+                        self._handle_worker_progress_ranged)
+                    worker.signals.progressed.connect(
+                        self._handle_worker_progressed)
+                    worker.signals.progress_stated.connect(
+                        self._handle_worker_progress_stated)
+
+                    # Enqueue this worker.
+                    self._workers_queued.append(worker)
+                    self._worker_to_conf_filename[worker] = conf_filename
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def conf_filenames_failed(self) -> set:
+        '''
+        Set of the absolute filenames of all simulation configurations for
+        which one or more workers either failed or were skipped by the
+        :meth:`run` method.
+        '''
+
+        return self._conf_filenames_failed
+
+    # ..................{ RUNNERS                           }..................
+    def run(self) -> int:
+        '''
+        Run all workers enqueued by this batch to completion, blocking the
+        current thread by running the Qt event loop until done.
+
+        Returns
+        ----------
+        int
+            Exit status of this batch, which is :data:`SUCCESS` only if *all*
+            enqueued workers succeeded *or* :data:`FAILURE_DEFAULT` otherwise.
+        '''
+
+        # Log this run.
+        logs.log_info(
+            'Running %d simulator worker(s) in batch '
+            '(with at most %d concurrently)...',
+            len(self._workers_queued), self._worker_count_max)
+
+        # Gracefully stop this batch on the user interrupting or terminating
+        # this process, preserving the prior handlers for restoration below.
+        signal_handlers_prior = {
+            signal_number: signal.signal(signal_number, self._handle_signal)
+            for signal_number in (signal.SIGINT, signal.SIGTERM)
+        }
+
+        # Start all initially startable workers *AFTER* the event loop below
+        # starts, guaranteeing that the completion of workers completing
+        # immediately is handled by that loop.
+        QTimer.singleShot(0, self._loop_worker)
+        self._signal_timer.start()
+
+        # Run the Qt event loop until the last worker completes.
+        try:
+            QCoreApplication.instance().exec_()
+        # Restore the prior signal handlers regardless of success.
+        finally:
+            self._signal_timer.stop()
+            for signal_number, signal_handler in (
+                signal_handlers_prior.items()):
+                signal.signal(signal_number, signal_handler)
+
+        # Report the outcome of this batch.
+        self._emit_event(
+            event='done',
+            succeeded=self._worker_count_succeeded,
+            failed=self._worker_count_failed,
+            skipped=self._worker_count_skipped,
+        )
+
+        # Return the exit status of this batch.
+        return (
+            SUCCESS
+            if not (self._worker_count_failed or self._worker_count_skipped)
+            else FAILURE_DEFAULT)
+
+
+    def stop(self) -> None:
+        '''
+        Gracefully stop all currently working workers *and* skip all
+        subsequently enqueued workers.
+        '''
+
+        # Log this request.
+        logs.log_warning('Stopping simulator batch...')
+
+        # Prevent subsequently enqueued workers from being started.
+        self._is_stopping = True
+        while self._workers_queued:
+            self._skip_worker(self._workers_queued[0])
+
+        # Gracefully stop all working workers.
+        for worker in self._workers_working:
+            worker.stop()
+
+        # If no workers are working, halt the event loop immediately.
+        self._quit_if_done()
+
+
+    def _handle_signal(self, signal_number: int, frame: object) -> None:
+        '''
+        Python-level POSIX signal handler gracefully stopping this batch.
+        '''
+
+        self.stop()
+
+    # ..................{ WORKERS                           }..................
+    def _loop_worker(self) -> None:
+        '''
+        Start all enqueued workers whose dependencies have all completed until
+        either no startable workers remain *or* the maximum number of workers
+        are working.
+
+        See Also
+        ----------
+        :meth:`QBetseeSimmerProactor._loop_worker`
+            Further details.
+        '''
+
+        # If stopping, avoid starting new workers.
+        if self._is_stopping:
+            return
+
+        # Start each startable worker in enqueued order.
+        for worker in get_workers_startable(
+            workers_queued=self._workers_queued,
+            workers_working=self._workers_working,
+            worker_count_max=self._worker_count_max,
+            is_dependent_on=self._is_worker_dependent_on,
+        ):
+            self._start_worker(worker)
+
+        # If no workers remain, halt the event loop.
+        self._quit_if_done()
+
+
+    def _is_worker_dependent_on(
+        self,
+        worker: QBetseeSimmerPhaseWorker,
+        worker_prior: QBetseeSimmerPhaseWorker,
+    ) -> bool:
+        '''
+        ``True`` only if the first passed worker is dependent on the second
+        passed worker enqueued before the first.
+
+        Workers running the same simulation configuration defer to the
+        :meth:`QBetseeSimmerPhaseWorker.is_dependent_on` method. Workers
+        running different configurations are independent *unless* both export,
+        as each exporting worker already saturates all available processors
+        with a pool of child processes regardless of configuration.
+        '''
+
+        # If both workers run the same configuration, defer to that method.
+        if (self._worker_to_conf_filename[worker] ==
+            self._worker_to_conf_filename[worker_prior]):
+            return worker.is_dependent_on(worker_prior)
+
+        # Else, these workers are dependent only if both export.
+        return (
+            worker.phase_subkind is SimmerPhaseSubkind.EXPORTING and
+            worker_prior.phase_subkind is SimmerPhaseSubkind.EXPORTING
+        )
+
+
+    def _start_worker(self, worker: QBetseeSimmerPhaseWorker) -> None:
+        '''
+        Pop the passed worker from the :attr:`_workers_queued` queue onto the
+        :attr:`_workers_working` queue *and* start this worker.
+        '''
+
+        # Move this worker from the worker queue onto the working queue.
+        self._workers_queued.remove(worker)
+        self._workers_working.append(worker)
+
+        # Report this start.
+        self._emit_worker_event(worker=worker, event='started')
+
+        # Start this worker in the compute thread pool.
+        guipoolthread.start_worker(
+            worker, thread_pool=guipoolthread.get_thread_pool_compute())
+
+
+    def _skip_worker(self, worker: QBetseeSimmerPhaseWorker) -> None:
+        '''
+        Dequeue the passed enqueued worker *without* starting this worker.
+        '''
+
+        # Dequeue this worker.
+        self._workers_queued.remove(worker)
+        self._worker_count_skipped += 1
+        self._conf_filenames_failed.add(self._worker_to_conf_filename[worker])
+
+        # Report this skip *BEFORE* forgetting this worker's configuration.
+        self._emit_worker_event(worker=worker, event='skipped')
+        del self._worker_to_conf_filename[worker]
+
+        # Schedule this worker for deletion.
+        worker.delete_later()
+
+
+    def _quit_if_done(self) -> None:
+        '''
+        Halt the Qt event loop if no workers remain to be run.
+        '''
+
+        if not (self._workers_queued or self._workers_working):
+            QCoreApplication.instance().quit()
+
+
+    def _get_worker_signalling(self) -> object:
+        '''
+        Working worker whose signals collection emitted the signal connected
+        to the slot currently being called if any *or* ``None`` otherwise.
+        '''
+
+        # Signals collection emitting the signal calling the current slot.
+        signals = self.sender()
+
+        # Return the first working worker owning this collection if any.
+        for worker in self._workers_working:
+            if worker.signals is signals:
+                return worker
+
+        # Else, no working worker owns this collection.
+        return None
+
+    # ..................{ SLOTS                             }..................
+    @Slot(int, int)
+    def _handle_worker_progress_ranged(
+        self, progress_min: int, progress_max: int) -> None:
+        '''
+        Slot signalled on any working worker emitting the
+        :attr:`QBetseeThreadPoolWorkerSignals.progress_ranged` signal.
+        '''
+
+        worker = self._get_worker_signalling()
+        if worker is not None:
+            self._emit_worker_event(
+                worker=worker,
+                event='ranged',
+                progress_min=progress_min,
+                progress_max=progress_max,
+            )
+
+
+    @Slot(int)
+    def _handle_worker_progressed(self, progress: int) -> None:
+        '''
+        Slot signalled on any working worker emitting the
+        :attr:`QBetseeThreadPoolWorkerSignals.progressed` signal.
+        '''
+
+        worker = self._get_worker_signalling()
+        if worker is not None:
+            self._emit_worker_event(
+                worker=worker, event='progressed', progress=progress)
+
+
+    @Slot(str)
+    def _handle_worker_progress_stated(self, status: str) -> None:
+        '''
+        Slot signalled on any working worker emitting the
+        :attr:`QBetseeThreadPoolWorkerSignals.progress_stated` signal.
+        '''
+
+        worker = self._get_worker_signalling()
+        if worker is not None:
+            self._emit_worker_event(
+                worker=worker, event='stated', status=status)
+
+
+    @Slot(Exception)
+    def _handle_worker_exception(self, exception: Exception) -> None:
+        '''
+        Slot signalled on any working worker raising an unexpected exception,
+        reporting this exception *without* halting other workers.
+        '''
+
+        worker = self._get_worker_signalling()
+        if worker is not None:
+            self._emit_worker_event(
+                worker=worker,
+                event='failed',
+                exception=type(exception).__name__,
+                message=str(exception),
+            )
+
+
+    @Slot(bool)
+    def _handle_worker_completion(self, is_success: bool) -> None:
+        '''
+        Slot signalled on any working worker completing, skipping all
+        subsequently enqueued workers running the same configuration if this
+        worker failed *and* starting all enqueued workers whose dependencies
+        have now completed.
+        '''
+
+        # Worker emitting this signal if still working *OR* "None" otherwise.
+        worker = self._get_worker_signalling()
+
+        # If this worker is no longer working, silently reduce to a noop.
+        if worker is None:
+            return
+
+        # Log this slot.
+        guithread.log_debug_thread_main(
+            'Handling batch simulator phase "%s" worker closure...',
+            worker.phase.name)
+
+        # Report this completion.
+        self._emit_worker_event(
+            worker=worker, event='finished', succeeded=is_success)
+
+        # Configuration run by this worker.
+        conf_filename = self._worker_to_conf_filename.pop(worker)
+
+        # Dequeue and schedule this worker for deletion.
+        self._workers_working.remove(worker)
+        worker.delete_later()
+
+        # If this worker succeeded, record this success.
+        if is_success:
+            self._worker_count_succeeded += 1
+        # Else, record this failure and skip all subsequently enqueued workers
+        # running this configuration, all of which depend on this worker.
+        else:
+            self._worker_count_failed += 1
+            self._conf_filenames_failed.add(conf_filename)
+            for worker_queued in tuple(self._workers_queued):
+                if (self._worker_to_conf_filename[worker_queued] ==
+                    conf_filename):
+                    self._skip_worker(worker_queued)
+
+        # Start all enqueued workers whose dependencies have now completed.
+        self._loop_worker()
+
+    # ..................{ EMITTERS                          }..................
+    def _emit_worker_event(
+        self, worker: QBetseeSimmerPhaseWorker, event: str, **kwargs) -> None:
+        '''
+        Write a progress event with the passed type and keyword arguments
+        describing the passed worker to the progress stream.
+        '''
+
+        self._emit_event(
+            event=event,
+            conf=self._worker_to_conf_filename[worker],
+            phase=worker.phase.name,
+            subkind=enums.get_member_name_lowercase(worker.phase_subkind),
+            **kwargs
+        )
+
+
+    def _emit_event(self, **kwargs) -> None:
+        '''
+        Write a progress event with the passed keyword arguments as a single
+        line of JSON to the progress stream.
+        '''
+
+        # Write this event, flushing immediately to ensure that consumers
+        # piping this stream receive this event without buffering delays.
+        self._progress_stream.write(json.dumps(kwargs) + '\n')
+        self._progress_stream.flush()
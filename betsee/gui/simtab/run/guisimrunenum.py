@@ -111,3 +111,57 @@ SimmerModelState = make_enum(
           more Python-specific pickled files.
     '''
 )
+
+
+SweepSampling = make_enum(
+    class_name='SweepSampling',
+    member_names=(
+        'CARTESIAN',
+        'LATIN_HYPERCUBE',
+    ),
+    doc='''
+    Enumeration of all supported types of **sweep sampling** (i.e., strategy
+    for expanding the values of all swept parameters into the parameter tuples
+    of all runs of a sweep).
+
+    Attributes
+    ----------
+    CARTESIAN : enum
+        **Cartesian sampling,** running the Cartesian product of all values of
+        all swept parameters. Parameters swept over ranges are discretized
+        into the passed number of evenly spaced values.
+    LATIN_HYPERCUBE : enum
+        **Latin hypercube sampling,** running a fixed number of parameter
+        tuples such that each of that number of equiprobable strata of the
+        values of each swept parameter is sampled exactly once. Parameters
+        swept over ranges are sampled continuously within each stratum;
+        parameters swept over explicit values are sampled from the values
+        in each stratum. Since the number of runs is independent of the
+        number of swept parameters, this sampling scales to
+        high-dimensional sweeps for which Cartesian sampling is infeasible.
+    ''')
+
+
+SimmerRunOutcome = make_enum(
+    class_name='SimmerRunOutcome',
+    member_names=(
+        'SUCCEEDED',
+        'FAILED',
+        'STOPPED',
+    ),
+    doc='''
+    Enumeration of all supported types of **simulator run outcome** (i.e.,
+    mutually exclusive manner in which a simulator worker finished), recorded
+    by the run history.
+
+    Attributes
+    ----------
+    SUCCEEDED : enum
+        **Succeeded outcome,** implying that worker to have completed all
+        work *without* raising an exception.
+    FAILED : enum
+        **Failed outcome,** implying that worker to have raised an exception.
+    STOPPED : enum
+        **Stopped outcome,** implying that worker to have been prematurely
+        stopped by the end user.
+    ''')
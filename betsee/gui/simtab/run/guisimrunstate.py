@@ -363,3 +363,28 @@ Most such strings contain no format specifiers and are thus displayable as is.
 Some such strings contain one or more format specifiers (e.g., ``{cmd_name}}`)
 and are thus displayable *only* after interpolating the corresponding values.
 '''
+
+
+SIMMER_PROACTOR_SUBSTATUS_TELEMETRY = QCoreApplication.translate(
+    'guisimrunstate',
+    '{substatus}<br>'
+    '<i>{steps_per_second:.1f} time steps per second, '
+    '{eta} remaining.</i>'
+)
+'''
+Human-readable, translated, unformatted string template suffixing the details
+of the current action with the throughput and estimated time remaining of the
+lead simulator worker while that worker models time steps of the
+initialization or simulation phases.
+
+Formats
+----------
+Format specifiers embedded in this string include:
+
+* ``{substatus}``, the details of the current action as templated by the
+  :data:`SIMMER_STATE_TO_PROACTOR_SUBSTATUS` dictionary.
+* ``{steps_per_second}``, a non-negative float signifying the smoothed number
+  of time steps modelled per second.
+* ``{eta}``, a human-readable string abbreviating the estimated time remaining
+  until the current phase has been modelled (e.g., ``1h 05m``).
+'''
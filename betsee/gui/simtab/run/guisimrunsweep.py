@@ -0,0 +1,722 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **simulator sweep** (i.e., batch of simulation configurations
+derived from a base configuration by varying one or more aliased parameters
+over user-specified values) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.science.parameters import Parameters
+from betse.util.io.log import logs
+from betse.util.path.dirs import DirOverwritePolicy
+from betse.util.type.types import (
+    type_check,
+    IterableOrNoneTypes,
+    SequenceTypes,
+    StrOrNoneTypes,
+)
+from betsee.guiexception import BetseeSimmerSweepException
+from betsee.gui.simtab.run.guisimrunenum import SweepSampling
+from betsee.util.path.guifileatomic import writing_file_atomic
+from collections import OrderedDict
+from copy import deepcopy
+from enum import Enum
+import ast, itertools, json, os, random, re, shutil
+
+# ....................{ CONSTANTS                         }....................
+SWEEP_INDEX_BASENAME = 'sweep.json'
+'''
+Basename of the JSON-formatted **sweep index** (i.e., file mapping from the
+parameter tuple of each run of a sweep to the simulation configuration file
+and outcome of that run) written into the top-level directory of each sweep.
+'''
+
+
+SWEEP_INDEX_VERSION = 2
+'''
+Version of the format of the sweep index, incremented on each
+backward-incompatible change to that format.
+'''
+
+
+SWEEP_RUN_DIRNAME_TEMPLATE = 'run_{:04d}'
+'''
+Format string templating the basename of the subdirectory of the top-level
+directory of each sweep containing the simulation configuration derived for
+each run of that sweep, formatted with the 0-based index of that run.
+'''
+
+
+_SWEEP_RUN_DIRNAME_REGEX = re.compile(r'^run_\d{4,}$')
+'''
+Compiled regular expression matching the basename of each subdirectory of the
+top-level directory of each sweep formatted by the
+:data:`SWEEP_RUN_DIRNAME_TEMPLATE` template, identifying stale subdirectories
+derived by prior sweeps to be removed.
+'''
+
+
+_BOOL_TRUE_TOKENS = frozenset(('true', 'yes', 'on', '1'))
+'''
+Set of all case-insensitive tokens coerced to ``True`` when setting boolean
+aliases swept by sweep parameters.
+'''
+
+
+_BOOL_FALSE_TOKENS = frozenset(('false', 'no', 'off', '0'))
+'''
+Set of all case-insensitive tokens coerced to ``False`` when setting boolean
+aliases swept by sweep parameters.
+'''
+
+
+SWEEP_SEED_DEFAULT = 0
+'''
+Default seed of the pseudorandom number generator sampling Latin hypercubes,
+guaranteeing that sweeps are reproducible by default.
+'''
+
+# ....................{ CLASSES ~ param                   }....................
+class SimmerSweepParam(object):
+    '''
+    **Swept parameter** (i.e., simulation configuration alias varied over
+    either an explicit sequence of values *or* a numeric range by a sweep).
+
+    Attributes
+    ----------
+    _alias_name : str
+        ``.``-delimited name of this alias relative to the
+        :class:`Parameters` class (e.g., ``sim_time_total``,
+        ``anim.is_after_sim_save``).
+    _values : SequenceOrNoneTypes
+        Sequence of all values of this parameter if this parameter is swept
+        over explicit values *or* ``None`` otherwise.
+    _value_count : int
+        Number of evenly spaced values into which this range is discretized
+        under Cartesian sampling if this parameter is swept over a range *or*
+        0 otherwise.
+    _value_max : NumericOrNoneTypes
+        Maximum value of this range if any *or* ``None`` otherwise.
+    _value_min : NumericOrNoneTypes
+        Minimum value of this range if any *or* ``None`` otherwise.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, spec: str) -> None:
+        '''
+        Initialize this swept parameter from the passed specification.
+
+        Parameters
+        ----------
+        spec : str
+            Specification of this parameter formatted as either:
+
+            * ``{alias}={value1},{value2},...``, sweeping this parameter over
+              these explicit values (e.g., ``cell_radius=2e-6,4e-6,8e-6``).
+            * ``{alias}={min}:{max}``, sweeping this parameter over this
+              numeric range under Latin hypercube sampling only.
+            * ``{alias}={min}:{max}:{count}``, sweeping this parameter over
+              this numeric range discretized into this number of evenly spaced
+              values under Cartesian sampling (e.g.,
+              ``sim_time_total=1:10:4``).
+
+            Each value is parsed as a Python literal if feasible (e.g.,
+            ``True``, ``4e-6``) *or* as a string otherwise.
+
+        Raises
+        ----------
+        BetseeSimmerSweepException
+            If this specification is malformed.
+        '''
+
+        # Split this specification into this alias name and values.
+        alias_name, delimiter, values_spec = spec.partition('=')
+        self._alias_name = alias_name.strip()
+
+        # If this specification is malformed, raise an exception.
+        if not (self._alias_name and delimiter and values_spec.strip()):
+            raise BetseeSimmerSweepException(synopsis=(
+                'Sweep parameter "{}" not of the form '
+                '"alias=values".'.format(spec)))
+
+        # Nullify all remaining instance variables for safety.
+        self._values = None
+        self._value_count = 0
+        self._value_max = None
+        self._value_min = None
+
+        # If these values are a range, parse this range.
+        if ':' in values_spec:
+            # Minimum, maximum, and optional number of values in this range.
+            range_items = [
+                _parse_value(range_item)
+                for range_item in values_spec.split(':')
+            ]
+
+            # If this range is malformed, raise an exception.
+            if not (
+                len(range_items) in (2, 3) and
+                all(isinstance(range_item, (int, float))
+                    for range_item in range_items[:2]) and
+                (len(range_items) == 2 or (
+                    isinstance(range_items[2], int) and range_items[2] > 0))
+            ):
+                raise BetseeSimmerSweepException(synopsis=(
+                    'Sweep parameter "{}" range "{}" not of the form '
+                    '"min:max" or "min:max:count".'.format(
+                        self._alias_name, values_spec)))
+
+            # Classify this range.
+            self._value_min, self._value_max = range_items[:2]
+            if len(range_items) == 3:
+                self._value_count = range_items[2]
+        # Else, these values are explicit. Parse these values.
+        else:
+            self._values = [
+                _parse_value(value)
+                for value in values_spec.split(',')
+                if value.strip()
+            ]
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def alias_name(self) -> str:
+        '''
+        ``.``-delimited name of this alias relative to the
+        :class:`Parameters` class.
+        '''
+
+        return self._alias_name
+
+    # ..................{ GETTERS                           }..................
+    def get_values_grid(self) -> SequenceTypes:
+        '''
+        Sequence of all values of this parameter to be run under Cartesian
+        sampling.
+
+        Raises
+        ----------
+        BetseeSimmerSweepException
+            If this parameter is swept over a range specifying no number of
+            values to discretize that range into.
+        '''
+
+        # If this parameter is swept over explicit values, return these values.
+        if self._values is not None:
+            return self._values
+
+        # If this range is undiscretizable, raise an exception.
+        if not self._value_count:
+            raise BetseeSimmerSweepException(synopsis=(
+                'Sweep parameter "{}" range specifies no value count '
+                '(i.e., not of the form "min:max:count"), '
+                'required by Cartesian sampling.'.format(self._alias_name)))
+
+        # If only one value is requested, return the minimum value.
+        if self._value_count == 1:
+            return [self._value_min]
+
+        # Else, return this number of evenly spaced values in this range.
+        value_step = (self._value_max - self._value_min) / (
+            self._value_count - 1)
+        return [
+            self._value_min + value_index * value_step
+            for value_index in range(self._value_count)
+        ]
+
+
+    @type_check
+    def get_value_stratified(self, fraction: float) -> object:
+        '''
+        Value of this parameter at the passed fraction of the distribution of
+        all values of this parameter under Latin hypercube sampling.
+
+        Parameters
+        ----------
+        fraction : float
+            Fraction in the half-open interval ``[0, 1)``.
+        '''
+
+        # If this parameter is swept over explicit values, return the value
+        # whose equiprobable stratum contains this fraction.
+        if self._values is not None:
+            return self._values[
+                min(int(fraction * len(self._values)), len(self._values) - 1)]
+
+        # Else, linearly interpolate this fraction into this range.
+        return self._value_min + fraction * (self._value_max - self._value_min)
+
+# ....................{ CLASSES ~ sweep                   }....................
+class SimmerSweep(object):
+    '''
+    **Simulator sweep** (i.e., batch of simulation configurations derived from
+    a base configuration by varying one or more aliased parameters over
+    user-specified values).
+
+    Each sweep expands the values of all swept parameters into a sequence of
+    **parameter tuples** (i.e., tuples of one value for each swept parameter),
+    derives one simulation configuration from the base configuration for each
+    such tuple into a dedicated subdirectory of the sweep directory, and
+    writes a **sweep index** (i.e., JSON-formatted file mapping from each
+    such tuple to the configuration and outcome of the corresponding run).
+    Running these configurations is delegated to the caller (typically, via
+    the :class:`QBetseeSimmerBatch` class).
+
+    Attributes
+    ----------
+    _conf_filename : str
+        Absolute filename of the base simulation configuration.
+    _params : SequenceTypes
+        Sequence of all :class:`SimmerSweepParam` instances swept by this
+        sweep.
+    _point_to_conf_filename : OrderedDict
+        Dictionary mapping from each parameter tuple to the absolute filename
+        of the simulation configuration derived for that tuple in parameter
+        tuple order if the :meth:`make_confs` method has been called *or* the
+        empty dictionary otherwise.
+    _points : list
+        List of all unique parameter tuples run by this sweep.
+    _sampling : SweepSampling
+        Type of sampling expanding these parameters into these tuples.
+    _seed : int
+        Seed of the pseudorandom number generator sampling Latin hypercubes.
+    _sweep_dirname : str
+        Absolute dirname of the directory to which derived configurations and
+        the sweep index are written.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+
+        # Mandatory parameters.
+        conf_filename: str,
+        params: SequenceTypes,
+
+        # Optional parameters.
+        sampling: Enum = SweepSampling.CARTESIAN,
+        sample_count: int = 0,
+        seed: int = SWEEP_SEED_DEFAULT,
+        sweep_dirname: StrOrNoneTypes = None,
+    ) -> None:
+        '''
+        Initialize this sweep, expanding the passed parameters into parameter
+        tuples.
+
+        Parameters
+        ----------
+        conf_filename : str
+            Absolute or relative filename of the base simulation configuration.
+        params : SequenceTypes
+            Non-empty sequence of all :class:`SimmerSweepParam` instances to be
+            swept.
+        sampling : SweepSampling
+            Type of sampling expanding these parameters into parameter tuples.
+            Defaults to :attr:`SweepSampling.CARTESIAN`.
+        sample_count : int
+            Number of parameter tuples to be sampled under Latin hypercube
+            sampling. Ignored under Cartesian sampling. Defaults to 0.
+        seed : int
+            Seed of the pseudorandom number generator sampling Latin
+            hypercubes. Defaults to :data:`SWEEP_SEED_DEFAULT`.
+        sweep_dirname : StrOrNoneTypes
+            Absolute or relative dirname of the directory to which derived
+            configurations and the sweep index are written. Defaults to
+            ``None``, in which case the ``sweep`` subdirectory of the directory
+            containing the base configuration is defaulted to.
+
+        Raises
+        ----------
+        BetseeSimmerSweepException
+            If either no parameters are passed *or* no parameter tuples are
+            expandable from these parameters.
+        '''
+
+        # If no parameters are passed, raise an exception.
+        if not params:
+            raise BetseeSimmerSweepException(
+                synopsis='Sweep specifies no parameters.')
+
+        # Classify all passed parameters.
+        self._conf_filename = os.path.abspath(conf_filename)
+        self._params = params
+        self._sampling = sampling
+        self._seed = seed
+        self._sweep_dirname = os.path.abspath(
+            sweep_dirname if sweep_dirname is not None else
+            os.path.join(os.path.dirname(self._conf_filename), 'sweep'))
+
+        # Default all remaining instance variables.
+        self._point_to_conf_filename = OrderedDict()
+
+        # Expand these parameters into parameter tuples.
+        if sampling is SweepSampling.CARTESIAN:
+            points = self._make_points_cartesian()
+        else:
+            points = self._make_points_latin_hypercube(sample_count)
+
+        # Remove all duplicate tuples while preserving order. Since each tuple
+        # is run exactly once, duplicate tuples (e.g., Latin hypercube samples
+        # of parameters swept over fewer explicit values than samples) would
+        # otherwise derive redundant configurations run redundantly.
+        self._points = list(OrderedDict.fromkeys(points))
+
+        # If any duplicate tuples were removed, log this removal.
+        if len(self._points) < len(points):
+            logs.log_info(
+                'Ignoring %d duplicate sweep parameter tuple(s).',
+                len(points) - len(self._points))
+
+        # If no tuples were expanded, raise an exception.
+        if not self._points:
+            raise BetseeSimmerSweepException(
+                synopsis='Sweep expands to no parameter tuples.')
+
+
+    def _make_points_cartesian(self) -> list:
+        '''
+        List of all parameter tuples in the Cartesian product of the values of
+        all swept parameters.
+        '''
+
+        return list(itertools.product(*(
+            param.get_values_grid() for param in self._params)))
+
+
+    def _make_points_latin_hypercube(self, sample_count: int) -> list:
+        '''
+        List of the passed number of parameter tuples sampling the Latin
+        hypercube spanned by the values of all swept parameters.
+        '''
+
+        # If no tuples are requested, raise an exception.
+        if sample_count <= 0:
+            raise BetseeSimmerSweepException(synopsis=(
+                'Latin hypercube sweep sample count {} not positive.'.format(
+                    sample_count)))
+
+        # Pseudorandom number generator seeded for reproducibility.
+        rng = random.Random(self._seed)
+
+        # For each parameter, a random permutation of all strata indices,
+        # guaranteeing each stratum of that parameter to be sampled once.
+        param_strata = [
+            rng.sample(range(sample_count), sample_count)
+            for _ in self._params
+        ]
+
+        # Return one tuple per sample, uniformly sampling each parameter
+        # within the stratum assigned to that sample.
+        return [
+            tuple(
+                param.get_value_stratified(
+                    (strata[sample_index] + rng.random()) / sample_count)
+                for param, strata in zip(self._params, param_strata)
+            )
+            for sample_index in range(sample_count)
+        ]
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def conf_filenames(self) -> list:
+        '''
+        List of the absolute filenames of all derived simulation configurations
+        in parameter tuple order if the :meth:`make_confs` method has been
+        called *or* the empty list otherwise.
+        '''
+
+        return list(self._point_to_conf_filename.values())
+
+
+    @property
+    def points(self) -> list:
+        '''
+        List of all unique parameter tuples run by this sweep.
+        '''
+
+        return self._points
+
+
+    @property
+    def index_filename(self) -> str:
+        '''
+        Absolute filename of the sweep index of this sweep.
+        '''
+
+        return os.path.join(self._sweep_dirname, SWEEP_INDEX_BASENAME)
+
+    # ..................{ GETTERS                           }..................
+    @type_check
+    def get_conf_filename(self, point: tuple) -> str:
+        '''
+        Absolute filename of the simulation configuration derived for the
+        passed parameter tuple.
+
+        Raises
+        ----------
+        BetseeSimmerSweepException
+            If either the :meth:`make_confs` method has yet to be called *or*
+            this tuple is not run by this sweep.
+        '''
+
+        # If this tuple is unrecognized, raise an exception.
+        if point not in self._point_to_conf_filename:
+            raise BetseeSimmerSweepException(synopsis=(
+                'Sweep parameter tuple {} unrecognized.'.format(point)))
+
+        # Return this filename.
+        return self._point_to_conf_filename[point]
+
+    # ..................{ MAKERS                            }..................
+    def make_confs(self) -> list:
+        '''
+        Derive one simulation configuration from the base configuration for
+        each parameter tuple of this sweep *and* write the sweep index,
+        returning the list of the absolute filenames of these configurations
+        in parameter tuple order.
+
+        Each such configuration is written into a dedicated subdirectory of
+        the sweep directory (e.g., ``sweep/run_0000/sim_config.yaml``) along
+        with all external resources referenced by the base configuration,
+        isolating the outputs of each run from all other runs. All stale
+        subdirectories derived by prior sweeps into the same sweep directory
+        but *not* derived by this sweep are removed, preventing the outputs of
+        those sweeps from being mistaken for those of this sweep.
+
+        Raises
+        ----------
+        BetseeSimmerSweepException
+            If any swept alias is unrecognized.
+        '''
+
+        # Log this derivation.
+        logs.log_info(
+            'Deriving %d sweep simulation configuration(s) into "%s"...',
+            len(self._points), self._sweep_dirname)
+
+        # Base configuration, deserialized exactly once and cloned below.
+        p_base = Parameters.make(self._conf_filename)
+
+        # Basename of each derived configuration.
+        conf_basename = os.path.basename(self._conf_filename)
+
+        # Clear all previously derived configurations.
+        self._point_to_conf_filename = OrderedDict()
+
+        # For each parameter tuple...
+        for point_index, point in enumerate(self._points):
+            # Configuration derived from the base configuration.
+            p = deepcopy(p_base)
+
+            # Set each swept alias of this configuration to its value.
+            for param, value in zip(self._params, point):
+                _set_alias_value(
+                    p=p, alias_name=param.alias_name, value=value)
+
+            # Absolute filename of this configuration.
+            conf_filename = os.path.join(
+                self._sweep_dirname,
+                SWEEP_RUN_DIRNAME_TEMPLATE.format(point_index),
+                conf_basename,
+            )
+
+            # Write this configuration *AND* all external resources required
+            # by this configuration, replacing any prior sweep.
+            os.makedirs(os.path.dirname(conf_filename), exist_ok=True)
+            p.save(
+                conf_filename=conf_filename,
+                is_conf_file_overwritable=True,
+                conf_subdir_overwrite_policy=DirOverwritePolicy.OVERWRITE,
+            )
+
+            # Record this filename.
+            self._point_to_conf_filename[point] = conf_filename
+
+        # Remove all stale subdirectories derived by prior sweeps.
+        self._remove_run_dirs_stale()
+
+        # Write the sweep index, marking all runs as pending.
+        self.write_index()
+
+        # Return these filenames.
+        return self.conf_filenames
+
+    # ..................{ REMOVERS                          }..................
+    def _remove_run_dirs_stale(self) -> None:
+        '''
+        Remove all subdirectories of the sweep directory derived by prior
+        sweeps but *not* by the most recent call to the :meth:`make_confs`
+        method (e.g., due to a prior sweep having run more parameter tuples).
+
+        Only subdirectories whose basenames are formatted by the
+        :data:`SWEEP_RUN_DIRNAME_TEMPLATE` template are removed, preserving
+        all other user-defined subdirectories of the sweep directory.
+        '''
+
+        # Set of the basenames of all subdirectories derived by this sweep.
+        run_basenames = {
+            os.path.basename(os.path.dirname(conf_filename))
+            for conf_filename in self._point_to_conf_filename.values()
+        }
+
+        # For each subdirectory of the sweep directory derived by a prior
+        # sweep but *NOT* this sweep, remove this subdirectory.
+        for run_basename in sorted(os.listdir(self._sweep_dirname)):
+            run_dirname = os.path.join(self._sweep_dirname, run_basename)
+            if (
+                _SWEEP_RUN_DIRNAME_REGEX.match(run_basename) and
+                run_basename not in run_basenames and
+                os.path.isdir(run_dirname)
+            ):
+                logs.log_info(
+                    'Removing stale sweep run directory "%s"...', run_dirname)
+                shutil.rmtree(run_dirname)
+
+    # ..................{ WRITERS                           }..................
+    @type_check
+    def write_index(
+        self,
+        conf_filenames_failed: IterableOrNoneTypes = None,
+    ) -> None:
+        '''
+        Write the sweep index, recording the outcome of each run.
+
+        This index maps from the JSON-serialized list of the values of each
+        parameter tuple (e.g., ``[2e-06, 1.0]``) to a dictionary recording the
+        configuration and outcome of the run of that tuple, enabling
+        consumers to look up each run by its tuple.
+
+        Parameters
+        ----------
+        conf_filenames_failed : IterableOrNoneTypes
+            Iterable of the absolute filenames of all derived configurations
+            whose runs either failed or were skipped if these runs have
+            completed *or* ``None`` otherwise (i.e., if these runs are still
+            pending). Defaults to ``None``.
+        '''
+
+        # Set of these filenames, permitting efficient lookup below.
+        if conf_filenames_failed is not None:
+            conf_filenames_failed = set(conf_filenames_failed)
+
+        # Sweep index.
+        index = {
+            'version': SWEEP_INDEX_VERSION,
+            'conf': self._conf_filename,
+            'sampling': self._sampling.name.lower(),
+            'seed': self._seed,
+            'params': [param.alias_name for param in self._params],
+            'runs': {
+                get_point_key(point): {
+                    'conf': os.path.relpath(
+                        conf_filename, self._sweep_dirname),
+                    'status': (
+                        'pending' if conf_filenames_failed is None else
+                        'failed' if conf_filename in conf_filenames_failed
+                        else 'succeeded'),
+                }
+                for point, conf_filename in (
+                    self._point_to_conf_filename.items())
+            },
+        }
+
+        # Write this index atomically, preventing consumers polling this file
+        # from reading a partially written index.
+        with writing_file_atomic(self.index_filename) as index_filename_temp:
+            with open(index_filename_temp, 'w') as index_file:
+                json.dump(index, index_file, indent=2)
+
+# ....................{ GETTERS                           }....................
+@type_check
+def get_point_key(point: tuple) -> str:
+    '''
+    Key uniquely identifying the passed parameter tuple in the sweep index,
+    serialized as a JSON-formatted list of the values of this tuple.
+    '''
+
+    return json.dumps(list(point), default=str)
+
+# ....................{ PRIVATE ~ parsers                 }....................
+def _parse_value(value: str) -> object:
+    '''
+    Passed string parsed as a Python literal if feasible *or* stripped of
+    ignorable whitespace otherwise.
+    '''
+
+    # Strip ignorable whitespace.
+    value = value.strip()
+
+    # Attempt to parse this string as a Python literal (e.g., "True", "4e-6").
+    try:
+        return ast.literal_eval(value)
+    # Else, preserve this string as is (e.g., "hexagonal").
+    except (ValueError, SyntaxError):
+        return value
+
+# ....................{ PRIVATE ~ setters                 }....................
+def _set_alias_value(p: Parameters, alias_name: str, value: object) -> None:
+    '''
+    Set the alias with the passed ``.``-delimited name relative to the passed
+    simulation configuration to the passed value, coerced to the type of the
+    current value of this alias.
+
+    Raises
+    ----------
+    BetseeSimmerSweepException
+        If this alias is unrecognized *or* this value is uncoercible.
+    '''
+
+    # Object declaring this alias and the unqualified name of this alias.
+    alias_parent = p
+    alias_name_parent, _, alias_basename = alias_name.rpartition('.')
+
+    # Resolve the object declaring this alias.
+    try:
+        for alias_parent_basename in (
+            alias_name_parent.split('.') if alias_name_parent else ()):
+            alias_parent = getattr(alias_parent, alias_parent_basename)
+
+        # Current value of this alias.
+        value_old = getattr(alias_parent, alias_basename)
+    except AttributeError as exception:
+        raise BetseeSimmerSweepException(synopsis=(
+            'Sweep parameter "{}" not a simulation configuration '
+            'alias.'.format(alias_name))) from exception
+
+    # Coerce this value to the type of this current value.
+    try:
+        if isinstance(value_old, Enum):
+            value = type(value_old)[str(value).upper()]
+        elif isinstance(value_old, bool):
+            # If this value is *NOT* already boolean, coerce this value from
+            # the corresponding token if recognized *OR* raise an exception
+            # otherwise (e.g., "ture", "2"), rather than silently coercing
+            # misspelled tokens to "False".
+            if not isinstance(value, bool):
+                value_token = str(value).strip().lower()
+                if value_token in _BOOL_TRUE_TOKENS:
+                    value = True
+                elif value_token in _BOOL_FALSE_TOKENS:
+                    value = False
+                else:
+                    raise ValueError(
+                        'Boolean token "{}" unrecognized.'.format(value))
+        elif isinstance(value_old, int):
+            value = int(round(value)) if isinstance(value, float) else int(
+                value)
+        elif isinstance(value_old, float):
+            value = float(value)
+    except (KeyError, TypeError, ValueError) as exception:
+        raise BetseeSimmerSweepException(synopsis=(
+            'Sweep parameter "{}" value "{}" not coercible to '
+            '"{}".'.format(
+                alias_name, value, type(value_old).__name__))) from exception
+
+    # Set this alias to this value.
+    setattr(alias_parent, alias_basename, value)
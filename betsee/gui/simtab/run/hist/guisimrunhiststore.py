@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **simulator run history** (i.e., persistent SQLite-backed record of
+the outcome and performance of each simulator worker previously run, enabling
+cross-run timing predictions and regression detection) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse import metadata as betse_metadata
+from betse.science.enum.enumphase import SimPhaseKind
+from betse.util.io.log import logs
+from betse.util.type.iterable import tuples
+from betse.util.type.types import (
+    type_check, NoneType, NumericOrNoneTypes, StrOrNoneTypes)
+from betsee.gui.simtab.run.guisimrunenum import SimmerRunOutcome
+from betsee.gui.simtab.run.work.guisimrunworkenum import SimmerPhaseSubkind
+from betsee.gui.simtab.run.work.guisimrunworkmetric import (
+    SimmerWorkerTelemetry)
+import os, sqlite3, statistics
+
+# ....................{ CONSTANTS                         }....................
+RUN_HISTORY_SCHEMA_VERSION = 1
+'''
+Version of the schema of the run history database, recorded as the SQLite
+``user_version`` pragma. Databases of prior versions are silently recreated.
+'''
+
+
+RUN_HISTORY_BASELINE_RUNS = 5
+'''
+Maximum number of the most recent successful runs of the same simulation
+configuration, phase, and type of work whose throughputs are aggregated into
+the **baseline throughput** (i.e., median throughput) of subsequent such runs.
+'''
+
+
+RUN_HISTORY_SLOW_RATIO = 1.5
+'''
+Minimum ratio of the baseline throughput of prior runs to the throughput of a
+successful run, above which that run is flagged as **slow** (i.e.,
+significantly slower than prior runs of the same simulation configuration).
+'''
+
+
+RUN_HISTORY_LOCK_TIMEOUT_SECONDS = 0.1
+'''
+Maximum number of seconds to wait for the run history database to be unlocked
+by another application instance, above which the current read or write is
+skipped rather than blocking the main event thread accessing this history.
+'''
+
+
+RUN_HISTORY_ROWS_MAX = 10000
+'''
+Maximum number of runs recorded by the run history, above which the oldest
+runs are silently discarded.
+'''
+
+# ....................{ TYPES                             }....................
+SimmerRunRecord = tuples.make_named_subclass(
+    class_name='SimmerRunRecord',
+    item_names=(
+        'run_id',
+        'time_started',
+        'conf_filename',
+        'conf_hash',
+        'phase_kind',
+        'phase_subkind',
+        'outcome',
+        'duration_seconds',
+        'paused_seconds',
+        'steps',
+        'steps_per_second',
+        'cpu_seconds',
+        'rss_peak_bytes',
+        'betse_version',
+        'is_slow',
+    ),
+    doc='''
+    Named tuple created and returned by :class:`SimmerRunHistory` methods,
+    describing a single previously run simulator worker.
+
+    Attributes
+    ----------
+    run_id : int
+        1-based integer uniquely identifying this run in the run history.
+    time_started : float
+        Wall-clock time in seconds since the epoch at which this run started.
+    conf_filename : str
+        Absolute filename of the simulation configuration run.
+    conf_hash : str
+        Hexadecimal SHA-256 hash of the contents of that file when run.
+    phase_kind : SimPhaseKind
+        Type of simulation phase run.
+    phase_subkind : SimmerPhaseSubkind
+        Type of work performed on that phase.
+    outcome : SimmerRunOutcome
+        Manner in which this run finished.
+    duration_seconds : float
+        Fractional number of seconds this run spent working, excluding all
+        time spent paused.
+    paused_seconds : float
+        Fractional number of seconds this run spent paused.
+    steps : IntOrNoneTypes
+        Number of progress values (typically, simulation time steps) completed
+        by this run if this run signalled progress *or* ``None`` otherwise.
+    steps_per_second : NumericOrNoneTypes
+        Mean throughput of this run in steps per second of working time if
+        this run completed one or more steps *or* ``None`` otherwise.
+    cpu_seconds : NumericOrNoneTypes
+        Fractional number of seconds of CPU time consumed by this run if
+        reported *or* ``None`` otherwise.
+    rss_peak_bytes : IntOrNoneTypes
+        Peak resident set size (RSS) in bytes of this run if reported *or*
+        ``None`` otherwise.
+    betse_version : str
+        Version of BETSE performing this run.
+    is_slow : bool
+        ``True`` only if this run was flagged as significantly slower than the
+        prior runs of the same configuration, phase, and type of work. See
+        :data:`RUN_HISTORY_SLOW_RATIO`.
+    '''
+)
+
+
+SimmerRunRecordOrNoneTypes = (SimmerRunRecord, NoneType)
+'''
+Tuple of both the simulator run record type *and* the type of the singleton
+``None`` object.
+'''
+
+# ....................{ PRIVATE ~ constants               }....................
+_SCHEMA = \
+'''
+CREATE TABLE IF NOT EXISTS run (
+    run_id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    time_started     REAL    NOT NULL,
+    conf_filename    TEXT    NOT NULL,
+    conf_hash        TEXT    NOT NULL,
+    phase_kind       TEXT    NOT NULL,
+    phase_subkind    TEXT    NOT NULL,
+    outcome          TEXT    NOT NULL,
+    duration_seconds REAL    NOT NULL,
+    paused_seconds   REAL    NOT NULL,
+    steps            INTEGER,
+    steps_per_second REAL,
+    cpu_seconds      REAL,
+    rss_peak_bytes   INTEGER,
+    betse_version    TEXT    NOT NULL,
+    is_slow          INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS run_by_conf ON run (
+    conf_hash, phase_kind, phase_subkind, outcome);
+'''
+'''
+SQL script creating the schema of the run history database if needed.
+'''
+
+
+_COLUMNS = ', '.join(SimmerRunRecord._fields)
+'''
+Comma-delimited names of all columns of the ``run`` table, in the same order
+as the items of the :class:`SimmerRunRecord` type.
+'''
+
+# ....................{ CLASSES                           }....................
+class SimmerRunHistory(object):
+    '''
+    **Simulator run history** (i.e., persistent SQLite-backed record of the
+    outcome and performance of each simulator worker previously run, enabling
+    cross-run timing predictions and regression detection).
+
+    Each row of this history records one simulator worker (i.e., the modelling
+    or exporting of one simulation phase), keyed by the hash of the contents
+    of the simulation configuration file run. Runs of the same configuration
+    are thus comparable regardless of the pathname of that file.
+
+    Robustness
+    ----------
+    This history is merely a convenience. All database errors (e.g., due to a
+    read-only home directory or a corrupt database) are logged as non-fatal
+    warnings, after which this history silently reduces to a noop for the
+    remainder of this session.
+
+    Since this history is accessed from the main event thread, this history
+    waits at most :data:`RUN_HISTORY_LOCK_TIMEOUT_SECONDS` for a database
+    locked by another application instance (e.g., recording its own run) to
+    be unlocked. On timing out, the current read or write is skipped rather
+    than this history disabled, as locks are typically transient; that run is
+    thus omitted from this history *or* that baseline is unavailable.
+
+    Thread Safety
+    ----------
+    This history is *not* thread-safe and is intended to be accessed *only*
+    from the main event thread (e.g., by slots of the simulator proactor).
+
+    Attributes
+    ----------
+    _conn : {sqlite3.Connection, NoneType}
+        Connection to the run history database if this database has been
+        successfully opened *or* ``None`` otherwise.
+    _filename : str
+        Absolute filename of the run history database.
+    _is_disabled : bool
+        ``True`` only if a prior database error disabled this history.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, filename: str) -> None:
+        '''
+        Initialize this run history against the SQLite database with the
+        passed filename.
+
+        For responsiveness, this database is lazily opened on first use.
+
+        Parameters
+        ----------
+        filename : str
+            Absolute filename of this database, created on first use if *not*
+            already found.
+        '''
+
+        # Classify all passed parameters.
+        self._filename = filename
+
+        # Defer opening this database until first use.
+        self._conn = None
+        self._is_disabled = False
+
+
+    def close(self) -> None:
+        '''
+        Close the connection to the run history database if open *or* silently
+        reduce to a noop otherwise.
+        '''
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ..................{ RECORDERS                         }..................
+    @type_check
+    def record_run(
+        self,
+        conf_filename: str,
+        conf_hash: str,
+        telemetry: SimmerWorkerTelemetry,
+        outcome: SimmerRunOutcome,
+    ) -> SimmerRunRecordOrNoneTypes:
+        '''
+        Record the simulator worker with the passed final telemetry as having
+        finished with the passed outcome while running the simulation
+        configuration with the passed filename and hash.
+
+        Parameters
+        ----------
+        conf_filename : str
+            Absolute filename of the simulation configuration run.
+        conf_hash : str
+            Hexadecimal SHA-256 hash of the contents of that file when run.
+        telemetry : SimmerWorkerTelemetry
+            Telemetry of that worker on finishing.
+        outcome : SimmerRunOutcome
+            Manner in which that worker finished.
+
+        Returns
+        ----------
+        SimmerRunRecordOrNoneTypes
+            Record of this run if successfully recorded *or* ``None`` otherwise
+            (e.g., due to a database error).
+        '''
+
+        # Number of steps completed by this run if progress was signalled.
+        steps = (
+            telemetry.progress - telemetry.progress_min
+            if telemetry.progress is not None and
+               telemetry.progress_min is not None else
+            None)
+
+        # Working time of this run, excluding all time spent paused.
+        duration_seconds = max(
+            telemetry.wall_seconds - telemetry.paused_seconds, 0.0)
+
+        # Mean throughput of this run if any steps were completed.
+        steps_per_second = (
+            steps / duration_seconds
+            if steps and duration_seconds > 0 else None)
+
+        # Baseline throughput of prior such runs *BEFORE* recording this run.
+        steps_per_second_baseline = self.get_steps_per_second_baseline(
+            conf_hash=conf_hash,
+            phase_kind=telemetry.phase_kind,
+            phase_subkind=telemetry.phase_subkind,
+        )
+
+        # True only if this run succeeded significantly slower than that
+        # baseline. Unsuccessful runs are never flagged, as their throughput
+        # is typically skewed by the work preceding their failure.
+        is_slow = (
+            outcome is SimmerRunOutcome.SUCCEEDED and
+            steps_per_second is not None and
+            steps_per_second_baseline is not None and
+            steps_per_second * RUN_HISTORY_SLOW_RATIO <
+                steps_per_second_baseline
+        )
+
+        # Record of this run, excluding the ID assigned by this database.
+        run_record = SimmerRunRecord(
+            run_id=None,
+            time_started=telemetry.time_started,
+            conf_filename=conf_filename,
+            conf_hash=conf_hash,
+            phase_kind=telemetry.phase_kind,
+            phase_subkind=telemetry.phase_subkind,
+            outcome=outcome,
+            duration_seconds=duration_seconds,
+            paused_seconds=telemetry.paused_seconds,
+            steps=steps,
+            steps_per_second=steps_per_second,
+            cpu_seconds=telemetry.cpu_seconds,
+            rss_peak_bytes=telemetry.rss_peak_bytes,
+            betse_version=betse_metadata.VERSION,
+            is_slow=is_slow,
+        )
+
+        # Connection to this database if usable *OR* "None" otherwise.
+        conn = self._get_conn()
+        if conn is None:
+            return None
+
+        # Attempt to insert this record *AND* prune the oldest records within
+        # a single transaction.
+        try:
+            with conn:
+                cursor = conn.execute(
+                    'INSERT INTO run ({}) VALUES ({})'.format(
+                        _COLUMNS, ', '.join('?' * len(run_record))),
+                    _pack_run_record(run_record))
+                conn.execute(
+                    'DELETE FROM run WHERE run_id <= ?',
+                    (cursor.lastrowid - RUN_HISTORY_ROWS_MAX,))
+        # If doing so fails, skip this record if this database is locked *OR*
+        # disable this history otherwise.
+        except sqlite3.Error as exception:
+            self._skip_or_disable(exception)
+            return None
+
+        # If this run is slow, log this regression.
+        if is_slow:
+            logs.log_warning(
+                'Simulation phase "%s" %s ran %.1fx slower than '
+                'prior runs of this configuration.',
+                telemetry.phase_kind.name.lower(),
+                telemetry.phase_subkind.name.lower(),
+                steps_per_second_baseline / steps_per_second)
+
+        # Return this record, including the ID assigned by this database.
+        return run_record._replace(run_id=cursor.lastrowid)
+
+    # ..................{ GETTERS                           }..................
+    @type_check
+    def get_runs(
+        self,
+        conf_hash: StrOrNoneTypes = None,
+        phase_kind: (SimPhaseKind, NoneType) = None,
+        phase_subkind: (SimmerPhaseSubkind, NoneType) = None,
+        outcome: (SimmerRunOutcome, NoneType) = None,
+        limit: int = 100,
+    ) -> tuple:
+        '''
+        Tuple of the records of all runs matching the passed criteria, ordered
+        from most to least recent.
+
+        Parameters
+        ----------
+        conf_hash : StrOrNoneTypes
+            Hash of the simulation configuration to match. Defaults to
+            ``None``, in which case runs of all configurations are matched.
+        phase_kind : (SimPhaseKind, NoneType)
+            Type of simulation phase to match. Defaults to ``None``, in which
+            case runs of all phases are matched.
+        phase_subkind : (SimmerPhaseSubkind, NoneType)
+            Type of work to match. Defaults to ``None``, in which case runs
+            performing all types of work are matched.
+        outcome : (SimmerRunOutcome, NoneType)
+            Outcome to match. Defaults to ``None``, in which case runs of all
+            outcomes are matched.
+        limit : int
+            Maximum number of records to return. Defaults to 100.
+
+        Returns
+        ----------
+        tuple
+            Tuple of :class:`SimmerRunRecord` instances. If this history is
+            disabled, this is the empty tuple.
+        '''
+
+        # Connection to this database if usable *OR* "None" otherwise.
+        conn = self._get_conn()
+        if conn is None:
+            return ()
+
+        # SQL conditions and parameters filtering these runs.
+        conditions = []
+        params = []
+        for column_name, column_value in (
+            ('conf_hash', conf_hash),
+            ('phase_kind', phase_kind.name if phase_kind else None),
+            ('phase_subkind', phase_subkind.name if phase_subkind else None),
+            ('outcome', outcome.name if outcome else None),
+        ):
+            if column_value is not None:
+                conditions.append('{} = ?'.format(column_name))
+                params.append(column_value)
+        params.append(limit)
+
+        # Attempt to query these runs.
+        try:
+            rows = conn.execute(
+                'SELECT {} FROM run {} ORDER BY run_id DESC LIMIT ?'.format(
+                    _COLUMNS,
+                    'WHERE ' + ' AND '.join(conditions) if conditions else '',
+                ),
+                params,
+            ).fetchall()
+        # If doing so fails, skip this query if this database is locked *OR*
+        # disable this history otherwise.
+        except sqlite3.Error as exception:
+            self._skip_or_disable(exception)
+            return ()
+
+        # Return these rows as records.
+        return tuple(_unpack_run_record(row) for row in rows)
+
+
+    @type_check
+    def get_steps_per_second_baseline(
+        self,
+        conf_hash: str,
+        phase_kind: SimPhaseKind,
+        phase_subkind: SimmerPhaseSubkind,
+    ) -> NumericOrNoneTypes:
+        '''
+        **Baseline throughput** (i.e., median throughput in steps per second
+        of the :data:`RUN_HISTORY_BASELINE_RUNS` most recent successful runs)
+        of the passed simulation configuration, phase, and type of work if
+        any such runs completed one or more steps *or* ``None`` otherwise.
+
+        This throughput predicts the throughput (and hence time remaining) of
+        subsequent such runs *before* those runs have progressed enough to be
+        measured.
+        '''
+
+        # Throughputs of these runs.
+        steps_per_second_prior = [
+            run_record.steps_per_second
+            for run_record in self.get_runs(
+                conf_hash=conf_hash,
+                phase_kind=phase_kind,
+                phase_subkind=phase_subkind,
+                outcome=SimmerRunOutcome.SUCCEEDED,
+                limit=RUN_HISTORY_BASELINE_RUNS,
+            )
+            if run_record.steps_per_second is not None
+        ]
+
+        # Return the median of these throughputs if any.
+        return (
+            statistics.median(steps_per_second_prior)
+            if steps_per_second_prior else None)
+
+    # ..................{ PRIVATE ~ connectors              }..................
+    def _get_conn(self) -> (sqlite3.Connection, NoneType):
+        '''
+        Connection to the run history database, opened and migrated to the
+        current schema on the first call to this method, if this history is
+        usable *or* ``None`` otherwise (i.e., if this history is disabled).
+        '''
+
+        # If this history is either disabled or already opened, return the
+        # existing connection if any.
+        if self._is_disabled or self._conn is not None:
+            return self._conn
+
+        # Log this opening.
+        logs.log_debug('Opening simulator run history "%s"...', self._filename)
+
+        # Attempt to open and migrate this database.
+        conn = None
+        try:
+            os.makedirs(os.path.dirname(self._filename), exist_ok=True)
+            conn = sqlite3.connect(
+                self._filename, timeout=RUN_HISTORY_LOCK_TIMEOUT_SECONDS)
+
+            # If this database is of a prior schema, recreate this database.
+            # Since this history is merely a convenience, discarding the
+            # history recorded under prior schemas is acceptable.
+            schema_version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if schema_version != RUN_HISTORY_SCHEMA_VERSION:
+                with conn:
+                    conn.execute('DROP TABLE IF EXISTS run')
+                conn.execute('PRAGMA user_version = {}'.format(
+                    RUN_HISTORY_SCHEMA_VERSION))
+
+            # Create this schema if needed.
+            conn.executescript(_SCHEMA)
+        # If doing so fails, close this connection *AND* either retry on the
+        # next call to this method if this database is locked *OR* disable
+        # this history otherwise.
+        except (OSError, sqlite3.Error) as exception:
+            if conn is not None:
+                conn.close()
+            self._skip_or_disable(exception)
+            return None
+
+        # Classify and return this connection.
+        self._conn = conn
+        return conn
+
+
+    def _skip_or_disable(self, exception: Exception) -> None:
+        '''
+        Skip the current read or write on the passed database error if this
+        error signifies this database to be locked by another application
+        instance *or* disable this history otherwise.
+        '''
+
+        # If this database is locked, log and ignore this error.
+        if (isinstance(exception, sqlite3.OperationalError) and
+            'locked' in str(exception)):
+            logs.log_debug(
+                'Simulator run history "%s" locked; skipping: %s',
+                self._filename, exception)
+        # Else, disable this history.
+        else:
+            self._disable(exception)
+
+
+    def _disable(self, exception: Exception) -> None:
+        '''
+        Disable this history for the remainder of this session on the passed
+        database error, logging this error as a non-fatal warning.
+        '''
+
+        logs.log_warning(
+            'Simulator run history "%s" disabled: %s',
+            self._filename, exception)
+        self.close()
+        self._is_disabled = True
+
+# ....................{ PRIVATE ~ converters              }....................
+def _pack_run_record(run_record: SimmerRunRecord) -> tuple:
+    '''
+    Tuple of all column values of the row recording the passed run, replacing
+    enumeration members by their names and booleans by integers.
+    '''
+
+    return run_record._replace(
+        phase_kind=run_record.phase_kind.name,
+        phase_subkind=run_record.phase_subkind.name,
+        outcome=run_record.outcome.name,
+        is_slow=int(run_record.is_slow),
+    )
+
+
+def _unpack_run_record(row: tuple) -> SimmerRunRecord:
+    '''
+    Record of the run recorded by the passed row, reversing the conversions
+    performed by the :func:`_pack_run_record` function.
+    '''
+
+    run_record = SimmerRunRecord(*row)
+    return run_record._replace(
+        phase_kind=SimPhaseKind[run_record.phase_kind],
+        phase_subkind=SimmerPhaseSubkind[run_record.phase_subkind],
+        outcome=SimmerRunOutcome[run_record.outcome],
+        is_slow=bool(run_record.is_slow),
+    )
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **simulator run history view** (i.e., :mod:`PySide2`-based widget
+tabulating the outcome and performance of the simulator runs most recently
+recorded by the run history) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from PySide2.QtCore import QCoreApplication, Qt, Slot
+from PySide2.QtGui import QBrush, QColor
+from PySide2.QtWidgets import (
+    QAbstractItemView, QHeaderView, QMainWindow, QTableWidget,
+    QTableWidgetItem)
+from betse.util.app.meta import appmetaone
+from betse.util.io.log import logs
+from betse.util.type.types import type_check
+from betsee.gui.simtab.run.guisimrunenum import SimmerRunOutcome
+from betsee.gui.simtab.run.hist.guisimrunhiststore import (
+    RUN_HISTORY_SLOW_RATIO, SimmerRunHistory, SimmerRunRecord)
+from betsee.gui.simtab.run.work.guisimrunworkmetric import format_duration
+from betsee.util.widget.mixin.guiwdgmixin import QBetseeObjectMixin
+import time
+
+# ....................{ CONSTANTS                         }....................
+HISTORY_VIEW_ROWS_MAX = 50
+'''
+Maximum number of the most recent runs tabulated by the run history view.
+'''
+
+
+HISTORY_VIEW_SLOW_COLOR = QColor(255, 200, 120)
+'''
+Background colour of the throughput cell of each run flagged as slow.
+'''
+
+# ....................{ PRIVATE ~ constants               }....................
+_COLUMN_HEADERS = (
+    QCoreApplication.translate('guisimrunhistview', 'Started'),
+    QCoreApplication.translate('guisimrunhistview', 'Phase'),
+    QCoreApplication.translate('guisimrunhistview', 'Work'),
+    QCoreApplication.translate('guisimrunhistview', 'Outcome'),
+    QCoreApplication.translate('guisimrunhistview', 'Duration'),
+    QCoreApplication.translate('guisimrunhistview', 'Steps/s'),
+    QCoreApplication.translate('guisimrunhistview', 'CPU'),
+    QCoreApplication.translate('guisimrunhistview', 'Peak RSS'),
+    QCoreApplication.translate('guisimrunhistview', 'BETSE'),
+)
+'''
+Tuple of the human-readable, translated header of each column of this view.
+'''
+
+
+_COLUMN_STEPS_PER_SECOND = 5
+'''
+0-based index of the column of this view tabulating throughput.
+'''
+
+# ....................{ CLASSES                           }....................
+class QBetseeSimmerHistoryView(QBetseeObjectMixin, QTableWidget):
+    '''
+    **Simulator run history view** (i.e., :mod:`PySide2`-based widget
+    tabulating the outcome and performance of the simulator runs most
+    recently recorded by the run history).
+
+    This view owns the :class:`SimmerRunHistory` recorded to by the simulator
+    proactor on the completion of each simulator worker. Since this view is
+    read-only and at most :data:`HISTORY_VIEW_ROWS_MAX` rows long, this view
+    is simply repopulated from that history on each such completion.
+
+    Attributes
+    ----------
+    history : {SimmerRunHistory, NoneType}
+        Run history tabulated by this view if initialized *or* ``None``
+        otherwise.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, *args, **kwargs) -> None:
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+        # Nullify all remaining instance variables for safety.
+        self.history = None
+
+
+    @type_check
+    def init(self, main_window: QMainWindow) -> None:
+        '''
+        Initialize this view against the passed parent main window.
+
+        Parameters
+        ----------
+        main_window: QBetseeMainWindow
+            Initialized application-specific parent :class:`QMainWindow` widget
+            against which to initialize this widget.
+        '''
+
+        # Initialize our superclass.
+        super().init()
+
+        # Log this initialization.
+        logs.log_debug('Initializing simulator run history view...')
+
+        # Run history persisted to the current user's dot directory.
+        self.history = SimmerRunHistory(
+            appmetaone.get_app_meta().dot_run_history_filename)
+
+        # Columns of this view.
+        self.setColumnCount(len(_COLUMN_HEADERS))
+        self.setHorizontalHeaderLabels(_COLUMN_HEADERS)
+        self.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeToContents)
+        self.verticalHeader().setVisible(False)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+        # Populate this view from this history.
+        self.refresh()
+
+        # Close this history on application closure.
+        QCoreApplication.instance().aboutToQuit.connect(self._close_history)
+
+    # ..................{ REFRESHERS                        }..................
+    def refresh(self) -> None:
+        '''
+        Repopulate this view from the most recent runs recorded by this
+        history.
+        '''
+
+        # Most recent runs recorded by this history.
+        run_records = self.history.get_runs(limit=HISTORY_VIEW_ROWS_MAX)
+
+        # Avoid repainting this view until repopulated.
+        self.setUpdatesEnabled(False)
+
+        # Repopulate this view, one row per run.
+        try:
+            self.setRowCount(len(run_records))
+            for row_index, run_record in enumerate(run_records):
+                self._set_row(row_index, run_record)
+        finally:
+            self.setUpdatesEnabled(True)
+
+
+    def _set_row(self, row_index: int, run_record: SimmerRunRecord) -> None:
+        '''
+        Populate the row with the passed index from the passed run.
+        '''
+
+        # Human-readable column values of this row.
+        column_texts = (
+            time.strftime(
+                '%Y-%m-%d %H:%M', time.localtime(run_record.time_started)),
+            run_record.phase_kind.name.lower(),
+            run_record.phase_subkind.name.lower(),
+            run_record.outcome.name.lower(),
+            format_duration(run_record.duration_seconds),
+            _format_optional('{:.1f}', run_record.steps_per_second),
+            _format_optional('{:.1f}s', run_record.cpu_seconds),
+            _format_optional(
+                '{:.0f} MiB',
+                run_record.rss_peak_bytes / 1048576
+                if run_record.rss_peak_bytes is not None else None),
+            run_record.betse_version,
+        )
+
+        # Set each cell of this row.
+        for column_index, column_text in enumerate(column_texts):
+            item = QTableWidgetItem(column_text)
+            if column_index >= 4:
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.setItem(row_index, column_index, item)
+
+        # Dim runs that did not succeed.
+        if run_record.outcome is not SimmerRunOutcome.SUCCEEDED:
+            for column_index in range(len(column_texts)):
+                self.item(row_index, column_index).setForeground(
+                    QBrush(Qt.gray))
+
+        # Highlight runs flagged as significantly slower than prior runs.
+        if run_record.is_slow:
+            item = self.item(row_index, _COLUMN_STEPS_PER_SECOND)
+            item.setBackground(QBrush(HISTORY_VIEW_SLOW_COLOR))
+            item.setToolTip(QCoreApplication.translate(
+                'guisimrunhistview',
+                'More than {:.1f}x slower than prior runs of this '
+                'simulation configuration.'
+            ).format(RUN_HISTORY_SLOW_RATIO))
+
+    # ..................{ SLOTS                             }..................
+    @Slot()
+    def _close_history(self) -> None:
+        '''
+        Close this history on application closure.
+        '''
+
+        if self.history is not None:
+            self.history.close()
+
+# ....................{ PRIVATE ~ formatters              }....................
+def _format_optional(template: str, value: object) -> str:
+    '''
+    Passed value formatted by the passed template if this value is
+    non-``None`` *or* the empty string otherwise.
+    '''
+
+    return template.format(value) if value is not None else ''
@@ -0,0 +1,647 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **simulator live ring** (i.e., shared-memory ring buffer streaming
+per-cell fields from the child process modelling a simulation phase to the
+live view of the GUI process) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.science.enum.enumphase import SimPhaseKind
+from betse.science.phase.phasecls import SimPhase
+from betse.util.io.log import logs
+from betse.util.type.types import type_check, SequenceTypes, StrOrNoneTypes
+import numpy as np
+
+# Shared memory is only available under Python >= 3.8. Under older Pythons,
+# the live view is silently disabled.
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    SharedMemory = None
+
+# ....................{ CONSTANTS                         }....................
+LIVE_RING_BYTES = 64 * 1024 * 1024
+'''
+Size in bytes of the shared memory underlying each live ring.
+
+Since most platforms lazily back shared memory with physical pages on first
+write, the cost of this size is proportional to the size of the frames
+actually streamed rather than this maximum.
+'''
+
+
+LIVE_RING_LABELS_BYTES = 4096
+'''
+Size in bytes of the region of each live ring storing the newline-delimited
+UTF-8-encoded labels of all fields streamed by the current layout.
+'''
+
+
+LIVE_RING_SLOT_COUNT_MAX = 4
+'''
+Maximum number of frames buffered by each live ring.
+
+Since the live view only ever reads the most recently written frame, more
+slots merely widen the window in which the live view may copy a frame before
+the writer overwrites that frame.
+'''
+
+LIVE_PHASE_KINDS = (SimPhaseKind.INIT, SimPhaseKind.SIM,)
+'''
+Tuple of each type of simulation phase whose per-cell fields are streamable
+to the live view (i.e., phases simulating cells over sampled time steps).
+'''
+
+# ....................{ CONSTANTS ~ private               }....................
+_HEADER_GENERATION = 0
+'''
+Index in the header of each live ring of the **generation** (i.e., 1-based
+integer incremented on each new layout *or* 0 while no layout is readable).
+'''
+
+
+_HEADER_ROW_COUNT = 1
+'''
+Index in the header of each live ring of the number of fields per frame.
+'''
+
+
+_HEADER_CELL_COUNT = 2
+'''
+Index in the header of each live ring of the number of cells per field.
+'''
+
+
+_HEADER_SLOT_COUNT = 3
+'''
+Index in the header of each live ring of the number of buffered frames.
+'''
+
+
+_HEADER_WRITE_COUNT = 4
+'''
+Index in the header of each live ring of the number of frames written since
+the current layout was opened.
+'''
+
+
+_HEADER_LABELS_SIZE = 5
+'''
+Index in the header of each live ring of the size in bytes of the encoded
+labels of the current layout.
+'''
+
+
+_HEADER_SIZE = 8
+'''
+Number of 64-bit integers in the header of each live ring.
+'''
+
+# ....................{ TESTERS                           }....................
+def is_live_supported() -> bool:
+    '''
+    ``True`` only if the active Python interpreter supports shared memory and
+    hence live rings.
+    '''
+
+    return SharedMemory is not None
+
+# ....................{ CLASSES                           }....................
+class SimmerLiveRing(object):
+    '''
+    **Simulator live ring** (i.e., shared-memory ring buffer streaming
+    per-cell fields from the child process modelling a simulation phase to the
+    live view of the GUI process).
+
+    Each **frame** of this ring is a two-dimensional Numpy array whose rows
+    are **fields** (e.g., transmembrane voltage, ion concentrations) and
+    whose columns are cells. Frames are written in-place into shared memory
+    and hence neither pickled nor written to disk.
+
+    Concurrency
+    ----------
+    This ring supports exactly one writer and any number of readers without
+    locking. Each slot is guarded by a **sequence number** (i.e., the 0-based
+    index of the frame currently residing in that slot *or* -1 while that
+    slot is being written), which readers check both before and after copying
+    that slot. Readers only ever copy the most recently written frame and
+    silently skip frames overwritten while being copied. Slow readers thus
+    drop frames rather than stalling the writer.
+
+    Layout
+    ----------
+    This ring's shared memory is laid out as:
+
+    #. A header of :data:`_HEADER_SIZE` 64-bit integers.
+    #. A region of :data:`LIVE_RING_LABELS_BYTES` bytes of field labels.
+    #. A ``(cell_count, 2)``-shaped array of the centres of all cells.
+    #. A ``(slot_count,)``-shaped array of slot sequence numbers.
+    #. A ``(slot_count,)``-shaped array of the progress value of each frame.
+    #. A ``(slot_count, row_count, cell_count)``-shaped array of frames.
+
+    Since the number of cells is unknown until the child process loads the
+    modelled phase, the writer opens a new layout at the start of each phase,
+    incrementing the generation readers check to detect this change.
+
+    Attributes
+    ----------
+    _cell_centres : {ndarray, NoneType}
+        View of the cell centres of the current layout if any *or* ``None``.
+    _frames : {ndarray, NoneType}
+        View of the frames of the current layout if any *or* ``None``.
+    _frame_steps : {ndarray, NoneType}
+        View of the frame progress values of the current layout if any *or*
+        ``None``.
+    _header : ndarray
+        View of the header of this ring.
+    _is_owner : bool
+        ``True`` only if this ring created (and hence unlinks) its shared
+        memory.
+    _labels : ndarray
+        View of the label region of this ring.
+    _shared_memory : SharedMemory
+        Shared memory underlying this ring.
+    _slot_seqs : {ndarray, NoneType}
+        View of the slot sequence numbers of the current layout if any *or*
+        ``None``.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, name: StrOrNoneTypes = None) -> None:
+        '''
+        Initialize this live ring.
+
+        Parameters
+        ----------
+        name : StrOrNoneTypes
+            Either:
+
+            * If ``None``, this ring creates new shared memory of
+              :data:`LIVE_RING_BYTES` bytes, which this ring owns and hence
+              unlinks on being closed. This is typically the case in the GUI
+              process.
+            * Else, the name of existing shared memory created by another
+              live ring to attach to. This is typically the case in the child
+              process modelling a phase.
+
+            Defaults to ``None``.
+        '''
+
+        # Create or attach to this shared memory.
+        self._is_owner = name is None
+        if self._is_owner:
+            self._shared_memory = SharedMemory(
+                create=True, size=LIVE_RING_BYTES)
+        else:
+            self._shared_memory = SharedMemory(name=name)
+
+        # Views of all statically sized regions of this shared memory.
+        self._header = np.ndarray(
+            (_HEADER_SIZE,), dtype=np.int64, buffer=self._shared_memory.buf)
+        self._labels = np.ndarray(
+            (LIVE_RING_LABELS_BYTES,),
+            dtype=np.uint8,
+            buffer=self._shared_memory.buf,
+            offset=self._header.nbytes,
+        )
+
+        # If this ring owns this memory, default this ring to no layout.
+        if self._is_owner:
+            self._header[:] = 0
+
+        # Nullify all views of dynamically sized regions.
+        self._cell_centres = None
+        self._frames = None
+        self._frame_steps = None
+        self._slot_seqs = None
+
+
+    def close(self) -> None:
+        '''
+        Release this ring's handle to its shared memory, unlinking that memory
+        if this ring owns that memory.
+
+        This ring is unusable after calling this method.
+        '''
+
+        # Release all views of this memory *BEFORE* closing this memory, which
+        # otherwise raises a "BufferError".
+        self._header = self._labels = None
+        self._cell_centres = self._frames = None
+        self._frame_steps = self._slot_seqs = None
+
+        # Close and (if this ring owns this memory) unlink this memory.
+        self._shared_memory.close()
+        if self._is_owner:
+            self._shared_memory.unlink()
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def name(self) -> str:
+        '''
+        Name of the shared memory underlying this ring, uniquely identifying
+        this ring across processes.
+        '''
+
+        return self._shared_memory.name
+
+    # ..................{ WRITERS                           }..................
+    @type_check
+    def open_layout(
+        self, labels: SequenceTypes, cell_centres: np.ndarray) -> bool:
+        '''
+        Open a new layout of this ring for frames of the passed fields of the
+        passed cells, invalidating all frames of the prior layout if any.
+
+        Parameters
+        ----------
+        labels : SequenceTypes
+            Sequence of the human-readable labels of each field per frame.
+        cell_centres : np.ndarray
+            ``(cell_count, 2)``-shaped array of the centres of all cells.
+
+        Returns
+        ----------
+        bool
+            ``True`` only if at least one frame of this layout fits in this
+            ring. If ``False``, this ring remains without a layout.
+        '''
+
+        # Generation of the prior layout if any *OR* 0 otherwise.
+        generation = int(self._header[_HEADER_GENERATION])
+
+        # Invalidate the prior layout *BEFORE* overwriting that layout.
+        self._header[_HEADER_GENERATION] = 0
+
+        # Encode these labels, truncating these labels to their region.
+        labels_encoded = '\n'.join(labels).encode('utf-8')[
+            :LIVE_RING_LABELS_BYTES]
+
+        # Number of fields and cells per frame.
+        row_count = len(labels)
+        cell_count = cell_centres.shape[0]
+
+        # Number of bytes available to slots and required by each slot.
+        slot_bytes_free = (
+            LIVE_RING_BYTES - self._get_slots_offset(cell_count))
+        slot_bytes = 8 + 8 + 8 * row_count * cell_count
+
+        # Number of slots fitting in this ring.
+        slot_count = min(
+            LIVE_RING_SLOT_COUNT_MAX, slot_bytes_free // slot_bytes)
+
+        # If no frame fits, report this failure.
+        if slot_count < 1:
+            return False
+
+        # Write this layout.
+        self._labels[:len(labels_encoded)] = np.frombuffer(
+            labels_encoded, dtype=np.uint8)
+        self._header[_HEADER_ROW_COUNT] = row_count
+        self._header[_HEADER_CELL_COUNT] = cell_count
+        self._header[_HEADER_SLOT_COUNT] = slot_count
+        self._header[_HEADER_WRITE_COUNT] = 0
+        self._header[_HEADER_LABELS_SIZE] = len(labels_encoded)
+        self._map_layout()
+        self._cell_centres[:] = cell_centres
+        self._slot_seqs[:] = -1
+
+        # Publish this layout *AFTER* writing this layout.
+        self._header[_HEADER_GENERATION] = generation + 1
+        return True
+
+
+    def begin_frame(self) -> np.ndarray:
+        '''
+        Begin writing the next frame of the current layout, returning a
+        writable ``(row_count, cell_count)``-shaped view of that frame.
+
+        Callers should fill this view in-place and then call the
+        :meth:`end_frame` method.
+        '''
+
+        # Index of the next frame and the slot this frame is written to.
+        frame_index = int(self._header[_HEADER_WRITE_COUNT])
+        slot = frame_index % self._slot_seqs.shape[0]
+
+        # Flag this slot as being written *BEFORE* writing this slot.
+        self._slot_seqs[slot] = -1
+
+        # Return a view of this slot.
+        return self._frames[slot]
+
+
+    @type_check
+    def end_frame(self, step: int) -> None:
+        '''
+        Finish writing the frame begun by the prior call to the
+        :meth:`begin_frame` method, publishing that frame to readers.
+
+        Parameters
+        ----------
+        step : int
+            Progress value (i.e., 1-based index of the sampled time step) of
+            this frame.
+        '''
+
+        # Index of this frame and the slot this frame was written to.
+        frame_index = int(self._header[_HEADER_WRITE_COUNT])
+        slot = frame_index % self._slot_seqs.shape[0]
+
+        # Publish this frame *AFTER* writing this frame.
+        self._frame_steps[slot] = step
+        self._slot_seqs[slot] = frame_index
+        self._header[_HEADER_WRITE_COUNT] = frame_index + 1
+
+    # ..................{ READERS                           }..................
+    def read_generation(self) -> int:
+        '''
+        Generation of the current layout if any *or* 0 otherwise.
+        '''
+
+        return int(self._header[_HEADER_GENERATION])
+
+
+    def read_layout(self) -> tuple:
+        '''
+        2-tuple ``(labels, cell_centres)`` of the current layout if any *or*
+        ``None`` otherwise, where ``labels`` is the tuple of field labels and
+        ``cell_centres`` is a copy of the centres of all cells.
+
+        Callers should compare the generation returned by the
+        :meth:`read_generation` method before and after calling this method,
+        discarding this layout if that generation changed.
+        '''
+
+        # If no layout is readable, return "None".
+        if not self.read_generation():
+            return None
+
+        # Map this layout *BEFORE* reading this layout.
+        self._map_layout()
+
+        # Decode these labels.
+        labels_size = int(self._header[_HEADER_LABELS_SIZE])
+        labels = tuple(
+            self._labels[:labels_size].tobytes().decode(
+                'utf-8', errors='replace').split('\n'))
+
+        # Return this layout.
+        return labels, self._cell_centres.copy()
+
+
+    @type_check
+    def read_frame_latest(self, frame_index_prior: int) -> tuple:
+        '''
+        3-tuple ``(frame_index, step, frame)`` of the most recently written
+        frame of the layout previously read by the :meth:`read_layout` method
+        if that frame is newer than the passed frame index *and* was copied
+        without being overwritten *or* ``None`` otherwise.
+
+        Parameters
+        ----------
+        frame_index_prior : int
+            0-based index of the most recently read frame *or* -1 if no
+            frame has been read from this layout.
+
+        Returns
+        ----------
+        {tuple, NoneType}
+            Either ``None`` or a 3-tuple ``(frame_index, step, frame)``, where
+            ``frame_index`` is the 0-based index of this frame, ``step`` is
+            the progress value of this frame, and ``frame`` is a copy of this
+            frame.
+        '''
+
+        # If no layout has been read, return "None".
+        if self._frames is None:
+            return None
+
+        # Index of the most recently written frame.
+        frame_index = int(self._header[_HEADER_WRITE_COUNT]) - 1
+
+        # If no frame newer than the prior frame exists, return "None".
+        if frame_index <= frame_index_prior:
+            return None
+
+        # Slot containing that frame.
+        slot = frame_index % self._slot_seqs.shape[0]
+
+        # If that slot no longer contains that frame, return "None".
+        if self._slot_seqs[slot] != frame_index:
+            return None
+
+        # Copy that frame and its progress value.
+        frame = self._frames[slot].copy()
+        step = int(self._frame_steps[slot])
+
+        # If the writer overwrote that frame while copying, return "None".
+        if self._slot_seqs[slot] != frame_index:
+            return None
+
+        # Return that frame.
+        return frame_index, step, frame
+
+    # ..................{ PRIVATE                           }..................
+    def _get_slots_offset(self, cell_count: int) -> int:
+        '''
+        Offset in bytes of the slot sequence numbers of a layout of the
+        passed number of cells.
+        '''
+
+        return (
+            self._header.nbytes + LIVE_RING_LABELS_BYTES + 8 * 2 * cell_count)
+
+
+    def _map_layout(self) -> None:
+        '''
+        Create views of all dynamically sized regions of the current layout.
+        '''
+
+        # Geometry of the current layout.
+        row_count = int(self._header[_HEADER_ROW_COUNT])
+        cell_count = int(self._header[_HEADER_CELL_COUNT])
+        slot_count = int(self._header[_HEADER_SLOT_COUNT])
+
+        # Offsets in bytes of each dynamically sized region.
+        centres_offset = self._header.nbytes + LIVE_RING_LABELS_BYTES
+        seqs_offset = self._get_slots_offset(cell_count)
+        steps_offset = seqs_offset + 8 * slot_count
+        frames_offset = steps_offset + 8 * slot_count
+
+        # Views of these regions.
+        buffer = self._shared_memory.buf
+        self._cell_centres = np.ndarray(
+            (cell_count, 2), dtype=np.float64,
+            buffer=buffer, offset=centres_offset)
+        self._slot_seqs = np.ndarray(
+            (slot_count,), dtype=np.int64,
+            buffer=buffer, offset=seqs_offset)
+        self._frame_steps = np.ndarray(
+            (slot_count,), dtype=np.int64,
+            buffer=buffer, offset=steps_offset)
+        self._frames = np.ndarray(
+            (slot_count, row_count, cell_count), dtype=np.float64,
+            buffer=buffer, offset=frames_offset)
+
+
+class SimmerLiveWriter(object):
+    '''
+    **Simulator live writer** (i.e., object residing in the child process
+    modelling a simulation phase, streaming the per-cell fields of that phase
+    to a live ring at a fixed decimation).
+
+    This writer is driven by the simulation phase callbacks of that phase,
+    which call the :meth:`restart` method on each new progress range and the
+    :meth:`write_frame_if_due` method on each progress value. Since the
+    simulator calls these callbacks once per sampled time step, each frame
+    reflects the fields of one such step.
+
+    This writer is strictly best-effort. If writing fails for any reason
+    (e.g., the phase defines no such fields), this writer logs a warning and
+    disables itself rather than halting the phase.
+
+    Attributes
+    ----------
+    _decimation : int
+        Number of sampled time steps per streamed frame.
+    _is_disabled : bool
+        ``True`` only if this writer has disabled itself.
+    _is_layout_open : bool
+        ``True`` only if a layout has been opened for the current range.
+    _phase : {SimPhase, NoneType}
+        Most recently constructed simulation phase if any *or* ``None``.
+    _ring : SimmerLiveRing
+        Live ring attached to by this writer.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, ring_name: str, decimation: int) -> None:
+        '''
+        Initialize this live writer.
+
+        Parameters
+        ----------
+        ring_name : str
+            Name of the shared memory underlying the live ring to attach to.
+        decimation : int
+            Number of sampled time steps per streamed frame. Must be positive.
+        '''
+
+        # Classify all passed parameters.
+        self._ring = SimmerLiveRing(name=ring_name)
+        self._decimation = max(decimation, 1)
+
+        # Default all remaining instance variables.
+        self._is_disabled = False
+        self._is_layout_open = False
+        self._phase = None
+
+    # ..................{ BINDERS                           }..................
+    @type_check
+    def bind_phase(self, phase: SimPhase) -> None:
+        '''
+        Stream the fields of the passed simulation phase.
+        '''
+
+        self._phase = phase
+        self._is_layout_open = False
+
+    # ..................{ WRITERS                           }..................
+    def restart(self) -> None:
+        '''
+        Open a new layout on writing the next frame.
+
+        This method is intended to be called on each new progress range, as
+        the fields of the bound phase may be reallocated between ranges.
+        '''
+
+        self._is_layout_open = False
+
+
+    @type_check
+    def write_frame_if_due(self, step: int) -> None:
+        '''
+        Stream the current fields of the bound phase as the next frame if the
+        passed progress value is a multiple of this writer's decimation *or*
+        silently reduce to a noop otherwise.
+        '''
+
+        # If this writer is disabled, no phase is bound, or this step is *NOT*
+        # due, silently reduce to a noop.
+        if (self._is_disabled or self._phase is None or
+            step < 1 or step % self._decimation):
+            return
+
+        # Attempt to stream these fields.
+        try:
+            self._write_frame(step)
+        # If doing so fails, disable this writer rather than halting the phase.
+        except Exception as exception:
+            logs.log_warning('Live view disabled: %s', exception)
+            self._is_disabled = True
+
+
+    def _write_frame(self, step: int) -> None:
+        '''
+        Stream the current fields of the bound phase as the next frame.
+        '''
+
+        # Simulation of the bound phase, localized for efficiency.
+        sim = self._phase.sim
+
+        # If no layout has been opened for the current range, do so.
+        if not self._is_layout_open:
+            # Human-readable labels of all fields, ordered as streamed below.
+            labels = ['Vmem [mV]'] + [
+                '{} [mmol/L]'.format(sim.ionlabel[ion_index])
+                for ion_index in range(len(sim.cc_cells))
+            ]
+
+            # If these fields are too large to fit in this ring, disable this
+            # writer.
+            if not self._ring.open_layout(
+                labels=labels, cell_centres=self._phase.cells.cell_centres):
+                logs.log_warning(
+                    'Live view disabled: %d cells too many to stream.',
+                    len(sim.vm_ave))
+                self._is_disabled = True
+                return
+
+            # Else, this layout was opened.
+            self._is_layout_open = True
+
+        # Write these fields into the next frame in-place, converting Vmem
+        # from volts to millivolts.
+        frame = self._ring.begin_frame()
+        np.multiply(sim.vm_ave, 1000, out=frame[0])
+        frame[1:] = sim.cc_cells
+        self._ring.end_frame(step)
+
+# ....................{ MAKERS                            }....................
+def make_phase_live(
+    live_writer: SimmerLiveWriter, *args, **kwargs) -> SimPhase:
+    '''
+    Create and return a new simulation phase passed all passed parameters
+    *and* bind the passed live writer to that phase.
+
+    This factory is intended to replace the :class:`SimPhase` class in the
+    namespace of the :mod:`betse.science.simrunner` submodule in the child
+    process modelling a phase, as simulation phase callbacks are otherwise
+    passed no reference to the phase they are called for.
+    '''
+
+    # Create this phase.
+    phase = SimPhase(*args, **kwargs)
+
+    # Bind this writer to this phase.
+    live_writer.bind_phase(phase)
+
+    # Return this phase.
+    return phase
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **simulator live view** (i.e., :mod:`PySide2`-based widget
+displaying the per-cell fields of the currently modelled simulation phase as
+that phase is modelled) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from PySide2.QtCore import QCoreApplication, Qt, QRectF, QTimer, Slot
+from PySide2.QtGui import QImage, QPainter
+from PySide2.QtWidgets import QMainWindow, QWidget
+from betse.util.io.log import logs
+from betse.util.type.types import type_check, StrOrNoneTypes
+from betsee.gui.simtab.run.live.guisimrunlivering import (
+    SimmerLiveRing, is_live_supported)
+from betsee.util.widget.mixin.guiwdgmixin import QBetseeObjectMixin
+from matplotlib import cm
+from scipy.spatial import cKDTree
+import numpy as np
+
+# ....................{ CONSTANTS                         }....................
+LIVE_VIEW_POLL_MILLISECONDS = 100
+'''
+Number of milliseconds between each poll of the live ring for a new frame,
+bounding the refresh rate of the live view.
+
+Frames streamed more frequently than this are silently dropped.
+'''
+
+
+LIVE_VIEW_RASTER_PIXELS = 256
+'''
+Number of pixels along the longer side of the raster each frame is rendered
+into *before* that raster is scaled to the size of the live view.
+'''
+
+
+LIVE_VIEW_CELL_RADIUS_FACTOR = 0.6
+'''
+Ratio of the radius of each cell as rendered by the live view to the median
+distance between neighbouring cell centres.
+
+Pixels further than this radius from every cell centre are transparent.
+'''
+
+# ....................{ CLASSES                           }....................
+class QBetseeSimmerLiveView(QBetseeObjectMixin, QWidget):
+    '''
+    **Simulator live view** (i.e., :mod:`PySide2`-based widget displaying the
+    per-cell fields of the currently modelled simulation phase as that phase
+    is modelled).
+
+    This view owns a :class:`SimmerLiveRing`, whose name is passed to each
+    child process modelling a phase. While modelling, that process streams
+    frames of per-cell fields into that ring at the decimation selected by
+    the end user. This view polls that ring from the main event thread for
+    the most recent such frame, dropping all intermediate frames.
+
+    Rendering
+    ----------
+    Each frame is rendered without Matplotlib figures. On each new layout
+    (i.e., at the start of each modelled phase), this view precomputes the
+    index of the cell nearest each pixel of a fixed-size raster. Rendering
+    each frame then reduces to colormapping the selected field and indexing
+    the resulting colours by these precomputed indices, both vectorized Numpy
+    operations.
+
+    Attributes
+    ----------
+    _frame : {ndarray, NoneType}
+        Most recently read frame if any *or* ``None`` otherwise.
+    _frame_index : int
+        0-based index of this frame in its layout *or* -1 if no frame has been
+        read from the current layout.
+    _frame_step : int
+        Progress value (i.e., 1-based index of the sampled time step) of this
+        frame.
+    _generation : int
+        Generation of the current layout of this ring *or* 0 if no layout has
+        been read.
+    _image : {QImage, NoneType}
+        Raster of the most recently rendered frame if any *or* ``None``.
+    _image_rgba : {ndarray, NoneType}
+        ``(height, width, 4)``-shaped Numpy array of RGBA bytes backing this
+        raster. Since :class:`QImage` does *not* copy this array, this array
+        *must* be preserved for the lifetime of that image.
+    _lut : ndarray
+        ``(257, 4)``-shaped colormap lookup table of RGBA bytes, whose last
+        row is the transparent background.
+    _pixel_cell_indices : {ndarray, NoneType}
+        ``(height, width)``-shaped Numpy array of the index of the cell
+        nearest each pixel of this raster *or* -1 for background pixels if a
+        layout has been read *or* ``None`` otherwise.
+    _poll_timer : {QTimer, NoneType}
+        Timer polling this ring for new frames.
+    _ring : {SimmerLiveRing, NoneType}
+        Live ring polled by this view if created *or* ``None`` otherwise.
+    _value_range : tuple
+        2-tuple ``(value_min, value_max)`` of the selected field of this frame.
+
+    Attributes (Widgets)
+    ----------
+    _decimation_box : QSpinBox
+        Alias of the :attr:`QBetseeMainWindow.sim_run_live_decimation` widget.
+    _field_box : QComboBox
+        Alias of the :attr:`QBetseeMainWindow.sim_run_live_field` widget.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, *args, **kwargs) -> None:
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+        # Colormap lookup table, suffixed by a transparent background row
+        # indexed by the pixel cell index -1.
+        self._lut = np.vstack((
+            (cm.viridis(np.linspace(0, 1, 256)) * 255).astype(np.uint8),
+            np.zeros((1, 4), dtype=np.uint8),
+        ))
+
+        # Nullify all remaining instance variables for safety.
+        self._decimation_box = None
+        self._field_box = None
+        self._poll_timer = None
+        self._ring = None
+        self._reset_layout()
+
+
+    @type_check
+    def init(self, main_window: QMainWindow) -> None:
+        '''
+        Initialize this live view against the passed parent main window.
+
+        Parameters
+        ----------
+        main_window: QBetseeMainWindow
+            Initialized application-specific parent :class:`QMainWindow` widget
+            against which to initialize this widget.
+        '''
+
+        # Initialize our superclass.
+        super().init()
+
+        # Log this initialization.
+        logs.log_debug('Initializing simulator live view...')
+
+        # Classify all widgets of this main window required by this view.
+        self._decimation_box = main_window.sim_run_live_decimation
+        self._field_box = main_window.sim_run_live_field
+
+        # Timer polling this ring, started on creating this ring.
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(LIVE_VIEW_POLL_MILLISECONDS)
+        self._poll_timer.timeout.connect(self._poll_ring)
+
+        # Rerender the current frame on selecting a different field.
+        self._field_box.currentIndexChanged.connect(self._select_field)
+
+        # Release this ring on application closure.
+        QCoreApplication.instance().aboutToQuit.connect(self._close_ring)
+
+
+    def _reset_layout(self) -> None:
+        '''
+        Revert this view to having read no layout.
+        '''
+
+        self._frame = None
+        self._frame_index = -1
+        self._frame_step = 0
+        self._generation = 0
+        self._image = None
+        self._image_rgba = None
+        self._pixel_cell_indices = None
+        self._value_range = (0., 0.)
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def decimation(self) -> int:
+        '''
+        Number of sampled time steps per frame streamed to this view, as
+        selected by the end user.
+        '''
+
+        return self._decimation_box.value()
+
+    # ..................{ GETTERS                           }..................
+    def get_ring_name(self) -> StrOrNoneTypes:
+        '''
+        Name of the shared memory underlying the live ring polled by this
+        view if the active Python interpreter supports shared memory *or*
+        ``None`` otherwise.
+
+        The first call to this method creates this ring and starts polling
+        this ring. Since this ring is reused by all subsequent phases, all
+        subsequent calls return the same name.
+        '''
+
+        # If shared memory is unsupported, return "None".
+        if not is_live_supported():
+            return None
+
+        # If this ring has yet to be created, do so.
+        if self._ring is None:
+            logs.log_debug('Creating simulator live ring...')
+            self._ring = SimmerLiveRing()
+            self._poll_timer.start()
+
+        # Return this ring's name.
+        return self._ring.name
+
+    # ..................{ SLOTS                             }..................
+    @Slot()
+    def _poll_ring(self) -> None:
+        '''
+        Slot polling this ring for a new layout and frame, rendering the most
+        recent such frame if any.
+        '''
+
+        # Generation of the current layout of this ring if any *OR* 0.
+        generation = self._ring.read_generation()
+
+        # If this ring has no layout, silently reduce to a noop.
+        if not generation:
+            return
+
+        # If this ring has a new layout, read this layout.
+        if generation != self._generation:
+            layout = self._ring.read_layout()
+
+            # If this layout was replaced while being read, retry later.
+            if layout is None or self._ring.read_generation() != generation:
+                return
+
+            # Adopt this layout.
+            self._set_layout(generation, *layout)
+
+        # Most recent frame of this layout if new *OR* "None" otherwise.
+        frame_read = self._ring.read_frame_latest(self._frame_index)
+
+        # If no new frame was read, silently reduce to a noop.
+        if frame_read is None:
+            return
+
+        # Render this frame.
+        self._frame_index, self._frame_step, self._frame = frame_read
+        self._render_frame()
+
+
+    @Slot(int)
+    def _select_field(self, field_index: int) -> None:
+        '''
+        Slot signalled on the end user selecting the field with the passed
+        index, rerendering the most recent frame.
+        '''
+
+        self._render_frame()
+
+
+    def _render_frame(self) -> None:
+        '''
+        Render the selected field of the most recent frame into this view's
+        raster and schedule this view for repainting.
+        '''
+
+        # If no frame has been read, silently reduce to a noop.
+        if self._frame is None or self._pixel_cell_indices is None:
+            return
+
+        # Selected field of this frame, defaulting to the first field.
+        values = self._frame[max(self._field_box.currentIndex(), 0)]
+
+        # Range of this field, guarding against uniform fields.
+        value_min = float(values.min())
+        value_max = float(values.max())
+        value_span = value_max - value_min or 1.
+        self._value_range = (value_min, value_max)
+
+        # Colormap index of each cell.
+        cell_lut_indices = np.clip(
+            (values - value_min) * (255 / value_span), 0, 255).astype(np.intp)
+
+        # Colour of each cell, suffixed by the background colour.
+        cell_colours = self._lut[np.append(cell_lut_indices, -1)]
+
+        # Colour of each pixel. For safety, this array is retained for the
+        # lifetime of the image wrapping this array.
+        self._image_rgba = np.ascontiguousarray(
+            cell_colours[self._pixel_cell_indices])
+        height, width = self._pixel_cell_indices.shape
+        self._image = QImage(
+            self._image_rgba.data, width, height, 4 * width,
+            QImage.Format_RGBA8888)
+
+        # Repaint this view.
+        self.update()
+
+
+    @Slot()
+    def _close_ring(self) -> None:
+        '''
+        Slot releasing this ring if created *or* reducing to a noop otherwise.
+        '''
+
+        # If this ring has yet to be created, silently reduce to a noop.
+        if self._ring is None:
+            return
+
+        # Stop polling *BEFORE* releasing this ring.
+        self._poll_timer.stop()
+        self._ring.close()
+        self._ring = None
+
+    # ..................{ EVENTS                            }..................
+    def paintEvent(self, event: object) -> None:
+
+        # Painter painting this view.
+        painter = QPainter(self)
+
+        # Rectangle of this view.
+        view_rect = QRectF(self.rect())
+
+        # If a frame has been rendered...
+        if self._image is not None:
+            # Scale this raster to fit this view, preserving aspect ratio.
+            image_size = self._image.size().scaled(
+                self.size(), Qt.KeepAspectRatio)
+            image_rect = QRectF(
+                (view_rect.width() - image_size.width()) / 2,
+                (view_rect.height() - image_size.height()) / 2,
+                image_size.width(),
+                image_size.height(),
+            )
+            painter.drawImage(image_rect, self._image)
+
+            # Overlay the selected field, step, and range of this frame.
+            painter.drawText(
+                view_rect,
+                Qt.AlignTop | Qt.AlignLeft,
+                QCoreApplication.translate(
+                    'QBetseeSimmerLiveView',
+                    '{0}  (step {1})\n{2:.4g} to {3:.4g}').format(
+                        self._field_box.currentText(),
+                        self._frame_step,
+                        *self._value_range))
+        # Else, no frame has been rendered. Describe why.
+        else:
+            painter.drawText(
+                view_rect,
+                Qt.AlignCenter,
+                QCoreApplication.translate(
+                    'QBetseeSimmerLiveView',
+                    'Modelled phases are displayed here while modelling.')
+                if is_live_supported() else
+                QCoreApplication.translate(
+                    'QBetseeSimmerLiveView',
+                    'Live view requires Python 3.8 or newer.'))
+
+        # Finalize this painting.
+        painter.end()
+
+    # ..................{ PRIVATE                           }..................
+    def _set_layout(
+        self,
+        generation: int,
+        labels: tuple,
+        cell_centres: np.ndarray,
+    ) -> None:
+        '''
+        Adopt the passed layout of this ring, precomputing the index of the
+        cell nearest each pixel of this view's raster.
+        '''
+
+        # Log this layout.
+        logs.log_debug(
+            'Simulator live view streaming %d fields of %d cells...',
+            len(labels), len(cell_centres))
+
+        # Label of the currently selected field *BEFORE* replacing all labels.
+        label_selected = self._field_box.currentText()
+
+        # Revert to having read no layout *BEFORE* adopting this layout.
+        self._reset_layout()
+        self._generation = generation
+
+        # Replace all fields selectable by the end user, preserving the
+        # current selection if still available.
+        self._field_box.blockSignals(True)
+        self._field_box.clear()
+        self._field_box.addItems(labels)
+        if label_selected in labels:
+            self._field_box.setCurrentIndex(labels.index(label_selected))
+        self._field_box.blockSignals(False)
+
+        # Bounding box of all cells.
+        centres_min = cell_centres.min(axis=0)
+        centres_span = cell_centres.max(axis=0) - centres_min
+        centres_span[centres_span == 0] = 1.
+
+        # Dimensions of this raster, preserving the aspect ratio of this box.
+        pixel_size = centres_span.max() / LIVE_VIEW_RASTER_PIXELS
+        width, height = np.maximum(
+            np.ceil(centres_span / pixel_size).astype(int), 1)
+
+        # Coordinates of the centre of each pixel. Since image rows increase
+        # downward, the Y axis is flipped.
+        pixel_x = centres_min[0] + (np.arange(width) + 0.5) * pixel_size
+        pixel_y = (
+            centres_min[1] + centres_span[1] -
+            (np.arange(height) + 0.5) * pixel_size)
+        pixel_coords = np.stack(
+            np.meshgrid(pixel_x, pixel_y), axis=-1).reshape(-1, 2)
+
+        # Radius of each cell, estimated from the median distance between
+        # neighbouring cell centres.
+        cells_tree = cKDTree(cell_centres)
+        if len(cell_centres) > 1:
+            cell_neighbour_distances, _ = cells_tree.query(cell_centres, k=2)
+            cell_radius = LIVE_VIEW_CELL_RADIUS_FACTOR * float(
+                np.median(cell_neighbour_distances[:, 1]))
+        else:
+            cell_radius = float(centres_span.max())
+
+        # Index of the cell nearest each pixel *OR* -1 for pixels outside
+        # every cell.
+        pixel_distances, pixel_cell_indices = cells_tree.query(pixel_coords)
+        pixel_cell_indices[pixel_distances > cell_radius] = -1
+        self._pixel_cell_indices = pixel_cell_indices.reshape(height, width)
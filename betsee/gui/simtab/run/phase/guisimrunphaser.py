@@ -16,7 +16,8 @@ from betse.util.type.iterable import tuples
 from betse.util.type.types import type_check, CallableTypes, QueueType
 from betsee.gui.window.guiwindow import QBetseeMainWindow
 from betsee.gui.simtab.run.phase.guisimrunphase import QBetseeSimmerPhase
-from betsee.gui.simtab.run.work.guisimrunwork import QBetseeSimmerPhaseWorker
+from betsee.gui.simtab.run.work.guisimrunwork import (
+    QBetseeSimmerPhaseProcessWorker)
 from betsee.gui.simtab.run.work.guisimrunworkenum import SimmerPhaseSubkind
 from betsee.util.widget.abc.control.guictlabc import QBetseeControllerABC
 from collections import deque
@@ -230,8 +231,11 @@ class QBetseeSimmerPhaser(QBetseeControllerABC):
         for phase in self.PHASES:
             # If this phase is currently queued for modelling...
             if phase.is_queued_modelling:
-                # Simulator worker modelling this phase.
-                worker = QBetseeSimmerPhaseWorker(
+                # Simulator worker modelling this phase in a child process.
+                # Since modelling is both CPU-bound and implemented largely in
+                # pure Python, modelling in a pooled thread of this process
+                # would compete with the Qt event loop for the GIL.
+                worker = QBetseeSimmerPhaseProcessWorker(
                     phase=phase, phase_subkind=SimmerPhaseSubkind.MODELLING)
 
                 # Enqueue a new instance of this subclass.
@@ -239,8 +243,10 @@ class QBetseeSimmerPhaser(QBetseeControllerABC):
 
             # If this phase is currently queued for exporting...
             if phase.is_queued_exporting:
-                # Simulator worker subclass exporting this phase.
-                worker = QBetseeSimmerPhaseWorker(
+                # Simulator worker exporting this phase in a child process,
+                # which then exports the individual plots and animations of
+                # this phase in parallel across a pool of child processes.
+                worker = QBetseeSimmerPhaseProcessWorker(
                     phase=phase, phase_subkind=SimmerPhaseSubkind.EXPORTING)
 
                 # Enqueue a new instance of this subclass.
@@ -17,13 +17,18 @@ from betse.util.type import enums
 from betse.util.type.cls import classes
 from betse.util.type.decorator.decmemo import property_cached
 from betse.util.type.obj import objects
-from betse.util.type.types import type_check, CallableTypes
+from betse.util.type.types import (
+    type_check, CallableTypes, IterableTypes, NoneType)
 from betsee.guiexception import BetseePySideThreadWorkerException
 from betsee.gui.simtab.run.guisimrunenum import SimmerState
-from betsee.gui.simtab.run.phase.guisimrunphase import QBetseeSimmerPhase
+from betsee.gui.simtab.run.work.guisimrunworkcache import SimmerPhaseCache
+from betsee.gui.simtab.run.work.guisimrunworkconf import (
+    SimmerConfSnapshot, reconfigure_p)
 from betsee.gui.simtab.run.work.guisimrunworkenum import SimmerPhaseSubkind
+from betsee.gui.simtab.run.work.guisimrunworkphase import run_phase_child
 from betsee.gui.simtab.run.work.guisimrunworksig import SimCallbacksSignaller
 from betsee.util.thread.pool.guipoolwork import QBetseeThreadPoolWorker
+from betsee.util.thread.pool.guipoolworkproc import QBetseeProcessPoolWorker
 
 # ....................{ SUPERCLASSES                      }....................
 class QBetseeSimmerWorkerABC(QBetseeThreadPoolWorker):
@@ -33,10 +38,13 @@ class QBetseeSimmerWorkerABC(QBetseeThreadPoolWorker):
 
     Attributes
     ----------
-    _conf_filename : StrOrNoneTypes
-        Absolute filename of the YAML-formatted simulation configuration file
-        defining the simulation to be run by this worker if the :meth:`init`
-        method of this worker has been called *or* ``None`` otherwise.
+    _conf_snapshot : {SimmerConfSnapshot, NoneType}
+        Snapshot of the YAML-formatted simulation configuration file defining
+        the simulation to be run by this worker if the :meth:`init` method of
+        this worker has been called *or* ``None`` otherwise. This snapshot is
+        typically shared between all workers enqueued by the same simulator
+        run, each of which clones the configuration deserialized at most once
+        by this snapshot.
     '''
 
     # ..................{ INITIALIZERS                      }..................
@@ -49,19 +57,20 @@ class QBetseeSimmerWorkerABC(QBetseeThreadPoolWorker):
         super().__init__()
 
         # Nullify all instance variables for safety.
-        self._conf_filename = None
+        self._conf_snapshot = None
 
 
     @type_check
-    def init(self, conf_filename: str, *args, **kwargs) -> None:
+    def init(
+        self, conf_snapshot: SimmerConfSnapshot, *args, **kwargs) -> None:
         '''
         Finalize the initialization of this simulator worker.
 
         Parameters
         ----------
-        conf_filename : str
-            Absolute filename of the YAML-formatted simulation configuration
-            file defining the simulation to be run by this worker.
+        conf_snapshot : SimmerConfSnapshot
+            Snapshot of the YAML-formatted simulation configuration file
+            defining the simulation to be run by this worker.
 
         All remaining parameters are passed as is to the superclass
         :meth:`init` method.
@@ -71,7 +80,7 @@ class QBetseeSimmerWorkerABC(QBetseeThreadPoolWorker):
         super().init(*args, **kwargs)
 
         # Classify all passed parameters.
-        self._conf_filename = conf_filename
+        self._conf_snapshot = conf_snapshot
 
     # ..................{ EXCEPTIONS                        }..................
     def _die_unless_initted(self) -> None:
@@ -81,14 +90,14 @@ class QBetseeSimmerWorkerABC(QBetseeThreadPoolWorker):
         Raises
         ----------
         BetseePySideThreadWorkerException
-            If the :attr:`_conf_filename` instance variable is ``None``,
+            If the :attr:`_conf_snapshot` instance variable is ``None``,
             in which case the :meth:`init` method has yet to be called.
         '''
 
-        # If the filename of this worker's simulation configuration file has
+        # If the snapshot of this worker's simulation configuration file has
         # yet to be set, the init() method has yet to be called. In this case,
         # raise an exception.
-        if self._conf_filename is None:
+        if self._conf_snapshot is None:
             raise BetseePySideThreadWorkerException(
                 '"{}" uninitialized (i.e., init() method not called).'.format(
                     objects.get_class_name_unqualified(self)))
@@ -148,6 +157,11 @@ class QBetseeSimmerWorkerABC(QBetseeThreadPoolWorker):
         simulation configuration; ergo, that object is guaranteed to remain
         unchanged by this worker.
 
+        For efficiency, this deep copy is cloned from the configuration
+        deserialized at most once per simulator run by the snapshot shared
+        between all workers of that run rather than redeserialized from disk
+        by each such worker. See the :class:`SimmerConfSnapshot` class.
+
         Doing so also permits this method to dynamically reconfigure this
         configuration in-memory to satisfy GUI requirements, including:
 
@@ -164,21 +178,12 @@ class QBetseeSimmerWorkerABC(QBetseeThreadPoolWorker):
             that of the caller.
         '''
 
-        # Simulation configuration newly deserialized from the passed original
-        # Simulation configuration.
-        p = Parameters.make(self._conf_filename)
-
-        # Disable all simulation configuration options either requiring
-        # interactive user input *OR* displaying graphical output intended for
-        # interactive user consumption (e.g., plots, animations).
-        p.anim.is_after_sim_show = False
-        p.anim.is_while_sim_show = False
-        p.plot.is_after_sim_show = False
+        # Simulation configuration newly cloned from the configuration
+        # deserialized by this snapshot, which is safely modifiable below.
+        p = self._conf_snapshot.make_p()
 
-        # Enable all simulation configuration options exporting to disk.
-        p.anim.is_after_sim_save = True
-        p.anim.is_while_sim_save = True
-        p.plot.is_after_sim_save = True
+        # Reconfigure this configuration to satisfy GUI requirements.
+        reconfigure_p(p)
 
         # Return this configuration.
         return p
@@ -191,8 +196,16 @@ class QBetseeSimmerPhaseWorker(QBetseeSimmerWorkerABC):
 
     Attributes
     ----------
-    _phase : QBetseeSimmerPhase
-        Simulator phase run by this worker.
+    _is_phase_cache_hit : bool
+        ``True`` only if this worker restored the result of this phase from
+        the :attr:`_phase_cache` rather than modelling this phase.
+    _phase : object
+        Simulator phase run by this worker, duck-typed as any object providing
+        the ``kind`` and ``name`` properties.
+    _phase_cache : {SimmerPhaseCache, NoneType}
+        Cache of modelled phase results consulted and updated by this worker
+        if the :meth:`enable_phase_cache` method has been called *or* ``None``
+        otherwise.
     _phase_subkind : SimmerPhaseSubkind
         Type of work performed within this phase by this worker.
     '''
@@ -201,7 +214,7 @@ class QBetseeSimmerPhaseWorker(QBetseeSimmerWorkerABC):
     @type_check
     def __init__(
         self,
-        phase: QBetseeSimmerPhase,
+        phase: object,
         phase_subkind: SimmerPhaseSubkind,
     ) -> None:
         '''
@@ -209,8 +222,16 @@ class QBetseeSimmerPhaseWorker(QBetseeSimmerWorkerABC):
 
         Parameters
         ----------
-        phase : QBetseeSimmerPhase
-            Simulator phase run by this worker.
+        phase : object
+            Simulator phase run by this worker, typically a
+            :class:`QBetseeSimmerPhase` controller queued by the simulator tab
+            *or* a widget-free :class:`SimmerPhaseHeadless` description when
+            running simulations in batch from the command line. Since the
+            former imports the main window, this phase is duck-typed as any
+            object providing the ``kind`` and ``name`` properties rather than
+            type-checked against that controller; doing so would import the
+            main window into every batch run and child process importing this
+            submodule.
         phase_subkind : SimmerPhaseSubkind
             Type of work performed within this phase by this worker.
         '''
@@ -222,11 +243,39 @@ class QBetseeSimmerPhaseWorker(QBetseeSimmerWorkerABC):
         self._phase = phase
         self._phase_subkind = phase_subkind
 
+        # Default this worker to *NOT* caching phase results.
+        self._is_phase_cache_hit = False
+        self._phase_cache = None
+
+
+    @type_check
+    def enable_phase_cache(self, phase_cache: SimmerPhaseCache) -> None:
+        '''
+        Enable the caching of the result of modelling this phase in the passed
+        cache.
+
+        This method is intended to be called from the main event thread
+        *before* this worker is started and only if this worker models rather
+        than exports this phase. On starting, this worker restores the result
+        of this phase from this cache if cached *or* models this phase and
+        then caches the result otherwise. Since testing whether this result is
+        cached requires keying this cache, that test is deferred to this
+        worker rather than performed by the main event thread.
+
+        Parameters
+        ----------
+        phase_cache : SimmerPhaseCache
+            Cache of modelled phase results to be consulted and updated.
+        '''
+
+        # Classify all passed parameters.
+        self._phase_cache = phase_cache
+
     # ..................{ PROPERTIES                        }..................
     # Read-only concrete properties.
 
     @property
-    def phase(self) -> QBetseeSimmerPhase:
+    def phase(self) -> object:
         '''
         Simulator phase run by this worker.
         '''
@@ -234,6 +283,16 @@ class QBetseeSimmerPhaseWorker(QBetseeSimmerWorkerABC):
         return self._phase
 
 
+    @property
+    def is_phase_cache_hit(self) -> bool:
+        '''
+        ``True`` only if this worker restored the cached result of this phase
+        rather than modelling this phase.
+        '''
+
+        return self._is_phase_cache_hit
+
+
     @property
     def phase_subkind(self) -> SimmerPhaseSubkind:
         '''
@@ -255,6 +314,54 @@ class QBetseeSimmerPhaseWorker(QBetseeSimmerWorkerABC):
             enum_type=SimmerState,
             enum_member_value=self._phase_subkind.value)
 
+    # ..................{ TESTERS                           }..................
+    def is_dependent_on(
+        self, worker_prior: 'QBetseeSimmerPhaseWorker') -> bool:
+        '''
+        ``True`` only if this worker is **dependent** on the passed worker
+        (i.e., requires that worker to have completed *before* this worker may
+        be safely started).
+
+        This tester assumes the passed worker to have been enqueued *before*
+        this worker by the :meth:`QBetseeSimmerPhaser.enqueue_phase_workers`
+        method, which enqueues workers in simulation phase order. Under this
+        assumption, this worker is dependent on that worker only if either:
+
+        * That worker models a phase, in which case the results of that
+          modelling are required by *all* subsequently enqueued workers (e.g.,
+          modelling the initialization phase requires the seeded cell cluster
+          previously modelled by the seed phase; exporting the initialization
+          phase requires the results previously modelled by that phase).
+        * Both this and that worker export a phase. Since :mod:`matplotlib`
+          maintains global state shared between all threads (e.g., the current
+          figure managed by :mod:`matplotlib.pyplot`), exporters running in
+          pooled threads are unsafe to run concurrently and *must* be
+          serialized. Exporters running in child processes instead export the
+          items of each phase in parallel across a pool of child processes
+          already saturating all available processors; running these
+          exporters concurrently would only oversubscribe these processors.
+
+        Conversely, this worker is independent of that worker if this worker
+        models a phase *and* that worker exports a prior phase (e.g., modelling
+        the simulation phase while exporting the initialization phase). Such
+        workers are safely runnable concurrently.
+
+        Parameters
+        ----------
+        worker_prior : QBetseeSimmerPhaseWorker
+            Simulator phase worker enqueued *before* this worker.
+
+        Returns
+        ----------
+        bool
+            ``True`` only if this worker is dependent on that worker.
+        '''
+
+        return (
+            worker_prior.phase_subkind is SimmerPhaseSubkind.MODELLING or
+            self.phase_subkind is SimmerPhaseSubkind.EXPORTING
+        )
+
     # ..................{ GETTERS                           }..................
     def _get_sim_runner_subcommand(self) -> CallableTypes:
         '''
@@ -289,6 +396,10 @@ class QBetseeSimmerPhaseWorker(QBetseeSimmerWorkerABC):
     # ..................{ WORKERS                           }..................
     def _work(self) -> None:
 
+        # If the result of this phase was restored from cache, finish.
+        if self._restore_phase_if_cached():
+            return
+
         # Simulation phase runner whose thread affinity is that of the caller.
         sim_runner = self._make_sim_runner()
 
@@ -297,3 +408,240 @@ class QBetseeSimmerPhaseWorker(QBetseeSimmerWorkerABC):
 
         # Run this subcommand on this runner.
         sim_runner_subcommand(sim_runner)
+
+        # If caching phase results, cache the result of this phase.
+        if self._phase_cache is not None:
+            self._phase_cache.store(self.phase.kind)
+
+
+    def _restore_phase_if_cached(self) -> bool:
+        '''
+        Restore the cached result of this phase if caching phase results *and*
+        this result is cached, returning ``True`` only if this result was
+        restored.
+
+        If this result is uncached, this method returns ``False``, in which
+        case the caller should model this phase as usual.
+        '''
+
+        # If *NOT* caching phase results or this result is uncached, report
+        # failure. Since this test keys this cache on its first call, this test
+        # is intentionally performed here in this worker's pooled thread.
+        if (self._phase_cache is None or
+            not self._phase_cache.is_cached(self.phase.kind)):
+            return False
+
+        # Emit a trivial progress range, permitting the simulator to display
+        # this restoration as any other unit of work.
+        self.signals.emit_progress_range(progress_min=0, progress_max=1)
+        self.signals.emit_progress_state(
+            'Restoring cached {} results...'.format(self.phase.name))
+
+        # If this result has since been evicted, report failure.
+        if not self._phase_cache.restore(self.phase.kind):
+            return False
+
+        # Report success.
+        self._is_phase_cache_hit = True
+        self.signals.emit_progress(progress=1)
+        return True
+
+class QBetseeSimmerPhaseProcessWorker(
+    QBetseeProcessPoolWorker, QBetseeSimmerPhaseWorker):
+    '''
+    Low-level **process-backed simulator phase worker** (i.e., simulator
+    worker running an arbitrary simulation phase in a dedicated child process
+    rather than in the pooled thread running this worker).
+
+    Unlike the :class:`QBetseeSimmerPhaseWorker` superclass, this worker does
+    *not* compete with the Qt event loop for the Global Interpreter Lock (GIL)
+    while running this phase, preserving the responsiveness of the GUI for the
+    duration of long-running phases. Moreover, fatal errors in C extensions
+    called by this phase (e.g., segmentation faults) terminate only that
+    child process rather than the GUI process, in which case this worker
+    emits the :attr:`signals.failed` signal as with any other exception.
+
+    Caveats
+    ----------
+    **This worker unpickles the simulation configuration in that child
+    process** rather than cloning the configuration cached by the snapshot
+    passed to the :meth:`init` method, as configurations are *not* shareable
+    across process boundaries. Since that snapshot pickles its configuration
+    at most once per deserialization, the underlying simulation configuration
+    file is deserialized at most once per simulator run regardless of the
+    number of workers or processes.
+
+    Attributes
+    ----------
+    _live_decimation : int
+        Number of sampled time steps per frame streamed to the live view.
+    _live_ring_name : StrOrNoneTypes
+        Name of the shared memory underlying the live ring this worker streams
+        the fields of this phase to if the :meth:`enable_live_view` method has
+        been called *or* ``None`` otherwise.
+
+    See Also
+    ----------
+    :class:`QBetseeProcessPoolWorker`
+        Further details.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, *args, **kwargs) -> None:
+        '''
+        Initialize this process-backed simulator phase worker.
+
+        All passed parameters are passed as is to the superclass method.
+        '''
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+        # Default this worker to *NOT* streaming to the live view.
+        self._live_decimation = 1
+        self._live_ring_name = None
+
+
+    @type_check
+    def enable_live_view(self, ring_name: str, decimation: int) -> None:
+        '''
+        Enable streaming of the per-cell fields of this phase from the child
+        process modelling this phase to the live ring with the passed name.
+
+        This method is intended to be called from the main event thread
+        *before* this worker is started and only if this worker models rather
+        than exports this phase.
+
+        Parameters
+        ----------
+        ring_name : str
+            Name of the shared memory underlying that live ring.
+        decimation : int
+            Number of sampled time steps per streamed frame.
+        '''
+
+        # Classify all passed parameters.
+        self._live_ring_name = ring_name
+        self._live_decimation = decimation
+
+    # ..................{ WORKERS                           }..................
+    def _work(self) -> object:
+
+        # If the result of this phase was restored from cache, finish without
+        # needlessly spawning a child process.
+        if self._restore_phase_if_cached():
+            return None
+
+        # Else, model this phase in a child process.
+        return super()._work()
+
+
+    def _make_child_work(self) -> tuple:
+
+        # Raise an exception unless the :meth:`init` method has been called.
+        self._die_unless_initted()
+
+        # Defer to a module-scoped callable picklable by the "spawn" start
+        # method, passed the pickled simulation configuration snapshotted for
+        # this run and only picklable strings identifying the subcommand to be
+        # run.
+        return (run_phase_child, (
+            self._conf_snapshot.make_p_pickled(),
+            self._get_sim_runner_subcommand().__name__,
+
+            # Cache of phase results keyed in this process if caching phase
+            # results *OR* "None" and the name of this phase. Since this
+            # cache pickles its keys, pickling this cache rather than rekeying
+            # this cache in the child guarantees both processes to agree.
+            self._phase_cache,
+            self.phase.kind.name,
+
+            # Name of the live ring if streaming *OR* "None" and decimation.
+            self._live_ring_name,
+            self._live_decimation,
+        ))
+
+# ....................{ SCHEDULERS                        }....................
+@type_check
+def get_workers_startable(
+    workers_queued: IterableTypes,
+    workers_working: IterableTypes,
+    worker_count_max: int,
+    is_dependent_on: CallableTypes,
+) -> list:
+    '''
+    List of all passed enqueued simulator phase workers that are currently
+    **startable** (i.e., dependent on no prior worker that has yet to
+    complete), in enqueued order.
+
+    This function implements the scheduling policy shared by all simulator
+    worker schedulers, including both the :class:`QBetseeSimmerProactor`
+    driving the simulator tab *and* the :class:`SimmerBatch` driving headless
+    batch runs. Since workers are enqueued in simulation phase order, a worker
+    may depend *only* on workers either still working or enqueued before
+    that worker.
+
+    Parameters
+    ----------
+    workers_queued : IterableTypes
+        Iterable of all enqueued workers that have yet to be started, in
+        enqueued order.
+    workers_working : IterableTypes
+        Iterable of all currently working workers.
+    worker_count_max : int
+        Maximum number of concurrently working workers. The length of the
+        returned list is at most this maximum minus the number of currently
+        working workers.
+    is_dependent_on : CallableTypes
+        Callable accepting two workers ``worker`` and ``worker_prior``, where
+        the latter was enqueued before the former, and returning ``True``
+        only if the former is dependent on the latter (e.g., the
+        :meth:`QBetseeSimmerPhaseWorker.is_dependent_on` method).
+
+    Returns
+    ----------
+    list
+        List of all startable workers, which the caller should start in
+        order.
+    '''
+
+    # List of all startable workers to be returned.
+    workers_startable = []
+
+    # Sequence of all workers enqueued *BEFORE* the current worker visited by
+    # the iteration below that have yet to complete.
+    workers_prior = list(workers_working)
+
+    # Number of workers working after starting all startable workers.
+    worker_count = len(workers_prior)
+
+    # For each enqueued worker (in enqueued order)...
+    for worker in workers_queued:
+        # If the maximum number of workers would already be working, cease.
+        if worker_count >= worker_count_max:
+            break
+
+        # If this worker is independent of all prior workers that have yet to
+        # complete, this worker is startable.
+        if not any(
+            is_dependent_on(worker, worker_prior)
+            for worker_prior in workers_prior
+        ):
+            workers_startable.append(worker)
+            worker_count += 1
+        # Else, this worker is unstartable.
+
+        # In either case, this worker has yet to complete. Since subsequently
+        # enqueued workers may depend on this worker, record this worker as
+        # such.
+        workers_prior.append(worker)
+
+    # Return this list.
+    return workers_startable
+
+# ....................{ TYPES                             }....................
+QBetseeSimmerPhaseWorkerOrNoneTypes = (QBetseeSimmerPhaseWorker, NoneType)
+'''
+Tuple of both the simulator phase worker type *and* the type of the singleton
+``None`` object.
+'''
@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **simulator phase cache** (i.e., content-addressed on-disk cache of
+the results of modelling simulation phases, keyed by a canonical hash of the
+simulation configuration subtree each such phase depends on) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse import metadata as betse_metadata
+from betse.science.enum.enumphase import SimPhaseKind
+from betse.science.parameters import Parameters
+from betse.util.io.log import logs
+from betse.util.type.types import type_check, GeneratorType
+from betsee.gui.simtab.run.work.guisimrunworkconf import hash_conf_file
+from betsee.util.path.guifileatomic import writing_file_atomic
+import hashlib, json, os, shutil, threading, time
+
+# ....................{ CONSTANTS                         }....................
+PHASE_CACHE_DIRNAME = '.betsee_phase_cache'
+'''
+Basename of the **phase cache directory** (i.e., directory containing one
+subdirectory for each cached phase result), residing in the directory
+containing the simulation configuration file and hence all output directories
+of that simulation.
+'''
+
+
+PHASE_CACHE_SIZE_MAX_DEFAULT = 4 * 1024**3
+'''
+Default maximum total size in bytes of all results cached in each phase cache
+directory, beyond which the least recently used results are evicted.
+'''
+
+
+PHASE_KIND_TO_CONF_KEYS_IGNORED = {
+    SimPhaseKind.SEED: frozenset((
+        'init time settings',
+        'sim time settings',
+    )),
+    SimPhaseKind.INIT: frozenset((
+        'sim time settings',
+    )),
+    SimPhaseKind.SIM: frozenset(),
+}
+'''
+Dictionary mapping from each type of simulation phase to the set of all
+top-level keys of the simulation configuration that phase is guaranteed *not*
+to depend on, in addition to the keys of :data:`CONF_KEYS_IGNORED`.
+
+All other top-level keys are conservatively assumed to be depended on, as the
+granularity at which BETSE reads configuration settings is *not* tracked.
+'''
+
+
+CONF_KEYS_IGNORED = frozenset((
+    # Export settings, read *ONLY* by exporting rather than modelling phases.
+    'results file saving',
+    'results options',
+
+    # Pathnames of modelled results, which the cache restores to whichever
+    # pathnames are currently configured.
+    'init file saving',
+    'sim file saving',
+
+    # Control flags governing *WHETHER* phases run rather than *HOW*.
+    'automatically run initialization',
+))
+'''
+Set of all top-level keys of the simulation configuration that *no* modelling
+phase depends on and hence ignored when hashing that configuration.
+'''
+
+# ....................{ CLASSES                           }....................
+class SimmerPhaseCache(object):
+    '''
+    **Simulator phase cache** (i.e., content-addressed on-disk cache of the
+    results of modelling simulation phases, keyed by a canonical hash of the
+    simulation configuration subtree each such phase depends on).
+
+    Each modelling phase produces exactly one pickled result file (e.g., the
+    seeded cell cluster for the seed phase), which this cache copies under the
+    key of that phase after that phase successfully completes. When that phase
+    is subsequently rerun with a configuration hashing to the same key, this
+    cache restores that file rather than remodelling that phase.
+
+    Keys
+    ----------
+    The key of each phase is the SHA-256 hash of:
+
+    * The version of BETSE, invalidating all results on upgrading BETSE.
+    * The name of that phase.
+    * The canonical JSON serialization of all top-level keys of the simulation
+      configuration that phase depends on. See
+      :data:`PHASE_KIND_TO_CONF_KEYS_IGNORED`.
+    * The SHA-256 hash of the contents of each external file referenced by
+      these keys (e.g., geometry masks, bitmap tissue profiles, ion profile
+      data), invalidating results on editing these files in-place. Since the
+      configuration schema does *not* distinguish pathnames from arbitrary
+      strings, each string value of these keys resolving to an existing file
+      relative to the directory containing the configuration file is
+      conservatively assumed to be such a reference.
+    * The key of the prior phase if any, as each phase depends on the result
+      of the prior phase.
+
+    Scope
+    ----------
+    **Cache hits restore only the pickled result of each phase.** All other
+    side effects of modelling that phase are *not* cached and hence *not*
+    restored, including:
+
+    * Animation frames exported while modelling (e.g., as enabled by the
+      ``while solving`` animation settings), which remain as previously
+      exported if at all.
+    * Plots, animations, and comma-separated value files exported after
+      modelling, which are regenerated only by subsequently running the
+      corresponding exporting phase.
+
+    Eviction
+    ----------
+    On storing each result, this cache evicts the least recently used results
+    until the total size of all cached results is at most the maximum size.
+    Results are "used" on being either stored or restored; the modification
+    time of the directory containing each result records that usage.
+
+    Keys are computed lazily on first use rather than on instantiation, as
+    hashing large external files (e.g., meshes, images) is slow enough to
+    block the GUI thread typically instantiating this cache. Invalidating
+    this cache computes no keys at all.
+
+    Thread Safety
+    ----------
+    This object retains a reference to the configuration dictionary of the
+    simulation configuration passed to its :meth:`__init__` method until
+    first keyed; that dictionary must *not* be modified in the interim.
+    Callers should typically pass a configuration cloned for this purpose
+    (e.g., by the :meth:`SimmerConfSnapshot.make_p` method). This object is
+    otherwise immutable; its methods are thus safely callable from any thread
+    or process. This object is also picklable, permitting the process keying
+    this cache to pass this cache as is to child processes storing results to
+    this cache rather than rekeying this cache from a possibly divergent
+    configuration. Concurrent stores of the same key are safe, as each store
+    is atomically renamed into place.
+
+    Attributes
+    ----------
+    _cache_dirname : str
+        Absolute dirname of the phase cache directory.
+    _conf : {dict, NoneType}
+        Dictionary deserialized from the simulation configuration file keying
+        this cache if this cache was instantiated in this process *or*
+        ``None`` if this cache was unpickled from another process.
+    _conf_dirname : str
+        Absolute dirname of the directory containing that file.
+    _phase_kind_to_filename : dict
+        Dictionary mapping from each type of simulation phase to the absolute
+        filename of the pickled result of that phase.
+    _phase_kind_to_key : {dict, NoneType}
+        Dictionary mapping from each type of simulation phase to the key of
+        that phase if this cache has been keyed *or* ``None`` otherwise.
+    _phase_kind_to_key_lock : threading.Lock
+        Lock serializing the lazy keying of this cache across threads.
+    _size_max : int
+        Maximum total size in bytes of all cached results.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        p: Parameters,
+        size_max: int = PHASE_CACHE_SIZE_MAX_DEFAULT,
+    ) -> None:
+        '''
+        Initialize this phase cache for the passed simulation configuration.
+
+        For safety, this method should be passed a simulation configuration
+        *before* that configuration is reconfigured in-memory (e.g., by the
+        :func:`betsee.gui.simtab.run.work.guisimrunworkconf.reconfigure_p`
+        function).
+
+        Parameters
+        ----------
+        p : Parameters
+            Simulation configuration to cache the phase results of.
+        size_max : int
+            Maximum total size in bytes of all cached results. Defaults to
+            :data:`PHASE_CACHE_SIZE_MAX_DEFAULT`.
+        '''
+
+        # Classify all passed parameters.
+        self._size_max = size_max
+
+        # Absolute dirname of the phase cache directory.
+        self._cache_dirname = os.path.join(p.conf_dirname, PHASE_CACHE_DIRNAME)
+
+        # Map each phase to the filename of its pickled result.
+        self._phase_kind_to_filename = {
+            SimPhaseKind.SEED: p.seed_pickle_filename,
+            SimPhaseKind.INIT: p.init_pickle_filename,
+            SimPhaseKind.SIM:  p.sim_pickle_filename,
+        }
+
+        # Classify the configuration to be lazily keyed. Since hashing this
+        # configuration and all external files it references is
+        # prohibitively slow for large meshes and images, these keys are
+        # deferred until first required by a worker rather than computed here
+        # in the (typically GUI) thread instantiating this cache.
+        self._conf = p.conf
+        self._conf_dirname = p.conf_dirname
+
+        # Nullify all remaining instance variables for safety.
+        self._phase_kind_to_key = None
+        self._phase_kind_to_key_lock = threading.Lock()
+
+    # ..................{ PICKLERS                          }..................
+    def __getstate__(self) -> dict:
+        '''
+        Pickle this cache with all keys computed, guaranteeing child
+        processes unpickling this cache to agree with the process keying this
+        cache rather than rekeying this cache from a divergent configuration.
+        '''
+
+        # Key this cache *BEFORE* copying this state.
+        self._get_phase_kind_to_key()
+
+        # Pickle all state except the configuration, which is no longer
+        # required, and the lock guarding keying, which is unpicklable.
+        state = self.__dict__.copy()
+        del state['_conf']
+        del state['_phase_kind_to_key_lock']
+        return state
+
+
+    def __setstate__(self, state: dict) -> None:
+        '''
+        Unpickle this cache from the passed state pickled by the
+        :meth:`__getstate__` method.
+        '''
+
+        self.__dict__.update(state)
+        self._conf = None
+        self._phase_kind_to_key_lock = threading.Lock()
+
+    # ..................{ TESTERS                           }..................
+    @type_check
+    def is_cached(self, phase_kind: SimPhaseKind) -> bool:
+        '''
+        ``True`` only if the result of the passed phase is cached under the
+        key of that phase for this configuration.
+        '''
+
+        return os.path.isfile(self._get_entry_filename(phase_kind))
+
+    # ..................{ RESTORERS                         }..................
+    @type_check
+    def restore(self, phase_kind: SimPhaseKind) -> bool:
+        '''
+        Restore the cached result of the passed phase to the pathname at which
+        that phase writes its result, returning ``True`` only if that result
+        was cached.
+
+        Only this pickled result is restored. Animation frames exported while
+        modelling that phase are *not* restored; see the class docstring.
+
+        For safety, this result is copied rather than hard-linked. Since BETSE
+        rewrites results in-place, hard-linking would corrupt this cache on
+        subsequently remodelling that phase. The modification time of this
+        result is preserved, preventing export manifests from misidentifying
+        restored results as changed.
+        '''
+
+        # Absolute filename of this cached result.
+        entry_filename = self._get_entry_filename(phase_kind)
+
+        # If this result is uncached (e.g., due to being evicted since tested
+        # by the caller), report failure.
+        if not os.path.isfile(entry_filename):
+            return False
+
+        # Log this restoration.
+        logs.log_info(
+            'Restoring cached simulation phase "%s" result...',
+            phase_kind.name.lower())
+
+        # Absolute filename of this phase's result.
+        phase_filename = self._phase_kind_to_filename[phase_kind]
+
+        # Copy this result atomically, preventing readers from observing a
+        # partially copied result.
+        os.makedirs(os.path.dirname(phase_filename), exist_ok=True)
+        with writing_file_atomic(phase_filename) as phase_filename_temp:
+            shutil.copy2(entry_filename, phase_filename_temp)
+
+        # Record this usage for eviction purposes.
+        self._touch_entry(phase_kind)
+
+        # Report success.
+        return True
+
+    # ..................{ STORERS                           }..................
+    @type_check
+    def store(self, phase_kind: SimPhaseKind) -> None:
+        '''
+        Cache the result of the passed phase under the key of that phase,
+        evicting the least recently used results as needed.
+
+        This method is intended to be called *only* immediately after that
+        phase successfully completes. If that phase produced no result, this
+        method silently reduces to a noop.
+        '''
+
+        # Absolute filename of this phase's result.
+        phase_filename = self._phase_kind_to_filename[phase_kind]
+
+        # If this phase produced no result, silently reduce to a noop.
+        if not os.path.isfile(phase_filename):
+            return
+
+        # Log this storage.
+        logs.log_debug(
+            'Caching simulation phase "%s" result...', phase_kind.name.lower())
+
+        # Absolute filename of this cached result.
+        entry_filename = self._get_entry_filename(phase_kind)
+
+        # Copy this result into this cache atomically, as above.
+        os.makedirs(os.path.dirname(entry_filename), exist_ok=True)
+        with writing_file_atomic(entry_filename) as entry_filename_temp:
+            shutil.copy2(phase_filename, entry_filename_temp)
+
+        # Record this usage *BEFORE* evicting, guaranteeing that this result
+        # is the most recently used and hence evicted last.
+        self._touch_entry(phase_kind)
+
+        # Evict the least recently used results as needed.
+        self._evict(entry_dirname_kept=os.path.dirname(entry_filename))
+
+    # ..................{ INVALIDATORS                      }..................
+    def invalidate(self) -> None:
+        '''
+        Remove *all* cached results for the simulation configuration with
+        which this cache was initialized, regardless of key.
+        '''
+
+        # Log this invalidation.
+        logs.log_info(
+            'Clearing simulation phase cache "%s"...', self._cache_dirname)
+
+        # Remove this cache directory if found.
+        shutil.rmtree(self._cache_dirname, ignore_errors=True)
+
+    # ..................{ PRIVATE ~ getters                 }..................
+    def _get_entry_filename(self, phase_kind: SimPhaseKind) -> str:
+        '''
+        Absolute filename of the cached result of the passed phase.
+        '''
+
+        return os.path.join(
+            self._cache_dirname,
+            self._get_phase_kind_to_key()[phase_kind],
+            os.path.basename(self._phase_kind_to_filename[phase_kind]),
+        )
+
+
+    def _get_phase_kind_to_key(self) -> dict:
+        '''
+        Dictionary mapping from each type of simulation phase to the key of
+        that phase, computed on the first call to this getter.
+
+        This getter is thread-safe, as workers running in different pooled
+        threads may concurrently share this cache.
+        '''
+
+        with self._phase_kind_to_key_lock:
+            if self._phase_kind_to_key is None:
+                self._phase_kind_to_key = _key_phases(
+                    conf=self._conf, conf_dirname=self._conf_dirname)
+
+        return self._phase_kind_to_key
+
+    # ..................{ PRIVATE ~ evicters                }..................
+    def _touch_entry(self, phase_kind: SimPhaseKind) -> None:
+        '''
+        Record the passed phase's cached result as most recently used.
+        '''
+
+        os.utime(os.path.dirname(self._get_entry_filename(phase_kind)))
+
+
+    def _evict(self, entry_dirname_kept: str) -> None:
+        '''
+        Evict the least recently used cached results until the total size of
+        all cached results is at most the maximum size, never evicting the
+        result in the directory with the passed dirname.
+        '''
+
+        # List of 3-tuples "(mtime, size, dirname)" describing each result.
+        entries = []
+        for entry_basename in os.listdir(self._cache_dirname):
+            entry_dirname = os.path.join(self._cache_dirname, entry_basename)
+
+            # Attempt to describe this result, ignoring results concurrently
+            # evicted by another process.
+            try:
+                entry_size = sum(
+                    os.path.getsize(os.path.join(entry_dirname, filename))
+                    for filename in os.listdir(entry_dirname))
+                entry_mtime = os.path.getmtime(entry_dirname)
+            except OSError:
+                continue
+
+            entries.append((entry_mtime, entry_size, entry_dirname))
+
+        # Total size of all cached results.
+        cache_size = sum(entry[1] for entry in entries)
+
+        # For each result from least to most recently used, evict this result
+        # until this cache is sufficiently small.
+        for entry_mtime, entry_size, entry_dirname in sorted(entries):
+            if cache_size <= self._size_max:
+                break
+            if entry_dirname == entry_dirname_kept:
+                continue
+
+            # Log this eviction.
+            logs.log_debug(
+                'Evicting simulation phase cache entry "%s" '
+                '(last used %s)...',
+                os.path.basename(entry_dirname),
+                time.ctime(entry_mtime))
+
+            # Evict this result.
+            shutil.rmtree(entry_dirname, ignore_errors=True)
+            cache_size -= entry_size
+
+# ....................{ PRIVATE ~ hashers                 }....................
+def _key_phases(conf: dict, conf_dirname: str) -> dict:
+    '''
+    Dictionary mapping from each type of simulation phase to the key of that
+    phase for the passed simulation configuration.
+
+    Parameters
+    ----------
+    conf : dict
+        Dictionary deserialized from the simulation configuration file.
+    conf_dirname : str
+        Absolute dirname of the directory containing that file, relative to
+        which relative pathnames of external files are resolved.
+    '''
+
+    # Dictionary mapping from each string value of this configuration found to
+    # be the pathname of an existing file to the hash of the contents of that
+    # file, shared between phases to avoid rehashing.
+    conf_str_to_file_hash = {}
+
+    # Map each phase to its key, chaining the key of each prior phase.
+    phase_kind_to_key = {}
+    phase_key_prior = ''
+    for phase_kind in SimPhaseKind:
+        # Set of all top-level keys ignored by this phase.
+        conf_keys_ignored = CONF_KEYS_IGNORED | (
+            PHASE_KIND_TO_CONF_KEYS_IGNORED[phase_kind])
+
+        # Subtree of this configuration this phase depends on.
+        conf_subtree = {
+            conf_key: conf_value
+            for conf_key, conf_value in conf.items()
+            if conf_key not in conf_keys_ignored
+        }
+
+        # Dictionary mapping from the pathname of each external file
+        # referenced by this subtree to the hash of that file's contents.
+        conf_file_hashes = _hash_conf_files(
+            conf_value=conf_subtree,
+            conf_dirname=conf_dirname,
+            conf_str_to_file_hash=conf_str_to_file_hash,
+        )
+
+        # Canonical serialization of all inputs to this key. Values *NOT*
+        # natively serializable (e.g., dates) are serialized by string.
+        phase_key_input = json.dumps(
+            [
+                betse_metadata.VERSION,
+                phase_kind.name,
+                conf_subtree,
+                conf_file_hashes,
+                phase_key_prior,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+        # Key of this phase.
+        phase_key_prior = phase_kind_to_key[phase_kind] = (
+            hashlib.sha256(phase_key_input.encode('utf-8')).hexdigest())
+
+    # Return this dictionary.
+    return phase_kind_to_key
+
+def _hash_conf_files(
+    conf_value: object, conf_dirname: str, conf_str_to_file_hash: dict,
+) -> dict:
+    '''
+    Dictionary mapping from each string value of the passed simulation
+    configuration subtree that is the absolute or relative pathname of an
+    existing file to the SHA-256 hash of the contents of that file.
+
+    Parameters
+    ----------
+    conf_value : object
+        Simulation configuration subtree to be searched for pathnames.
+    conf_dirname : str
+        Absolute dirname of the directory containing the simulation
+        configuration file, relative to which relative pathnames are resolved.
+    conf_str_to_file_hash : dict
+        Dictionary mapping from each string value previously found to be the
+        pathname of an existing file to the hash of that file, both consulted
+        to avoid rehashing that file *and* updated with all newly hashed files.
+    '''
+
+    # Dictionary to be returned.
+    conf_file_hashes = {}
+
+    # For each string value of this subtree...
+    for conf_str in _iter_conf_strs(conf_value):
+        # If this string has already been hashed, reuse this hash.
+        if conf_str in conf_str_to_file_hash:
+            conf_file_hashes[conf_str] = conf_str_to_file_hash[conf_str]
+            continue
+
+        # Absolute pathname this string resolves to if a pathname. Since
+        # os.path.join() returns absolute pathnames as is, this also handles
+        # absolute pathnames.
+        conf_pathname = os.path.join(conf_dirname, conf_str)
+
+        # If this string is the pathname of an existing file, hash this file.
+        # Strings *NOT* representable as pathnames (e.g., due to embedded null
+        # bytes) raise exceptions and are ignored.
+        try:
+            if os.path.isfile(conf_pathname):
+                conf_file_hash = hash_conf_file(conf_pathname)
+                conf_file_hashes[conf_str] = conf_file_hash
+                conf_str_to_file_hash[conf_str] = conf_file_hash
+        except (OSError, ValueError):
+            pass
+
+    # Return this dictionary.
+    return conf_file_hashes
+
+
+def _iter_conf_strs(conf_value: object) -> GeneratorType:
+    '''
+    Generator recursively yielding each non-empty string value of the passed
+    simulation configuration subtree, ignoring all keys.
+    '''
+
+    # If this value is a non-empty string, yield this string.
+    if isinstance(conf_value, str):
+        if conf_value:
+            yield conf_value
+    # Else if this value is a mapping, recursively yield from all values.
+    elif isinstance(conf_value, dict):
+        for conf_value_nested in conf_value.values():
+            yield from _iter_conf_strs(conf_value_nested)
+    # Else if this value is a sequence, recursively yield from all items.
+    elif isinstance(conf_value, (list, tuple)):
+        for conf_value_nested in conf_value:
+            yield from _iter_conf_strs(conf_value_nested)
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **simulator configuration snapshot** (i.e., thread-safe cache of the
+simulation configuration deserialized at most once per simulator run and
+cloned for each simulator worker) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from PySide2.QtCore import QMutex, QMutexLocker
+from betse.science.parameters import Parameters
+from betse.util.io.log import logs
+from betse.util.type.types import type_check
+from betsee.gui.simtab.run.live import guisimrunlivering
+from copy import deepcopy
+import hashlib, os, pickle
+
+# ....................{ CLASSES                           }....................
+class SimmerConfSnapshot(object):
+    '''
+    **Simulator configuration snapshot** (i.e., thread-safe cache of the
+    simulation configuration deserialized at most once per simulator run and
+    cloned for each simulator worker).
+
+    Deserializing a simulation configuration from disk (i.e., by calling the
+    :meth:`Parameters.make` class method) parses *and* validates the entire
+    YAML-formatted file underlying that configuration -- a non-negligible cost
+    for large configurations (e.g., defining numerous tissue profiles). Rather
+    than repeating this cost for each queued simulator worker, the simulator
+    proactor creates one snapshot on starting each queue of workers; each such
+    worker then calls the :meth:`make_p` method to cheaply clone the
+    configuration deserialized by the first such call.
+
+    Since configurations are *not* shareable across process boundaries,
+    process-backed workers instead call the :meth:`make_p_pickled` method to
+    obtain this configuration pickled at most once per deserialization, which
+    the child process performing each such worker's business logic cheaply
+    unpickles rather than redeserializing the underlying file.
+
+    Staleness
+    ----------
+    Each call to the :meth:`make_p` method tests whether the underlying file
+    has changed since this configuration was deserialized (e.g., due to the
+    user saving unrelated changes while a simulation is running). For
+    efficiency, this test is performed in two stages:
+
+    #. If the modification time and size of this file are unchanged, this file
+       is assumed to be unchanged.
+    #. Else, this file is rehashed. If the hash of this file's contents is
+       unchanged, this file is unchanged (e.g., due to the user saving an
+       unmodified configuration). Else, this file is redeserialized.
+
+    Thread Safety
+    ----------
+    All public methods of this class are thread-safe and hence safely callable
+    from arbitrary pooled threads. Since the deserialized configuration cached
+    by this snapshot is *never* modified after deserialization, each clone is
+    safely created outside of the lock synchronizing access to this cache.
+
+    Attributes
+    ----------
+    _conf_filename : str
+        Absolute filename of the YAML-formatted simulation configuration file
+        to be deserialized.
+    _conf_hash : StrOrNoneTypes
+        Hexadecimal SHA-256 hash of the contents of this file at the time this
+        file was last deserialized if any *or* ``None`` otherwise.
+    _conf_stat : TupleOrNoneTypes
+        2-tuple ``(mtime_ns, size)`` of the modification time and size of this
+        file at the time this file was last hashed if any *or* ``None``
+        otherwise.
+    _lock : QMutex
+        Non-exception-safe mutual exclusion primitive rendering access to this
+        cache thread-safe. As with all :class:`QMutex` instances, each access
+        to this primitive should be encapsulated by instantiating an
+        exception-safe one-off :class:`QMutexLocker` context manager as the
+        target of a ``with`` context.
+    _p : {Parameters, NoneType}
+        Simulation configuration last deserialized from this file if any *or*
+        ``None`` otherwise.
+    _p_pickled : {bytes, NoneType}
+        Simulation configuration last deserialized from this file pickled if
+        the :meth:`make_p_pickled` method has been called since this file was
+        last deserialized *or* ``None`` otherwise.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, conf_filename: str) -> None:
+        '''
+        Initialize this snapshot.
+
+        For responsiveness, this method intentionally does *not* deserialize
+        the passed file. Instead, the first call to the :meth:`make_p` method
+        (typically from a pooled thread) does so.
+
+        Parameters
+        ----------
+        conf_filename : str
+            Absolute filename of the YAML-formatted simulation configuration
+            file to be deserialized.
+        '''
+
+        # Classify all passed parameters.
+        self._conf_filename = conf_filename
+
+        # Nullify all remaining instance variables for safety.
+        self._conf_hash = None
+        self._conf_stat = None
+        self._p = None
+        self._p_pickled = None
+
+        # Mutual exclusion primitive safeguarding this cache.
+        self._lock = QMutex()
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def conf_filename(self) -> str:
+        '''
+        Absolute filename of the YAML-formatted simulation configuration file
+        deserialized by this snapshot.
+        '''
+
+        return self._conf_filename
+
+    # ..................{ MAKERS                            }..................
+    def make_p(self) -> Parameters:
+        '''
+        Create and return a deep copy of the simulation configuration
+        deserialized from the file with which this snapshot was initialized,
+        deserializing this file first only if this file has yet to be
+        deserialized *or* has changed since last deserialized.
+
+        The caller is free to arbitrarily modify the returned configuration,
+        which is guaranteed to share *no* mutable state with this snapshot.
+
+        Returns
+        ----------
+        Parameters
+            Deep copy of the simulation configuration cached by this snapshot,
+            whose thread affinity is that of the caller.
+        '''
+
+        # Within a thread- and exception-safe context manager synchronizing
+        # access to this cache across multiple threads...
+        with QMutexLocker(self._lock):
+            # Redeserialize this file if this file has changed since last
+            # deserialized *AND* localize this configuration *BEFORE*
+            # releasing this lock.
+            p = self._get_p()
+
+        # Return a deep copy of this configuration *AFTER* releasing this lock.
+        # Since this configuration is never modified after deserialization,
+        # this is safe and avoids serializing the cloning performed by
+        # concurrently working simulator workers.
+        return deepcopy(p)
+
+
+    def make_p_pickled(self) -> bytes:
+        '''
+        Pickled simulation configuration deserialized from the file with which
+        this snapshot was initialized, deserializing this file first only if
+        this file has yet to be deserialized *or* has changed since last
+        deserialized.
+
+        This configuration is pickled at most once per deserialization and
+        hence efficiently passable to each child process spawned by a
+        process-backed worker, which unpickles this configuration into an
+        object sharing *no* mutable state with this snapshot.
+
+        Returns
+        ----------
+        bytes
+            Simulation configuration cached by this snapshot, pickled.
+        '''
+
+        # Within a thread- and exception-safe context manager synchronizing
+        # access to this cache across multiple threads...
+        with QMutexLocker(self._lock):
+            # Redeserialize this file if this file has changed since last
+            # deserialized.
+            p = self._get_p()
+
+            # If this configuration has yet to be pickled, do so. Since
+            # configurations are never modified after deserialization, this
+            # pickle remains valid until this file is redeserialized above.
+            if self._p_pickled is None:
+                self._p_pickled = pickle.dumps(p, pickle.HIGHEST_PROTOCOL)
+
+            # Return this pickle.
+            return self._p_pickled
+
+    # ..................{ GETTERS                           }..................
+    def _get_p(self) -> Parameters:
+        '''
+        Simulation configuration cached by this snapshot, deserializing the
+        file with which this snapshot was initialized first only if this file
+        has yet to be deserialized *or* has changed since last deserialized.
+
+        Caveats
+        ----------
+        **This private method is non-thread-safe.** The caller *must*
+        explicitly embed each call to this method within a context manager of
+        the form ``with QMutexLocker(self._lock):``. Moreover, the caller must
+        *never* modify the returned configuration.
+        '''
+
+        # If this file has changed since last deserialized, redeserialize.
+        if self._is_stale():
+            # Log this deserialization.
+            logs.log_debug(
+                'Snapshotting simulation configuration "%s"...',
+                self._conf_filename)
+
+            # Deserialize this file *AND* invalidate the prior pickle of the
+            # prior deserialization of this file.
+            self._p = Parameters.make(self._conf_filename)
+            self._p_pickled = None
+
+        # Return this configuration.
+        return self._p
+
+    # ..................{ TESTERS                           }..................
+    def _is_stale(self) -> bool:
+        '''
+        ``True`` only if the file with which this snapshot was initialized has
+        yet to be deserialized *or* has changed since last deserialized,
+        updating the metadata describing this file as a side effect.
+
+        Caveats
+        ----------
+        **This private method is non-thread-safe.** The caller *must*
+        explicitly embed each call to this method within a context manager of
+        the form ``with QMutexLocker(self._lock):``.
+        '''
+
+        # Metadata describing this file.
+        conf_stat_result = os.stat(self._conf_filename)
+        conf_stat = (conf_stat_result.st_mtime_ns, conf_stat_result.st_size)
+
+        # If this file has already been deserialized *AND* this metadata is
+        # unchanged, this file is assumed to be unchanged. Avoid rehashing.
+        if self._p is not None and conf_stat == self._conf_stat:
+            return False
+        # Else, this file has either yet to be deserialized *OR* has been
+        # touched since last deserialized.
+
+        # Hash of this file's contents.
+        conf_hash = hash_conf_file(self._conf_filename)
+
+        # True only if this file has either yet to be deserialized *OR* has
+        # genuinely changed since last deserialized.
+        is_stale = self._p is None or conf_hash != self._conf_hash
+
+        # Record this metadata for subsequent calls to this method.
+        self._conf_hash = conf_hash
+        self._conf_stat = conf_stat
+
+        # Return this boolean.
+        return is_stale
+
+# ....................{ RECONFIGURERS                     }....................
+@type_check
+def reconfigure_p(p: Parameters) -> None:
+    '''
+    Dynamically reconfigure the passed simulation configuration in-memory to
+    satisfy GUI requirements.
+
+    Specifically, this function:
+
+    * Disables all simulation configuration options either requiring
+      interactive user input *or* displaying graphical output intended for
+      interactive user consumption (e.g., plots, animations).
+    * Enables all simulation configuration options exporting to disk *after*
+      modelling each phase.
+    * Enables exporting animations *while* modelling each phase only if the
+      live view of the simulator tab is unsupported by the active Python
+      interpreter (i.e., under Python < 3.8).
+
+    If the live view is supported, exporting animations while modelling each
+    phase is instead left as configured by the user rather than forcibly
+    enabled, as doing so writes one file per animation per sampled time step,
+    slowing modelling substantially. Users preferring to merely inspect these
+    animations interactively are then served by the live view, which streams
+    these fields without writing to disk. Else, these exports remain the only
+    means of inspecting these animations while modelling.
+    '''
+
+    # Disable all simulation configuration options either requiring
+    # interactive user input *OR* displaying graphical output intended for
+    # interactive user consumption (e.g., plots, animations).
+    p.anim.is_after_sim_show = False
+    p.anim.is_while_sim_show = False
+    p.plot.is_after_sim_show = False
+
+    # Enable all simulation configuration options exporting to disk after
+    # modelling each phase.
+    p.anim.is_after_sim_save = True
+    p.plot.is_after_sim_save = True
+
+    # If the live view is unsupported, enable exporting animations to disk
+    # while modelling each phase as well.
+    if not guisimrunlivering.is_live_supported():
+        p.anim.is_while_sim_save = True
+
+# ....................{ HASHERS                           }....................
+@type_check
+def hash_conf_file(filename: str) -> str:
+    '''
+    Hexadecimal SHA-256 hash of the contents of the file with the passed
+    filename, typically a simulation configuration file.
+
+    This hash identifies the exact configuration simulated by each run (e.g.,
+    in the run history), independent of the pathname of that file.
+    '''
+
+    # Hasher to be iteratively updated with the contents of this file.
+    file_hasher = hashlib.sha256()
+
+    # Iteratively hash this file in fixed-size chunks, avoiding reading large
+    # files into memory in their entirety.
+    with open(filename, 'rb') as file_bytes:
+        for file_chunk in iter(lambda: file_bytes.read(65536), b''):
+            file_hasher.update(file_chunk)
+
+    # Return this hash.
+    return file_hasher.hexdigest()
@@ -9,6 +9,7 @@ describing different types of simulator work) functionality.
 '''
 
 # ....................{ IMPORTS                           }....................
+from betse.util.type.enums import make_enum
 from betsee.gui.simtab.run.guisimrunenum import SimmerState
 from enum import Enum
 
@@ -52,3 +53,28 @@ class SimmerPhaseSubkind(Enum):
     # For simplicity elsewhere, reuse existing enumeration values.
     MODELLING = SimmerState.MODELLING.value
     EXPORTING = SimmerState.EXPORTING.value
+
+
+ExportItemFreshness = make_enum(
+    class_name='ExportItemFreshness',
+    member_names=('UNEXPORTED', 'STALE', 'FRESH',),
+    doc='''
+    Enumeration of all possible **export item freshnesses** (i.e., states of
+    the previously exported artifact of an export item relative to the current
+    simulation configuration and modelled results).
+
+    Attributes
+    ----------
+    UNEXPORTED : enum
+        This item has yet to be exported by any export pipeline.
+    STALE : enum
+        This item has been exported but either its YAML-backed
+        subconfiguration, the shared export settings, *or* the modelled
+        results of the exported phase have since changed, implying that the
+        artifact of this item no longer reflects these inputs, *or* one or
+        more files exported by this item have since been removed.
+    FRESH : enum
+        This item has been exported, no inputs of this item have since
+        changed, *and* all files exported by this item still exist, implying
+        that re-exporting this item would be redundant.
+    ''')
@@ -0,0 +1,653 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **simulator export pool** (i.e., pool of child processes exporting
+the individual plots, animations, and comma-separated value files of a
+simulation phase in parallel) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.exceptions import BetseSimPipeRunnerUnsatisfiedException
+from betse.lib.matplotlib import mplfigure
+from betse.science import filehandling as fh
+from betse.science.enum.enumphase import SimPhaseKind
+from betse.science.phase.phasecls import SimPhase
+from betse.science.pipe.export.pipeexps import SimPipesExport
+from betse.util.app.meta import appmetaone
+from betse.util.io.log import logs
+from betse.util.type.types import type_check, CallableTypes
+from betsee.guiexception import BetseeSimmerExportException
+from betsee.gui.simtab.run.work.guisimrunworkconf import reconfigure_p
+from betsee.gui.simtab.run.work.guisimrunworkexpman import (
+    SimmerExportManifest,
+    make_export_staging_dir,
+    move_export_files_staged,
+)
+from betsee.util.io.log import guilogconf
+from betsee.util.thread.pool.guipoolworkproc import (
+    CHILD_POLL_SECONDS, CHILD_STOP_TIMEOUT_SECONDS)
+from collections import deque
+from multiprocessing import connection
+import multiprocessing, os, pickle, traceback
+
+# ....................{ CONSTANTS                         }....................
+EXPORT_PROCESS_COUNT_MAX_DEFAULT = min(os.cpu_count() or 1, 4)
+'''
+Default maximum number of child processes concurrently exporting the items of
+each simulation phase, defaulting to the number of logical processors capped
+to a small constant.
+
+Since each such process deserializes the entire modelled simulation phase
+being exported, memory consumption scales linearly with this number. Large
+simulation phases commonly exceed a gigabyte once deserialized; spawning one
+such process for each logical processor of a many-core workstation would
+readily exhaust available memory. Moreover, the speedup of exporting in
+parallel is bounded by the few long-running animations dominating most
+exports, beyond which additional processes only consume memory.
+'''
+
+# ....................{ CLASSES                           }....................
+class SimPipesExportPool(SimPipesExport):
+    '''
+    **Simulator export pool** (i.e., simulation export pipeline container
+    exporting each enabled pipeline runner in a pool of child processes rather
+    than serially in the current process).
+
+    Each **export item** (i.e., enabled runner of an export pipeline, such as
+    a single plot or animation) is rendered by :mod:`matplotlib` in pure
+    Python and is thus CPU-bound *and* independent of all other items. This
+    pool spawns a small number of child processes (by default, one per
+    processor up to :data:`EXPORT_PROCESS_COUNT_MAX_DEFAULT`), each
+    deserializing the modelled simulation phase being exported exactly once,
+    and then dispatches items to idle processes until all items have been
+    exported.
+
+    Failures are isolated per item. If an item raises an exception (or kills
+    the process exporting that item), that failure is logged and the
+    remaining items continue to be exported; only after all items have been
+    exported is a single exception summarizing all failed items raised.
+
+    Exports are incremental. Items whose fingerprint is unchanged since their
+    last successful export are skipped, as recorded by the export manifest of
+    the exported phase. See the :class:`SimmerExportManifest` class.
+
+    Caveats
+    ----------
+    **This pool must be instantiated from a non-daemonic process** (e.g., the
+    child process spawned by a :class:`QBetseeSimmerPhaseProcessWorker`
+    worker), as :mod:`multiprocessing` prohibits daemonic processes from
+    spawning child processes. Items are identified
+    across process boundaries solely by their position in the deterministic
+    sequence of enabled runners, which each child process recomputes from the
+    same pickled simulation configuration.
+
+    **Pausing this pool pauses only the dispatching of items.** Items already
+    dispatched to a child process continue to be exported until completion.
+
+    Attributes
+    ----------
+    _conf_pickled : bytes
+        Pickled simulation configuration unpickled by each child process.
+    _halter : CallableTypes
+        Callable periodically called while waiting for child processes,
+        blocking while this export is paused *and* raising an exception if
+        this export is stopped.
+    _manifest : SimmerExportManifest
+        Export manifest of the exported phase, consulted to skip fresh items
+        *and* updated on successfully exporting stale items.
+    _process_count_max : int
+        Maximum number of child processes concurrently exporting items.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        conf_pickled: bytes,
+        halter: CallableTypes,
+        manifest: SimmerExportManifest,
+        process_count_max: int = EXPORT_PROCESS_COUNT_MAX_DEFAULT,
+    ) -> None:
+        '''
+        Initialize this simulator export pool.
+
+        Parameters
+        ----------
+        conf_pickled : bytes
+            Pickled simulation configuration unpickled by each child process,
+            typically as returned by the
+            :meth:`SimmerConfSnapshot.make_p_pickled` method.
+        halter : CallableTypes
+            Callable periodically called while waiting for child processes,
+            typically the
+            :meth:`ProcessPoolWorkerChannel.halt_work_if_requested` method of
+            the channel of the process-backed worker running this export.
+        manifest : SimmerExportManifest
+            Export manifest of the exported phase, which this pool both
+            consults and updates.
+        process_count_max : int
+            Maximum number of child processes concurrently exporting items.
+            Defaults to :data:`EXPORT_PROCESS_COUNT_MAX_DEFAULT`.
+        '''
+
+        # Initialize our superclass.
+        super().__init__()
+
+        # Classify all passed parameters.
+        self._conf_pickled = conf_pickled
+        self._halter = halter
+        self._manifest = manifest
+        self._process_count_max = process_count_max
+
+    # ..................{ EXPORTERS                         }..................
+    @type_check
+    def export(self, phase: SimPhase) -> None:
+
+        # List of 4-tuples "(pipe_index, runner_index, runner_metadata,
+        # runner_conf)" identifying each enabled runner of each export
+        # pipeline for this phase, where "runner_index" is the 0-based index
+        # of this runner within those yielded by this pipeline's
+        # iter_runners_enabled() generator.
+        items = []
+
+        # For the index and instance of each available export pipeline...
+        for pipe_index, pipe_export in enumerate(self.PIPES_EXPORT):
+            # Initialize this pipeline for this phase.
+            pipe_export.init(phase)
+
+            # Append all pipeline runners enabled for this pipeline and phase.
+            for runner_index, (runner_method, runner_conf) in enumerate(
+                pipe_export.iter_runners_enabled(phase)):
+                items.append((
+                    pipe_index,
+                    runner_index,
+                    runner_method.metadata,
+                    runner_conf,
+                ))
+
+        # Notify the caller of the range of work performed by this export, as
+        # with the superclass method.
+        phase.callbacks.progress_ranged(progress_max=len(items))
+
+        # Queue of the 0-based indices into the "items" list of all items yet
+        # to be dispatched to a child process, excluding fresh items.
+        item_indices_queued = deque()
+
+        # For each item, skip this item if fresh *OR* queue this item.
+        for item_index, item in enumerate(items):
+            if self._manifest.is_item_fresh(item[3]):
+                phase.callbacks.progressed_next(
+                    status='Skipping unchanged {}.'.format(
+                        _get_item_label(item[2])))
+            else:
+                item_indices_queued.append(item_index)
+
+        # If no items are stale, silently reduce to a noop. Spawning child
+        # processes only to export nothing would be senseless.
+        if not item_indices_queued:
+            return
+
+        # Number of child processes to be spawned, avoiding spawning more
+        # processes than items.
+        process_count = min(self._process_count_max, len(item_indices_queued))
+
+        # Log this export.
+        logs.log_info(
+            'Exporting %d of %d simulation %s items across %d processes...',
+            len(item_indices_queued),
+            len(items),
+            phase.kind.name.lower(),
+            process_count,
+        )
+
+        # List of the human-readable labels of all failed items.
+        item_labels_failed = []
+
+        # Dictionary mapping from the parent end of the pipe to each child
+        # process to a 2-tuple "(process, item_index)" of that process and
+        # the index of the item currently exported by that process if any
+        # *OR* "None" otherwise.
+        conn_to_child = {}
+
+        # Attempt to...
+        try:
+            # Spawn all child processes.
+            for _ in range(process_count):
+                self._spawn_child(phase=phase, conn_to_child=conn_to_child)
+
+            # While one or more items remain to be either dispatched or
+            # exported...
+            while item_indices_queued or any(
+                item_index is not None
+                for _, item_index in conn_to_child.values()):
+                # Dispatch queued items to all idle child processes.
+                for conn, (process, item_index) in tuple(
+                    conn_to_child.items()):
+                    if item_index is None and item_indices_queued:
+                        self._dispatch_item(
+                            conn=conn,
+                            phase=phase,
+                            items=items,
+                            item_indices_queued=item_indices_queued,
+                            conn_to_child=conn_to_child,
+                        )
+
+                # Block while paused *OR* stop if requested.
+                self._halter()
+
+                # For the parent end of the pipe to each child process having
+                # either finished exporting an item or died within a brief
+                # window, blocking here for at most that window...
+                for conn in connection.wait(
+                    tuple(conn_to_child.keys()), CHILD_POLL_SECONDS):
+                    # Child process and index of the item exported by it.
+                    process, item_index = conn_to_child[conn]
+
+                    # Attempt to receive the outcome of exporting this item.
+                    try:
+                        outcome, reason, output_filenames = conn.recv()
+                    # If this process died (e.g., due to a segmentation fault
+                    # in a C extension), replace this process by a new
+                    # process if items remain queued *AND* fail the item it
+                    # was exporting if any.
+                    except (EOFError, OSError):
+                        self._respawn_child(
+                            conn=conn,
+                            phase=phase,
+                            item_indices_queued=item_indices_queued,
+                            conn_to_child=conn_to_child,
+                        )
+                        if item_index is None:
+                            continue
+                        outcome = 'failed'
+                        reason = 'child process exit code {}'.format(
+                            process.exitcode)
+                        output_filenames = None
+                    # Else, this process is now idle.
+                    else:
+                        conn_to_child[conn] = (process, None)
+
+                    # Report the outcome of exporting this item.
+                    self._handle_item_outcome(
+                        phase=phase,
+                        item=items[item_index],
+                        outcome=outcome,
+                        reason=reason,
+                        output_filenames=output_filenames,
+                        item_labels_failed=item_labels_failed,
+                    )
+        # Regardless of how this export finishes, guarantee all child
+        # processes to be terminated *BEFORE* returning. Failing to do so
+        # would leak these processes on this export being stopped. Likewise,
+        # persist all items successfully exported before this export finished,
+        # preventing these items from being needlessly re-exported.
+        finally:
+            _halt_children(conn_to_child)
+            self._manifest.save()
+
+        # Log the directory to which all results were exported, as with the
+        # superclass method.
+        logs.log_info('Simulation results exported to:')
+        logs.log_info('\t%s', phase.export_dirname)
+
+        # If one or more items failed, raise an exception summarizing these
+        # failures. Since all remaining items were exported, this exception
+        # is raised only *AFTER* all items have been attempted.
+        if item_labels_failed:
+            raise BetseeSimmerExportException(
+                synopsis='{} of {} exports failed.'.format(
+                    len(item_labels_failed), len(items)),
+                exegesis='Failed exports: {}.'.format(
+                    ', '.join(item_labels_failed)),
+            )
+
+    # ..................{ PRIVATE ~ spawners                }..................
+    def _spawn_child(self, phase: SimPhase, conn_to_child: dict) -> None:
+        '''
+        Spawn one child process exporting items of the passed simulation
+        phase *and* add the parent end of the pipe to that process to the
+        passed dictionary as an idle process.
+        '''
+
+        # Multiprocessing context spawning rather than forking child processes,
+        # as with the process-backed worker running this export.
+        process_context = multiprocessing.get_context('spawn')
+
+        # Bidirectional pipe between this process and that process.
+        conn_parent, conn_child = process_context.Pipe(duplex=True)
+
+        # Child process exporting items.
+        process = process_context.Process(
+            target=_run_export_child,
+            args=(conn_child, self._conf_pickled, phase.kind.name),
+            name='betsee-exporter-{}'.format(len(conn_to_child)),
+            daemon=True,
+        )
+
+        # Spawn this process *BEFORE* closing the child end of this pipe in
+        # this process, guaranteeing that this process detects the premature
+        # termination of that process as EOF on the parent end of this pipe.
+        process.start()
+        conn_child.close()
+
+        # Record this process as idle.
+        conn_to_child[conn_parent] = (process, None)
+
+    def _respawn_child(
+        self,
+        conn: object,
+        phase: SimPhase,
+        item_indices_queued: deque,
+        conn_to_child: dict,
+    ) -> None:
+        '''
+        Reap the prematurely terminated child process whose parent pipe end
+        is the passed connection *and*, if one or more items remain queued,
+        replace that process by a new idle child process.
+
+        Avoiding respawning processes when no items remain queued guarantees
+        that a process repeatedly dying on startup cannot respawn forever.
+        '''
+
+        # Reap this process *BEFORE* forgetting this process.
+        process, _ = conn_to_child.pop(conn)
+        process.join(CHILD_POLL_SECONDS)
+        conn.close()
+
+        # If items remain queued, spawn a new process in its place.
+        if item_indices_queued:
+            self._spawn_child(phase=phase, conn_to_child=conn_to_child)
+
+    # ..................{ PRIVATE ~ dispatchers             }..................
+    def _dispatch_item(
+        self,
+        conn: object,
+        phase: SimPhase,
+        items: list,
+        item_indices_queued: deque,
+        conn_to_child: dict,
+    ) -> None:
+        '''
+        Dispatch the next queued item to the idle child process whose parent
+        pipe end is the passed connection.
+
+        If that process has since prematurely terminated, that process is
+        replaced by a new idle process and that item remains queued.
+        '''
+
+        # Child process and the index of the next queued item.
+        process, _ = conn_to_child[conn]
+        item_index = item_indices_queued.popleft()
+
+        # Identifiers of this item recomputable by that process.
+        pipe_index, runner_index, _, _ = items[item_index]
+
+        # Attempt to dispatch this item.
+        try:
+            conn.send((pipe_index, runner_index))
+        # If that process has since died, requeue this item *AND* replace
+        # that process.
+        except (BrokenPipeError, OSError):
+            item_indices_queued.appendleft(item_index)
+            self._respawn_child(
+                conn=conn,
+                phase=phase,
+                item_indices_queued=item_indices_queued,
+                conn_to_child=conn_to_child,
+            )
+        # Else, record that process as exporting this item.
+        else:
+            conn_to_child[conn] = (process, item_index)
+
+    # ..................{ PRIVATE ~ handlers                }..................
+    def _handle_item_outcome(
+        self,
+        phase: SimPhase,
+        item: tuple,
+        outcome: str,
+        reason: str,
+        output_filenames: list,
+        item_labels_failed: list,
+    ) -> None:
+        '''
+        Notify the caller of the outcome of exporting the passed item,
+        recording this item and the passed relative filenames of all files
+        exported by this item in the export manifest if this item succeeded
+        *or* appending the label of this item to the passed list if this item
+        failed.
+        '''
+
+        # Human-readable label of this item.
+        item_label = _get_item_label(item[2])
+
+        # If this item was successfully exported, record *AND* notify the
+        # caller of this item.
+        if outcome == 'succeeded':
+            self._manifest.record_item(
+                item_conf=item[3], output_filenames=output_filenames)
+            status = 'Exported {}.'.format(item_label)
+        # If this item's requirements are unsatisfied (e.g., due to the
+        # current simulation configuration disabling fluid flow), notify the
+        # caller of this non-fatal condition, as with the superclass method.
+        elif outcome == 'unsatisfied':
+            status = 'Excluding {}, as {}.'.format(item_label, reason)
+        # Else, this item failed. Log this failure *AND* record this item.
+        else:
+            logs.log_error('Exporting %s failed:\n%s', item_label, reason)
+            item_labels_failed.append(item_label)
+            status = 'Failed exporting {}.'.format(item_label)
+
+        # Notify the caller of the completion of this item.
+        phase.callbacks.progressed_next(status=status)
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_item_label(runner_metadata: object) -> str:
+    '''
+    Human-readable label of the export item with the passed runner metadata.
+    '''
+
+    return '{} "{}"'.format(
+        runner_metadata.noun_singular_lowercase, runner_metadata.kind)
+
+# ....................{ PRIVATE ~ children                }....................
+def _run_export_child(
+    conn: object, conf_pickled: bytes, phase_kind_name: str) -> None:
+    '''
+    Entry point of each child process spawned by a :class:`SimPipesExportPool`
+    pool, exporting each item requested by that pool over the passed pipe end
+    until requested to exit.
+
+    Each request is either:
+
+    * A 2-tuple ``(pipe_index, runner_index)`` identifying the item to be
+      exported, to which this process replies with a 3-tuple
+      ``(outcome, reason, output_filenames)``, where ``outcome`` is either
+      ``succeeded``, ``unsatisfied``, or ``failed``, ``reason`` is a
+      human-readable explanation of that outcome if any *or* ``None``
+      otherwise, and ``output_filenames`` is the list of the filenames
+      (relative to the export directory of this phase) of all files exported
+      by this item if this item succeeded *or* ``None`` otherwise.
+    * ``None``, in which case this process exits.
+
+    Parameters
+    ----------
+    conn : multiprocessing.connection.Connection
+        Child end of the pipe between that pool and this process.
+    conf_pickled : bytes
+        Pickled simulation configuration defining the simulation phase to be
+        exported.
+    phase_kind_name : str
+        Name of the :class:`SimPhaseKind` member to be exported.
+    '''
+
+    # Attempt to prepare this phase for exporting.
+    try:
+        phase, runners = _init_export_child(
+            conf_pickled=conf_pickled, phase_kind_name=phase_kind_name)
+    # If doing so fails, fail all items requested below with this failure
+    # rather than silently dying, preserving this traceback for the user.
+    except Exception:
+        phase = None
+        runners = None
+        init_traceback = traceback.format_exc()
+
+    # For each request received from that pool...
+    while True:
+        # Attempt to receive this request. If that pool has closed its end of
+        # this pipe without requesting that this process exit (e.g., due to
+        # the process running that pool having been terminated), exit.
+        try:
+            item = conn.recv()
+        except EOFError:
+            break
+
+        # If this request is to exit, exit.
+        if item is None:
+            break
+
+        # If this phase failed to be prepared, fail this item.
+        if phase is None:
+            conn.send(('failed', init_traceback, None))
+            continue
+
+        # Method and configuration of the pipeline runner exporting this item.
+        pipe_index, runner_index = item
+        runner_method, runner_conf = runners[pipe_index][runner_index]
+
+        # Export this item into its own staging directory rather than
+        # directly into the export directory of this phase, enabling the
+        # files exported by this item (and only this item) to be detected
+        # below regardless of other items concurrently exported by sibling
+        # processes into the same export directory.
+        export_dirname = phase.export_dirname
+        phase.export_dirname = make_export_staging_dir(export_dirname)
+
+        # Attempt to export this item, as with the superclass method.
+        try:
+            runner_method(phase, runner_conf)
+        except BetseSimPipeRunnerUnsatisfiedException as exception:
+            outcome = ('unsatisfied', exception.reason)
+        except Exception:
+            outcome = ('failed', traceback.format_exc())
+        else:
+            outcome = ('succeeded', None)
+        # Unconditionally close all open matplotlib figures, as with the
+        # superclass method, preventing figures from accumulating across
+        # items exported by this long-lived process. Likewise, move all files
+        # exported by this item (including those partially exported by an
+        # unsuccessful item) into the export directory of this phase.
+        finally:
+            mplfigure.close_figures_all()
+            output_filenames = move_export_files_staged(
+                staging_dirname=phase.export_dirname,
+                export_dirname=export_dirname,
+            )
+            phase.export_dirname = export_dirname
+
+        # Reply with this outcome, reporting these files only on success.
+        conn.send(outcome + (
+            output_filenames if outcome[0] == 'succeeded' else None,))
+
+    # Close this pipe end.
+    conn.close()
+
+
+def _init_export_child(conf_pickled: bytes, phase_kind_name: str) -> tuple:
+    '''
+    Prepare the simulation phase with the passed name of the passed pickled
+    simulation configuration for exporting from within a child process
+    spawned by a :class:`SimPipesExportPool` pool.
+
+    Returns
+    ----------
+    (SimPhase, tuple)
+        2-tuple ``(phase, runners)``, where ``phase`` is the deserialized
+        simulation phase and ``runners`` is a tuple containing, for each
+        available export pipeline, a tuple of the 2-tuples
+        ``(runner_method, runner_conf)`` yielded by that pipeline's
+        ``iter_runners_enabled()`` generator.
+    '''
+
+    # Initialize BETSE and its mandatory dependencies in this process with a
+    # non-interactive matplotlib backend *AND* redirect log messages otherwise
+    # printed to standard output to standard error, as with the child process
+    # spawned by each process-backed simulator worker.
+    appmetaone.set_app_meta_betse_if_unset().init_libs(
+        matplotlib_backend_name='Agg')
+    guilogconf.log_stdout_to_stderr()
+
+    # Simulation configuration unpickled and reconfigured for the GUI.
+    p = pickle.loads(conf_pickled)
+    reconfigure_p(p)
+
+    # Type of this phase.
+    phase_kind = SimPhaseKind[phase_kind_name]
+
+    # Absolute filename of the pickled result of this phase. Since only the
+    # initialization and simulation phases export via pipelines, no other
+    # phases are supported.
+    phase_pickle_filename = {
+        SimPhaseKind.INIT: p.init_pickle_filename,
+        SimPhaseKind.SIM:  p.sim_pickle_filename,
+    }[phase_kind]
+
+    # Deserialize this phase, as with the SimRunner.plot_*() subcommands.
+    sim, cells, _ = fh.loadSim(phase_pickle_filename)
+    phase = SimPhase(kind=phase_kind, cells=cells, p=p, sim=sim)
+    phase.dyna.init_profiles(phase)
+
+    # Runners enabled by each export pipeline, enumerated in the same order
+    # as the parent pool enumerated these runners.
+    runners = []
+    for pipe_export in SimPipesExport().PIPES_EXPORT:
+        pipe_export.init(phase)
+        runners.append(tuple(pipe_export.iter_runners_enabled(phase)))
+
+    # Return this phase and these runners.
+    return phase, tuple(runners)
+
+# ....................{ PRIVATE ~ halters                 }....................
+def _halt_children(conn_to_child: dict) -> None:
+    '''
+    Reap all child processes in the passed dictionary *and* close the parent
+    end of the pipe to each such process.
+
+    Idle processes are requested to gracefully exit, falling back to being
+    non-gracefully terminated if failing to do so within
+    :data:`CHILD_STOP_TIMEOUT_SECONDS`. Busy processes (i.e., still exporting
+    an item, typically due to this export having been stopped) are
+    immediately terminated. Since exported files are disposable, doing so is
+    safe.
+    '''
+
+    # Request that all idle processes gracefully exit *BEFORE* waiting on any
+    # process, permitting these processes to exit in parallel.
+    for conn, (process, item_index) in conn_to_child.items():
+        if item_index is None:
+            # Attempt to send this request. If this process has since closed
+            # its end of this pipe, ignore this failure.
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        # Else, this process is busy. Terminate this process.
+        else:
+            process.terminate()
+
+    # For the parent end of the pipe to each child process and that process...
+    for conn, (process, _) in conn_to_child.items():
+        # Wait for this process to exit. If this process fails to do so,
+        # terminate this process.
+        process.join(CHILD_STOP_TIMEOUT_SECONDS)
+        if process.is_alive():
+            logs.log_warning(
+                'Terminating export child process "%s" non-gracefully!',
+                process.name)
+            process.terminate()
+            process.join()
+
+        # Close the parent end of this pipe.
+        conn.close()
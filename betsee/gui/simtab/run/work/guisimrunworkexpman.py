@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **simulator export manifest** (i.e., on-disk record of the
+fingerprint of each export item at the time that item was last exported,
+enabling subsequent exports to regenerate only changed items) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse import metadata as betse_metadata
+from betse.lib.yaml.abc.yamllistabc import YamlListItemABC
+from betse.science.enum.enumphase import SimPhaseKind
+from betse.science.parameters import Parameters
+from betse.util.io.log import logs
+from betse.util.type.types import type_check, StrOrNoneTypes
+from betsee.guiexception import BetseeSimmerExportException
+from betsee.gui.simtab.run.work.guisimrunworkenum import ExportItemFreshness
+from betsee.util.path.guifileatomic import writing_file_atomic
+import hashlib, json, os, shutil, tempfile
+
+# ....................{ CONSTANTS                         }....................
+EXPORT_MANIFEST_BASENAME_TEMPLATE = '.betsee_export_{}.json'
+'''
+Format template of the basename of each **export manifest file** (i.e.,
+JSON-formatted file residing in the export directory of a simulation phase),
+formatted with the lowercase name of that phase.
+
+Since the initialization and simulation phases may be configured to share the
+same export directory, each phase is recorded by a distinct file.
+'''
+
+
+EXPORT_MANIFEST_VERSION = 2
+'''
+Version of the format of each export manifest file, invalidating all existing
+files of prior formats on changing this format.
+'''
+
+
+_EXPORT_MANIFEST_BASENAME_PREFIX = (
+    EXPORT_MANIFEST_BASENAME_TEMPLATE.partition('{}')[0])
+'''
+Prefix of the basename of each export manifest file. The basename of each
+temporary file atomically renamed into place as such a file is this prefix
+prefixed by an additional ``.`` character.
+'''
+
+
+_EXPORT_STAGING_BASENAME_PREFIX = '.betsee_staging_'
+'''
+Prefix of the basename of each **export staging directory** (i.e., temporary
+subdirectory of an export directory into which a single export item is
+exported in isolation), as created by the :func:`make_export_staging_dir`
+function.
+'''
+
+
+EXPORT_PHASE_KINDS = (SimPhaseKind.INIT, SimPhaseKind.SIM,)
+'''
+Tuple of each type of simulation phase exporting via export pipelines and
+hence supporting export manifests.
+'''
+
+# ....................{ CLASSES                           }....................
+class SimmerExportManifest(object):
+    '''
+    **Simulator export manifest** (i.e., on-disk record of the fingerprint of
+    each export item of a simulation phase at the time that item was last
+    exported, enabling subsequent exports to regenerate only changed items).
+
+    Fingerprints
+    ----------
+    The fingerprint of each **export item** (i.e., YAML-backed list item of
+    an export list, such as a single cell cluster plot) is the SHA-256 hash
+    of:
+
+    * The version of BETSE, invalidating all artifacts on upgrading BETSE.
+    * The name of the exported phase.
+    * The **shared export settings** (i.e., the entire simulation
+      configuration *excluding* all export lists), as settings outside these
+      lists (e.g., colormaps, the default export format) affect all items.
+    * The type and YAML-backed subconfiguration of this item.
+    * The size and modification time of the pickled results of the exported
+      phase, which all items visualize.
+
+    Items are keyed by type and name, which the YAML-backed lists containing
+    these items guarantee to be unique. Renaming an item thus renders that
+    item unexported.
+
+    Outputs
+    ----------
+    Each item is also recorded with the relative filenames of all files
+    exported by that item (i.e., created or modified in the export directory
+    of this phase while that item was exported). An item whose fingerprint is
+    unchanged is nonetheless stale if any such file no longer exists (e.g.,
+    due to the user having manually deleted that file), as skipping that item
+    would otherwise silently fail to regenerate that file.
+
+    Since items are exported in parallel into the same directory, the files
+    recorded for an item may also include files exported by other items
+    concurrently exported with that item. This is safe, as spuriously
+    recorded files only cause that item to be spuriously re-exported on
+    these files being deleted.
+
+    Attributes
+    ----------
+    _export_dirname : str
+        Absolute dirname of the export directory of this phase, relative to
+        which the filenames recorded for each item are stored.
+    _item_key_to_record : dict
+        Dictionary mapping from the key of each previously exported item to
+        a dictionary ``{'fingerprint': fingerprint, 'outputs': filenames}``
+        of the fingerprint of that item at the time of that export and the
+        list of the relative filenames of all files exported by that item.
+    _manifest_filename : str
+        Absolute filename of the export manifest file of this phase.
+    _phase_kind : SimPhaseKind
+        Type of the exported simulation phase.
+    _phase_stamp : {list, NoneType}
+        2-list ``[size, mtime]`` of the pickled results of this phase if these
+        results exist *or* ``None`` otherwise, in which case no item is fresh.
+    _shared_hash : str
+        SHA-256 hash of the shared export settings.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        p: Parameters,
+        phase_kind: SimPhaseKind,
+        shared_hash: StrOrNoneTypes = None,
+    ) -> None:
+        '''
+        Initialize this export manifest by loading the export manifest file
+        of the passed phase if any.
+
+        For safety, this method should be passed a simulation configuration
+        *before* that configuration is reconfigured in-memory (e.g., by the
+        :func:`betsee.gui.simtab.run.work.guisimrunworkconf.reconfigure_p`
+        function), as the simulation tab fingerprints its unreconfigured
+        configuration.
+
+        Parameters
+        ----------
+        p : Parameters
+            Simulation configuration to fingerprint the export items of.
+        phase_kind : SimPhaseKind
+            Type of the exported simulation phase. Must be an item of
+            :data:`EXPORT_PHASE_KINDS`.
+        shared_hash : StrOrNoneTypes
+            SHA-256 hash of the shared export settings of this configuration
+            as previously returned by the :func:`hash_conf_shared` function
+            if the caller caches this hash *or* ``None`` otherwise, in which
+            case this hash is computed here. Since this hash serializes the
+            entire configuration, callers repeatedly instantiating manifests
+            for an unchanged configuration should cache this hash. Defaults
+            to ``None``.
+        '''
+
+        # Classify all passed parameters.
+        self._phase_kind = phase_kind
+
+        # Export directory and pickled results of this phase.
+        if phase_kind is SimPhaseKind.INIT:
+            export_dirname = p.init_export_dirname
+            phase_pickle_filename = p.init_pickle_filename
+        elif phase_kind is SimPhaseKind.SIM:
+            export_dirname = p.sim_export_dirname
+            phase_pickle_filename = p.sim_pickle_filename
+        # Else, this phase does *NOT* export via export pipelines.
+        else:
+            raise BetseeSimmerExportException(synopsis=(
+                'Simulation phase "{}" export manifest '
+                'unsupported.'.format(phase_kind.name.lower())))
+
+        # Absolute filename of this manifest file.
+        self._export_dirname = export_dirname
+        self._manifest_filename = os.path.join(
+            export_dirname,
+            EXPORT_MANIFEST_BASENAME_TEMPLATE.format(phase_kind.name.lower()))
+
+        # Stamp of these results if any *OR* "None" otherwise.
+        try:
+            phase_stat = os.stat(phase_pickle_filename)
+            self._phase_stamp = [phase_stat.st_size, phase_stat.st_mtime_ns]
+        except OSError:
+            self._phase_stamp = None
+
+        # Hash the shared export settings unless already hashed.
+        self._shared_hash = (
+            shared_hash if shared_hash is not None else hash_conf_shared(p))
+
+        # Load this manifest file if any.
+        self._item_key_to_record = self._load()
+
+    # ..................{ TESTERS                           }..................
+    @type_check
+    def get_item_freshness(
+        self, item_conf: YamlListItemABC) -> ExportItemFreshness:
+        '''
+        Freshness of the passed export item with respect to this manifest.
+        '''
+
+        # Record of this item at the time of its last export if any *OR*
+        # "None" otherwise.
+        item_record = self._item_key_to_record.get(_get_item_key(item_conf))
+
+        # If this item has yet to be exported, this item is unexported.
+        if item_record is None:
+            return ExportItemFreshness.UNEXPORTED
+        # Else if this item's inputs have since changed, this item is stale.
+        elif item_record['fingerprint'] != self._get_item_fingerprint(
+            item_conf):
+            return ExportItemFreshness.STALE
+        # Else if any file exported by this item has since been removed,
+        # this item is stale despite its inputs being unchanged.
+        elif not all(
+            os.path.isfile(os.path.join(self._export_dirname, filename))
+            for filename in item_record['outputs']):
+            return ExportItemFreshness.STALE
+        # Else, this item is fresh.
+        else:
+            return ExportItemFreshness.FRESH
+
+
+    @type_check
+    def is_item_fresh(self, item_conf: YamlListItemABC) -> bool:
+        '''
+        ``True`` only if the passed export item is fresh (i.e., has been
+        exported, no inputs of this item have since changed, *and* all files
+        exported by this item still exist).
+        '''
+
+        return (
+            self.get_item_freshness(item_conf) is ExportItemFreshness.FRESH)
+
+    # ..................{ RECORDERS                         }..................
+    @type_check
+    def record_item(
+        self, item_conf: YamlListItemABC, output_filenames: list) -> None:
+        '''
+        Record the passed export item as having been successfully exported
+        with its current fingerprint into the files with the passed filenames.
+
+        This method modifies only the in-memory manifest. Callers should
+        subsequently call the :meth:`save` method to persist this record.
+
+        Parameters
+        ----------
+        item_conf : YamlListItemABC
+            Export item to be recorded.
+        output_filenames : list
+            List of the filenames of all files exported by this item, relative
+            to the export directory of this phase (e.g., as returned by the
+            :func:`move_export_files_staged` function).
+        '''
+
+        self._item_key_to_record[_get_item_key(item_conf)] = {
+            'fingerprint': self._get_item_fingerprint(item_conf),
+            'outputs': sorted(output_filenames),
+        }
+
+
+    def save(self) -> None:
+        '''
+        Atomically write this manifest to its export manifest file.
+        '''
+
+        # Log this save.
+        logs.log_debug(
+            'Saving simulation %s export manifest "%s"...',
+            self._phase_kind.name.lower(), self._manifest_filename)
+
+        # Write this manifest atomically, preventing concurrent readers (e.g.,
+        # the simulation configuration tree) from observing a partial manifest.
+        os.makedirs(os.path.dirname(self._manifest_filename), exist_ok=True)
+        with writing_file_atomic(
+            self._manifest_filename) as manifest_filename_temp:
+            with open(manifest_filename_temp, 'w') as manifest_file:
+                json.dump(
+                    {
+                        'version': EXPORT_MANIFEST_VERSION,
+                        'items': self._item_key_to_record,
+                    },
+                    manifest_file,
+                    indent=2,
+                    sort_keys=True,
+                )
+
+    # ..................{ PRIVATE ~ loaders                 }..................
+    def _load(self) -> dict:
+        '''
+        Dictionary mapping from the key of each previously exported item to
+        the record of that item loaded from this manifest file if this file
+        exists *and* is of the current format *or* the empty dictionary
+        otherwise.
+        '''
+
+        # Attempt to load this file.
+        try:
+            with open(self._manifest_filename, 'r') as manifest_file:
+                manifest = json.load(manifest_file)
+        # If this file does not exist, no items have been exported.
+        except FileNotFoundError:
+            return {}
+        # If this file is unreadable or malformed, ignore this file. Since
+        # this manifest is merely an optimization, doing so is safe.
+        except (OSError, ValueError) as exception:
+            logs.log_warning(
+                'Ignoring unreadable export manifest "%s": %s',
+                self._manifest_filename, exception)
+            return {}
+
+        # If this file is of a different format, ignore this file.
+        if (not isinstance(manifest, dict) or
+            manifest.get('version') != EXPORT_MANIFEST_VERSION):
+            return {}
+
+        # Mapping recorded by this file, ignoring malformed records.
+        item_key_to_record = manifest.get('items')
+        if not isinstance(item_key_to_record, dict):
+            return {}
+        return {
+            item_key: item_record
+            for item_key, item_record in item_key_to_record.items()
+            if (isinstance(item_record, dict) and
+                isinstance(item_record.get('fingerprint'), str) and
+                isinstance(item_record.get('outputs'), list))
+        }
+
+    # ..................{ PRIVATE ~ getters                 }..................
+    def _get_item_fingerprint(self, item_conf: YamlListItemABC) -> str:
+        '''
+        Fingerprint of the passed export item.
+        '''
+
+        # Canonical serialization of all inputs to this fingerprint. Values
+        # *NOT* natively serializable are serialized by string.
+        item_fingerprint_input = json.dumps(
+            [
+                betse_metadata.VERSION,
+                self._phase_kind.name,
+                self._shared_hash,
+                type(item_conf).__name__,
+                item_conf.conf,
+                self._phase_stamp,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+        # Return the hash of these inputs.
+        return hashlib.sha256(
+            item_fingerprint_input.encode('utf-8')).hexdigest()
+
+# ....................{ STAGERS                           }....................
+def make_export_staging_dir(export_dirname: str) -> str:
+    '''
+    Create and return the absolute dirname of a new **export staging
+    directory** (i.e., empty temporary subdirectory of the passed export
+    directory into which a single export item is exported in isolation),
+    creating this export directory if needed.
+
+    Exporting each item into its own staging directory attributes each
+    exported file to exactly the item exporting that file, regardless of how
+    many items are concurrently exported into the same export directory. The
+    :func:`move_export_files_staged` function subsequently moves these files
+    into this export directory.
+    '''
+
+    # Create this export directory if needed.
+    os.makedirs(export_dirname, exist_ok=True)
+
+    # Create and return this staging directory. Since this directory resides
+    # in this export directory, files staged here are atomically renamed
+    # rather than copied into this export directory.
+    return tempfile.mkdtemp(
+        prefix=_EXPORT_STAGING_BASENAME_PREFIX, dir=export_dirname)
+
+
+def move_export_files_staged(
+    staging_dirname: str, export_dirname: str) -> list:
+    '''
+    Move all files exported into the passed export staging directory (as
+    created by the :func:`make_export_staging_dir` function) into the same
+    relative paths of the passed export directory, remove this staging
+    directory, and return the list of the filenames of these files relative
+    to this export directory.
+
+    This function walks only this staging directory and hence runs in time
+    linear in the number of files exported by a single item rather than in
+    the number of files in this export directory.
+    '''
+
+    # List of relative filenames to be returned.
+    filenames_moved = []
+
+    # For each file exported into this staging directory...
+    for dirname, _, basenames in os.walk(staging_dirname):
+        # Directory of this export directory to move these files into.
+        dirname_relative = os.path.relpath(dirname, staging_dirname)
+        dirname_target = os.path.normpath(
+            os.path.join(export_dirname, dirname_relative))
+        os.makedirs(dirname_target, exist_ok=True)
+
+        # Atomically move each such file into this directory, replacing any
+        # file previously exported by the same item.
+        for basename in basenames:
+            os.replace(
+                os.path.join(dirname, basename),
+                os.path.join(dirname_target, basename),
+            )
+            filenames_moved.append(os.path.normpath(
+                os.path.join(dirname_relative, basename)))
+
+    # Remove this staging directory and all now-empty subdirectories.
+    shutil.rmtree(staging_dirname, ignore_errors=True)
+
+    # Return this list.
+    return filenames_moved
+
+# ....................{ HASHERS                           }....................
+def hash_conf_shared(p: Parameters) -> str:
+    '''
+    SHA-256 hash of the **shared export settings** (i.e., the entire passed
+    simulation configuration *excluding* all export lists) of the passed
+    simulation configuration.
+
+    Export lists are excluded by identity rather than by key path, as the key
+    paths of these lists vary between BETSE versions.
+    '''
+
+    # Set of the identities of the low-level sequences underlying all export
+    # lists of this configuration.
+    export_list_ids = {
+        id(yaml_list.conf)
+        for yaml_list in (
+            p.anim.anims_after_sim,
+            p.csv.csvs_after_sim,
+            p.plot.plots_cell_after_sim,
+            p.plot.plots_cells_after_sim,
+        )
+    }
+
+    # Canonical serialization of this configuration excluding these lists.
+    conf_shared = json.dumps(
+        _prune_conf(p.conf, export_list_ids), sort_keys=True, default=str)
+
+    # Return the hash of this serialization.
+    return hashlib.sha256(conf_shared.encode('utf-8')).hexdigest()
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_item_key(item_conf: YamlListItemABC) -> str:
+    '''
+    Key uniquely identifying the passed export item within its export
+    manifest, comprising the type and name of this item.
+    '''
+
+    return '{}:{}'.format(type(item_conf).__name__, item_conf.name)
+
+# ....................{ PRIVATE ~ hashers                 }....................
+def _prune_conf(conf: object, export_list_ids: set) -> object:
+    '''
+    Shallow copy of the passed YAML-backed container recursively replacing
+    each sequence whose identity is in the passed set by ``None``.
+    '''
+
+    # If this container is an excluded export list, exclude this list.
+    if id(conf) in export_list_ids:
+        return None
+    # Else if this container is a mapping, prune each value.
+    elif isinstance(conf, dict):
+        return {
+            conf_key: _prune_conf(conf_value, export_list_ids)
+            for conf_key, conf_value in conf.items()
+        }
+    # Else if this container is a sequence, prune each item.
+    elif isinstance(conf, list):
+        return [
+            _prune_conf(conf_item, export_list_ids) for conf_item in conf]
+    # Else, this is a scalar. Preserve this scalar as is.
+    else:
+        return conf
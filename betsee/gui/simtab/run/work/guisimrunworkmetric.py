@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **simulator worker metrics** (i.e., performance telemetry collected
+for each simulator worker by the simulator proactor, including throughput and
+the estimated time remaining) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.science.enum.enumphase import SimPhaseKind
+from betse.util.type.iterable import tuples
+from betse.util.type.types import type_check, NoneType, NumericOrNoneTypes
+from betsee.gui.simtab.run.work.guisimrunworkenum import SimmerPhaseSubkind
+import math, time
+
+# ....................{ CONSTANTS                         }....................
+METRICS_RATE_SMOOTHING_SECONDS = 10.0
+'''
+Time constant in fractional seconds of the exponentially weighted moving
+average smoothing the throughput (and hence estimated time remaining) of each
+simulator worker.
+
+Larger constants yield steadier but less responsive estimates. Since each
+sample is weighted by the time elapsed since the prior sample, this constant
+is independent of the rate at which progress is sampled.
+'''
+
+# ....................{ TYPES                             }....................
+SimmerWorkerTelemetry = tuples.make_named_subclass(
+    class_name='SimmerWorkerTelemetry',
+    item_names=(
+        'phase_kind',
+        'phase_subkind',
+        'time_started',
+        'wall_seconds',
+        'paused_seconds',
+        'cpu_seconds',
+        'rss_peak_bytes',
+        'progress_min',
+        'progress_max',
+        'progress',
+        'steps_per_second',
+        'steps_per_second_prior',
+        'eta_seconds',
+        'is_success',
+    ),
+    doc='''
+    Named tuple created and returned by the
+    :meth:`SimmerWorkerMetrics.get_telemetry` method, aggregating a snapshot of
+    the performance telemetry of a single simulator worker.
+
+    Since all items of this tuple are either enumeration members, numbers, or
+    ``None``, this tuple is trivially exportable (e.g., by calling the
+    :meth:`_asdict` method and serializing the resulting dictionary).
+
+    Attributes
+    ----------
+    phase_kind : SimPhaseKind
+        Type of simulation phase run by this worker.
+    phase_subkind : SimmerPhaseSubkind
+        Type of work performed on this phase by this worker.
+    time_started : float
+        Wall-clock time in seconds since the epoch at which this worker was
+        started.
+    wall_seconds : float
+        Fractional number of seconds elapsed between this worker being started
+        and either finishing if finished *or* now otherwise, including all
+        time spent paused.
+    paused_seconds : float
+        Fractional number of seconds this worker has spent blocked in pause.
+    cpu_seconds : NumericOrNoneTypes
+        Fractional number of seconds of CPU time consumed by the child process
+        running this worker if reported *or* ``None`` otherwise (e.g., if the
+        result of this phase was restored from cache).
+    rss_peak_bytes : NumericOrNoneTypes
+        Peak resident set size (RSS) in bytes of that child process if
+        reported *or* ``None`` otherwise.
+    progress_min : NumericOrNoneTypes
+        Minimum progress value signalled by this worker if any *or* ``None``.
+    progress_max : NumericOrNoneTypes
+        Maximum progress value signalled by this worker if any *or* ``None``.
+    progress : NumericOrNoneTypes
+        Most recent progress value signalled by this worker if any *or*
+        ``None``.
+    steps_per_second : NumericOrNoneTypes
+        Smoothed throughput of this worker in progress values (typically,
+        simulation time steps) per second of unpaused wall time if this
+        worker has progressed at least twice *or* ``None`` otherwise.
+    steps_per_second_prior : NumericOrNoneTypes
+        Baseline throughput of prior runs of the same simulation
+        configuration, phase, and type of work if any *or* ``None``
+        otherwise.
+    eta_seconds : NumericOrNoneTypes
+        Estimated number of fractional seconds remaining until this worker
+        attains its maximum progress value if estimable *or* ``None``
+        otherwise.
+    is_success : {bool, NoneType}
+        ``True`` only if this worker finished successfully, ``False`` if this
+        worker finished unsuccessfully, *or* ``None`` if this worker has yet
+        to finish.
+    '''
+)
+
+
+SimmerWorkerTelemetryOrNoneTypes = (SimmerWorkerTelemetry, NoneType)
+'''
+Tuple of both the simulator worker telemetry type *and* the type of the
+singleton ``None`` object.
+'''
+
+# ....................{ CLASSES                           }....................
+class SimmerWorkerMetrics(object):
+    '''
+    **Simulator worker metrics** (i.e., performance telemetry collected for a
+    single simulator worker by the simulator proactor from the signals emitted
+    by that worker).
+
+    This object is *not* thread-safe and is intended to be accessed *only*
+    from the main event thread (e.g., by slots of the simulator proactor).
+
+    Attributes
+    ----------
+    cpu_seconds : NumericOrNoneTypes
+        Fractional number of seconds of CPU time consumed by the child process
+        running this worker if reported *or* ``None`` otherwise.
+    is_success : {bool, NoneType}
+        ``True`` only if this worker finished successfully, ``False`` if this
+        worker finished unsuccessfully, *or* ``None`` if this worker has yet
+        to finish.
+    phase_kind : SimPhaseKind
+        Type of simulation phase run by this worker.
+    phase_subkind : SimmerPhaseSubkind
+        Type of work performed on this phase by this worker.
+    progress : NumericOrNoneTypes
+        Most recent progress value signalled by this worker if any *or*
+        ``None`` otherwise.
+    progress_max : NumericOrNoneTypes
+        Maximum progress value signalled by this worker if any *or* ``None``
+        otherwise.
+    progress_min : NumericOrNoneTypes
+        Minimum progress value signalled by this worker if any *or* ``None``
+        otherwise.
+    rss_peak_bytes : NumericOrNoneTypes
+        Peak resident set size (RSS) in bytes of that child process if
+        reported *or* ``None`` otherwise.
+    steps_per_second : NumericOrNoneTypes
+        Smoothed throughput of this worker in progress values per second of
+        unpaused wall time if estimable *or* ``None`` otherwise.
+    steps_per_second_prior : NumericOrNoneTypes
+        Baseline throughput of prior runs of the same simulation
+        configuration, phase, and type of work if any *or* ``None``
+        otherwise. Until this worker has progressed enough to measure its own
+        throughput, the time remaining is extrapolated from this throughput.
+    time_started : float
+        Wall-clock time in seconds since the epoch at which this worker was
+        started.
+
+    Attributes (Private)
+    ----------
+    _paused_seconds : float
+        Fractional number of seconds this worker spent blocked in *all*
+        previously completed pauses, excluding the current pause if any.
+    _rate_progress_prior : NumericOrNoneTypes
+        Progress value of the prior throughput sample if any *or* ``None``.
+    _rate_time_prior : NumericOrNoneTypes
+        Monotonic time of the prior throughput sample if any *or* ``None``.
+    _time_finished : NumericOrNoneTypes
+        Monotonic time at which this worker finished if finished *or* ``None``
+        otherwise.
+    _time_paused : NumericOrNoneTypes
+        Monotonic time at which this worker was last paused if currently
+        paused *or* ``None`` otherwise.
+    _time_started : float
+        Monotonic time at which this worker was started.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        phase_kind: SimPhaseKind,
+        phase_subkind: SimmerPhaseSubkind,
+        steps_per_second_prior: NumericOrNoneTypes = None,
+    ) -> None:
+        '''
+        Initialize these metrics for a simulator worker started now.
+
+        Parameters
+        ----------
+        phase_kind : SimPhaseKind
+            Type of simulation phase run by this worker.
+        phase_subkind : SimmerPhaseSubkind
+            Type of work performed on this phase by this worker.
+        steps_per_second_prior : NumericOrNoneTypes
+            Baseline throughput of prior runs of the same simulation
+            configuration, phase, and type of work if any *or* ``None``
+            otherwise. Defaults to ``None``.
+        '''
+
+        # Classify all passed parameters.
+        self.phase_kind = phase_kind
+        self.phase_subkind = phase_subkind
+        self.steps_per_second_prior = steps_per_second_prior
+
+        # Times at which this worker was started.
+        self.time_started = time.time()
+        self._time_started = time.monotonic()
+
+        # Nullify all remaining instance variables for safety.
+        self.cpu_seconds = None
+        self.is_success = None
+        self.progress = None
+        self.progress_max = None
+        self.progress_min = None
+        self.rss_peak_bytes = None
+        self.steps_per_second = None
+        self._paused_seconds = 0.0
+        self._rate_progress_prior = None
+        self._rate_time_prior = None
+        self._time_finished = None
+        self._time_paused = None
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def wall_seconds(self) -> float:
+        '''
+        Fractional number of seconds elapsed between this worker being
+        started and either finishing if finished *or* now otherwise.
+        '''
+
+        time_end = (
+            self._time_finished if self._time_finished is not None else
+            time.monotonic())
+        return time_end - self._time_started
+
+
+    @property
+    def paused_seconds(self) -> float:
+        '''
+        Fractional number of seconds this worker has spent blocked in pause,
+        including the current pause if any.
+        '''
+
+        paused_seconds = self._paused_seconds
+        if self._time_paused is not None:
+            paused_seconds += time.monotonic() - self._time_paused
+        return paused_seconds
+
+
+    @property
+    def eta_seconds(self) -> NumericOrNoneTypes:
+        '''
+        Estimated number of fractional seconds remaining until this worker
+        attains its maximum progress value if this worker has yet to finish
+        *and* has either a positive measured throughput or a positive
+        baseline throughput *or* ``None`` otherwise.
+        '''
+
+        # Throughput to extrapolate from, preferring the measured throughput
+        # of this worker to the baseline throughput of prior runs.
+        steps_per_second = (
+            self.steps_per_second if self.steps_per_second is not None else
+            self.steps_per_second_prior)
+
+        # If this worker has finished or no throughput is estimable, no time
+        # remaining is estimable either.
+        if (
+            self._time_finished is not None or
+            self.progress_max is None or
+            not steps_per_second
+        ):
+            return None
+
+        # Last progress value signalled by this worker, defaulting to the
+        # minimum progress value if this worker has yet to progress.
+        progress = (
+            self.progress if self.progress is not None else
+            self.progress_min)
+
+        # Else, extrapolate from this throughput.
+        return max(self.progress_max - progress, 0) / steps_per_second
+
+    # ..................{ RECORDERS                         }..................
+    @type_check
+    def record_progress_range(
+        self, progress_min: int, progress_max: int) -> None:
+        '''
+        Record the passed progress range signalled by this worker.
+
+        Since each range typically delimits a distinct stage of work (e.g., a
+        distinct simulation phase), this method also resets the throughput
+        estimated for the prior range if any.
+        '''
+
+        self.progress_min = progress_min
+        self.progress_max = progress_max
+        self.progress = None
+        self.steps_per_second = None
+        self._rate_progress_prior = progress_min
+        self._rate_time_prior = time.monotonic()
+
+
+    @type_check
+    def record_progress(self, progress: int) -> None:
+        '''
+        Record the passed progress value signalled by this worker, updating
+        the smoothed throughput of this worker.
+        '''
+
+        # Record this value.
+        self.progress = progress
+
+        # If this worker is paused, avoid sampling throughput. Progress
+        # signalled while paused was made *BEFORE* this pause.
+        if self._time_paused is not None:
+            return
+
+        # Current time.
+        time_now = time.monotonic()
+
+        # If no prior sample exists, record this sample and reduce to a noop.
+        if self._rate_time_prior is None:
+            self._rate_progress_prior = progress
+            self._rate_time_prior = time_now
+            return
+
+        # Time and progress elapsed since the prior sample.
+        time_delta = time_now - self._rate_time_prior
+        progress_delta = progress - self._rate_progress_prior
+
+        # If no time has elapsed, defer sampling to the next call.
+        if time_delta <= 0:
+            return
+
+        # Record this sample as the prior sample.
+        self._rate_progress_prior = progress
+        self._rate_time_prior = time_now
+
+        # If progress regressed (e.g., due to a restarted stage of work),
+        # discard all prior throughput.
+        if progress_delta < 0:
+            self.steps_per_second = None
+            return
+
+        # Instantaneous throughput since the prior sample.
+        steps_per_second = progress_delta / time_delta
+
+        # Smooth this throughput by an exponentially weighted moving average,
+        # weighting this sample by the time elapsed since the prior sample.
+        if self.steps_per_second is None:
+            self.steps_per_second = steps_per_second
+        else:
+            self.steps_per_second += (
+                1.0 - math.exp(-time_delta / METRICS_RATE_SMOOTHING_SECONDS)
+            ) * (steps_per_second - self.steps_per_second)
+
+
+    def record_paused(self) -> None:
+        '''
+        Record this worker as having blocked in pause now.
+        '''
+
+        if self._time_paused is None:
+            self._time_paused = time.monotonic()
+
+
+    def record_resumed(self) -> None:
+        '''
+        Record this worker as having unblocked from pause now.
+        '''
+
+        # If this worker is not paused, silently reduce to a noop.
+        if self._time_paused is None:
+            return
+
+        # Current time.
+        time_now = time.monotonic()
+
+        # Accumulate the duration of this pause.
+        self._paused_seconds += time_now - self._time_paused
+        self._time_paused = None
+
+        # Exclude this pause from the next throughput sample.
+        if self._rate_time_prior is not None:
+            self._rate_time_prior = time_now
+
+
+    def record_usage(
+        self,
+        cpu_seconds: NumericOrNoneTypes,
+        rss_peak_bytes: NumericOrNoneTypes,
+    ) -> None:
+        '''
+        Record the passed resource usage most recently reported by the child
+        process running this worker.
+        '''
+
+        self.cpu_seconds = cpu_seconds
+        self.rss_peak_bytes = rss_peak_bytes
+
+
+    @type_check
+    def record_finished(self, is_success: bool) -> None:
+        '''
+        Record this worker as having finished now with the passed status.
+        '''
+
+        # Close the current pause if any *BEFORE* freezing the wall time.
+        self.record_resumed()
+
+        self.is_success = is_success
+        self._time_finished = time.monotonic()
+
+    # ..................{ GETTERS                           }..................
+    def get_telemetry(self) -> SimmerWorkerTelemetry:
+        '''
+        Named tuple aggregating a snapshot of these metrics, typically for
+        displaying or exporting these metrics.
+        '''
+
+        return SimmerWorkerTelemetry(
+            phase_kind=self.phase_kind,
+            phase_subkind=self.phase_subkind,
+            time_started=self.time_started,
+            wall_seconds=self.wall_seconds,
+            paused_seconds=self.paused_seconds,
+            cpu_seconds=self.cpu_seconds,
+            rss_peak_bytes=self.rss_peak_bytes,
+            progress_min=self.progress_min,
+            progress_max=self.progress_max,
+            progress=self.progress,
+            steps_per_second=self.steps_per_second,
+            steps_per_second_prior=self.steps_per_second_prior,
+            eta_seconds=self.eta_seconds,
+            is_success=self.is_success,
+        )
+
+# ....................{ FORMATTERS                        }....................
+@type_check
+def format_duration(seconds: NumericOrNoneTypes) -> str:
+    '''
+    Human-readable string abbreviating the passed number of seconds to its
+    two most significant units (e.g., ``1h 05m``, ``3m 07s``, ``42s``) if
+    this number is non-``None`` *or* ``?`` otherwise.
+    '''
+
+    # If this number is unknown, return a placeholder.
+    if seconds is None:
+        return '?'
+
+    # Hours, minutes, and seconds in this number rounded to the nearest second.
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+
+    # Return the two most significant of these units.
+    if hours:
+        return '{}h {:02d}m'.format(hours, minutes)
+    elif minutes:
+        return '{}m {:02d}s'.format(minutes, seconds)
+    else:
+        return '{}s'.format(seconds)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **headless simulator phase** (i.e., widget-free description of a
+simulation phase run by a simulator worker outside the simulator tab)
+functionality, including the entry point of child processes modelling and
+exporting such phases.
+
+This submodule intentionally imports *no* widgets of the main window, as
+child processes spawned to run simulation phases import this submodule on
+unpickling that entry point.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.science.enum.enumphase import SimPhaseKind
+from betse.science import simrunner
+from betse.science.simrunner import SimRunner
+from betse.util.app.meta import appmetaone
+from betse.util.type import enums
+from betse.util.type.cls import classes
+from betse.util.type.types import type_check, NoneType, StrOrNoneTypes
+from betsee.gui.simtab.run.live.guisimrunlivering import (
+    SimmerLiveWriter, make_phase_live)
+from betsee.gui.simtab.run.work.guisimrunworkcache import SimmerPhaseCache
+from betsee.gui.simtab.run.work.guisimrunworkconf import reconfigure_p
+from betsee.gui.simtab.run.work.guisimrunworkexp import SimPipesExportPool
+from betsee.gui.simtab.run.work.guisimrunworkexpman import (
+    SimmerExportManifest)
+from betsee.gui.simtab.run.work.guisimrunworksig import SimCallbacksSignaller
+from betsee.util.io.log import guilogconf
+from betsee.util.thread.pool.guipoolworkproc import ProcessPoolWorkerChannel
+from functools import partial
+import pickle
+
+# ....................{ CONSTANTS                         }....................
+SIM_RUNNER_SUBCOMMAND_NAME_EXPORT_POOLED_TO_PHASE_KIND = {
+    'plot_init': SimPhaseKind.INIT,
+    'plot_sim':  SimPhaseKind.SIM,
+}
+'''
+Dictionary mapping from the name of each simulation subcommand exporting via
+export pipelines to the type of simulation phase exported by that subcommand.
+
+When run by a :class:`QBetseeSimmerPhaseProcessWorker` worker, each such
+subcommand incrementally exports the individual items of these pipelines
+(e.g., plots, animations) in parallel across a :class:`SimPipesExportPool`
+pool.
+'''
+
+# ....................{ CLASSES                           }....................
+class SimmerPhaseHeadless(object):
+    '''
+    **Headless simulator phase** (i.e., widget-free description of a
+    simulation phase run by a simulator worker outside the simulator tab).
+
+    Simulator workers require *only* the type and name of the simulation phase
+    they run. Whereas the :class:`QBetseeSimmerPhase` controller additionally
+    wraps the widgets of the simulator tab queueing that phase, this object
+    wraps nothing else and is thus safely instantiable in the absence of the
+    main window (e.g., when running simulations in batch from the command
+    line).
+
+    Attributes
+    ----------
+    _kind : SimPhaseKind
+        Type of simulation phase described by this object.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, kind: SimPhaseKind) -> None:
+        '''
+        Initialize this headless simulator phase.
+
+        Parameters
+        ----------
+        kind : SimPhaseKind
+            Type of simulation phase described by this object.
+        '''
+
+        # Classify all passed parameters.
+        self._kind = kind
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def kind(self) -> SimPhaseKind:
+        '''
+        Type of simulation phase described by this object.
+        '''
+
+        return self._kind
+
+
+    @property
+    def name(self) -> str:
+        '''
+        Machine-readable alphabetic lowercase name of the type of simulation
+        phase described by this object (e.g., ``seed``, ``init``).
+        '''
+
+        return enums.get_member_name_lowercase(self._kind)
+
+# ....................{ CHILDREN                          }....................
+def run_phase_child(
+    channel: ProcessPoolWorkerChannel,
+    conf_pickled: bytes,
+    sim_runner_subcommand_name: str,
+    phase_cache: (SimmerPhaseCache, NoneType),
+    phase_kind_name: str,
+    live_ring_name: StrOrNoneTypes,
+    live_decimation: int,
+) -> None:
+    '''
+    Run the simulation subcommand with the passed name on the passed pickled
+    simulation configuration from within the child process spawned by a
+    :class:`QBetseeSimmerPhaseProcessWorker` instance.
+
+    Parameters
+    ----------
+    channel : ProcessPoolWorkerChannel
+        Channel forwarding progress from this process to that worker.
+    conf_pickled : bytes
+        Pickled simulation configuration defining the simulation to be run,
+        typically as returned by the
+        :meth:`SimmerConfSnapshot.make_p_pickled` method.
+    sim_runner_subcommand_name : str
+        Name of the public method of the :class:`SimRunner` class to be run.
+    phase_cache : {SimmerPhaseCache, NoneType}
+        Cache of phase results to store the result of this phase to on
+        successfully running this subcommand if any *or* ``None`` otherwise.
+        This cache is keyed by the parent process against the same
+        configuration as this pickled configuration.
+    phase_kind_name : str
+        Name of the :class:`SimPhaseKind` member of the phase run by this
+        subcommand.
+    live_ring_name : StrOrNoneTypes
+        Name of the shared memory underlying the live ring to stream the
+        per-cell fields of this phase to if any *or* ``None`` otherwise.
+    live_decimation : int
+        Number of sampled time steps per streamed frame.
+    '''
+
+    # Initialize BETSE and its mandatory dependencies in this process, which
+    # shares *NO* state with the GUI process. Since this process displays no
+    # graphical output, a non-interactive matplotlib backend suffices. Since
+    # unpickling this function imported this submodule and hence the
+    # "betse.science" package, which implicitly instantiates the BETSE
+    # application metadata singleton on importation, only instantiate that
+    # singleton if that package failed to do so.
+    appmetaone.set_app_meta_betse_if_unset().init_libs(
+        matplotlib_backend_name='Agg')
+
+    # Redirect log messages otherwise printed to standard output to standard
+    # error instead. This process inherits the standard output of the parent
+    # process, which may be reserved for machine-readable output (e.g., the
+    # progress stream written by the "betsee --batch-conf-files" mode).
+    guilogconf.log_stdout_to_stderr()
+
+    # Type of phase exported via export pipelines by this subcommand if any
+    # *OR* "None" otherwise.
+    phase_kind_export_pooled = (
+        SIM_RUNNER_SUBCOMMAND_NAME_EXPORT_POOLED_TO_PHASE_KIND.get(
+            sim_runner_subcommand_name))
+
+    # Simulation configuration unpickled and reconfigured for the GUI. Since
+    # reconfiguration modifies this configuration, the export manifest (if
+    # any) is keyed *BEFORE* doing so.
+    p = pickle.loads(conf_pickled)
+    export_manifest = (
+        SimmerExportManifest(p=p, phase_kind=phase_kind_export_pooled)
+        if phase_kind_export_pooled is not None else None)
+    reconfigure_p(p)
+
+    # Live writer streaming to the live view if any *OR* "None" otherwise.
+    live_writer = (
+        SimmerLiveWriter(ring_name=live_ring_name, decimation=live_decimation)
+        if live_ring_name is not None else None)
+
+    # If streaming to the live view, bind this writer to each phase created by
+    # the "SimRunner" class. Since that class passes its callbacks no
+    # reference to these phases, the phase class it instantiates is replaced
+    # in the namespace of the submodule defining that class (as below).
+    if live_writer is not None:
+        simrunner.SimPhase = partial(make_phase_live, live_writer)
+
+    # Simulation phase runner forwarding progress to that worker.
+    sim_runner = SimRunner(
+        p=p,
+        callbacks=SimCallbacksSignaller(
+            signals=channel, live_writer=live_writer),
+    )
+
+    # If this subcommand exports via export pipelines, export the items of
+    # these pipelines in parallel across a pool of child processes rather than
+    # serially in this process. Since the "SimRunner" class hardcodes the
+    # export pipeline container it instantiates, that container is replaced
+    # in the namespace of the submodule defining that class. Since this
+    # process is dedicated to running this subcommand, doing so is safe.
+    if export_manifest is not None:
+        simrunner.SimPipesExport = partial(
+            SimPipesExportPool,
+            conf_pickled=conf_pickled,
+            halter=channel.halt_work_if_requested,
+            manifest=export_manifest,
+        )
+
+    # Simulation subcommand to be run.
+    sim_runner_subcommand = classes.get_method(
+        cls=SimRunner, method_name=sim_runner_subcommand_name)
+
+    # Run this subcommand on this runner. Since the phase returned by this
+    # subcommand is neither picklable nor required by the GUI, this phase is
+    # intentionally discarded.
+    sim_runner_subcommand(sim_runner)
+
+    # If caching phase results, cache the result of this phase.
+    if phase_cache is not None:
+        phase_cache.store(SimPhaseKind[phase_kind_name])
@@ -12,7 +12,9 @@ simulation phase callbacks whose methods emit queued Qt signals) classes.
 # from PySide2.QtCore import QCoreApplication  # Slot, Signal
 from betse.science.phase.phasecallbacks import SimCallbacksBC
 # from betse.util.io.log import logs
-from betse.util.type.types import type_check
+from betse.util.type.types import type_check, NoneType
+from betsee.gui.simtab.run.live.guisimrunlivering import SimmerLiveWriter
+from betsee.util.thread.pool.guipoolworkproc import ProcessPoolWorkerChannel
 from betsee.util.thread.pool.guipoolworksig import (
     QBetseeThreadPoolWorkerSignals)
 
@@ -31,20 +33,40 @@ class SimCallbacksSignaller(SimCallbacksBC):
 
     Attributes
     ----------
-    _signals : QBetseeThreadPoolWorkerSignals
-        Collection of all signals emittable by simulator workers.
+    _signals : (QBetseeThreadPoolWorkerSignals, ProcessPoolWorkerChannel)
+        Either:
+
+        * If these callbacks are called from a pooled thread of the GUI
+          process, the collection of all signals emittable by the simulator
+          worker running in that thread.
+        * If these callbacks are called from a child process spawned by a
+          process-backed simulator worker, the channel forwarding progress
+          from that process to that worker, which then emits these signals.
+    _live_writer : {SimmerLiveWriter, NoneType}
+        Live writer streaming the fields of the current phase to the live view
+        on each progress value if any *or* ``None`` otherwise.
     '''
 
     # ..................{ INITIALIZERS                      }..................
     @type_check
-    def __init__(self, signals: QBetseeThreadPoolWorkerSignals) -> None:
+    def __init__(
+        self,
+        signals: (QBetseeThreadPoolWorkerSignals, ProcessPoolWorkerChannel),
+        live_writer: (SimmerLiveWriter, NoneType) = None,
+    ) -> None:
         '''
         Initialize this callbacks collection.
 
         Parameters
         ----------
-        signals : QBetseeThreadPoolWorkerSignals
-            Collection of all signals emittable by simulator workers.
+        signals : (QBetseeThreadPoolWorkerSignals, ProcessPoolWorkerChannel)
+            Either the collection of all signals emittable by simulator
+            workers *or* the channel forwarding progress from a child process
+            to a process-backed simulator worker.
+        live_writer : {SimmerLiveWriter, NoneType}
+            Live writer streaming the fields of the current phase to the live
+            view on each progress value if any *or* ``None`` otherwise.
+            Defaults to ``None``.
         '''
 
         # Initialize our superclass with all passed parameters.
@@ -52,6 +74,7 @@ class SimCallbacksSignaller(SimCallbacksBC):
 
         # Classify all passed parameters.
         self._signals = signals
+        self._live_writer = live_writer
 
     # ..................{ CALLBACKS ~ progress              }..................
     @type_check
@@ -66,6 +89,10 @@ class SimCallbacksSignaller(SimCallbacksBC):
         self._signals.emit_progress_range(
             progress_min=progress_min, progress_max=progress_max)
 
+        # If streaming to the live view, restart streaming for this range.
+        if self._live_writer is not None:
+            self._live_writer.restart()
+
 
     @type_check
     def progress_stated(self, status: str) -> None:
@@ -83,5 +110,10 @@ class SimCallbacksSignaller(SimCallbacksBC):
         # Perform all superclass callback handling first.
         super().progressed(progress=progress)
 
+        # If streaming to the live view, stream this progress value *BEFORE*
+        # forwarding this value, which may block while this phase is paused.
+        if self._live_writer is not None:
+            self._live_writer.write_frame_if_due(progress)
+
         # Forward these callback parameters to the corresponding worker signal.
         self._signals.emit_progress(progress=progress)
@@ -76,7 +76,7 @@ from betsee import guimetadata
 from betsee.guiexception import BetseePySideWindowException
 from betsee.gui.guimainsignaler import QBetseeSignaler
 from betsee.lib.pyside2 import guipsdui
-from betsee.util.app import guiappwindow
+from betsee.util.app import guiappstartup, guiappwindow
 from betsee.util.io import guierror
 from betsee.util.io.log import guilogconf
 from betsee.util.type.guitype import QWidgetOrNoneTypes
@@ -196,10 +196,12 @@ class QBetseeMainWindow(*MAIN_WINDOW_BASE_CLASSES):
         # transitive widgets of this window. This superclass method is defined
         # by the helper base class generated by the
         # "betsee.lib.pyside2.cache.guipsdcacheui" submodule.
-        self.setupUi(self)
+        with guiappstartup.profiling_phase('setup_ui'):
+            self.setupUi(self)
 
         # Customize this main window with additional Python logic.
-        self._init(sim_conf_filename)
+        with guiappstartup.profiling_phase('init'):
+            self._init(sim_conf_filename)
 
 
     @type_check
@@ -342,6 +344,15 @@ class QBetseeMainWindow(*MAIN_WINDOW_BASE_CLASSES):
         for toolbar_button in self.toolbar.findChildren(QToolButton):
             toolbar_button.setFocusPolicy(Qt.NoFocus)
 
+        # If no simulation configuration file is to be opened on application
+        # startup *AND* a prior instance of this application exited while a
+        # simulation configuration had unsaved changes recorded by its
+        # autosave journal, open that configuration instead. The
+        # QBetseeSimConf.load() method then offers that journal for recovery.
+        if sim_conf_filename is None:
+            sim_conf_filename = (
+                self.sim_conf.get_journal_conf_filename_or_none())
+
         # If no simulation configuration file is to be opened on application
         # startup, default our configuration to the unloaded state.
         #
@@ -350,9 +361,12 @@ class QBetseeMainWindow(*MAIN_WINDOW_BASE_CLASSES):
         if sim_conf_filename is None:
             self.sim_conf.unload()
         # Else, such a file is to be opened on application startup. In this
-        # case, default our configuration to the loaded state.
+        # case, default our configuration to the loaded state. Since this file
+        # is deserialized asynchronously, this merely starts doing so; the
+        # main window is displayed while this file is still being loaded.
         else:
-            self.sim_conf.load(sim_conf_filename)
+            with guiappstartup.profiling_phase('sim_conf_load'):
+                self.sim_conf.load(sim_conf_filename)
 
     # ..................{ TESTERS                           }..................
     def _is_closable(self) -> bool:
@@ -426,6 +440,11 @@ class QBetseeMainWindow(*MAIN_WINDOW_BASE_CLASSES):
             # terminating each such worker otherwise.
             self.sim_tab.halt_work()
 
+            # Block until all queued simulation configuration saves (e.g.,
+            # queued by the user electing to save unsaved changes above) have
+            # been written.
+            self.sim_conf.finalize_writes()
+
             # Store application-wide settings *BEFORE* closing this window.
             self.signaler.store_settings_signal.emit()
 
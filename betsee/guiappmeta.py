@@ -59,7 +59,7 @@ class BetseeAppMeta(BetseAppMeta):
 
         # Defer heavyweight imports.
         from betsee.lib.pyside2 import guipsd
-        from betsee.util.app import guiapp
+        from betsee.util.app import guiapp, guiappstartup
 
         # Instantiate the "QApplication" singleton *BEFORE* initializing BETSE
         # dependencies. Our reasoning is subtle, but vital: initializing BETSE
@@ -70,17 +70,20 @@ class BetseeAppMeta(BetseAppMeta):
         # this singleton is instantiated. Permitting "Qt5Agg" to instantiate
         # this singleton first prevents us from initializing these settings
         # here. This singleton *MUST* thus be instantiated by us first.
-        guiapp.init()
+        with guiappstartup.profiling_phase('qapplication'):
+            guiapp.init()
 
         # Initialize PySide2 *AFTER* instantiating the "QApplication"
         # singleton, as PySide2 will implicitly instantiate its own such
         # singleton if we fail to explicitly do so first.
-        guipsd.init(cache_policy=cache_policy)
+        with guiappstartup.profiling_phase('pyside2_cache'):
+            guipsd.init(cache_policy=cache_policy)
 
         # Initialize our superclass dependencies (and hence those required by
         # BETSE itself) to strictly require a Qt 5-specific matplotlib backend
         # *AFTER* initializing PySide2 .
-        super().init_libs(matplotlib_backend_name='Qt5Agg')
+        with guiappstartup.profiling_phase('betse'):
+            super().init_libs(matplotlib_backend_name='Qt5Agg')
 
     # ..................{ DEINITIALIZERS                    }..................
     def deinit(self) -> None:
@@ -309,6 +312,37 @@ class BetseeAppMeta(BetseAppMeta):
             guimetadata.MAIN_WINDOW_QRC_MODULE_NAME + '.py')
 
 
+    @property_cached
+    def data_rcc_filename(self) -> str:
+        '''
+        Absolute filename of the binary application-wide Qt resource collection
+        (RCC) file compiled from the XML-formatted Qt resource collection (QRC)
+        file exported by the external Qt Designer application structuring all
+        external resources (e.g., icons) required by this application's main
+        window.
+
+        Unlike the pure-Python module whose filename is given by the
+        :meth:`data_py_qrc_filename` property, this file is directly
+        registrable (and hence memory-mappable) by Qt *without* being imported
+        by Python, reducing both startup time and resident memory.
+
+        If this file exists, this file is guaranteed to be registrable but
+        *not* necessarily up-to-date with the input paths from which this file
+        is dynamically regenerated at runtime; else, the caller is assumed to
+        explicitly regenerate this file.
+
+        See Also
+        ----------
+        :meth:`dot_rcc_filename`
+            User-specific equivalent of this file.
+        :mod:`betsee.lib.pyside2.cache.guipsdcache`
+            Submodule dynamically generating this file.
+        '''
+
+        return pathnames.join(
+            self.data_py_dirname, self.package_name + '.rcc')
+
+
     @property_cached
     def data_py_ui_filename(self) -> str:
         '''
@@ -335,6 +369,22 @@ class BetseeAppMeta(BetseAppMeta):
             self.data_py_dirname,
             guimetadata.MAIN_WINDOW_UI_MODULE_NAME + '.py')
 
+    # ..................{ PROPERTIES ~ file : dot           }..................
+    @property_cached
+    def dot_run_history_filename(self) -> str:
+        '''
+        Absolute filename of the user-specific SQLite database recording the
+        **run history** (i.e., the outcome and performance of each simulation
+        phase previously modelled or exported by this application).
+
+        See Also
+        ----------
+        :mod:`betsee.gui.simtab.run.hist.guisimrunhiststore`
+            Submodule reading and writing this database.
+        '''
+
+        return pathnames.join(self.dot_dirname, 'run_history.sqlite3')
+
     # ..................{ PROPERTIES ~ file : dot : py      }..................
     @property_cached
     def dot_py_qrc_filename(self) -> str:
@@ -355,6 +405,26 @@ class BetseeAppMeta(BetseAppMeta):
             pathnames.get_basename(self.data_py_qrc_filename))
 
 
+    @property_cached
+    def dot_rcc_filename(self) -> str:
+        '''
+        Absolute filename of the binary user-specific Qt resource collection
+        (RCC) file compiled from the XML-formatted Qt resource collection (QRC)
+        file exported by the external Qt Designer application structuring all
+        external resources (e.g., icons) required by this application's main
+        window.
+
+        See Also
+        ----------
+        :meth:`data_rcc_filename`
+            Application-wide equivalent of this file.
+        '''
+
+        return pathnames.join(
+            self.dot_py_dirname,
+            pathnames.get_basename(self.data_rcc_filename))
+
+
     @property_cached
     def dot_py_ui_filename(self) -> str:
         '''
@@ -165,6 +165,17 @@ class BetseeSimConfException(BetseeException):
         return QCoreApplication.translate(
             'BetseeSimConfException', 'Simulation Configuration Error')
 
+
+class BetseeSimConfPatchException(BetseeSimConfException):
+    '''
+    Simulation configuration-specific exception raised on failing to patch
+    changed options into the YAML-formatted text of a saved simulation
+    configuration file (e.g., due to that file having been externally
+    modified), in which case that file should be rewritten in its entirety.
+    '''
+
+    pass
+
 # ....................{ EXCEPTIONS ~ psd                  }....................
 class BetseePySideException(BetseeLibException):
     '''
@@ -530,3 +541,39 @@ class BetseeSimmerBetseException(BetseeSimmerException):
         # Translate this title.
         return QCoreApplication.translate(
             'BetseeSimmerBetseException', 'BETSE Error')
+
+
+class BetseeSimmerExportException(BetseeSimmerException):
+    '''
+    **Simulator export** (i.e., plot, animation, or comma-separated value
+    file exported from a previously modelled simulation phase)-specific
+    exception.
+    '''
+
+    @property
+    def _title_default(self) -> str:
+
+        # Defer heavyweight imports *NOT* guaranteed to exist.
+        from PySide2.QtCore import QCoreApplication
+
+        # Translate this title.
+        return QCoreApplication.translate(
+            'BetseeSimmerExportException', 'Export Error')
+
+
+class BetseeSimmerSweepException(BetseeSimmerException):
+    '''
+    **Simulator sweep** (i.e., batch of simulation configurations derived from
+    a base configuration by varying one or more aliased parameters)-specific
+    exception.
+    '''
+
+    @property
+    def _title_default(self) -> str:
+
+        # Defer heavyweight imports *NOT* guaranteed to exist.
+        from PySide2.QtCore import QCoreApplication
+
+        # Translate this title.
+        return QCoreApplication.translate(
+            'BetseeSimmerSweepException', 'Sweep Error')
@@ -10,15 +10,17 @@ user-specific files on the local filesystem.
 '''
 
 # ....................{ IMPORTS                           }....................
-import PySide2
+import PySide2, importlib
 from betse.util.app.meta import appmetaone
 from betse.util.io.log import logs
-from betse.util.path import files, paths, pathnames
+from betse.util.path import files, pathnames
 from betse.util.os.command import cmdpath
 from betse.util.py.module import pyimport, pymodule
 from betse.util.type.enums import make_enum
-from betse.util.type.types import type_check, IterableTypes
+from betse.util.type.types import type_check
 from betsee.guiexception import BetseeCacheException
+from betsee.lib.pyside2.cache import guipsdcachemanifest
+from betsee.lib.pyside2.cache.guipsdcachemanifest import CacheManifest
 from betsee.gui.simconf.stack.widget.guisimconfradiobtn import (
     QBetseeSimConfEnumRadioButtonGroup)
 
@@ -100,8 +102,17 @@ def init(cache_policy: CachePolicy) -> None:
     pure-Python :mod:`PySide2`-based submodule converted from a source
     XML-formatted file and zero or more binary resources exported by the
     external Qt (Creator|Designer) GUI. For efficiency, previously cached
-    submodules are regenerated *only* as needed (i.e., if older than the
-    underlying paths from which these submodules are generated).
+    submodules are regenerated *only* as needed (i.e., if the contents of the
+    underlying paths from which these submodules are generated have changed,
+    as recorded by the manifest residing next to each such submodule). All
+    submodules are written atomically, guaranteeing that concurrently started
+    instances of this application *never* observe partially written files.
+
+    This function additionally caches a binary Qt resource collection (RCC)
+    file compiled from the same XML-formatted file as the QRC submodule under
+    the same cache policy and registers that file with the Qt resource system,
+    avoiding the cost of importing that submodule at application startup. See
+    the :func:`_register_resources` function for further details.
 
     Parameters
     ----------
@@ -141,6 +152,60 @@ def init(cache_policy: CachePolicy) -> None:
     # these submodules to be subsequently imported elsewhere in the codebase.
     pyimport.register_dir(app_meta.dot_py_dirname)
 
+    # Register all binary resources required by this GUI with the Qt resource
+    # system *AFTER* registering this directory, as the fallback performed by
+    # this function imports a submodule from this directory.
+    _register_resources()
+
+
+def _register_resources() -> None:
+    '''
+    Register all binary resources (e.g., icons) required by this GUI with the
+    Qt resource system.
+
+    Specifically, this function either:
+
+    * If the user-specific binary Qt resource collection (RCC) file exists,
+      registers that file with the Qt resource system. This is the common
+      case. Since Qt directly memory-maps this file, doing so is substantially
+      faster and consumes substantially less resident memory than the
+      fallback below.
+    * Else, imports the user-specific pure-Python submodule embedding these
+      resources as byte literals, which registers these resources as a side
+      effect of being imported. Since Python must parse and unmarshal this
+      submodule into heap memory, this fallback is substantially slower than
+      the above approach. This fallback is only performed if this file could
+      neither be generated nor copied (e.g., due to the ``rcc`` command being
+      unavailable *and* no application-wide file being bundled with this
+      application).
+    '''
+
+    # Avoid circular import dependencies.
+    from betsee import guimetadata
+    from betsee.lib.pyside2.cache import guipsdcacheqrc
+
+    # Application metadata singleton.
+    app_meta = appmetaone.get_app_meta()
+
+    # If the user-specific binary resource collection exists...
+    if files.is_file(app_meta.dot_rcc_filename):
+        # Attempt to register this collection.
+        try:
+            guipsdcacheqrc.register_rcc_file(app_meta.dot_rcc_filename)
+            return
+        # If doing so fails for *ANY* reason whatsoever, log this exception as
+        # a non-fatal warning and fallback to the pure-Python submodule below.
+        except Exception as exception:
+            logs.log_exception(exception)
+            logs.log_warning('Registration failed due to uncaught exception!')
+
+    # Else, fallback to importing the pure-Python submodule embedding these
+    # resources, implicitly registering these resources.
+    logs.log_debug(
+        'Importing PySide2 resources submodule "%s"...',
+        guimetadata.MAIN_WINDOW_QRC_MODULE_NAME)
+    importlib.import_module(guimetadata.MAIN_WINDOW_QRC_MODULE_NAME)
+
 
 def _init_dev() -> None:
     '''
@@ -166,6 +231,9 @@ def _init_dev() -> None:
     _cache_py_qrc_file(
         qrc_filename=app_meta.data_qrc_filename,
         py_filename=app_meta.data_py_qrc_filename)
+    _cache_rcc_file(
+        qrc_filename=app_meta.data_qrc_filename,
+        rcc_filename=app_meta.data_rcc_filename)
     _cache_py_ui_file(
         ui_filename=app_meta.data_ui_filename,
         py_filename=app_meta.data_py_ui_filename)
@@ -173,10 +241,13 @@ def _init_dev() -> None:
     # (Re)cache *ALL* user-specific submodules (in arbitrary order). For
     # simplicity, simply replace these files with their application-wide
     # equivalents cached above.
-    files.copy_overwritable(
+    guipsdcachemanifest.copy_cache_file(
         src_filename=app_meta.data_py_qrc_filename,
         trg_filename=app_meta.dot_py_qrc_filename)
-    files.copy_overwritable(
+    guipsdcachemanifest.copy_cache_file(
+        src_filename=app_meta.data_rcc_filename,
+        trg_filename=app_meta.dot_rcc_filename)
+    guipsdcachemanifest.copy_cache_file(
         src_filename=app_meta.data_py_ui_filename,
         trg_filename=app_meta.dot_py_ui_filename)
 
@@ -217,10 +288,30 @@ def _init_user() -> None:
 
         # Fallback to simply replacing this submodule with its application-wide
         # equivalent bundled with this application.
-        files.copy_overwritable(
+        guipsdcachemanifest.copy_cache_file(
             src_filename=app_meta.data_py_qrc_filename,
             trg_filename=app_meta.dot_py_qrc_filename)
 
+    # Attempt to (re)cache the user-specific binary resource collection.
+    try:
+        _cache_rcc_file(
+            qrc_filename=app_meta.data_qrc_filename,
+            rcc_filename=app_meta.dot_rcc_filename)
+    # If doing so fails for *ANY* reason whatsoever...
+    except Exception as exception:
+        # Log this exception as a non-fatal warning.
+        logs.log_exception(exception)
+        logs.log_warning('Synchronization failed due to uncaught exception!')
+
+        # If this application bundles an application-wide equivalent of this
+        # collection, fallback to simply replacing this collection with that
+        # equivalent. Else, the _register_resources() function subsequently
+        # falls back to the user-specific QRC submodule cached above.
+        if files.is_file(app_meta.data_rcc_filename):
+            guipsdcachemanifest.copy_cache_file(
+                src_filename=app_meta.data_rcc_filename,
+                trg_filename=app_meta.dot_rcc_filename)
+
     # Attempt to (re)cache the user-specific UI submodule.
     try:
         _cache_py_ui_file(
@@ -234,7 +325,7 @@ def _init_user() -> None:
 
         # Fallback to simply replacing this submodule with its application-wide
         # equivalent bundled with this application.
-        files.copy_overwritable(
+        guipsdcachemanifest.copy_cache_file(
             src_filename=app_meta.data_py_ui_filename,
             trg_filename=app_meta.dot_py_ui_filename)
 
@@ -245,10 +336,10 @@ def _cache_py_qrc_file(qrc_filename: str, py_filename: str) -> None:
     Reuse the previously cached pure-Python :mod:`PySide2`-based submodule
     embedding all binary resources in this application's main Qt resource
     collection (QRC) with the passed filename if that submodule is sufficiently
-    up-to-date (i.e., at least as new as all input paths required to regenerate
-    that submodule) *or* regenerate this submodule from these input paths
-    otherwise, principally including the input QRC file with the passed
-    filename.
+    up-to-date (i.e., generated from the current contents of all input paths
+    required to regenerate that submodule) *or* atomically regenerate this
+    submodule from these input paths otherwise, principally including the input
+    QRC file with the passed filename.
 
     Parameters
     ----------
@@ -272,30 +363,71 @@ def _cache_py_qrc_file(qrc_filename: str, py_filename: str) -> None:
     # Avoid circular import dependencies.
     from betsee.lib.pyside2.cache import guipsdcacheqrc
 
-    # List of the absolute pathnames of all input paths required to do so. For
-    # efficiency, these paths are ordered via the heuristic documented by the
-    # paths.is_mtime_recursive_older_than_paths() function. These include:
-    #
-    # * All files and subdirectories of the input directory containing both
-    #   this input QRC file and all resource files referenced by this file.
-    # * The input "rcc" executable run by the psdqrc.convert_qrc_to_py_file()
-    #   function called below.
-    src_pathnames = [
-        qrc_filename,
-        pymodule.get_filename(guipsdcacheqrc),
-        cmdpath.get_filename('rcc'),
-    ]
-
-    # If this output module is at least as new as all of the above paths, this
-    # output module is sufficiently up-to-date and need *NOT* be regenerated.
-    if not _is_trg_file_stale(
-        src_pathnames=src_pathnames, trg_filename=py_filename):
+    # Manifest describing this output module.
+    manifest = _make_qrc_manifest(
+        qrc_filename=qrc_filename, trg_filename=py_filename)
+
+    # If the contents of all source paths described by this manifest are
+    # unchanged since this output module was last generated, this output
+    # module is sufficiently up-to-date and need *NOT* be regenerated.
+    if not _is_trg_file_stale(manifest=manifest, trg_filename=py_filename):
         return
 
-    # Else, this output module is older than at least one such path, in which
-    # case this output module is outdated and must be regenerated.
-    guipsdcacheqrc.convert_qrc_to_py_file(
-        qrc_filename=qrc_filename, py_filename=py_filename)
+    # Else, this output module is outdated and must be regenerated. For safety,
+    # do so atomically *BEFORE* recording these contents in this manifest.
+    with manifest.writing_trg_file() as py_filename_temp:
+        guipsdcacheqrc.convert_qrc_to_py_file(
+            qrc_filename=qrc_filename, py_filename=py_filename_temp)
+
+
+@type_check
+def _cache_rcc_file(qrc_filename: str, rcc_filename: str) -> None:
+    '''
+    Reuse the previously cached binary Qt resource collection (RCC) file
+    compiled from this application's main Qt resource collection (QRC) with
+    the passed filename if that file is sufficiently up-to-date (i.e.,
+    generated from the current contents of all input paths required to
+    regenerate that file) *or* atomically regenerate this file from these input
+    paths otherwise.
+
+    Parameters
+    ----------
+    qrc_filename : str
+        Absolute or relative filename of the input ``.qrc``-suffixed file.
+    rcc_filename : str
+        Absolute or relative filename of the output ``.rcc``-suffixed file.
+
+    Raises
+    ----------
+    BetseCommandException
+        If the ``rcc`` command installed by the optional third-party dependency
+        ``pyside2-tools`` is *not* in the current ``${PATH}``.
+
+    See Also
+    ----------
+    :func:`_cache_py_qrc_file`
+        Further details.
+    :func:`guipsdcacheqrc.convert_qrc_to_rcc_file`
+        Further details.
+    '''
+
+    # Avoid circular import dependencies.
+    from betsee.lib.pyside2.cache import guipsdcacheqrc
+
+    # Manifest describing this output file.
+    manifest = _make_qrc_manifest(
+        qrc_filename=qrc_filename, trg_filename=rcc_filename)
+
+    # If the contents of all source paths described by this manifest are
+    # unchanged since this output file was last generated, this output file is
+    # sufficiently up-to-date and need *NOT* be regenerated.
+    if not _is_trg_file_stale(manifest=manifest, trg_filename=rcc_filename):
+        return
+
+    # Else, this output file is outdated and must be atomically regenerated.
+    with manifest.writing_trg_file() as rcc_filename_temp:
+        guipsdcacheqrc.convert_qrc_to_rcc_file(
+            qrc_filename=qrc_filename, rcc_filename=rcc_filename_temp)
 
 
 @type_check
@@ -303,10 +435,10 @@ def _cache_py_ui_file(ui_filename: str, py_filename: str) -> None:
     '''
     Reuse the previously cached pure-Python :mod:`PySide2`-based submodule
     implementing the superficial construction of this application's main window
-    if that submodule is sufficiently up-to-date (i.e., at least as new as all
-    input paths required to regenerate that submodule) *or* regenerate that
-    submodule from these input paths otherwise, principally including the input
-    UI file with the passed filename.
+    if that submodule is sufficiently up-to-date (i.e., generated from the
+    current contents of all input paths required to regenerate that submodule)
+    *or* atomically regenerate that submodule from these input paths otherwise,
+    principally including the input UI file with the passed filename.
 
     Parameters
     ----------
@@ -334,56 +466,103 @@ def _cache_py_ui_file(ui_filename: str, py_filename: str) -> None:
     # "pyside2uic" package installed by the "pyside2-tools" dependency.
     pyside2uic = libs.import_runtime_optional('pyside2uic')
 
-    # List of the absolute pathnames of all input paths required to do so. For
-    # efficiency, these paths are ordered via the heuristic documented by the
-    # paths.is_mtime_recursive_older_than_paths() function. These include:
+    # Manifest describing this output module, whose source paths include:
     #
     # * This input UI file.
     # * The file providing the submodule of this application converting this UI
     #   file into a Python module.
-    # * Any file or subdirectory in the input directories containing the
-    #   "PySide2" and "pyside2uic" packages required by the
-    #   psdui.convert_ui_to_py_file() function called below.
-    src_pathnames = [
-        ui_filename,
-        pymodule.get_filename(guipsdcacheui),
-        pymodule.get_dirname(PySide2),
-        pymodule.get_dirname(pyside2uic),
-    ]
-
-    # If this output module is at least as new as all of the above paths, this
-    # output module is sufficiently up-to-date and need *NOT* be regenerated.
-    if not _is_trg_file_stale(
-        src_pathnames=src_pathnames, trg_filename=py_filename):
+    #
+    # Rather than recursively hashing the input directories containing the
+    # "PySide2" and "pyside2uic" packages required by the
+    # guipsdcacheui.convert_ui_to_py_file() function called below, the
+    # versions of these packages are recorded instead. Hashing these
+    # directories (which contain large binary shared libraries) would be
+    # prohibitively expensive and detect no meaningful change not already
+    # detected by these versions.
+    manifest = CacheManifest(
+        trg_filename=py_filename,
+        src_pathnames=(ui_filename, pymodule.get_filename(guipsdcacheui),),
+        tool_version='PySide2 {}; pyside2uic {}'.format(
+            PySide2.__version__, getattr(pyside2uic, '__version__', '')),
+    )
+
+    # If the contents of all source paths described by this manifest are
+    # unchanged since this output module was last generated, this output
+    # module is sufficiently up-to-date and need *NOT* be regenerated.
+    if not _is_trg_file_stale(manifest=manifest, trg_filename=py_filename):
         return
 
-    # Else, this output module is older than at least one such path, in which
-    # case this output module is outdated and must be regenerated.
-    guipsdcacheui.convert_ui_to_py_file(
-        ui_filename=ui_filename,
-        py_filename=py_filename,
-        promote_obj_name_to_class=_PROMOTE_OBJ_NAME_TO_CLASS,
+    # Else, this output module is outdated and must be atomically regenerated.
+    with manifest.writing_trg_file() as py_filename_temp:
+        guipsdcacheui.convert_ui_to_py_file(
+            ui_filename=ui_filename,
+            py_filename=py_filename_temp,
+            promote_obj_name_to_class=_PROMOTE_OBJ_NAME_TO_CLASS,
+        )
+
+# ....................{ MAKERS                            }....................
+@type_check
+def _make_qrc_manifest(
+    qrc_filename: str, trg_filename: str) -> CacheManifest:
+    '''
+    Manifest describing the cached file with the passed filename generated from
+    this application's main Qt resource collection (QRC) by the ``rcc``
+    command (e.g., either the pure-Python QRC submodule *or* the binary Qt
+    resource collection).
+
+    Parameters
+    ----------
+    qrc_filename : str
+        Absolute filename of the input ``.qrc``-suffixed file.
+    trg_filename : str
+        Absolute filename of this cached file.
+
+    Raises
+    ----------
+    BetseCommandException
+        If the ``rcc`` command installed by the optional third-party dependency
+        ``pyside2-tools`` is *not* in the current ``${PATH}``.
+    '''
+
+    # Avoid circular import dependencies.
+    from betsee.lib.pyside2.cache import guipsdcacheqrc
+
+    # Create and return a manifest whose source paths include:
+    #
+    # * All files and subdirectories of the input directory containing both
+    #   the input QRC file and all resource files referenced by this file.
+    # * The file providing the submodule of this application running the
+    #   "rcc" command.
+    # * The input "rcc" executable itself. Since the "rcc" command reports no
+    #   machine-readable version, the hash of this executable serves as the
+    #   version of this tool. Unlike the modification time of this executable,
+    #   this hash only changes when this executable genuinely changes.
+    return CacheManifest(
+        trg_filename=trg_filename,
+        src_pathnames=(
+            pathnames.get_dirname(qrc_filename),
+            pymodule.get_filename(guipsdcacheqrc),
+            cmdpath.get_filename('rcc'),
+        ),
+        tool_version='PySide2 {}'.format(PySide2.__version__),
     )
 
 # ....................{ TESTERS                           }....................
 @type_check
-def _is_trg_file_stale(
-    src_pathnames: IterableTypes, trg_filename: str) -> bool:
+def _is_trg_file_stale(manifest: CacheManifest, trg_filename: str) -> bool:
     '''
     ``True`` only if the passed target file either does not exist, does exist
     but is a directory, does exist but is **empty** (i.e., zero-byte), *or*
-    does exist but is older than all source paths in the passed iterable.
+    does exist but the passed manifest describing this file is stale.
 
     If this function returns ``True``, the caller is expected to explicitly
-    (re)create this target file from these source paths.
+    (re)create this target file from the source paths described by this
+    manifest.
 
     Parameters
     ----------
-    src_pathnames: IterableTypes[str]
-        Iterable of the absolute or relative pathnames of all source paths
-        required to (re)create this target file. For efficiency, these paths
-        should be ordered according to the heuristic discussed by the
-        :func:`paths.is_mtime_recursive_older_than_paths` function.
+    manifest : CacheManifest
+        Manifest describing this target file.
     trg_filename : str
         Absolute or relative filename of the target file.
 
@@ -395,7 +574,9 @@ def _is_trg_file_stale(
         * Does *not* exist.
         * Does exist but is a directory.
         * Does exist but is an **empty file** (i.e., zero-byte).
-        * Does exist but is older than all such source paths.
+        * Does exist but the contents of one or more source paths *or* the
+          version of the tool generating this file have changed since this
+          file was last generated. See :meth:`CacheManifest.is_stale`.
     '''
 
     # Log this inspection.
@@ -407,9 +588,8 @@ def _is_trg_file_stale(
     return (
         # This target file does not exist or does but is *NOT* a file *OR*...
         not files.is_file(trg_filename) or
-        # This target file is empty.
+        # This target file is empty *OR*...
         files.is_empty(trg_filename) or
-        # This target file does exist but is older than at least one of these
-        # source paths *OR*...
-        paths.is_mtime_recursive_older_than_paths(trg_filename, src_pathnames)
+        # This target file does exist but is stale.
+        manifest.is_stale()
     )
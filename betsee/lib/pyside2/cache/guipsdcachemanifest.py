@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **cache manifest** (i.e., JSON-formatted file residing next to a
+cached file recording the content hashes of all source paths from which that
+file was generated) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.util.io.log import logs
+from betse.util.path import pathnames
+from betse.util.type.types import type_check, IterableTypes
+from betsee.util.path.guifileatomic import writing_file_atomic
+from contextlib import contextmanager
+import hashlib, json, os, shutil
+
+# ....................{ CONSTANTS                         }....................
+MANIFEST_FILETYPE = 'manifest'
+'''
+Filetype suffixing the filename of each manifest, appended to the filename of
+the cached file described by that manifest (e.g., ``betsee_ui.py.manifest``).
+'''
+
+
+MANIFEST_FORMAT_VERSION = 1
+'''
+Version of the format of all manifests, incremented on each
+backward-incompatible change to this format. Manifests of any other version are
+unconditionally stale.
+'''
+
+# ....................{ CLASSES                           }....................
+class CacheManifest(object):
+    '''
+    **Cache manifest** (i.e., JSON-formatted file residing next to a cached
+    file recording the content hashes of all source paths from which that file
+    was generated *and* the version of the tool generating that file).
+
+    Cached files are regenerated *only* when the contents of these source paths
+    or the version of this tool genuinely change. Unlike modification times,
+    content hashes are robust against spurious churn (e.g., due to package
+    upgrades or container rebuilds touching unmodified files).
+
+    Efficiency
+    ----------
+    For efficiency, each manifest additionally records the modification time
+    and size of each source file. If both are unchanged, the hash recorded for
+    that file is reused rather than recomputed. Ergo, files are rehashed *only*
+    when touched, reducing the common case to a single ``stat()`` call per
+    source file.
+
+    Attributes
+    ----------
+    _manifest_filename : str
+        Absolute filename of this manifest.
+    _src_pathnames : tuple
+        Tuple of the absolute pathnames of all source paths required to
+        (re)generate the cached file described by this manifest. Source
+        directories are recursively hashed.
+    _src_filename_to_stat_hash : dict
+        Dictionary mapping from the absolute filename of each source file
+        (including those recursively residing in source directories) to a
+        3-list ``[mtime_ns, size, hash]`` describing that file as of the most
+        recent call to the :meth:`is_stale` method *or* ``None`` if that method
+        has yet to be called.
+    _tool_version : str
+        Human-readable version of the tool generating this cached file.
+    _trg_filename : str
+        Absolute filename of the cached file described by this manifest.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        trg_filename: str,
+        src_pathnames: IterableTypes,
+        tool_version: str,
+    ) -> None:
+        '''
+        Initialize this manifest.
+
+        Parameters
+        ----------
+        trg_filename : str
+            Absolute filename of the cached file described by this manifest.
+        src_pathnames : IterableTypes[str]
+            Iterable of the absolute pathnames of all source paths (including
+            both files *and* directories) required to (re)generate this cached
+            file.
+        tool_version : str
+            Human-readable version of the tool generating this cached file.
+        '''
+
+        # Classify all passed parameters.
+        self._trg_filename = trg_filename
+        self._src_pathnames = tuple(src_pathnames)
+        self._tool_version = tool_version
+
+        # Absolute filename of this manifest.
+        self._manifest_filename = get_manifest_filename(trg_filename)
+
+        # Nullify all remaining instance variables for safety.
+        self._src_filename_to_stat_hash = None
+
+    # ..................{ TESTERS                           }..................
+    def is_stale(self) -> bool:
+        '''
+        ``True`` only if the cached file described by this manifest is
+        **stale** (i.e., requires regeneration), rehashing all source files
+        touched since this manifest was last written as a side effect.
+
+        Specifically, this method returns ``True`` only if either:
+
+        * This manifest does *not* exist or is unreadable or malformed.
+        * The version of the tool recorded by this manifest differs from the
+          current version of that tool.
+        * The set of source files recorded by this manifest differs from the
+          current set of source files (e.g., due to a source file having been
+          added to or removed from a source directory).
+        * The content hash of any source file differs from that recorded by
+          this manifest.
+
+        If this method returns ``False`` but one or more source files were
+        touched without being modified, this manifest is silently rewritten to
+        record their new modification times, avoiding rehashing these files
+        on subsequent calls to this method.
+        '''
+
+        # Dictionary previously serialized to this manifest if any *OR* "None".
+        manifest_old = self._read()
+
+        # Dictionary mapping from the absolute filename of each source file to
+        # the metadata recorded by this manifest for that file.
+        src_filename_to_stat_hash_old = (
+            manifest_old.get('sources', {}) if manifest_old is not None else
+            {})
+
+        # Describe all current source files, reusing previously recorded
+        # hashes for all untouched files.
+        self._src_filename_to_stat_hash = self._make_src_filename_to_stat_hash(
+            src_filename_to_stat_hash_old)
+
+        # If this manifest is unreadable, malformed, or of a differing format,
+        # this cached file is stale.
+        if (
+            manifest_old is None or
+            manifest_old.get('format') != MANIFEST_FORMAT_VERSION
+        ):
+            logs.log_debug(
+                'Cache manifest "%s" not found or unrecognized.',
+                pathnames.get_basename(self._manifest_filename))
+            return True
+
+        # If this tool has been upgraded or downgraded, this file is stale.
+        if manifest_old.get('tool_version') != self._tool_version:
+            logs.log_debug(
+                'Cache manifest "%s" tool version changed.',
+                pathnames.get_basename(self._manifest_filename))
+            return True
+
+        # If any source file has been added, removed, or modified, this cached
+        # file is stale. Since each value is a 3-list "[mtime_ns, size, hash]",
+        # only the last item of each value is compared.
+        src_filename_to_hash_old = {
+            src_filename: src_stat_hash[-1]
+            for src_filename, src_stat_hash in (
+                src_filename_to_stat_hash_old.items())
+        }
+        src_filename_to_hash_new = {
+            src_filename: src_stat_hash[-1]
+            for src_filename, src_stat_hash in (
+                self._src_filename_to_stat_hash.items())
+        }
+        if src_filename_to_hash_old != src_filename_to_hash_new:
+            logs.log_debug(
+                'Cache manifest "%s" source contents changed.',
+                pathnames.get_basename(self._manifest_filename))
+            return True
+
+        # Else, this cached file is fresh. If one or more source files were
+        # touched without being modified, record their current metadata to
+        # avoid rehashing these files on subsequent calls to this method.
+        if src_filename_to_stat_hash_old != self._src_filename_to_stat_hash:
+            # Attempt to rewrite this manifest. Since failing to do so merely
+            # incurs rehashing on the next call to this method, failure is
+            # non-fatal and hence merely logged.
+            try:
+                self.write()
+            except OSError as exception:
+                logs.log_debug(
+                    'Cache manifest "%s" unwritable: %s',
+                    self._manifest_filename, exception)
+
+        # Return false.
+        return False
+
+    # ..................{ WRITERS                           }..................
+    def write(self) -> None:
+        '''
+        Atomically write this manifest, describing all source files as of the
+        most recent call to the :meth:`is_stale` method.
+
+        This method is typically called only after successfully (re)generating
+        the cached file described by this manifest.
+        '''
+
+        # If the is_stale() method has yet to be called, describe all current
+        # source files by hashing these files.
+        if self._src_filename_to_stat_hash is None:
+            self._src_filename_to_stat_hash = (
+                self._make_src_filename_to_stat_hash({}))
+
+        # Dictionary to be serialized to this manifest.
+        manifest = {
+            'format': MANIFEST_FORMAT_VERSION,
+            'tool_version': self._tool_version,
+            'sources': self._src_filename_to_stat_hash,
+        }
+
+        # Atomically serialize this dictionary to this manifest.
+        with writing_file_atomic(self._manifest_filename) as manifest_filename:
+            with open(manifest_filename, 'w') as manifest_file:
+                json.dump(manifest, manifest_file, indent=1, sort_keys=True)
+
+
+    @contextmanager
+    def writing_trg_file(self):
+        '''
+        Context manager atomically (re)generating the cached file described by
+        this manifest *and* then writing this manifest.
+
+        This context manager yields the absolute filename of a temporary file
+        residing in the same directory as this cached file. The body of the
+        ``with`` statement using this context manager is expected to write the
+        regenerated contents of this cached file to this temporary file. If
+        this body succeeds, this temporary file is atomically renamed to this
+        cached file and this manifest is then written; else, this temporary
+        file is removed and both this cached file and this manifest are
+        preserved as is.
+
+        Ergo, concurrent processes (e.g., two instances of this application
+        started simultaneously) are guaranteed to *never* observe a partially
+        written cached file.
+
+        Yields
+        ----------
+        str
+            Absolute filename of the temporary file to be written.
+        '''
+
+        # Atomically write this cached file.
+        with writing_file_atomic(self._trg_filename) as trg_filename_temp:
+            yield trg_filename_temp
+
+        # Write this manifest *AFTER* successfully writing this cached file.
+        # If this process is killed between these two writes, this manifest is
+        # merely stale and this file is regenerated on the next startup.
+        self.write()
+
+    # ..................{ PRIVATE ~ makers                  }..................
+    def _make_src_filename_to_stat_hash(
+        self, src_filename_to_stat_hash_old: dict) -> dict:
+        '''
+        Dictionary mapping from the absolute filename of each current source
+        file to a 3-list ``[mtime_ns, size, hash]`` describing that file,
+        reusing the hash recorded by the passed dictionary for each file whose
+        modification time and size are unchanged.
+        '''
+
+        # Dictionary to be returned.
+        src_filename_to_stat_hash = {}
+
+        # For the absolute filename of each current source file...
+        for src_filename in self._iter_src_filenames():
+            # Metadata describing this file.
+            src_stat = os.stat(src_filename)
+            src_mtime_ns = src_stat.st_mtime_ns
+            src_size = src_stat.st_size
+
+            # Metadata previously recorded for this file if any *OR* "None".
+            src_stat_hash_old = src_filename_to_stat_hash_old.get(
+                src_filename, None)
+
+            # If this file is untouched since last hashed, reuse that hash.
+            if (
+                src_stat_hash_old is not None and
+                src_stat_hash_old[:2] == [src_mtime_ns, src_size]
+            ):
+                src_hash = src_stat_hash_old[-1]
+            # Else, this file is either new or has been touched. Rehash.
+            else:
+                src_hash = _hash_file(src_filename)
+
+            # Record this metadata.
+            src_filename_to_stat_hash[src_filename] = [
+                src_mtime_ns, src_size, src_hash]
+
+        # Return this dictionary.
+        return src_filename_to_stat_hash
+
+
+    def _iter_src_filenames(self):
+        '''
+        Generator iteratively yielding the absolute filename of each source
+        file, recursively yielding all files in each source directory in a
+        deterministic (i.e., lexicographically sorted) order.
+        '''
+
+        # For the pathname of each source path...
+        for src_pathname in self._src_pathnames:
+            # If this path is a directory, recursively yield all files in this
+            # directory in sorted order.
+            if os.path.isdir(src_pathname):
+                for parent_dirname, child_dirnames, child_filenames in os.walk(
+                    src_pathname):
+                    # Sort subdirectories in-place, ensuring os.walk() visits
+                    # these subdirectories in sorted order as well.
+                    child_dirnames.sort()
+
+                    # Ignore bytecode, which Python freely regenerates and
+                    # which hence conveys no meaningful change.
+                    child_dirnames[:] = [
+                        child_dirname
+                        for child_dirname in child_dirnames
+                        if child_dirname != '__pycache__'
+                    ]
+
+                    # Yield all files in this subdirectory in sorted order.
+                    for child_filename in sorted(child_filenames):
+                        yield os.path.join(parent_dirname, child_filename)
+            # Else, this path is a file. Yield this file.
+            else:
+                yield src_pathname
+
+    # ..................{ PRIVATE ~ readers                 }..................
+    def _read(self):
+        '''
+        Dictionary deserialized from this manifest if this manifest exists and
+        is well-formed *or* ``None`` otherwise.
+        '''
+
+        # Attempt to deserialize this manifest.
+        try:
+            with open(self._manifest_filename, 'r') as manifest_file:
+                manifest = json.load(manifest_file)
+        # If this manifest does not exist or is malformed, return "None".
+        except (OSError, ValueError):
+            return None
+
+        # Return this dictionary if this manifest is a dictionary *OR* "None".
+        return manifest if isinstance(manifest, dict) else None
+
+# ....................{ GETTERS                           }....................
+@type_check
+def get_manifest_filename(trg_filename: str) -> str:
+    '''
+    Absolute filename of the manifest describing the cached file with the
+    passed absolute filename.
+    '''
+
+    return trg_filename + '.' + MANIFEST_FILETYPE
+
+# ....................{ COPIERS                           }....................
+@type_check
+def copy_cache_file(src_filename: str, trg_filename: str) -> None:
+    '''
+    Atomically copy the cached file with the passed source filename *and* the
+    manifest describing that file if any to the passed target filename,
+    silently replacing the existing target file and manifest if any.
+
+    If no such source manifest exists, the target manifest is removed if
+    found, ensuring that the target file is subsequently treated as stale.
+
+    Parameters
+    ----------
+    src_filename : str
+        Absolute filename of the cached file to be copied.
+    trg_filename : str
+        Absolute filename to copy this file to.
+    '''
+
+    # Log this copy.
+    logs.log_debug(
+        'Copying cached file "%s" to "%s"...', src_filename, trg_filename)
+
+    # Absolute filenames of the source and target manifests.
+    src_manifest_filename = get_manifest_filename(src_filename)
+    trg_manifest_filename = get_manifest_filename(trg_filename)
+
+    # Atomically copy this file.
+    with writing_file_atomic(trg_filename) as trg_filename_temp:
+        shutil.copyfile(src_filename, trg_filename_temp)
+
+    # If this source manifest exists, atomically copy this manifest as well.
+    if os.path.isfile(src_manifest_filename):
+        with writing_file_atomic(
+            trg_manifest_filename) as trg_manifest_filename_temp:
+            shutil.copyfile(src_manifest_filename, trg_manifest_filename_temp)
+    # Else if this target manifest exists, remove this manifest.
+    elif os.path.isfile(trg_manifest_filename):
+        os.remove(trg_manifest_filename)
+
+# ....................{ PRIVATE ~ hashers                 }....................
+def _hash_file(filename: str) -> str:
+    '''
+    Hexadecimal SHA-256 hash of the contents of the file with the passed
+    filename.
+    '''
+
+    # Hasher to be iteratively updated with the contents of this file.
+    file_hasher = hashlib.sha256()
+
+    # Iteratively hash this file in fixed-size chunks, avoiding reading large
+    # files (e.g., the "rcc" executable) into memory in their entirety.
+    with open(filename, 'rb') as file_bytes:
+        for file_chunk in iter(lambda: file_bytes.read(65536), b''):
+            file_hasher.update(file_chunk)
+
+    # Return this hash.
+    return file_hasher.hexdigest()
@@ -10,10 +10,53 @@ Qt Designer application.
 '''
 
 # ....................{ IMPORTS                           }....................
+from PySide2.QtCore import QResource
 from betse.util.io.log import logs
 from betse.util.path import files, pathnames, paths
 from betse.util.os.command import cmdrun, cmds
 from betse.util.type.types import type_check
+from betsee.guiexception import BetseeCacheException
+
+# ....................{ REGISTRARS                        }....................
+@type_check
+def register_rcc_file(rcc_filename: str) -> None:
+    '''
+    Register all binary resources compiled into the binary Qt resource
+    collection (RCC) file with the passed ``.rcc``-suffixed filename with the
+    Qt resource system, rendering these resources accessible via the ``:/``
+    resource path prefix.
+
+    Unlike importing the pure-Python module generated by the
+    :func:`convert_qrc_to_py_file` function, registering this file neither
+    parses nor unmarshals Python code *and* avoids copying these resources
+    into the heap of the active Python process. Instead, Qt memory-maps this
+    file where supported by the current platform.
+
+    Parameters
+    ----------
+    rcc_filename : str
+        Absolute or relative filename of the ``.rcc``-suffixed file to be
+        registered.
+
+    Raises
+    ----------
+    BetseeCacheException
+        If Qt fails to register this file (e.g., due to this file being
+        malformed).
+    '''
+
+    # Log this registration.
+    logs.log_debug(
+        'Registering PySide2 resources "%s"...',
+        pathnames.get_basename(rcc_filename))
+
+    # If this file does *NOT* exist, raise an exception.
+    files.die_unless_file(rcc_filename)
+
+    # If Qt fails to register this file, raise an exception.
+    if not QResource.registerResource(rcc_filename):
+        raise BetseeCacheException(
+            'Qt resource collection "{}" unregistrable.'.format(rcc_filename))
 
 # ....................{ CONVERTERS                        }....................
 @type_check
@@ -84,3 +127,71 @@ def convert_qrc_to_py_file(qrc_filename: str, py_filename: str) -> None:
     #FIXME: The contents of this output "py_filename" should additionally be
     #opened for writing and prefixed by a shebang line running the active Python
     #interpreter. See the "guipsdcacheui" submodule for relevant logic.
+
+
+@type_check
+def convert_qrc_to_rcc_file(qrc_filename: str, rcc_filename: str) -> None:
+    '''
+    Convert the XML-formatted file with the passed ``.qrc``-suffixed filename
+    *and* all binary resources referenced by this file exported by the external
+    Qt Designer GUI into the binary Qt resource collection (RCC) file with the
+    passed ``.rcc``-suffixed filename.
+
+    This function requires the optional third-party dependency
+    ``pyside2-tools`` distributed by The Qt Company. Specifically, this
+    high-level function wraps the low-level ``rcc`` command installed by that
+    dependency with a human-usable API.
+
+    Parameters
+    ----------
+    qrc_filename : str
+        Absolute or relative filename of the input ``.qrc``-suffixed file.
+    rcc_filename : str
+        Absolute or relative filename of the output ``.rcc``-suffixed file.
+
+    See Also
+    ----------
+    :func:`register_rcc_file`
+        Function registering the output file with the Qt resource system.
+    '''
+
+    # Log this conversion attempt.
+    logs.log_info(
+        'Synchronizing PySide2 resources "%s" from "%s"...',
+        pathnames.get_basename(rcc_filename),
+        pathnames.get_basename(qrc_filename))
+
+    # If "rcc" is *NOT* in the current ${PATH}, raise an exception.
+    cmds.die_unless_command(
+        filename='rcc',
+        reason='(e.g., as package "pyside2-tools" not installed).')
+
+    # If this input file does *NOT* exist, raise an exception.
+    files.die_unless_file(qrc_filename)
+
+    # If this output file is unwritable, raise an exception.
+    paths.die_unless_writable(rcc_filename)
+
+    # If these files do *NOT* have the expected filetypes, raise an exception.
+    pathnames.die_unless_filetype_equals(pathname=qrc_filename, filetype='qrc')
+    pathnames.die_unless_filetype_equals(pathname=rcc_filename, filetype='rcc')
+
+    # Convert this input file to this output file if successful *OR* raise an
+    # exception otherwise. See convert_qrc_to_py_file() for further details.
+    cmdrun.log_output_or_die(
+        command_words=(
+            'rcc',
+            # Avoid compressing media files referenced by the input QRC file.
+            # Since uncompressed resources are directly memory-mappable by Qt,
+            # this also avoids decompressing these resources at runtime.
+            '--compress-algo', 'none',
+            # Output something other than nothing (the default).
+            '--verbose',
+            # Output a binary resource collection rather than C++ (the
+            # default).
+            '--binary',
+            # Output to this file rather than stdout (the default).
+            '--output', rcc_filename,
+            # Input the contents of this QRC file.
+            qrc_filename,
+        ))
@@ -21,6 +21,7 @@ from betse.util.py.pyident import IDENTIFIER_UNQUALIFIED_REGEX
 from betse.util.type.cls import classes
 from betse.util.type.text import regexes
 from betse.util.type.types import type_check, MappingType
+from betsee import guimetadata
 from betsee.guiexception import BetseeCacheException
 from io import StringIO
 
@@ -402,6 +403,10 @@ def _munge_ui_code(
     * Globally replaces all lines of this code reducing vector SVG icons to
       non-vector in-memory pixmaps with lines preserving these icons as is. See
       this function's body for detailed commentary.
+    * Removes the line of this code importing the pure-Python submodule
+      embedding all binary resources required by this UI, which the
+      :func:`betsee.lib.pyside2.cache.guipsdcache.init` function instead
+      registers explicitly (preferably from a binary resource collection).
     * For the name of each instance variable of the main window and
       application-specific subclass to instantiate that variable to in the
       passed dictonary, replaces the single line of this code instantiating
@@ -467,6 +472,19 @@ def _munge_ui_code(
         replacement=r'\1File(\2, QtCore.QSize()\3',
     )
 
+    # Globally remove the line of this code importing the pure-Python
+    # submodule embedding all binary resources required by this UI (e.g.,
+    # "import betsee_rc"). Importing this submodule requires Python to parse
+    # and unmarshal every such resource into heap memory on every startup.
+    # Instead, the guipsdcache.init() function explicitly registers these
+    # resources *BEFORE* this UI is imported -- preferably by memory-mapping a
+    # binary resource collection and only importing this submodule otherwise.
+    ui_code_str = regexes.replace_substrs_line(
+        text=ui_code_str,
+        regex=r'^import {}$'.format(guimetadata.MAIN_WINDOW_QRC_MODULE_NAME),
+        replacement='',
+    )
+
     # For the name of each instance variable of the main window and
     # application-specific subclass to instantiate that variable to...
     for promote_obj_name, promote_class in (
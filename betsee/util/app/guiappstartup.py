@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Submodule providing the **startup profiler** (i.e., hierarchical timer
+recording the wall time, import time, and resident memory consumed by each
+phase of this application's startup) singleton for this application.
+
+This profiler is disabled by default, in which case all functions defined by
+this submodule reduce to efficient noops. This profiler is enabled *only* when
+the end user passes the ``--profile-startup`` command-line option, in which
+case a report of all profiled phases is written on the first iteration of the
+main event loop (i.e., immediately after the main window is first displayed).
+'''
+
+# ....................{ IMPORTS                           }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable exceptions on application startup, the
+# top-level of this module may import *ONLY* from submodules guaranteed to:
+# * Exist, including standard Python and application modules, including both
+#   BETSEE and BETSE modules.
+# * Never raise exceptions on importation (e.g., due to module-level logic).
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+from betse.util.io.log import logs
+from betse.util.path import pathnames
+from betse.util.type.types import (
+    type_check, GeneratorType, IntOrNoneTypes)
+from contextlib import contextmanager
+import builtins, json, os, sys, threading, time
+
+# ....................{ GLOBALS                           }....................
+# This global is initialized by the init() function called elsewhere.
+_STARTUP_PROFILER = None
+'''
+Startup profiler singleton for this application if the ``--profile-startup``
+command-line option was passed *or* ``None`` otherwise.
+'''
+
+# ....................{ CONSTANTS                         }....................
+REPORT_FORMAT_VERSION = 1
+'''
+Version of the JSON-formatted report written by the startup profiler.
+
+This version should be incremented on each backward-incompatible change to the
+structure of this report, permitting external consumers (e.g., deployment
+pipelines comparing startup times across releases) to detect such changes.
+'''
+
+
+REPORT_FOLDED_FILETYPE = 'folded'
+'''
+Filetype of reports written by the startup profiler in the **folded stack
+format** (i.e., plaintext format whose lines are each a semicolon-delimited
+stack of phase names suffixed by the self time of the last such phase in
+integer microseconds) consumed by flame graph generators (e.g.,
+``flamegraph.pl``, ``speedscope``, ``inferno``).
+
+Reports with all other filetypes are written in JSON format.
+'''
+
+# ....................{ CLASSES                           }....................
+class StartupPhase(object):
+    '''
+    **Startup phase** (i.e., named contiguous interval of this application's
+    startup profiled by the startup profiler, possibly containing one or more
+    nested child phases).
+
+    Attributes
+    ----------
+    children : list
+        List of all child phases nested in this phase in starting order.
+    import_seconds : float
+        Wall time in fractional seconds spent importing modules from the main
+        thread during this phase, including that of all child phases.
+    module_count : int
+        Number of modules newly imported during this phase, including those of
+        all child phases.
+    name : str
+        Human-readable name of this phase, unique among its sibling phases.
+    rss_bytes_start : IntOrNoneTypes
+        Resident set size (RSS) in bytes of the active Python process at the
+        start of this phase if retrievable on the current platform *or*
+        ``None`` otherwise.
+    rss_bytes_stop : IntOrNoneTypes
+        Resident set size (RSS) in bytes of the active Python process at the
+        end of this phase if retrievable on the current platform *or* ``None``
+        otherwise.
+    wall_seconds : float
+        Wall time in fractional seconds spent in this phase, including that of
+        all child phases.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, name: str) -> None:
+        '''
+        Initialize this startup phase.
+
+        Parameters
+        ----------
+        name : str
+            Human-readable name of this phase.
+        '''
+
+        # Classify all passed parameters.
+        self.name = name
+
+        # Default all remaining instance variables.
+        self.children = []
+        self.import_seconds = 0.0
+        self.module_count = 0
+        self.rss_bytes_start = None
+        self.rss_bytes_stop = None
+        self.wall_seconds = 0.0
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def self_seconds(self) -> float:
+        '''
+        Wall time in fractional seconds spent in this phase, excluding that of
+        all child phases.
+        '''
+
+        return max(
+            self.wall_seconds -
+            sum(child.wall_seconds for child in self.children),
+            0.0)
+
+    # ..................{ EXPORTERS                         }..................
+    def to_dict(self) -> dict:
+        '''
+        JSON-serializable dictionary describing this phase *and* all child
+        phases of this phase recursively.
+        '''
+
+        return {
+            'name': self.name,
+            'wall_seconds': self.wall_seconds,
+            'self_seconds': self.self_seconds,
+            'import_seconds': self.import_seconds,
+            'module_count': self.module_count,
+            'rss_bytes_start': self.rss_bytes_start,
+            'rss_bytes_stop': self.rss_bytes_stop,
+            'children': [child.to_dict() for child in self.children],
+        }
+
+
+    def iter_folded_lines(self, stack_prefix: str = '') -> GeneratorType:
+        '''
+        Generator iteratively yielding one line in the folded stack format for
+        this phase *and* all child phases of this phase recursively.
+
+        Parameters
+        ----------
+        stack_prefix : str
+            Semicolon-delimited stack of the names of all parent phases of this
+            phase suffixed by a semicolon if this phase has a parent phase *or*
+            the empty string otherwise. Defaults to the empty string.
+
+        See Also
+        ----------
+        :data:`REPORT_FOLDED_FILETYPE`
+            Further details.
+        '''
+
+        # Semicolon-delimited stack of the names of this and all parent phases.
+        # Since semicolons and whitespace delimit this format, these
+        # characters are replaced in this name by underscores.
+        stack = stack_prefix + self.name.replace(';', '_').replace(' ', '_')
+
+        # Yield this phase's line.
+        yield '{} {}'.format(stack, int(round(self.self_seconds * 1000000)))
+
+        # Yield the lines of all child phases recursively.
+        for child in self.children:
+            yield from child.iter_folded_lines(stack_prefix=stack + ';')
+
+
+class StartupProfiler(object):
+    '''
+    **Startup profiler** (i.e., hierarchical timer recording the wall time,
+    import time, and resident memory consumed by each phase of this
+    application's startup).
+
+    Import Time
+    ----------
+    Import time is recorded by temporarily replacing the builtin
+    :func:`__import__` function with a wrapper timing each outermost import
+    performed by the main thread (i.e., excluding imports nested in other
+    imports, whose time is already included in that of the outermost import).
+    Since the :func:`importlib.import_module` function bypasses that builtin,
+    modules dynamically imported by that function are excluded from this
+    time but *not* from the number of newly imported modules.
+
+    Attributes
+    ----------
+    _import_depth : int
+        Current depth of nested imports performed by the main thread.
+    _import_func_orig : CallableTypes
+        Builtin :func:`__import__` function replaced by the :meth:`_import`
+        method for the duration of profiling.
+    _import_seconds : float
+        Total wall time in fractional seconds spent importing modules from the
+        main thread since profiling started.
+    _phase_root : StartupPhase
+        Root phase encapsulating the entirety of this application's startup.
+    _phase_stack : list
+        Stack of all currently started phases, whose first item is the root
+        phase and whose last item is the currently active phase.
+    _phase_stack_starts : list
+        Stack of 3-tuples ``(wall_seconds, import_seconds, module_count)``
+        recorded at the start of each currently started phase, such that the
+        *n*-th item of this stack corresponds to the *n*-th item of the
+        :attr:`_phase_stack`.
+    _report_filename : str
+        Absolute or relative filename of the report to be written.
+    _thread_main : threading.Thread
+        Main thread, the only thread whose imports are timed.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(self, report_filename: str) -> None:
+        '''
+        Initialize this startup profiler *and* start profiling the root phase.
+
+        Parameters
+        ----------
+        report_filename : str
+            Absolute or relative filename of the report to be written by the
+            :meth:`stop` method. If this filename has the filetype
+            :data:`REPORT_FOLDED_FILETYPE`, this report is written in the
+            folded stack format; else, this report is written in JSON format.
+        '''
+
+        # Classify all passed parameters.
+        self._report_filename = report_filename
+
+        # Initialize all remaining instance variables.
+        self._import_depth = 0
+        self._import_func_orig = builtins.__import__
+        self._import_seconds = 0.0
+        self._phase_root = StartupPhase(name='startup')
+        self._phase_stack = []
+        self._phase_stack_starts = []
+        self._thread_main = threading.main_thread()
+
+        # Time all subsequent imports.
+        builtins.__import__ = self._import
+
+        # Start profiling the root phase.
+        self._start_phase(self._phase_root)
+
+    # ..................{ PHASERS                           }..................
+    @contextmanager
+    @type_check
+    def profiling_phase(self, name: str) -> GeneratorType:
+        '''
+        Context manager profiling the block of code executed by this context
+        as a new child phase of the currently active phase.
+
+        Parameters
+        ----------
+        name : str
+            Human-readable name of this phase.
+        '''
+
+        # Child phase to be profiled.
+        phase = StartupPhase(name=name)
+
+        # Add this phase to the currently active phase.
+        self._phase_stack[-1].children.append(phase)
+
+        # Profile this phase for the duration of this context.
+        self._start_phase(phase)
+        try:
+            yield
+        finally:
+            self._stop_phase()
+
+
+    @type_check
+    def start_phase(self, name: str) -> None:
+        '''
+        Start profiling a new child phase of the currently active phase,
+        implicitly stopped by the subsequent call to the :meth:`stop` method.
+
+        Unlike the :meth:`profiling_phase` context manager, this method
+        profiles phases spanning the main event loop (e.g., the time to first
+        paint of the main window, which ends only on the first iteration of
+        that loop).
+
+        Parameters
+        ----------
+        name : str
+            Human-readable name of this phase.
+        '''
+
+        # Child phase to be profiled.
+        phase = StartupPhase(name=name)
+
+        # Add this phase to the currently active phase.
+        self._phase_stack[-1].children.append(phase)
+
+        # Profile this phase until this profiler is stopped.
+        self._start_phase(phase)
+
+
+    def _start_phase(self, phase: StartupPhase) -> None:
+        '''
+        Start profiling the passed phase as the currently active phase.
+        '''
+
+        # Record the resident memory consumed by this process.
+        phase.rss_bytes_start = _get_rss_bytes()
+
+        # Push this phase onto this stack.
+        self._phase_stack.append(phase)
+        self._phase_stack_starts.append(
+            (time.perf_counter(), self._import_seconds, len(sys.modules)))
+
+
+    def _stop_phase(self) -> None:
+        '''
+        Stop profiling the currently active phase.
+        '''
+
+        # Pop this phase and its starting metrics off this stack.
+        phase = self._phase_stack.pop()
+        wall_seconds_start, import_seconds_start, module_count_start = (
+            self._phase_stack_starts.pop())
+
+        # Record all metrics describing this phase.
+        phase.wall_seconds = time.perf_counter() - wall_seconds_start
+        phase.import_seconds = self._import_seconds - import_seconds_start
+        phase.module_count = len(sys.modules) - module_count_start
+        phase.rss_bytes_stop = _get_rss_bytes()
+
+    # ..................{ STOPPERS                          }..................
+    def stop(self) -> None:
+        '''
+        Stop profiling the root phase and all currently active child phases
+        of that phase *and* write a report describing all profiled phases.
+        '''
+
+        # Restore the builtin importer *BEFORE* doing anything else.
+        builtins.__import__ = self._import_func_orig
+
+        # Stop profiling all currently active phases, including the root.
+        while self._phase_stack:
+            self._stop_phase()
+
+        # Log this report.
+        logs.log_info(
+            'Started up in %.3f seconds '
+            '(%.3f seconds importing %d modules); '
+            'writing startup profile "%s"...',
+            self._phase_root.wall_seconds,
+            self._phase_root.import_seconds,
+            self._phase_root.module_count,
+            self._report_filename)
+
+        # If this report is to be written in the folded stack format, do so.
+        if pathnames.get_filetype_undotted_or_none(self._report_filename) == (
+            REPORT_FOLDED_FILETYPE):
+            with open(self._report_filename, 'w') as report_file:
+                for report_line in self._phase_root.iter_folded_lines():
+                    report_file.write(report_line + '\n')
+        # Else, write this report in JSON format.
+        else:
+            with open(self._report_filename, 'w') as report_file:
+                json.dump({
+                    'format': REPORT_FORMAT_VERSION,
+                    'python_version': sys.version.split()[0],
+                    'platform': sys.platform,
+                    'phase': self._phase_root.to_dict(),
+                }, report_file, indent=2)
+
+    # ..................{ IMPORTERS                         }..................
+    def _import(self, *args, **kwargs) -> object:
+        '''
+        Wrapper replacing the builtin :func:`__import__` function for the
+        duration of profiling, timing each outermost import performed by the
+        main thread.
+        '''
+
+        # If this import is either nested in another import *OR* performed by
+        # a thread other than the main thread, defer to the original importer.
+        if (
+            self._import_depth or
+            threading.current_thread() is not self._thread_main
+        ):
+            return self._import_func_orig(*args, **kwargs)
+
+        # Else, time this outermost import.
+        self._import_depth += 1
+        import_time_start = time.perf_counter()
+        try:
+            return self._import_func_orig(*args, **kwargs)
+        finally:
+            self._import_seconds += time.perf_counter() - import_time_start
+            self._import_depth -= 1
+
+# ....................{ INITIALIZERS                      }....................
+@type_check
+def init(report_filename: str) -> None:
+    '''
+    Enable the startup profiler singleton, profiling all subsequent startup
+    phases *and* writing a report describing these phases to the file with the
+    passed filename on the subsequent call to the :func:`deinit` function.
+
+    Parameters
+    ----------
+    report_filename : str
+        Absolute or relative filename of this report. See the
+        :meth:`StartupProfiler.__init__` method for further details.
+    '''
+
+    # Globals modified below.
+    global _STARTUP_PROFILER
+
+    # Log this initialization.
+    logs.log_debug('Enabling startup profiler...')
+
+    # Enable this profiler.
+    _STARTUP_PROFILER = StartupProfiler(report_filename=report_filename)
+
+
+def deinit() -> None:
+    '''
+    Disable the startup profiler singleton *and* write a report describing all
+    profiled startup phases if this profiler is enabled *or* silently reduce to
+    a noop otherwise.
+    '''
+
+    # Globals modified below.
+    global _STARTUP_PROFILER
+
+    # If this profiler is disabled, silently noop.
+    if _STARTUP_PROFILER is None:
+        return
+
+    # Localize and disable this profiler *BEFORE* stopping this profiler,
+    # guaranteeing this function to be safely callable at most once even in
+    # the event of an exception writing this report.
+    startup_profiler = _STARTUP_PROFILER
+    _STARTUP_PROFILER = None
+
+    # Stop this profiler and write this report.
+    startup_profiler.stop()
+
+# ....................{ TESTERS                           }....................
+def is_enabled() -> bool:
+    '''
+    ``True`` only if the startup profiler singleton is currently enabled.
+    '''
+
+    return _STARTUP_PROFILER is not None
+
+# ....................{ CONTEXTS                          }....................
+@contextmanager
+@type_check
+def profiling_phase(name: str) -> GeneratorType:
+    '''
+    Context manager profiling the block of code executed by this context as a
+    new child phase of the currently active startup phase if the startup
+    profiler singleton is enabled *or* reducing to a noop otherwise.
+
+    Parameters
+    ----------
+    name : str
+        Human-readable name of this phase.
+    '''
+
+    # If this profiler is disabled, reduce to a noop.
+    if _STARTUP_PROFILER is None:
+        yield
+    # Else, profile this phase.
+    else:
+        with _STARTUP_PROFILER.profiling_phase(name):
+            yield
+
+# ....................{ STARTERS                          }....................
+@type_check
+def start_phase(name: str) -> None:
+    '''
+    Start profiling a new child phase of the currently active startup phase,
+    implicitly stopped by the subsequent call to the :func:`deinit` function,
+    if the startup profiler singleton is enabled *or* silently reduce to a noop
+    otherwise.
+
+    Parameters
+    ----------
+    name : str
+        Human-readable name of this phase. See the
+        :meth:`StartupProfiler.start_phase` method for further details.
+    '''
+
+    # If this profiler is enabled, profile this phase.
+    if _STARTUP_PROFILER is not None:
+        _STARTUP_PROFILER.start_phase(name)
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_rss_bytes() -> IntOrNoneTypes:
+    '''
+    Resident set size (RSS) in bytes of the active Python process if
+    retrievable on the current platform *or* ``None`` otherwise.
+
+    Specifically, this getter returns:
+
+    * Under Linux, the current RSS of this process.
+    * Under other POSIX-compatible platforms (e.g., macOS), the peak rather
+      than current RSS of this process.
+    * Under all other platforms (e.g., Windows), ``None``.
+    '''
+
+    # Attempt to retrieve the current RSS from the Linux-specific "statm"
+    # pseudo-file, whose second field is this RSS in pages.
+    try:
+        with open('/proc/self/statm', 'r') as statm_file:
+            return (
+                int(statm_file.read().split()[1]) *
+                os.sysconf('SC_PAGE_SIZE'))
+    # If this platform is *NOT* Linux, fallback to the next approach.
+    except (OSError, ValueError, IndexError):
+        pass
+
+    # Attempt to import the POSIX-specific "resource" module.
+    try:
+        import resource
+    # If this platform is *NOT* POSIX-compatible, report failure.
+    except ImportError:
+        return None
+
+    # Peak RSS of this process in platform-specific units.
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Return this RSS in bytes. Whereas macOS reports this RSS in bytes, all
+    # other POSIX-compatible platforms report this RSS in kilobytes.
+    return rss_peak if sys.platform == 'darwin' else rss_peak * 1024
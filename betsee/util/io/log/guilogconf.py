@@ -24,15 +24,55 @@ from betse.util.io.log.conf import logconf
 from betse.util.io.log.logenum import LogLevel
 from betse.util.io.log.logfilter import LogFilterThirdPartyDebug
 from betse.util.type.types import type_check
-from betsee.util.io.log.guiloghandle import LogHandlerSignal
+from betsee.util.io.log.guiloghandle import LogHandlerSignalBuffered
 from betsee.util.widget.stock.guitextedit import QBetseePlainTextEdit
+import sys
+
+# ....................{ CONSTANTS                         }....................
+LOG_BLOCK_COUNT_MAX = 10000
+'''
+Maximum number of **blocks** (i.e., lines) of log messages retained by the
+text widget passed to the :func:`log_to_text_edit` function, beyond which the
+oldest such blocks are discarded from the top of that widget.
+
+Since this widget is typically displayed for the entire lifetime of this
+application, an unbounded widget would consume unbounded memory *and* slow
+appending to that widget as its document grows.
+'''
 
 # ....................{ INITIALIZERS                      }....................
+def log_stdout_to_stderr() -> None:
+    '''
+    Redirect all log records otherwise printed to standard output by the
+    default logging configuration for the active Python process to standard
+    error instead, reserving the former for machine-readable output (e.g., the
+    progress stream written by the ``betsee --batch-conf-files`` mode).
+
+    This function is thread-safe. Since the
+    :meth:`logging.StreamHandler.setStream` method is unavailable under Python
+    3.6, this function instead replaces the stream of the standard output
+    handler under that handler's lock, as that method does.
+    '''
+
+    # Root logger handler printing to standard output.
+    handler_stdout = logconf.get_log_conf().handler_stdout
+
+    # Flush all log records previously printed to standard output *BEFORE*
+    # replacing that stream, preventing these records from being interleaved
+    # with records printed to standard error.
+    handler_stdout.acquire()
+    try:
+        handler_stdout.flush()
+        handler_stdout.stream = sys.stderr
+    finally:
+        handler_stdout.release()
+
+
 @type_check
 def log_to_text_edit(text_edit: QBetseePlainTextEdit) -> None:
     '''
     Append all unfiltered log records to the passed text widget in an
-    autoscrolling, non-blocking, thread-safe manner.
+    autoscrolling, non-blocking, thread-safe, batched manner.
 
     This function integrates the default logging configuration for the active
     Python process with the current :mod:`PySide2` application. Specifically,
@@ -45,6 +85,11 @@ def log_to_text_edit(text_edit: QBetseePlainTextEdit) -> None:
       option), all log records.
     * Else, all log records with level ``LogLevel.INFO`` and higher.
 
+    These records are buffered and periodically appended to this widget in
+    batches by a :class:`LogHandlerSignalBuffered` handler. This widget is
+    additionally bounded to retain at most :data:`LOG_BLOCK_COUNT_MAX` lines,
+    preventing verbose logging from stalling the GUI.
+
     Parameters
     ----------
     text_edit : QBetseePlainTextEdit
@@ -54,9 +99,14 @@ def log_to_text_edit(text_edit: QBetseePlainTextEdit) -> None:
     # Global logging configuration.
     log_config = logconf.get_log_conf()
 
-    # Root logger handler redirecting to all slots connected to a signal.
-    logger_root_handler_signal = LogHandlerSignal(
-        signal=text_edit.append_text_signal)
+    # Discard the oldest lines of this widget on exceeding this maximum.
+    text_edit.setMaximumBlockCount(LOG_BLOCK_COUNT_MAX)
+
+    # Root logger handler periodically redirecting batches of log records to
+    # all slots connected to a signal, whose flush timer is owned by this
+    # widget.
+    logger_root_handler_signal = LogHandlerSignalBuffered(
+        signal=text_edit.append_text_signal, timer_parent=text_edit)
 
     # If verbosity is enabled, redirect all log records; else, only redirect
     # log records with level "INFO" and higher.
@@ -8,10 +8,26 @@ Low-level :mod:`PySide2`-specific logging handler subclasses.
 '''
 
 # ....................{ IMPORTS                           }....................
-from PySide2.QtCore import Signal
+from PySide2.QtCore import QObject, QTimer, Signal
 from betse.util.type.types import type_check
+from collections import deque
 from logging import Handler
 
+# ....................{ CONSTANTS                         }....................
+LOG_FLUSH_INTERVAL_MILLISECONDS_DEFAULT = 100
+'''
+Default number of milliseconds between each flush of the log records buffered
+by the :class:`LogHandlerSignalBuffered` handler.
+'''
+
+
+LOG_RECORD_COUNT_MAX_DEFAULT = 4096
+'''
+Default maximum number of log records buffered by the
+:class:`LogHandlerSignalBuffered` handler between flushes, beyond which the
+oldest such records are dropped.
+'''
+
 # ....................{ CLASSES                           }....................
 #FIXME: Post as an answer to the following StackOverflow question:
 #    https://stackoverflow.com/questions/14349563/how-to-get-non-blocking-real-time-behavior-from-python-logging-module-output-t
@@ -80,3 +96,180 @@ class LogHandlerSignal(Handler):
         # Ergo, nullifying this instance variable on the first call to this
         # method is the optimal solution.
         self._signal = None
+
+# ....................{ SUBCLASSES                        }....................
+class LogHandlerSignalBuffered(LogHandlerSignal):
+    '''
+    Buffered :class:`Signal`-based handler, periodically redirecting all log
+    records sent to this handler since the prior such redirection as a single
+    batch to each slot connected to the signal with which this handler was
+    initialized.
+
+    The superclass handler emits one signal for each log record. When logging
+    from non-main threads (e.g., pooled simulator workers logging debug
+    messages under the ``--verbose`` option), each such signal is a queued
+    cross-thread signal whose slot appends to a text widget. At thousands of
+    records per second, this stalls the main event loop. This handler instead:
+
+    * Appends each formatted log record to a bounded double-ended queue. Since
+      appending to and popping from a :class:`collections.deque` are atomic
+      operations under the GIL, this queue requires no explicit locking and
+      hence never blocks the logging thread.
+    * Periodically flushes this queue from the main event thread on a timer,
+      joining all buffered records into a single newline-delimited string
+      emitted via a single signal.
+    * Drops the oldest buffered records under overload (i.e., when more than
+      the maximum number of records are logged between two flushes), noting
+      the number of dropped records in the next flush.
+
+    Attributes
+    ----------
+    _flush_timer : QTimer
+        Timer residing in the thread in which this handler was instantiated
+        (typically, the main event thread), periodically flushing this buffer.
+    _record_messages : QueueType
+        Bounded double-ended queue of all log messages formatted from log
+        records sent to this handler since the prior flush.
+    _record_dropped_count : int
+        Number of log records dropped since the prior flush.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+
+        # Mandatory parameters.
+        signal: Signal,
+        timer_parent: QObject,
+
+        # Optional parameters.
+        flush_interval: int = LOG_FLUSH_INTERVAL_MILLISECONDS_DEFAULT,
+        record_count_max: int = LOG_RECORD_COUNT_MAX_DEFAULT,
+
+        # Variadic parameters.
+        **kwargs
+    ) -> None:
+        '''
+        Initialize this handler to log with the passed signal.
+
+        Caveats
+        ----------
+        **This handler must be instantiated from a thread running a Qt event
+        loop** (typically, the main event thread). Why? Because the timer
+        flushing this handler resides in that thread.
+
+        Parameters
+        ----------
+        signal : Signal
+            Signal to forward batches of log records to.
+        timer_parent : QObject
+            Parent object of the timer periodically flushing this handler,
+            typically the widget owning the passed signal. The lifetime of this
+            timer is thus bound to that of this object.
+        flush_interval : int
+            Number of milliseconds between each flush of this handler. Defaults
+            to :data:`LOG_FLUSH_INTERVAL_MILLISECONDS_DEFAULT`.
+        record_count_max : int
+            Maximum number of log records buffered between flushes. Defaults to
+            :data:`LOG_RECORD_COUNT_MAX_DEFAULT`.
+
+        All remaining parameters are passed as is to our superclass method.
+        '''
+
+        # Initialize our superclass with all remaining passed parameters.
+        super().__init__(signal=signal, **kwargs)
+
+        # Bounded queue of all log messages to be flushed, dropping the oldest
+        # such message on appending to this queue when full.
+        self._record_messages = deque(maxlen=record_count_max)
+        self._record_dropped_count = 0
+
+        # Timer periodically flushing this queue.
+        self._flush_timer = QTimer(timer_parent)
+        self._flush_timer.setInterval(flush_interval)
+        self._flush_timer.timeout.connect(self.flush)
+        self._flush_timer.start()
+
+    # ..................{ EMITTERS                          }..................
+    def emit(self, record) -> None:
+
+        # If this handler has already been closed, silently reduce to a noop.
+        if self._signal is None:
+            return
+
+        # If this queue is full, the oldest log message buffered in this queue
+        # is about to be implicitly dropped by the following append. Note this.
+        #
+        # Note that this test and the following append are *NOT* atomic and
+        # hence may undercount dropped messages under contention. Since this
+        # count is purely informational, this is preferable to locking.
+        if len(self._record_messages) == self._record_messages.maxlen:
+            self._record_dropped_count += 1
+
+        # Append the log message formatted from this log record via this
+        # handler's current log message formatter to this queue. Since log
+        # records may reference mutable objects, this record is formatted
+        # immediately rather than deferred until flushing.
+        self._record_messages.append(self.format(record))
+
+    # ..................{ FLUSHERS                          }..................
+    def flush(self) -> None:
+        '''
+        Forward all log messages buffered since the prior flush as a single
+        newline-delimited string to all slots connected to this signal.
+
+        This method is periodically called by the flush timer from the thread
+        in which this handler was instantiated, but is safely callable from any
+        thread (e.g., by :func:`logging.shutdown` at application exit) *and*
+        after the object owning this signal has been destroyed, in which case
+        this handler is permanently reduced to a noop.
+        '''
+
+        # If this handler has already been closed *OR* no log messages have
+        # been buffered since the prior flush, silently reduce to a noop.
+        if self._signal is None or not self._record_messages:
+            return
+
+        # List of all log messages to be flushed. For thread-safety, each
+        # message is atomically popped from this queue rather than iterating
+        # over this queue, which other threads may concurrently append to.
+        record_messages = []
+
+        # If one or more log messages were dropped since the prior flush,
+        # prefix these messages by a synopsis of these drops.
+        if self._record_dropped_count:
+            record_messages.append(
+                '[{} log record(s) dropped.]'.format(
+                    self._record_dropped_count))
+            self._record_dropped_count = 0
+
+        # Atomically pop each buffered log message.
+        try:
+            while True:
+                record_messages.append(self._record_messages.popleft())
+        # When this queue is empty, cease popping.
+        except IndexError:
+            pass
+
+        # Forward these messages as a single string to all connected slots.
+        try:
+            self._signal.emit('\n'.join(record_messages))
+        # If the C++ object owning this signal has already been destroyed
+        # (e.g., when logging.shutdown() flushes this handler at application
+        # exit *AFTER* the main window owning that object has been garbage
+        # collected), silently discard these messages *AND* reduce this
+        # handler to a noop. These messages have already been logged to all
+        # other handlers (e.g., the logfile handler) and hence are not lost.
+        except RuntimeError:
+            self._signal = None
+
+    # ..................{ CLOSERS                           }..................
+    def close(self) -> None:
+
+        # Flush all remaining log messages *BEFORE* closing our superclass,
+        # which nullifies the signal these messages are flushed to.
+        self.flush()
+
+        # Close our superclass.
+        super().close()
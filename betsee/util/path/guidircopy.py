@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Directory copier** (i.e., functions recursively copying directory trees by
+the cheapest means supported by the underlying filesystems) facilities.
+
+These functions are *not* :mod:`PySide2`-specific and hence safely callable
+from pooled threads.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.util.io.log import logs
+from betse.util.os.brand import linux, macos
+from betse.util.path import dirs, pathnames
+from betse.util.type.enums import make_enum
+from betse.util.type.iterable import tuples
+from betse.util.type.types import (
+    type_check, CallableOrNoneTypes, IterableTypes, IterableOrNoneTypes)
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import errno, fnmatch, os, shutil
+
+# ....................{ CONSTANTS                         }....................
+COPY_THREADS_MAX = 4
+'''
+Maximum number of threads concurrently streaming files when reflinks are
+unsupported.
+
+Since streaming is I/O-bound *and* the :func:`shutil.copy2` function releases
+the GIL while copying, several such threads saturate most local and network
+filesystems. Additional threads only increase seeking on rotational media.
+'''
+
+# ....................{ ENUMS                             }....................
+FileCopyKind = make_enum(
+    class_name='FileCopyKind',
+    member_names=('REFLINK', 'STREAM',),
+    doc='''
+    Enumeration of all means by which the :func:`copy_dirs_into_dir` function
+    copies each file, in descending order of preference.
+
+    Attributes
+    ----------
+    REFLINK : enum
+        **Reflink** (i.e., copy-on-write clone sharing all data blocks with
+        the source file until either is modified), supported by Btrfs, XFS,
+        and OCFS2 under Linux *and* APFS under macOS. Reflinks are constant
+        time regardless of file size.
+    STREAM : enum
+        **Streamed copy** (i.e., full copy of all file data and metadata),
+        performed by the :func:`shutil.copy2` function and hence delegated to
+        the kernel (e.g., :func:`os.sendfile`) where supported.
+
+    Hardlinks are intentionally unsupported, even for source files the current
+    user cannot write. A hardlink shares the inode and hence the permissions
+    of its source file; changing the permissions of either file (e.g., to make
+    the copy writable) changes both, permitting subsequent writes to the copy
+    to silently modify the source file.
+    ''',
+)
+
+# ....................{ TYPES                             }....................
+DirCopyStats = tuples.make_named_subclass(
+    class_name='DirCopyStats',
+    item_names=(
+        'file_count',
+        'byte_count',
+        'kind_to_file_count',
+    ),
+    doc='''
+    Named tuple summarizing a single call to the :func:`copy_dirs_into_dir`
+    function.
+
+    Attributes
+    ----------
+    file_count : int
+        Number of files copied.
+    byte_count : int
+        Total size in bytes of these files.
+    kind_to_file_count : dict
+        Dictionary mapping from each :class:`FileCopyKind` member to the
+        number of files copied by that means.
+    '''
+)
+
+# ....................{ COPIERS                           }....................
+@type_check
+def copy_dirs_into_dir(
+    # Mandatory parameters.
+    src_dirnames: IterableTypes,
+    trg_dirname: str,
+
+    # Optional parameters.
+    ignore_basename_globs: IterableOrNoneTypes = None,
+    progress_callback: CallableOrNoneTypes = None,
+) -> DirCopyStats:
+    '''
+    Recursively copy each source directory with the passed dirnames to a
+    subdirectory of the target directory with the passed dirname whose
+    basename is that of that source directory, silently overwriting all
+    existing target files.
+
+    This function is a drop-in replacement for successively calling the
+    :func:`betse.util.path.dirs.copy_dir_into_dir` function with the
+    :attr:`DirOverwritePolicy.OVERWRITE` policy for each source directory,
+    preserving symbolic links and file metadata as is. Each file is copied by
+    the cheapest means supported by the underlying filesystems, as enumerated
+    by the :class:`FileCopyKind` enumeration. Files that must be streamed are
+    streamed in parallel by up to :data:`COPY_THREADS_MAX` threads.
+
+    Each existing target file is removed *before* being copied over, preventing
+    writes to that file from propagating to other hardlinks of that file.
+
+    Parameters
+    ----------
+    src_dirnames : IterableTypes
+        Iterable of the absolute or relative dirnames of all source
+        directories to be copied from.
+    trg_dirname : str
+        Absolute or relative dirname of the target directory to be copied into.
+    ignore_basename_globs : IterableOrNoneTypes
+        Iterable of shell-style globs (e.g., ``('*.tmp', '.keep')``) matching
+        the basenames of all paths transitively owned by these source
+        directories to be ignored. Defaults to ``None``, in which case no such
+        paths are ignored.
+    progress_callback : CallableOrNoneTypes
+        Callable passed the 2-tuple ``(byte_count_copied, byte_count_total)``
+        after copying each file, always called from the calling thread.
+        Defaults to ``None``, in which case no progress is reported.
+
+    Returns
+    ----------
+    DirCopyStats
+        Summary of this copy.
+
+    Raises
+    ----------
+    BetseDirException
+        If any source directory either does *not* exist or is a parent
+        directory of its target subdirectory.
+    OSError
+        If any path is uncopyable (e.g., due to insufficient permissions).
+    '''
+
+    # Log this copy.
+    logs.log_debug('Copying directories into: %s', trg_dirname)
+
+    # Dirnames of all target directories and pathnames of all target symbolic
+    # links to be created *AND* 3-tuples "(src_filename, trg_filename, size)"
+    # of all files to be copied.
+    dirname_pairs = []
+    link_pairs = []
+    file_triples = []
+
+    # For each source directory, plan the copy of this directory.
+    for src_dirname in src_dirnames:
+        # Absolute dirname of the target subdirectory.
+        trg_subdirname = pathnames.join(
+            trg_dirname, pathnames.get_basename(src_dirname))
+
+        # If this source directory does *NOT* exist or is a parent directory
+        # of this target subdirectory, raise an exception. Permitting the
+        # latter provokes infinite recursion.
+        dirs.die_unless_dir(src_dirname)
+        dirs.die_if_subdir(
+            parent_dirname=src_dirname, child_dirname=trg_subdirname)
+
+        _plan_dir_copy(
+            src_dirname=src_dirname,
+            trg_dirname=trg_subdirname,
+            ignore_basename_globs=ignore_basename_globs or (),
+            dirname_pairs=dirname_pairs,
+            link_pairs=link_pairs,
+            file_triples=file_triples,
+        )
+
+    # Create all target directories and symbolic links *BEFORE* copying files
+    # into these directories.
+    for _, trg_subdirname in dirname_pairs:
+        os.makedirs(trg_subdirname, exist_ok=True)
+    for src_linkname, trg_linkname in link_pairs:
+        _remove_path_if_found(trg_linkname)
+        os.symlink(os.readlink(src_linkname), trg_linkname)
+
+    # Total size in bytes of all files to be copied *AND* copied so far.
+    byte_count_total = sum(size for _, _, size in file_triples)
+    byte_count_copied = 0
+
+    # Dictionary mapping from each means of copying to the number of files
+    # copied by that means.
+    kind_to_file_count = {kind: 0 for kind in FileCopyKind}
+
+    # Copy all files in parallel. Since reflinks complete immediately, only
+    # streamed copies benefit from this parallelism. Note
+    # that progress is reported from this thread rather than these threads,
+    # as callers typically emit signals unsafe to emit from foreign threads.
+    if file_triples:
+        with ThreadPoolExecutor(
+            max_workers=min(COPY_THREADS_MAX, len(file_triples)),
+        ) as executor:
+            futures = [
+                executor.submit(copy_file, src_filename, trg_filename)
+                for src_filename, trg_filename, _ in file_triples
+            ]
+            future_to_size = {
+                future: file_triple[2]
+                for future, file_triple in zip(futures, file_triples)
+            }
+
+            # As each file is copied, report progress.
+            try:
+                for future in as_completed(futures):
+                    kind_to_file_count[future.result()] += 1
+                    byte_count_copied += future_to_size[future]
+                    if progress_callback is not None:
+                        progress_callback(byte_count_copied, byte_count_total)
+            # If any copy failed, cancel all pending copies *BEFORE* reraising
+            # this exception. Exiting this context then waits for all running
+            # copies to finish.
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    # Copy the metadata of all target directories *AFTER* copying all files
+    # into these directories, which would otherwise modify these timestamps.
+    # Directories are iterated in reverse order to copy the metadata of
+    # subdirectories before that of their parents, mimicking copytree().
+    for src_subdirname, trg_subdirname in reversed(dirname_pairs):
+        shutil.copystat(src_subdirname, trg_subdirname)
+
+    # Log and return a summary of this copy.
+    logs.log_debug(
+        'Copied %d file(s) (%s).',
+        len(file_triples),
+        ', '.join(
+            '{}: {}'.format(kind.name.lower(), file_count)
+            for kind, file_count in kind_to_file_count.items()
+        ),
+    )
+    return DirCopyStats(
+        file_count=len(file_triples),
+        byte_count=byte_count_total,
+        kind_to_file_count=kind_to_file_count,
+    )
+
+
+@type_check
+def copy_file(src_filename: str, trg_filename: str) -> FileCopyKind:
+    '''
+    Copy the source file with the passed filename to the target file with the
+    passed filename by the cheapest means supported by the underlying
+    filesystems, silently removing the latter if already existing.
+
+    This function is thread-safe.
+
+    Parameters
+    ----------
+    src_filename : str
+        Absolute or relative filename of the source file to be copied from.
+    trg_filename : str
+        Absolute or relative filename of the target file to be copied to.
+
+    Returns
+    ----------
+    FileCopyKind
+        Means by which this file was copied.
+    '''
+
+    # If these filenames refer to the same directory entry, raise an
+    # exception. Removing the target file below would remove the source file.
+    # Note that these filenames may instead refer to distinct directory entries
+    # of the same inode (i.e., hardlinks), in which case the target entry is
+    # safely removed below, as this function never writes through an existing
+    # link.
+    if (os.path.isfile(trg_filename) and
+        os.path.realpath(src_filename) == os.path.realpath(trg_filename)):
+        raise shutil.SameFileError(
+            '"{}" and "{}" are the same file.'.format(
+                src_filename, trg_filename))
+
+    # Remove the target file if any, as reflinks require nonexistent targets
+    # *AND* the target file may be a hardlink to the source file, which
+    # streaming would otherwise refuse to copy over.
+    _remove_path_if_found(trg_filename)
+
+    # Attempt to reflink these files *BEFORE* falling back to slower means.
+    if _reflink_file_if_supported(src_filename, trg_filename):
+        return FileCopyKind.REFLINK
+
+    # Else, stream the data and metadata of this file.
+    shutil.copy2(src_filename, trg_filename)
+    return FileCopyKind.STREAM
+
+# ....................{ PRIVATE ~ constants               }....................
+_FICLONE = 0x40049409
+'''
+Linux-specific ``FICLONE`` :func:`fcntl.ioctl` request reflinking the file
+referenced by the passed file descriptor into the file on which this request
+is issued.
+
+This constant is the generic ``_IOW(0x94, 9, int)`` encoding shared by all
+mainstream architectures (e.g., x86, ARM, RISC-V). Under architectures with
+divergent encodings, this request fails with ``ENOTTY`` and hence silently
+falls back to slower means.
+'''
+
+
+_REFLINK_UNSUPPORTED_ERRNOS = frozenset((
+    errno.EBADF,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTSUP,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+    errno.EXDEV,
+))
+'''
+Frozen set of all :mod:`errno` codes signifying reflinks to be unsupported
+between two filesystems rather than an unrelated failure.
+'''
+
+# ....................{ PRIVATE ~ globals                 }....................
+_reflink_unsupported_dev_pairs = set()
+'''
+Set of all 2-tuples ``(src_dev, trg_dev)`` of the device identifiers of all
+pairs of filesystems between which reflinks were previously found to be
+unsupported, preventing repeated attempts for each file.
+
+Since adding to and testing for membership in sets is atomic under the GIL,
+this set is safely accessible from multiple threads.
+'''
+
+# ....................{ PRIVATE ~ planners                }....................
+def _plan_dir_copy(
+    src_dirname: str,
+    trg_dirname: str,
+    ignore_basename_globs: IterableTypes,
+    dirname_pairs: list,
+    link_pairs: list,
+    file_triples: list,
+) -> None:
+    '''
+    Append all directories, symbolic links, and files transitively owned by
+    the passed source directory (excluding those ignored by the passed globs)
+    to the passed lists.
+    '''
+
+    # Append this directory itself.
+    dirname_pairs.append((src_dirname, trg_dirname))
+
+    # For each direct child of this directory...
+    with os.scandir(src_dirname) as dir_entries:
+        for dir_entry in dir_entries:
+            # If this child is ignorable, ignore this child.
+            if any(
+                fnmatch.fnmatch(dir_entry.name, ignore_basename_glob)
+                for ignore_basename_glob in ignore_basename_globs
+            ):
+                continue
+
+            # Absolute pathname of the target child.
+            trg_pathname = pathnames.join(trg_dirname, dir_entry.name)
+
+            # Preserve symbolic links as is, mimicking the "symlinks=True"
+            # option passed to copytree() by copy_dir_into_dir().
+            if dir_entry.is_symlink():
+                link_pairs.append((dir_entry.path, trg_pathname))
+            # Recursively plan the copy of each subdirectory.
+            elif dir_entry.is_dir():
+                _plan_dir_copy(
+                    src_dirname=dir_entry.path,
+                    trg_dirname=trg_pathname,
+                    ignore_basename_globs=ignore_basename_globs,
+                    dirname_pairs=dirname_pairs,
+                    link_pairs=link_pairs,
+                    file_triples=file_triples,
+                )
+            # Else, this child is a file.
+            else:
+                file_triples.append((
+                    dir_entry.path, trg_pathname, dir_entry.stat().st_size))
+
+# ....................{ PRIVATE ~ copiers                 }....................
+def _reflink_file_if_supported(src_filename: str, trg_filename: str) -> bool:
+    '''
+    Reflink the source file with the passed filename to the nonexistent target
+    file with the passed filename if the current platform and filesystems
+    support reflinks *or* silently reduce to a noop otherwise.
+
+    Returns
+    ----------
+    bool
+        ``True`` only if this file was reflinked.
+    '''
+
+    # Device identifiers of the filesystems containing these files.
+    dev_pair = (
+        os.stat(src_filename).st_dev,
+        os.stat(os.path.dirname(os.path.abspath(trg_filename))).st_dev,
+    )
+
+    # If reflinks were previously found to be unsupported between these
+    # filesystems, avoid attempting to do so again.
+    if dev_pair in _reflink_unsupported_dev_pairs:
+        return False
+
+    # Attempt to reflink these files in a platform-specific manner.
+    try:
+        if linux.is_linux():
+            _reflink_file_linux(src_filename, trg_filename)
+        elif macos.is_macos():
+            _reflink_file_macos(src_filename, trg_filename)
+        else:
+            raise OSError(errno.ENOTSUP, 'Reflinks unsupported.')
+    # If reflinks are unsupported between these filesystems, record this fact
+    # *AND* remove the partially created target file if any.
+    except OSError as exception:
+        if exception.errno not in _REFLINK_UNSUPPORTED_ERRNOS:
+            raise
+        _reflink_unsupported_dev_pairs.add(dev_pair)
+        _remove_path_if_found(trg_filename)
+        return False
+
+    # Else, these files were reflinked.
+    return True
+
+
+def _reflink_file_linux(src_filename: str, trg_filename: str) -> None:
+    '''
+    Reflink the source file with the passed filename to the nonexistent target
+    file with the passed filename under Linux, copying the metadata of the
+    former to the latter.
+    '''
+
+    # Avoid importing this POSIX-specific module under non-POSIX platforms.
+    import fcntl
+
+    # Reflink these files by issuing the "FICLONE" request on the target file.
+    with open(src_filename, 'rb') as src_file:
+        with open(trg_filename, 'xb') as trg_file:
+            fcntl.ioctl(trg_file.fileno(), _FICLONE, src_file.fileno())
+
+    # Copy the metadata of the source file, mimicking shutil.copy2().
+    shutil.copystat(src_filename, trg_filename)
+
+
+def _reflink_file_macos(src_filename: str, trg_filename: str) -> None:
+    '''
+    Reflink the source file with the passed filename to the nonexistent target
+    file with the passed filename under macOS, implicitly copying the metadata
+    of the former to the latter.
+    '''
+
+    # Avoid importing this module under platforms requiring it *NOT*.
+    import ctypes
+
+    # C library of the active Python interpreter, preserving "errno".
+    libc = ctypes.CDLL(None, use_errno=True)
+
+    # If this library lacks the clonefile() system call (i.e., under macOS <
+    # 10.12 (Sierra)), reflinks are unsupported.
+    if not hasattr(libc, 'clonefile'):
+        raise OSError(errno.ENOTSUP, 'clonefile() unavailable.')
+
+    # Reflink these files by calling this system call. Since this call also
+    # clones metadata, no subsequent call to shutil.copystat() is required.
+    if libc.clonefile(
+        os.fsencode(src_filename), os.fsencode(trg_filename), 0) != 0:
+        exception_errno = ctypes.get_errno()
+        raise OSError(exception_errno, os.strerror(exception_errno))
+
+# ....................{ PRIVATE ~ removers                }....................
+def _remove_path_if_found(pathname: str) -> None:
+    '''
+    Remove the non-directory path with the passed pathname if this path
+    exists (including dangling symbolic links) *or* silently reduce to a noop
+    otherwise.
+    '''
+
+    try:
+        os.unlink(pathname)
+    except FileNotFoundError:
+        pass
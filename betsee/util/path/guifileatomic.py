@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Atomic file writer** (i.e., context managers writing files such that readers
+observe either the prior or the new contents of each file but never partial
+contents) facilities.
+
+These functions are *not* :mod:`PySide2`-specific and hence safely callable
+from pooled threads and child processes.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.util.type.types import type_check
+from contextlib import contextmanager
+import os, shutil, tempfile
+
+# ....................{ WRITERS                           }....................
+@contextmanager
+@type_check
+def writing_file_atomic(filename: str):
+    '''
+    Context manager atomically writing the file with the passed filename.
+
+    This context manager yields the absolute filename of a new temporary file
+    residing in the same directory as this file and suffixed by the same
+    filetype as this file (preserving filetype validation performed by callers
+    on this filename). On successfully exiting the body of the ``with``
+    statement using this context manager, this temporary file is flushed to
+    disk and then atomically renamed to this file, replacing the existing file
+    if any; else, this temporary file is removed and the existing file if any
+    is preserved.
+
+    Since this temporary file and this file reside on the same filesystem, this
+    rename is guaranteed to be atomic on all supported platforms (including
+    Windows, courtesy the :func:`os.replace` function). Since this temporary
+    file is flushed to disk *before* this rename, a system crash shortly after
+    this rename cannot replace this file by an empty or truncated file (as
+    commonly occurs on filesystems reordering metadata updates before data
+    writes, such as ext4 with delayed allocation).
+
+    Parameters
+    ----------
+    filename : str
+        Absolute filename of the file to be atomically written. The parent
+        directory of this file must already exist.
+
+    Yields
+    ----------
+    str
+        Absolute filename of the temporary file to be written. The caller is
+        expected to close all handles to this file before exiting the body of
+        the ``with`` statement using this context manager.
+    '''
+
+    # Absolute dirname and basename of this file.
+    dirname = os.path.dirname(os.path.abspath(filename))
+    basename = os.path.basename(filename)
+
+    # Filetype of this file including the prefixing "." if any *OR* the empty
+    # string otherwise.
+    filetype = os.path.splitext(basename)[1]
+
+    # Create a new empty temporary file in this directory, closing the low-level
+    # file descriptor returned by this function. Since this filename is
+    # prefixed by ".", this file is hidden under POSIX-compatible platforms.
+    temp_fd, temp_filename = tempfile.mkstemp(
+        prefix='.' + basename + '.', suffix=filetype, dir=dirname)
+    os.close(temp_fd)
+
+    # Attempt to yield this temporary file to the caller *AND* then atomically
+    # rename this temporary file to this file.
+    try:
+        yield temp_filename
+
+        # Preserve the permissions of the existing file if any *OR* default to
+        # conventional permissions otherwise. By default, temporary files are
+        # only readable by the current user.
+        if os.path.isfile(filename):
+            shutil.copymode(filename, temp_filename)
+        else:
+            os.chmod(temp_filename, 0o644)
+
+        # Flush the contents of this temporary file to disk *BEFORE* renaming
+        # this file. Since the caller has already closed this file, this file
+        # is reopened solely to do so. Under Windows, flushing requires write
+        # access; under POSIX, any access suffices.
+        _fsync_path(temp_filename, os.O_RDWR)
+
+        # Atomically replace the existing file if any with this file.
+        os.replace(temp_filename, filename)
+    # If doing so fails for *ANY* reason whatsoever, remove this temporary file
+    # and reraise this exception.
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+
+    # Flush this rename to disk by flushing the parent directory of this file,
+    # which POSIX requires for this rename to survive a system crash. Since
+    # this file has already been atomically written, failing to do so merely
+    # weakens this guarantee (e.g., under Windows, which prohibits opening
+    # directories) and is thus silently ignored.
+    try:
+        _fsync_path(dirname, os.O_RDONLY)
+    except OSError:
+        pass
+
+# ....................{ PRIVATE ~ flushers                }....................
+def _fsync_path(pathname: str, flags: int) -> None:
+    '''
+    Flush the contents of the file or directory with the passed pathname to
+    disk, opening this path with the passed :func:`os.open` flags.
+    '''
+
+    path_fd = os.open(pathname, flags)
+    try:
+        os.fsync(path_fd)
+    finally:
+        os.close(path_fd)
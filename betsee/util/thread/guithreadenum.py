@@ -42,3 +42,26 @@ DELETED : enum
     :meth:`QBetseeThreadPoolWorker.delete_later` method). From this state, this
     worker cannot freely transition to *any* other state.
 '''
+
+
+ThreadWorkerTransition = make_enum(
+    class_name='ThreadWorkerTransition',
+    member_names=('PAUSE', 'RESUME', 'STOP',))
+'''
+Enumeration of all supported types of **multithreaded worker transition**
+(i.e., change between the execution states enumerated by
+:data:`ThreadWorkerState` externally requested of a worker from another
+thread *and* subsequently acknowledged by that worker from its own thread).
+
+Attributes
+----------
+PAUSE : enum
+    Transition from the running to the paused state, requested by a call to a
+    ``pause`` method and acknowledged when that worker blocks.
+RESUME : enum
+    Transition from the paused to the running state, requested by a call to a
+    ``resume`` method and acknowledged when that worker unblocks.
+STOP : enum
+    Transition from *any* state to the idle state, requested by a call to a
+    ``stop`` method and acknowledged when that worker halts.
+'''
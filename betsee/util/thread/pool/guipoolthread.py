@@ -18,6 +18,15 @@ from betsee.guiexception import BetseePySideThreadException
 from betsee.util.type.guitype import QThreadPoolOrNoneTypes
 from betsee.util.thread.pool.guipoolwork import QBetseeThreadPoolWorker
 
+# ....................{ GLOBALS                           }....................
+# This global is initialized by the get_thread_pool_compute() function.
+_THREAD_POOL_COMPUTE = None
+'''
+Singleton **compute thread pool** lazily created by the
+:func:`get_thread_pool_compute` function if that function has been called *or*
+``None`` otherwise.
+'''
+
 # ....................{ EXCEPTIONS                        }....................
 @type_check
 def die_if_working(thread_pool: QThreadPoolOrNoneTypes = None) -> None:
@@ -84,6 +93,36 @@ def get_thread_pool() -> QThreadPool:
     return QThreadPool.globalInstance()
 
 
+def get_thread_pool_compute() -> QThreadPool:
+    '''
+    Singleton **compute thread pool** (i.e., :class:`QThreadPool`-based
+    container of one or more threads dedicated to long-running, CPU-bound
+    workers, such as simulator phases).
+
+    This pool is intentionally distinct from the singleton thread pool
+    returned by the :func:`get_thread_pool` function, which runs short-lived
+    workers required for the GUI to remain responsive (e.g., saving and
+    loading simulation configurations, decoding image previews). Were both
+    kinds of workers to share the same pool, long-running workers would
+    occupy every thread of that pool on machines with few logical processor
+    cores, queueing all short-lived workers until some long-running worker
+    finished.
+
+    By Qt default, the maximum number of threads in this pool is the number of
+    logical processor cores available to the active Python process.
+    '''
+
+    # Globals modified below.
+    global _THREAD_POOL_COMPUTE
+
+    # If this pool has yet to be created, do so.
+    if _THREAD_POOL_COMPUTE is None:
+        _THREAD_POOL_COMPUTE = QThreadPool()
+
+    # Return this pool.
+    return _THREAD_POOL_COMPUTE
+
+
 @type_check
 def get_worker_count(thread_pool: QThreadPoolOrNoneTypes = None) -> int:
     '''
@@ -93,7 +132,7 @@ def get_worker_count(thread_pool: QThreadPoolOrNoneTypes = None) -> int:
     Parameters
     ----------
     thread_pool : QThreadPoolOrNoneTypes
-        Thread pool to inspect the wokers of. Defaults to ``None``, in which
+        Thread pool to inspect the workers of. Defaults to ``None``, in which
         case the singleton thread pool returned by the :func:`get_thread_pool`
         function is defaulted to.
     '''
@@ -105,6 +144,36 @@ def get_worker_count(thread_pool: QThreadPoolOrNoneTypes = None) -> int:
     # Return the number of non-idle threads in this thread pool.
     return thread_pool.activeThreadCount()
 
+
+@type_check
+def get_worker_count_max(thread_pool: QThreadPoolOrNoneTypes = None) -> int:
+    '''
+    Maximum number of workers concurrently workable in non-idle threads of the
+    passed thread pool.
+
+    By Qt default, this is the number of logical processor cores available to
+    the active Python process (i.e., :func:`QThread.idealThreadCount`). Since
+    the thread pool silently queues all workers started in excess of this
+    number, callers scheduling workers in a dependency-aware manner (e.g., the
+    simulator proactor) are advised to never start more than this number of
+    workers at any given time.
+
+    Parameters
+    ----------
+    thread_pool : QThreadPoolOrNoneTypes
+        Thread pool to inspect the workers of. Defaults to ``None``, in which
+        case the singleton thread pool returned by the :func:`get_thread_pool`
+        function is defaulted to.
+    '''
+
+    # Default this thread pool to the singleton thread pool if needed.
+    if thread_pool is None:
+        thread_pool = get_thread_pool()
+
+    # Return the maximum number of threads in this thread pool, guaranteed to
+    # be at least one for sanity.
+    return max(thread_pool.maxThreadCount(), 1)
+
 # ....................{ RUNNERS                           }....................
 @type_check
 def start_worker(
@@ -32,8 +32,11 @@ from betsee.guiexception import (
     BetseePySideThreadWorkerStopException,
 )
 from betsee.util.thread import guithread
-from betsee.util.thread.guithreadenum import ThreadWorkerState
+from betsee.util.thread.guithreadenum import (
+    ThreadWorkerState, ThreadWorkerTransition)
+from betsee.util.thread.pool.guipoolworklat import ThreadWorkerLatencies
 from betsee.util.thread.pool.guipoolworksig import (
+    PROGRESS_FRAME_RATE,
     QBetseeThreadPoolWorkerSignals,
 )
 from betsee.util.type.guitype import (
@@ -41,6 +44,22 @@ from betsee.util.type.guitype import (
     QLabelOrNoneTypes,
 )
 
+# ....................{ CONSTANTS                         }....................
+THREAD_HALT_CHECK_CALLS = 64
+'''
+Number of calls to the :meth:`QBetseeThreadPoolWorker._halt_work_if_requested`
+method between each test of whether the thread running that worker has been
+externally requested to halt (e.g., by the :func:`guithread.halt_thread_work`
+function).
+
+Since such requests are *not* signalled by the fast-path flag tested by each
+such call, this test is deferred to every such number of calls rather than
+performed on every call, amortizing the cost of querying Qt (roughly a
+microsecond per query) across calls. Even the cheapest solver steps calling
+that method take far longer than this number of calls, so such requests are
+still detected well within a single frame.
+'''
+
 # ....................{ GLOBALS                           }....................
 _worker_id_next = 0
 '''
@@ -261,6 +280,11 @@ class QBetseeThreadPoolWorker(QRunnable):
 
     Attributes (Public)
     ----------
+    latencies : ThreadWorkerLatencies
+        Thread-safe record of the time elapsed between each transition (e.g.,
+        pause, resume, stop) externally requested of this worker and the
+        acknowledgement of that transition by this worker, enabling callers to
+        track and assert the responsiveness of this worker.
     signals : QBetseeThreadPoolWorkerSignals
         Low-level collection of all public signals thread-safely emittable by
         the :meth:`run` method from within an arbitrary pooled thread possibly
@@ -268,6 +292,9 @@ class QBetseeThreadPoolWorker(QRunnable):
 
     Attributes (Private)
     ----------
+    _progress_frame_rate : int
+        Maximum number of times per second that coalesced progress emitted by
+        this worker is delivered to slots. See the :meth:`__init__` method.
     _thread : WeakRefType
         Weak reference to the :class:`QThread` instance wrapping the thread in
         which the :meth:`run` method is currently running if that method is
@@ -281,6 +308,16 @@ class QBetseeThreadPoolWorker(QRunnable):
 
     Attributes (Private: State)
     ----------
+    _is_transition_pending : bool
+        ``True`` only if a transition has been externally requested of this
+        worker but *not* yet acknowledged by the
+        :meth:`_halt_work_if_requested` method. This flag is the fast path
+        enabling that method to avoid acquiring the :attr:`_state_lock`
+        primitive on each call. Although this flag is only ever written while
+        holding that primitive, this flag is safely readable *without* holding
+        that primitive. Reading and writing a single attribute is atomic under
+        the GIL, while a stale read merely defers the handling of a pending
+        transition to the next call of that method.
     _state : ThreadWorkerState
         Non-thread-safe current execution state of this worker. This state is
         non-thread-safe and hence should *only* be accessed by instantiating an
@@ -295,6 +332,11 @@ class QBetseeThreadPoolWorker(QRunnable):
         target of a ``with`` context. Note that the context provided by the
         :class:QMutexLocker` class is *not* safely reusable and hence *must* be
         re-instantiated in each ``with`` context.
+    _state_thread_countdown : int
+        Number of calls to the :meth:`_halt_work_if_requested` method remaining
+        until that method next tests whether the thread running this worker
+        has been externally requested to halt. This integer is accessed *only*
+        from that thread and hence requires no locking.
     _state_unpaused : QWaitCondition
         Thread synchronization primitive, permitting this worker when paused in
         its parent thread to indefinitely block until an object in another
@@ -312,14 +354,35 @@ class QBetseeThreadPoolWorker(QRunnable):
 
     # ..................{ INITIALIZERS                      }..................
     @type_check
-    def __init__(self) -> None:
+    def __init__(self, progress_frame_rate: int = PROGRESS_FRAME_RATE) -> None:
         '''
         Initialize this pooled worker.
+
+        Parameters
+        ----------
+        progress_frame_rate : int
+            Maximum number of times per second that coalesced progress emitted
+            by this worker is delivered to slots residing in the main event
+            thread. Defaults to :data:`PROGRESS_FRAME_RATE`.
+
+        Raises
+        ----------
+        BetseePySideThreadWorkerException
+            If this rate is non-positive.
         '''
 
         # Initialize our superclass.
         super().__init__()
 
+        # If this rate is non-positive, raise an exception.
+        if progress_frame_rate <= 0:
+            raise BetseePySideThreadWorkerException(
+                'Progress frame rate {} not positive.'.format(
+                    progress_frame_rate))
+
+        # Classify all passed parameters.
+        self._progress_frame_rate = progress_frame_rate
+
         # Prevent Qt from implicitly deleting this worker on completion, as is
         # the C++-centric default. See the "Lifecycle" section of the above
         # docstring for further commentary.
@@ -335,6 +398,13 @@ class QBetseeThreadPoolWorker(QRunnable):
         # Default this worker's initial state to the idle state.
         self._state = ThreadWorkerState.IDLE
 
+        # Default this worker to having no pending transitions.
+        self._is_transition_pending = False
+        self._state_thread_countdown = THREAD_HALT_CHECK_CALLS
+
+        # Record of the latencies of all transitions requested of this worker.
+        self.latencies = ThreadWorkerLatencies()
+
         # Weak reference to the thread currently running the run() method.
         self._thread = None
 
@@ -529,6 +599,16 @@ class QBetseeThreadPoolWorker(QRunnable):
                 # Change to the running state.
                 self._state = ThreadWorkerState.RUNNING
 
+                # Discard all transitions requested of a prior run, if any.
+                # Since the above state change overrides these transitions,
+                # this run will never acknowledge them.
+                self._is_transition_pending = False
+                self.latencies.discard_pending()
+
+                # Test this thread for a request to halt on the first call to
+                # the _halt_work_if_requested() method below.
+                self._state_thread_countdown = 1
+
             # Notify external subscribers *BEFORE* beginning subclass work.
             self.signals.started.emit()
 
@@ -542,7 +622,16 @@ class QBetseeThreadPoolWorker(QRunnable):
             # raise ValueError('wat?')
 
             # Value returned by performing subclass-specific business logic.
-            return_value = self._work()
+            # Regardless of whether this logic succeeds, deliver all progress
+            # still pending from this logic *BEFORE* emitting any signal
+            # signifying the outcome of this logic below. Since slots
+            # connected to those signals typically finalize progress widgets
+            # (e.g., by resetting progress bars), progress delivered *AFTER*
+            # those signals would overwrite that finalization.
+            try:
+                return_value = self._work()
+            finally:
+                self.signals.flush_progress()
         # If a periodic call to the _halt_work_if_requested() method performed
         # within the above call detects either this worker or this worker's
         # thread has been externally requested to stop, do so gracefully by...
@@ -639,6 +728,9 @@ class QBetseeThreadPoolWorker(QRunnable):
             # Change this worker's state to paused.
             self._state = ThreadWorkerState.PAUSED
 
+            # Notify the _halt_work_if_requested() method of this transition.
+            self._request_transition(ThreadWorkerTransition.PAUSE)
+
 
     def resume(self) -> None:
         '''
@@ -685,6 +777,10 @@ class QBetseeThreadPoolWorker(QRunnable):
 
                 # Change this worker's state to working, thus unpausing.
                 self._state = ThreadWorkerState.RUNNING
+
+                # Notify the _halt_work_if_requested() method of this
+                # transition.
+                self._request_transition(ThreadWorkerTransition.RESUME)
             # Regardless of whether doing so raised an exception or not...
             finally:
                 # Unblock the parent thread of this worker if currently
@@ -732,6 +828,10 @@ class QBetseeThreadPoolWorker(QRunnable):
                 # Regardless of the current state of this worker, change this
                 # worker's state to idle (i.e., non-working).
                 self._state = ThreadWorkerState.IDLE
+
+                # Notify the _halt_work_if_requested() method of this
+                # transition.
+                self._request_transition(ThreadWorkerTransition.STOP)
             # Regardless of whether doing so raised an exception or not...
             finally:
                 # Unblock the parent thread of this worker if currently
@@ -906,7 +1006,9 @@ class QBetseeThreadPoolWorker(QRunnable):
             # Weak reference to the _halt_work_if_requested() method, avoiding
             # circular references between this object and this child object.
             halt_work_if_requested=pyref.refer_weak(
-                self._halt_work_if_requested))
+                self._halt_work_if_requested),
+            progress_frame_rate=self._progress_frame_rate,
+        )
 
     # ..................{ WORKERS ~ abstract                }..................
     # Abstract methods required to be redefined by subclasses.
@@ -972,11 +1074,17 @@ class QBetseeThreadPoolWorker(QRunnable):
 
         Caveats
         ----------
-        This method imposes minor computational overhead and hence should be
-        called intermittently (rather than overly frequently). Notably, each
-        call to this method processes *all* pending events currently queued
-        with this worker's thread -- including those queued for all other
-        workers currently running in this thread.
+        This method is safely callable as frequently as desired (e.g., on each
+        step of a long-running solver). Unless a transition is pending, each
+        call reduces to testing a single boolean flag and decrementing a
+        single integer *without* acquiring any lock. Since the request to halt
+        this worker's thread is *not* signalled by this flag, that request is
+        only tested every :data:`THREAD_HALT_CHECK_CALLS` calls and hence
+        detected slightly later than requests signalled to this worker
+        directly.
+
+        Each transition acknowledged by this method records the latency of
+        that transition with the :attr:`latencies` object.
 
         Raises
         ----------
@@ -985,28 +1093,107 @@ class QBetseeThreadPoolWorker(QRunnable):
             signalled or requested to be stopped.
         '''
 
+        # If no transition has been requested of this worker...
+        if not self._is_transition_pending:
+            # If this worker's thread has yet to be tested for a request to
+            # halt during the current window of calls, silently reduce to a
+            # noop. This is the fast path and hence *MUST* remain trivial.
+            self._state_thread_countdown -= 1
+            if self._state_thread_countdown > 0:
+                return
+
+            # Else, begin the next window of calls.
+            self._state_thread_countdown = THREAD_HALT_CHECK_CALLS
+
+            # If this thread has *NOT* been requested to halt, silently reduce
+            # to a noop.
+            if not guithread.should_halt_thread_work():
+                return
+        # Else, either a transition has been requested of this worker *OR* this
+        # worker's thread has been requested to halt. Handle this request.
+
         # Within a thread- and exception-safe context manager synchronizing
         # access to this state across multiple threads...
         with QMutexLocker(self._state_lock):
-            # If either:
-            if (
-                # If an external call to the stop() method has requested that
-                # this worker be stopped...
-                self._state is ThreadWorkerState.IDLE or
-                # This worker's thread has been externally requested to stop...
-                guithread.should_halt_thread_work()
-            # ...then permanently halt this worker.
-            ):
-                self._stop_work()
-
-            # If an external call to the pause() method from another thread has
-            # requested this worker to temporarily halt work, do so *AFTER*
-            # detecting and handling a request to permanently halt work. Why?
-            # Requests to permanently halt take priority over requests to
-            # temporarily halt.
-            if self._state is ThreadWorkerState.PAUSED:
+            # Until this worker is neither stopping nor paused...
+            while True:
+                # Note all transitions requested thus far to have been handled
+                # *BEFORE* handling these transitions below. Since transitions
+                # are only requested while holding this lock, no subsequently
+                # requested transition is lost.
+                self._is_transition_pending = False
+
+                # If either:
+                if (
+                    # If an external call to the stop() method has requested
+                    # that this worker be stopped...
+                    self._state is ThreadWorkerState.IDLE or
+                    # This worker's thread has been externally requested to
+                    # stop...
+                    guithread.should_halt_thread_work()
+                # ...then permanently halt this worker.
+                ):
+                    self._acknowledge_transition(ThreadWorkerTransition.STOP)
+                    self._stop_work()
+
+                # If an external call to the pause() method from another thread
+                # has requested this worker to temporarily halt work, do so
+                # *AFTER* detecting and handling a request to permanently halt
+                # work. Why? Requests to permanently halt take priority over
+                # requests to temporarily halt.
+                if self._state is not ThreadWorkerState.PAUSED:
+                    break
+
+                # Block until resumed or stopped.
+                self._acknowledge_transition(ThreadWorkerTransition.PAUSE)
                 self._block_work()
 
+                # If this worker was resumed rather than stopped while blocked,
+                # acknowledge this resumption. In either case, iterate to
+                # handle any request to stop made while blocked.
+                if self._state is ThreadWorkerState.RUNNING:
+                    self._acknowledge_transition(ThreadWorkerTransition.RESUME)
+
+            # Discard all transitions coalesced *WITHOUT* being acknowledged
+            # (e.g., a pause immediately followed by a resume *BEFORE* this
+            # call), which would otherwise be recorded as spuriously long
+            # latencies.
+            self.latencies.discard_pending()
+
+    # ..................{ TRANSITIONERS                     }..................
+    def _request_transition(self, transition: ThreadWorkerTransition) -> None:
+        '''
+        Non-thread-safely record the passed type of transition as having been
+        externally requested of this worker, notifying the next call to the
+        :meth:`_halt_work_if_requested` method of this request.
+
+        Caveats
+        ----------
+        **This private method is non-thread-safe.** The caller *must*
+        explicitly embed each call to this method within a context manager of
+        the form ``with QMutexLocker(self._state_lock):``.
+        '''
+
+        self.latencies.request(transition)
+        self._is_transition_pending = True
+
+
+    def _acknowledge_transition(
+        self, transition: ThreadWorkerTransition) -> None:
+        '''
+        Record the passed type of transition as having been acknowledged by
+        this worker, logging the latency of this transition if requested.
+        '''
+
+        # Latency of this transition if requested *OR* "None" otherwise.
+        latency = self.latencies.acknowledge(transition)
+
+        # If this transition was requested, log this latency.
+        if latency is not None:
+            guithread.log_debug_thread_current(
+                'Pooled thread worker "%d" acknowledged %s in %.4fs.',
+                self._worker_id, transition.name.lower(), latency)
+
     # ..................{ STOPPERS                          }..................
     def _stop_work(self) -> None:
         '''
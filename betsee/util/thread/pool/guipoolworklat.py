@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **pooled worker latencies** (i.e., thread-safe record of the time
+elapsed between each transition externally requested of a pooled worker and
+the acknowledgement of that transition by that worker) classes.
+'''
+
+# ....................{ IMPORTS                           }....................
+from PySide2.QtCore import QMutex, QMutexLocker
+from betse.util.type.types import type_check, NumericOrNoneTypes
+from betsee.util.thread.guithreadenum import ThreadWorkerTransition
+from collections import deque
+import time
+
+# ....................{ CONSTANTS                         }....................
+LATENCY_SAMPLES_MAX = 256
+'''
+Maximum number of latencies recorded for each type of transition, above which
+the oldest latencies of that type are silently discarded.
+
+This bound prevents long-lived recyclable workers from leaking memory.
+'''
+
+# ....................{ CLASSES                           }....................
+class ThreadWorkerLatencies(object):
+    '''
+    **Pooled worker latencies** (i.e., thread-safe record of the time elapsed
+    between each transition externally requested of a pooled worker and the
+    acknowledgement of that transition by that worker).
+
+    Each latency is measured in fractional seconds against the monotonic
+    clock and hence immune to changes in the system time.
+
+    Requests
+    ----------
+    Each type of transition is associated with at most one **pending request**
+    (i.e., request *not* yet acknowledged) at any time. Subsequent requests of
+    the same type preserve the time of the first such request, as the worker
+    responds to all such requests with a single acknowledgement. Requests
+    coalesced by the worker without acknowledgement (e.g., a pause immediately
+    followed by a resume *before* that worker blocks) are discarded rather
+    than recorded as spuriously long latencies.
+
+    Attributes
+    ----------
+    _lock : QMutex
+        Non-exception-safe mutual exclusion primitive rendering this object
+        thread-safe. See the :class:`QBetseeThreadPoolWorker` class for
+        commentary on the proper use of this primitive.
+    _transition_to_latencies : dict
+        Dictionary mapping from each type of transition to a bounded deque of
+        the latencies of all previously acknowledged requests of that type.
+    _transition_to_time_requested : dict
+        Dictionary mapping from each type of transition with a pending request
+        to the monotonic time in fractional seconds of that request.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self) -> None:
+        '''
+        Initialize this record to contain *no* latencies.
+        '''
+
+        self._lock = QMutex()
+        self._transition_to_latencies = {
+            transition: deque(maxlen=LATENCY_SAMPLES_MAX)
+            for transition in ThreadWorkerTransition
+        }
+        self._transition_to_time_requested = {}
+
+    # ..................{ RECORDERS                         }..................
+    @type_check
+    def request(self, transition: ThreadWorkerTransition) -> None:
+        '''
+        Record the passed type of transition as having been requested now.
+        '''
+
+        with QMutexLocker(self._lock):
+            self._transition_to_time_requested.setdefault(
+                transition, time.monotonic())
+
+
+    @type_check
+    def acknowledge(
+        self, transition: ThreadWorkerTransition) -> NumericOrNoneTypes:
+        '''
+        Record the pending request of the passed type of transition as having
+        been acknowledged now, returning the latency in fractional seconds of
+        this request if this request is pending *or* ``None`` otherwise (e.g.,
+        if this transition was instead requested of this worker's thread).
+        '''
+
+        with QMutexLocker(self._lock):
+            # Time of this request if pending *OR* "None" otherwise.
+            time_requested = self._transition_to_time_requested.pop(
+                transition, None)
+
+            # If no such request is pending, silently reduce to a noop.
+            if time_requested is None:
+                return None
+
+            # Latency of this request.
+            latency = time.monotonic() - time_requested
+
+            # Record and return this latency.
+            self._transition_to_latencies[transition].append(latency)
+            return latency
+
+
+    def discard_pending(self) -> None:
+        '''
+        Discard all pending requests *without* recording their latencies.
+        '''
+
+        with QMutexLocker(self._lock):
+            self._transition_to_time_requested.clear()
+
+
+    def clear(self) -> None:
+        '''
+        Discard all pending requests *and* recorded latencies.
+        '''
+
+        with QMutexLocker(self._lock):
+            self._transition_to_time_requested.clear()
+            for latencies in self._transition_to_latencies.values():
+                latencies.clear()
+
+    # ..................{ GETTERS                           }..................
+    @type_check
+    def get_latencies(self, transition: ThreadWorkerTransition) -> tuple:
+        '''
+        Tuple of the latencies in fractional seconds of all previously
+        acknowledged requests of the passed type of transition, in ascending
+        order of acknowledgement.
+        '''
+
+        with QMutexLocker(self._lock):
+            return tuple(self._transition_to_latencies[transition])
+
+
+    @type_check
+    def get_latency_max(
+        self, transition: ThreadWorkerTransition) -> NumericOrNoneTypes:
+        '''
+        Maximum latency in fractional seconds of all previously acknowledged
+        requests of the passed type of transition if any *or* ``None``
+        otherwise.
+        '''
+
+        latencies = self.get_latencies(transition)
+        return max(latencies) if latencies else None
+
+
+    @type_check
+    def get_latency_mean(
+        self, transition: ThreadWorkerTransition) -> NumericOrNoneTypes:
+        '''
+        Arithmetic mean latency in fractional seconds of all previously
+        acknowledged requests of the passed type of transition if any *or*
+        ``None`` otherwise.
+        '''
+
+        latencies = self.get_latencies(transition)
+        return sum(latencies) / len(latencies) if latencies else None
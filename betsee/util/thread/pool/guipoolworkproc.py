@@ -0,0 +1,822 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **process-backed pooled worker** (i.e., pooled worker delegating its
+business logic to a dedicated child process rather than performing that logic
+in the pooled thread running this worker) classes.
+'''
+
+# ....................{ IMPORTS                           }....................
+from PySide2.QtCore import QMutexLocker
+from betse.exceptions import BetseMethodUnimplementedException
+from betse.util.type.iterable import tuples
+from betse.util.type.types import CallableTypes, SequenceTypes
+from betsee.guiexception import (
+    BetseePySideThreadWorkerException,
+    BetseePySideThreadWorkerStopException,
+)
+from betsee.util.thread import guithread
+from betsee.util.thread.guithreadenum import ThreadWorkerState
+from betsee.util.thread.pool.guipoolwork import QBetseeThreadPoolWorker
+from multiprocessing.util import Finalize
+import multiprocessing, pickle, sys, threading, time, traceback
+
+# Attempt to import the POSIX-specific "resource" module, unavailable under
+# Windows. In that case, peak memory usage is unreported.
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# ....................{ CONSTANTS                         }....................
+CHILD_POLL_SECONDS = 0.05
+'''
+Maximum number of fractional seconds that the pooled thread running each
+process-backed worker blocks while waiting for a message from the child
+process performing this worker's business logic, bounding the latency with
+which this worker responds to requests to pause, resume, or stop.
+'''
+
+
+CHILD_STOP_TIMEOUT_SECONDS = 5.0
+'''
+Maximum number of fractional seconds to wait for a disposable child process
+(e.g., an idle export process) to gracefully exit *before* non-gracefully
+terminating that process, *or* for a non-gracefully terminated child process
+to be reaped.
+
+Child processes performing the business logic of process-backed workers are
+*not* disposable and hence never terminated after this timeout. See the
+:meth:`QBetseeProcessPoolWorker._halt_child` method for further details.
+'''
+
+
+CHILD_USAGE_SECONDS = 1.0
+'''
+Minimum number of fractional seconds between each report of the resource
+usage of the child process performing each process-backed worker's business
+logic, piggybacked onto progress sent by that process.
+
+Each child process additionally reports its final resource usage immediately
+*before* returning, raising an exception, or stopping.
+'''
+
+# ....................{ TYPES                             }....................
+ProcessUsage = tuples.make_named_subclass(
+    class_name='ProcessUsage',
+    item_names=('cpu_seconds', 'rss_peak_bytes',),
+    doc='''
+    Named tuple created and returned by the :func:`get_process_usage`
+    function, aggregating the resource usage of the current process.
+
+    Attributes
+    ----------
+    cpu_seconds : float
+        Fractional number of seconds of CPU time (i.e., the sum of user and
+        system time) consumed by this process.
+    rss_peak_bytes : IntOrNoneTypes
+        Peak resident set size (RSS) in bytes of this process if the current
+        platform reports this size (e.g., Linux, macOS) *or* ``None``
+        otherwise (e.g., Windows).
+    '''
+)
+
+# ....................{ SUPERCLASSES                      }....................
+class QBetseeProcessPoolWorker(QBetseeThreadPoolWorker):
+    '''
+    Abstract base class of all **process-backed pooled worker** (i.e., pooled
+    worker delegating its business logic to a dedicated child process rather
+    than performing that logic in the pooled thread running this worker)
+    subclasses.
+
+    Motivation
+    ----------
+    Pooled workers performing CPU-bound pure-Python business logic in pooled
+    threads of the GUI process hold the Global Interpreter Lock (GIL) for most
+    of that logic and hence compete with the Qt event loop in the main thread,
+    inducing perceptible stutter throughout that logic. Moreover, fatal errors
+    in C extensions called by that logic (e.g., segmentation faults) terminate
+    the entire GUI process.
+
+    Process-backed workers suffer neither deficiency. The pooled thread
+    running each such worker merely spawns a child process performing this
+    logic and then forwards messages received from that process as the
+    signals of this worker, blocking on interprocess I/O (and thus releasing
+    the GIL) for the vast majority of this time. If that process fatally
+    fails, this worker emits the :attr:`signals.failed` signal; the GUI
+    process continues unharmed.
+
+    Child Process
+    ----------
+    Each child process is created with the ``spawn`` start method, which runs
+    a new Python interpreter rather than forking the current process. Since
+    forking a multithreaded Qt process is unsafe, this is mandatory. Ergo, the
+    child callable returned by the :meth:`_make_child_work` method *must* be a
+    module-scoped callable (e.g., *not* a lambda or bound method) and all
+    arguments returned by that method *must* be picklable.
+
+    That callable is passed a :class:`ProcessPoolWorkerChannel` object as its
+    first positional argument, which publishes the same ``emit_progress_*``
+    methods as the :class:`QBetseeThreadPoolWorkerSignals` class. Each call to
+    these methods forwards progress to this worker *and* implicitly pauses,
+    resumes, or stops that callable as requested by the :meth:`pause`,
+    :meth:`resume`, and :meth:`stop` methods of this worker. That callable
+    should thus call these methods periodically.
+
+    Each child process is also created non-daemonic, permitting that callable
+    to spawn child processes of its own (e.g., a pool of export processes).
+    Since :mod:`multiprocessing` prohibits daemonic processes from having
+    children, this is also mandatory. Since non-daemonic processes are *not*
+    implicitly terminated on the parent process exiting, each such process is
+    instead explicitly reaped by this worker on finishing, terminated by the
+    :meth:`halt` method, and terminated on the GUI process exiting by the
+    :func:`halt_children` function as a last resort.
+
+    Stopping
+    ----------
+    That callable only stops at its next **stop point** (i.e., call to a
+    channel method handling control requests, typically an ``emit_progress_*``
+    method). Since that callable may
+    legitimately perform lengthy work between stop points (e.g., pickling
+    the results of a simulation phase to disk), the :meth:`stop` method
+    requests that process stop and then waits indefinitely for that process
+    to acknowledge this request by stopping, rather than terminating that
+    process after a fixed grace period and hence possibly corrupting that
+    work. That process is non-gracefully terminated *only* if this worker is
+    explicitly requested to stop a second time while waiting (e.g., by the
+    user stopping the simulator again) or halted (e.g., by the
+    :meth:`halt` method at application shutdown).
+
+    Attributes (Public)
+    ----------
+    child_usage : {ProcessUsage, NoneType}
+        Most recent resource usage reported by the child process performing
+        this worker's business logic if that process has reported its usage
+        *or* ``None`` otherwise (e.g., if this worker has yet to spawn that
+        process). Since this attribute is only ever replaced rather than
+        modified in-place, this attribute is safely readable from any thread.
+
+    Attributes (Private)
+    ----------
+    _child_process : {multiprocessing.Process, NoneType}
+        Child process performing this worker's business logic if this worker
+        is currently working *or* ``None`` otherwise.
+    _is_child_kill_requested : bool
+        ``True`` only if this worker has been requested to stop *after*
+        already having been requested to stop, in which case the child process
+        performing this worker's business logic is non-gracefully terminated
+        rather than waited on.
+    _is_child_paused : bool
+        ``True`` only if this worker has requested that the child process
+        performing this worker's business logic pause.
+    _is_stop_requested : bool
+        ``True`` only if this worker has been requested to stop.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, *args, **kwargs) -> None:
+        '''
+        Initialize this process-backed pooled worker.
+
+        All passed parameters are passed as is to the superclass method.
+        '''
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+        # Default all remaining instance variables.
+        self._child_process = None
+        self._is_child_kill_requested = False
+        self._is_child_paused = False
+        self._is_stop_requested = False
+        self.child_usage = None
+
+    # ..................{ SUBCLASS                          }..................
+    def _make_child_work(self) -> tuple:
+        '''
+        2-tuple ``(child_func, child_args)`` describing the business logic to
+        be performed by the child process spawned by this worker, where:
+
+        * ``child_func`` is the module-scoped callable to be called by that
+          process, passed a :class:`ProcessPoolWorkerChannel` object followed
+          by all items of ``child_args`` as positional arguments. The value
+          returned by this callable (which *must* be picklable) is emitted as
+          the :attr:`signals.succeeded` signal of this worker.
+        * ``child_args`` is the sequence of all picklable positional arguments
+          to be passed to that callable.
+
+        This method is called from the pooled thread running this worker.
+        Subclasses are required to redefine this method.
+        '''
+
+        raise BetseMethodUnimplementedException()
+
+    # ..................{ WORKERS                           }..................
+    def _work(self) -> object:
+
+        # Callable to be called by the child process and arguments to be
+        # passed to that callable.
+        child_func, child_args = self._make_child_work()
+
+        # Multiprocessing context spawning rather than forking child processes.
+        process_context = multiprocessing.get_context('spawn')
+
+        # Bidirectional pipe between this worker and that process.
+        conn_parent, conn_child = process_context.Pipe(duplex=True)
+
+        # Child process performing this worker's business logic. Since this
+        # process may spawn child processes of its own, this process *MUST*
+        # be non-daemonic. See the class docstring for further details.
+        process = process_context.Process(
+            target=_run_child,
+            args=(
+                conn_child,
+                child_func,
+                child_args,
+                self._progress_frame_rate,
+            ),
+            name='betsee-worker-{}'.format(self._worker_id),
+            daemon=False,
+        )
+
+        # Log this spawning.
+        guithread.log_debug_thread_current(
+            'Spawning pooled process worker "%d"...', self._worker_id)
+
+        # Spawn this process *BEFORE* closing the child end of this pipe in
+        # this process, guaranteeing that this process detects the premature
+        # termination of that process as EOF on the parent end of this pipe.
+        process.start()
+        conn_child.close()
+
+        # Record this process for subsequent termination if needed.
+        self._child_process = process
+        _add_child(process)
+
+        # Default that process to *NOT* being paused or having used anything.
+        self._is_child_paused = False
+        self.child_usage = None
+
+        # Forward all messages received from that process until that process
+        # either returns a value, raises an exception, stops, or dies.
+        try:
+            while True:
+                # Pause, resume, or stop that process if requested.
+                self._sync_child_state(conn_parent)
+
+                # If no message is received from that process within a brief
+                # window, repeat this synchronization. Blocking here releases
+                # the GIL for the duration of this window.
+                if not conn_parent.poll(CHILD_POLL_SECONDS):
+                    # If that process has died without a final message, fail.
+                    if not process.is_alive() and not conn_parent.poll():
+                        self._die_child(process)
+                    continue
+
+                # Attempt to receive the next message from that process.
+                try:
+                    message = conn_parent.recv()
+                # If that process died while sending this message, fail.
+                except (EOFError, OSError):
+                    self._die_child(process)
+
+                # Type of this message.
+                message_type = message[0]
+
+                # Forward progress messages as the corresponding signals.
+                if message_type == 'progress_ranged':
+                    self.signals.emit_progress_range(
+                        progress_min=message[1], progress_max=message[2])
+                elif message_type == 'progress_stated':
+                    self.signals.emit_progress_state(status=message[1])
+                elif message_type == 'progressed':
+                    self.signals.emit_progress(progress=message[1])
+                # Record resource usage reported by that process.
+                elif message_type == 'usage':
+                    self.child_usage = ProcessUsage(*message[1:])
+                # If that process returned a value, return this value.
+                elif message_type == 'succeeded':
+                    return message[1]
+                # If that process raised an exception, reraise this exception.
+                elif message_type == 'failed':
+                    raise message[1]
+                # If that process stopped as requested, stop this worker.
+                elif message_type == 'stopped':
+                    self._stop_work()
+                # Else, this message is unrecognized. Raise an exception.
+                else:
+                    raise BetseePySideThreadWorkerException(
+                        'Pooled process worker "{}" message type "{}" '
+                        'unrecognized.'.format(self._worker_id, message_type))
+        # Regardless of how this worker finishes, guarantee that process to be
+        # terminated and reaped *BEFORE* returning. Failing to do so would
+        # leak that process on this worker being stopped or failing.
+        finally:
+            self._halt_child(process=process, conn=conn_parent)
+            _discard_child(process)
+            self._child_process = None
+
+    # ..................{ HALTERS                           }..................
+    def stop(self) -> None:
+
+        # If this worker has already been requested to stop, the child
+        # process performing this worker's business logic has yet to reach a
+        # stop point since that request. Since the caller is explicitly
+        # requesting this worker stop again, non-gracefully terminate that
+        # process rather than continuing to wait on that process.
+        if self._is_stop_requested:
+            self._is_child_kill_requested = True
+
+        # Record this request.
+        self._is_stop_requested = True
+
+        # Stop this worker as usual.
+        super().stop()
+
+
+    def halt(self) -> None:
+
+        # Child process performing this worker's business logic if any.
+        # Localized to avoid a race with the pooled thread nullifying this
+        # variable on finishing.
+        process = self._child_process
+
+        # If that process is still running, non-gracefully terminate that
+        # process *BEFORE* halting the pooled thread waiting on that process.
+        # Since this method is only called after this worker has already
+        # failed to gracefully stop, that process is unresponsive. Likewise,
+        # prevent the pooled thread from continuing to wait on that process.
+        self._is_child_kill_requested = True
+        if process is not None and process.is_alive():
+            guithread.log_warning_thread_current(
+                'Terminating pooled process worker child process "%s" '
+                'non-gracefully!', process.name)
+            process.terminate()
+
+        # Halt this worker as usual.
+        super().halt()
+
+
+    def _sync_child_state(self, conn: object) -> None:
+        '''
+        Synchronize the execution state of the child process performing this
+        worker's business logic with that of this worker, pausing, resuming,
+        or stopping this process as requested by external callers.
+
+        This method blocks for the duration of each pause of this worker, as
+        with the superclass :meth:`_halt_work_if_requested` method.
+
+        Parameters
+        ----------
+        conn : multiprocessing.connection.Connection
+            Parent end of the pipe between this worker and that process.
+
+        Raises
+        ----------
+        BetseePySideThreadWorkerStopException
+            If this worker has been requested to stop.
+        '''
+
+        # If a transition has been requested of this worker, test this state
+        # within a thread- and exception-safe context manager synchronizing
+        # access to this state across multiple threads. Else, avoid acquiring
+        # this lock on each poll of that process.
+        if self._is_transition_pending:
+            with QMutexLocker(self._state_lock):
+                is_paused = self._state is ThreadWorkerState.PAUSED
+
+            # If this worker has been paused but that process has yet to be
+            # requested to pause, request that process pause *BEFORE* blocking
+            # this pooled thread below.
+            if is_paused and not self._is_child_paused:
+                conn.send(('pause',))
+                self._is_child_paused = True
+
+        # Block while this worker is paused *OR* stop if requested.
+        self._halt_work_if_requested()
+
+        # If that process was previously requested to pause, this worker has
+        # now been resumed. In this case, request that process resume.
+        if self._is_child_paused:
+            conn.send(('resume',))
+            self._is_child_paused = False
+
+
+    def _halt_child(self, process: object, conn: object) -> None:
+        '''
+        Gracefully stop the passed child process performing this worker's
+        business logic if still running *and* close the passed parent end of
+        the pipe to this process.
+
+        This method waits indefinitely for this process to reach its next stop
+        point, non-gracefully terminating this process *only* if this worker
+        is explicitly requested to stop again or halted while waiting. See the
+        class docstring for further details.
+        '''
+
+        # If this process is still running, request that it gracefully stop.
+        if process.is_alive():
+            # Attempt to send this request. If this process has since closed
+            # its end of this pipe, ignore this failure.
+            try:
+                conn.send(('stop',))
+            except (BrokenPipeError, OSError):
+                pass
+
+            # Wait for this process to acknowledge this request by stopping.
+            while process.is_alive():
+                # If this worker has been explicitly requested to stop again,
+                # terminate this process rather than continuing to wait.
+                if self._is_child_kill_requested:
+                    guithread.log_warning_thread_current(
+                        'Terminating pooled process worker child process '
+                        '"%s" non-gracefully!', process.name)
+                    process.terminate()
+                    break
+
+                # Discard all messages sent by this process while reaching its
+                # next stop point, preventing this process from blocking on a
+                # full pipe. If this process has since closed its end of this
+                # pipe, ignore this failure.
+                try:
+                    while conn.poll():
+                        conn.recv()
+                except (EOFError, OSError):
+                    pass
+
+                # Wait a brief window for this process to stop, bounding the
+                # latency with which this worker responds to a kill request.
+                process.join(CHILD_POLL_SECONDS)
+
+        # Reap this process.
+        process.join()
+
+        # Close the parent end of this pipe.
+        conn.close()
+
+
+    def _die_child(self, process: object) -> None:
+        '''
+        Raise an exception describing the premature termination of the passed
+        child process performing this worker's business logic (e.g., due to a
+        segmentation fault in a C extension called by that process).
+        '''
+
+        # Wait for that process to be fully reaped, ensuring its exit code is
+        # available.
+        process.join(CHILD_POLL_SECONDS)
+
+        # Raise this exception.
+        raise BetseePySideThreadWorkerException(
+            'Pooled process worker "{}" child process terminated '
+            'unexpectedly with exit code {}.'.format(
+                self._worker_id, process.exitcode))
+
+# ....................{ CLASSES                           }....................
+class ProcessPoolWorkerChannel(object):
+    '''
+    **Process-backed pooled worker channel** (i.e., object residing in the
+    child process spawned by a :class:`QBetseeProcessPoolWorker` instance,
+    forwarding progress from that process to that worker *and* control
+    requests from that worker to that process).
+
+    This channel intentionally publishes the same ``emit_progress_*`` methods
+    as the :class:`QBetseeThreadPoolWorkerSignals` class, permitting objects
+    designed to report progress via the latter (e.g., simulation phase
+    callbacks) to transparently report progress via the former instead.
+
+    Progress Coalescing
+    ----------
+    As with the :class:`QBetseeThreadPoolWorkerSignals` class, progress values
+    passed to the :meth:`emit_progress` method are coalesced rather than
+    forwarded as is. Only the most recent such value is forwarded at most as
+    many times per second as the progress frame rate of that worker, avoiding
+    one interprocess message (and hence one pickling and one system call) for
+    each simulation time step. Pending progress is forwarded *before* each
+    subsequent progress range or status, preserving the order in which these
+    were emitted, and on this process finishing.
+
+    Attributes
+    ----------
+    _conn : multiprocessing.connection.Connection
+        Child end of the pipe between that worker and this process.
+    _is_paused : bool
+        ``True`` only if that worker has requested that this process pause.
+    _progress_pending : IntOrNoneTypes
+        Most recent progress passed to the :meth:`emit_progress` method that
+        has yet to be forwarded to that worker if any *or* ``None`` otherwise.
+    _progress_seconds : float
+        Minimum number of seconds between forwarding successive progress to
+        that worker, equal to the reciprocal of its progress frame rate.
+    _progress_time_next : float
+        Monotonic time in fractional seconds after which the next call to the
+        :meth:`emit_progress` method forwards progress to that worker.
+    _usage_time_next : float
+        Monotonic time in fractional seconds after which the next call to the
+        :meth:`emit_progress` method reports the resource usage of this
+        process to that worker.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    def __init__(self, conn: object, progress_frame_rate: int) -> None:
+        '''
+        Initialize this channel.
+
+        Parameters
+        ----------
+        conn : multiprocessing.connection.Connection
+            Child end of the pipe between that worker and this process.
+        progress_frame_rate : int
+            Maximum number of times per second that progress is forwarded to
+            that worker.
+        '''
+
+        # Classify all passed parameters.
+        self._conn = conn
+        self._progress_seconds = 1.0 / progress_frame_rate
+
+        # Default this process to *NOT* being paused.
+        self._is_paused = False
+
+        # Forward and report resource usage on the first progress emitted by
+        # this process.
+        self._progress_pending = None
+        self._progress_time_next = 0.0
+        self._usage_time_next = 0.0
+
+    # ..................{ EMITTERS                          }..................
+    def emit_progress_range(
+        self, progress_min: int, progress_max: int) -> None:
+        '''
+        Forward the passed progress range to the parent worker *and* pause or
+        stop this process if requested.
+        '''
+
+        self._send_progress_pending()
+        self._conn.send(('progress_ranged', progress_min, progress_max))
+        self.halt_work_if_requested()
+
+
+    def emit_progress_state(self, status: str) -> None:
+        '''
+        Forward the passed progress status to the parent worker *and* pause or
+        stop this process if requested.
+        '''
+
+        self._send_progress_pending()
+        self._conn.send(('progress_stated', status))
+        self.halt_work_if_requested()
+
+
+    def emit_progress(self, progress: int) -> None:
+        '''
+        Coalesce the passed progress for subsequent forwarding to the parent
+        worker *and* pause or stop this process if requested.
+        '''
+
+        # Record this progress, overwriting any prior pending progress.
+        self._progress_pending = progress
+
+        # Current monotonic time.
+        time_now = time.monotonic()
+
+        # If progress has not been forwarded recently, forward this progress.
+        if time_now >= self._progress_time_next:
+            self._send_progress_pending()
+            self._progress_time_next = time_now + self._progress_seconds
+
+        # If resource usage has not been reported recently, report this usage.
+        if time_now >= self._usage_time_next:
+            self.emit_usage()
+
+        self.halt_work_if_requested()
+
+
+    def emit_final(self) -> None:
+        '''
+        Forward all pending progress *and* the final resource usage of this
+        process to the parent worker.
+
+        This method is called immediately *before* this process sends its
+        final message to that worker.
+        '''
+
+        self._send_progress_pending()
+        self.emit_usage()
+
+
+    def emit_usage(self) -> None:
+        '''
+        Forward the current resource usage of this process to the parent
+        worker.
+        '''
+
+        self._conn.send(('usage',) + tuple(get_process_usage()))
+        self._usage_time_next = time.monotonic() + CHILD_USAGE_SECONDS
+
+
+    def _send_progress_pending(self) -> None:
+        '''
+        Forward the most recent pending progress (if any) to the parent
+        worker.
+        '''
+
+        if self._progress_pending is not None:
+            self._conn.send(('progressed', self._progress_pending))
+            self._progress_pending = None
+
+    # ..................{ HALTERS                           }..................
+    def halt_work_if_requested(self) -> None:
+        '''
+        Handle all control requests sent by the parent worker since the last
+        call to this method, blocking while this process is paused.
+
+        Raises
+        ----------
+        BetseePySideThreadWorkerStopException
+            If the parent worker has requested that this process stop.
+        '''
+
+        # Handle all pending control requests without blocking.
+        while self._conn.poll():
+            self._handle_control(self._conn.recv())
+
+        # While paused, block on and handle each subsequent control request.
+        while self._is_paused:
+            self._handle_control(self._conn.recv())
+
+
+    def _handle_control(self, message: tuple) -> None:
+        '''
+        Handle the passed control request sent by the parent worker.
+        '''
+
+        # Type of this request.
+        message_type = message[0]
+
+        # Pause, resume, or stop this process as requested.
+        if message_type == 'pause':
+            self._is_paused = True
+        elif message_type == 'resume':
+            self._is_paused = False
+        elif message_type == 'stop':
+            raise BetseePySideThreadWorkerStopException('So say we all.')
+
+# ....................{ GETTERS                           }....................
+def get_process_usage() -> ProcessUsage:
+    '''
+    Named tuple aggregating the resource usage of the current process.
+    '''
+
+    # If the "resource" module is unavailable, report only CPU time.
+    if resource is None:
+        return ProcessUsage(
+            cpu_seconds=time.process_time(), rss_peak_bytes=None)
+
+    # Resource usage of this process.
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+
+    # Peak RSS of this process, reported in bytes under macOS but kilobytes
+    # under all other POSIX-compatible platforms.
+    rss_peak_bytes = usage.ru_maxrss
+    if sys.platform != 'darwin':
+        rss_peak_bytes *= 1024
+
+    # Return this usage.
+    return ProcessUsage(
+        cpu_seconds=usage.ru_utime + usage.ru_stime,
+        rss_peak_bytes=rss_peak_bytes,
+    )
+
+# ....................{ PRIVATE ~ child                   }....................
+def _run_child(
+    conn: object,
+    child_func: CallableTypes,
+    child_args: SequenceTypes,
+    progress_frame_rate: int,
+) -> None:
+    '''
+    Entry point of each child process spawned by a process-backed pooled
+    worker, calling the passed callable with a new channel wrapping the passed
+    pipe end and forwarding progress at most the passed number of times per
+    second followed by the passed arguments *and* sending the outcome of that
+    call back to that worker.
+    '''
+
+    # Channel wrapping this pipe end.
+    channel = ProcessPoolWorkerChannel(
+        conn=conn, progress_frame_rate=progress_frame_rate)
+
+    # Attempt to...
+    try:
+        # Call this callable, capturing the returned value.
+        return_value = child_func(channel, *child_args)
+    # If the parent worker requested that this process stop, notify that
+    # worker of this graceful stoppage.
+    except BetseePySideThreadWorkerStopException:
+        channel.emit_final()
+        conn.send(('stopped',))
+    # If this callable raised any other exception, send this exception.
+    except Exception as exception:
+        channel.emit_final()
+        _send_child_exception(conn, exception)
+    # Else, send this value. In all cases, forward all pending progress and
+    # the final resource usage of this process *BEFORE* the final message,
+    # after which that worker receives no further messages.
+    else:
+        channel.emit_final()
+        conn.send(('succeeded', return_value))
+    # In any case, close this pipe end.
+    finally:
+        conn.close()
+
+
+def _send_child_exception(conn: object, exception: Exception) -> None:
+    '''
+    Send the passed exception raised in a child process back to the parent
+    worker, falling back to a generic exception embedding the traceback of
+    this exception if this exception is unpicklable.
+    '''
+
+    # Human-readable traceback of this exception.
+    exception_traceback = ''.join(traceback.format_exception(
+        type(exception), exception, exception.__traceback__))
+
+    # Attempt to pickle this exception *BEFORE* sending this exception, as a
+    # pickling failure while sending would leave this pipe in an undefined
+    # state.
+    try:
+        pickle.dumps(exception)
+    # If this exception is unpicklable, replace this exception by a generic
+    # picklable exception embedding this traceback.
+    except Exception:
+        exception = BetseePySideThreadWorkerException(
+            'Pooled process worker child process failed:\n{}'.format(
+                exception_traceback))
+
+    # Send this exception.
+    conn.send(('failed', exception))
+
+# ....................{ HALTERS                           }....................
+def halt_children() -> None:
+    '''
+    Non-gracefully terminate *all* child processes spawned by process-backed
+    pooled workers that are still running.
+
+    This function is registered to be called on the active Python process
+    exiting, *before* :mod:`multiprocessing` joins all non-daemonic child
+    processes at exit. Failing to terminate these processes first would block
+    that exit until these processes finish on their own.
+    '''
+
+    # Snapshot all such processes *BEFORE* iterating, as pooled threads may
+    # concurrently discard these processes on finishing.
+    with _CHILD_PROCESSES_LOCK:
+        processes = tuple(_CHILD_PROCESSES)
+
+    # For each such process still running, terminate *AND* reap this process.
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+            process.join(CHILD_STOP_TIMEOUT_SECONDS)
+
+# ....................{ PRIVATE ~ globals                 }....................
+_CHILD_PROCESSES = set()
+'''
+Set of all child processes spawned by process-backed pooled workers that have
+yet to be reaped by those workers.
+'''
+
+
+_CHILD_PROCESSES_LOCK = threading.Lock()
+'''
+Lock rendering access to the :data:`_CHILD_PROCESSES` set thread-safe.
+'''
+
+
+# Terminate all such processes still running on the GUI process exiting.
+# The "multiprocessing" package runs all finalizers with a non-negative exit
+# priority on exiting *BEFORE* joining all non-daemonic child processes.
+Finalize(None, halt_children, exitpriority=10)
+
+# ....................{ PRIVATE ~ registrars              }....................
+def _add_child(process: object) -> None:
+    '''
+    Record the passed child process spawned by a process-backed pooled worker
+    for subsequent termination by the :func:`halt_children` function.
+    '''
+
+    with _CHILD_PROCESSES_LOCK:
+        _CHILD_PROCESSES.add(process)
+
+
+def _discard_child(process: object) -> None:
+    '''
+    Forget the passed child process reaped by a process-backed pooled worker.
+    '''
+
+    with _CHILD_PROCESSES_LOCK:
+        _CHILD_PROCESSES.discard(process)
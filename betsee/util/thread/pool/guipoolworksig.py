@@ -15,10 +15,22 @@ classes.
 #slots of the "QBetseeSimmer" controller.
 
 # ....................{ IMPORTS                           }....................
-from PySide2.QtCore import QObject, Signal
+from PySide2.QtCore import QMutex, QMutexLocker, QObject, QTimer, Signal, Slot
 # from betse.util.io.log import logs
 from betse.util.type.types import type_check, WeakRefBoundMethodType
 
+# ....................{ CONSTANTS                         }....................
+PROGRESS_FRAME_RATE = 30
+'''
+Default maximum number of times per second that coalesced progress emitted by
+pooled workers is delivered to slots residing in the main event thread *and*
+that child processes performing the business logic of process-backed pooled
+workers forward progress to those workers.
+
+Since the human eye perceives little difference in progress widgets updated
+more frequently than this, this rate suffices for all reasonable use cases.
+'''
+
 # ....................{ SUPERCLASSES                      }....................
 class QBetseeThreadPoolWorkerSignals(QObject):
     '''
@@ -45,12 +57,39 @@ class QBetseeThreadPoolWorkerSignals(QObject):
     signals to be trivially connected to, these signals necessarily remain
     public rather than private variables.
 
+    Progress Coalescing
+    ----------
+    Progress is typically emitted far more frequently than progress widgets
+    can be meaningfully updated (e.g., once for each of tens of thousands of
+    simulation time steps). Emitting one queued cross-thread signal for each
+    such update would flood the main event loop, slowing both the GUI and the
+    worker. Instead, the :meth:`emit_progress_range`, :meth:`emit_progress`,
+    and :meth:`emit_progress_state` methods merely record the most recent
+    progress range, value, and status in a thread-safe manner. A timer
+    residing in the main event thread then samples this progress at most the
+    passed number of times per second (defaulting to
+    :data:`PROGRESS_FRAME_RATE`), emitting the corresponding
+    :attr:`progress_ranged`, :attr:`progressed`, and :attr:`progress_stated`
+    signals *only* for progress changed since the prior sample. Intermediate
+    progress overwritten before being sampled is silently dropped and counted
+    by the :attr:`progress_dropped_count` property.
+
+    Since slots connected to the :attr:`failed` and :attr:`succeeded` signals
+    typically finalize progress widgets, the parent worker calls the
+    :meth:`flush_progress` method to deliver all remaining pending progress
+    *before* emitting either of those signals.
+
     Thread Affinity
     ----------
     Each instance of this class resides in the original thread in which this
     worker was instantiated and resides. Hence, neither this class nor any
-    subclass of this class should define slots. Why? Qt would execute these
-    slots in that original thread rather than the thread running this worker.
+    subclass of this class should define slots intended to be run from the
+    thread running this worker. Why? Qt would execute these slots in that
+    original thread rather than the thread running this worker. The sole
+    exception is the :meth:`flush_progress` slot, which is intentionally run
+    from that original thread by the timer sampling pending progress *and*
+    thread-safely called as a plain method from the thread running this worker
+    on that worker finishing.
 
     Attributes
     ----------
@@ -59,6 +98,30 @@ class QBetseeThreadPoolWorkerSignals(QObject):
         halting all business logic performed by the parent worker that owns
         this collection when requested to do so by external callers residing in
         other threads.
+
+    Attributes (Private: Progress)
+    ----------
+    _progress_dropped_count : int
+        Number of progress emissions overwritten by subsequent emissions
+        *before* being sampled and hence never delivered.
+    _progress_lock : QMutex
+        Non-exception-safe mutual exclusion primitive rendering all pending
+        progress thread-safe. Each access to this primitive should be
+        encapsulated by instantiating an exception-safe one-off
+        :class:`QMutexLocker` context manager as the target of a ``with``
+        context.
+    _progress_pending : IntOrNoneTypes
+        Most recent progress value emitted since last sampled if any *or*
+        ``None`` otherwise.
+    _progress_range_pending : TupleOrNoneTypes
+        Most recent 2-tuple ``(progress_min, progress_max)`` emitted since last
+        sampled if any *or* ``None`` otherwise.
+    _progress_status_pending : StrOrNoneTypes
+        Most recent progress status emitted since last sampled if any *or*
+        ``None`` otherwise.
+    _progress_timer : QTimer
+        Timer residing in the main event thread, periodically sampling all
+        pending progress while the parent worker is working.
     '''
 
     # ..................{ SIGNALS                           }..................
@@ -206,10 +269,20 @@ class QBetseeThreadPoolWorkerSignals(QObject):
 
     # ..................{ INITIALIZERS                      }..................
     @type_check
-    def __init__(self, halt_work_if_requested: WeakRefBoundMethodType) -> None:
+    def __init__(
+        self,
+        halt_work_if_requested: WeakRefBoundMethodType,
+        progress_frame_rate: int = PROGRESS_FRAME_RATE,
+    ) -> None:
         '''
         Initialize this pooled worker signals collection.
 
+        Caveats
+        ----------
+        **This collection must be instantiated from a thread running a Qt
+        event loop** (typically, the main event thread). Why? Because the
+        timer sampling pending progress resides in that thread.
+
         Parameters
         ----------
         halt_work_if_requested : WeakRefBoundMethodType
@@ -221,6 +294,9 @@ class QBetseeThreadPoolWorkerSignals(QObject):
             method bound to this parent worker. Accepting a reference to this
             method rather than this parent worker avoids circular object
             references between this parent worker and this child collection.
+        progress_frame_rate : int
+            Maximum number of times per second that pending progress is
+            sampled. Defaults to :data:`PROGRESS_FRAME_RATE`.
         '''
 
         # Initialize our superclass.
@@ -229,14 +305,108 @@ class QBetseeThreadPoolWorkerSignals(QObject):
         # Classify all passed parameters.
         self._halt_work_if_requested = halt_work_if_requested
 
+        # Nullify all pending progress for safety.
+        self._progress_dropped_count = 0
+        self._progress_pending = None
+        self._progress_range_pending = None
+        self._progress_status_pending = None
+
+        # Mutual exclusion primitive safeguarding this pending progress.
+        self._progress_lock = QMutex()
+
+        # Timer sampling this pending progress, parented to this collection
+        # and hence scheduled for deletion with this collection.
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(max(1000 // progress_frame_rate, 1))
+        self._progress_timer.timeout.connect(self.flush_progress)
+
+        # Sample pending progress *ONLY* while the parent worker is working.
+        # Since these signals are emitted from the pooled thread running that
+        # worker, these queued connections run these slots in the thread in
+        # which this collection resides. Note that the "finished" signal is
+        # connected here *BEFORE* any external slots are connected to that
+        # signal, ensuring all pending progress to be flushed *BEFORE* those
+        # slots are signalled (e.g., to schedule this worker for deletion).
+        self.started.connect(self._progress_timer.start)
+        self.finished.connect(self._stop_progress)
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def progress_dropped_count(self) -> int:
+        '''
+        Number of progress emissions (i.e., calls to the
+        :meth:`emit_progress_range`, :meth:`emit_progress`, and
+        :meth:`emit_progress_state` methods) overwritten by subsequent such
+        emissions *before* being sampled and hence never delivered to slots.
+
+        This property is thread-safe.
+        '''
+
+        # Within a thread- and exception-safe context manager synchronizing
+        # access to this count across multiple threads, return this count.
+        with QMutexLocker(self._progress_lock):
+            return self._progress_dropped_count
+
+    # ..................{ SLOTS                             }..................
+    @Slot()
+    def flush_progress(self) -> None:
+        '''
+        Slot periodically signalled by the :attr:`_progress_timer` in the
+        thread in which this collection resides, emitting all pending progress
+        (i.e., progress emitted by the parent worker since last sampled) in
+        the same order that the parent worker emits this progress.
+
+        This slot is also thread-safely callable as a method from the thread
+        running the parent worker, in which case the signals emitted by this
+        method are queued to slots residing in other threads *before* all
+        signals subsequently emitted by that worker.
+        '''
+
+        # Within a thread- and exception-safe context manager synchronizing
+        # access to this pending progress across multiple threads, localize
+        # *AND* clear this pending progress.
+        with QMutexLocker(self._progress_lock):
+            progress_range = self._progress_range_pending
+            progress = self._progress_pending
+            progress_status = self._progress_status_pending
+            self._progress_range_pending = None
+            self._progress_pending = None
+            self._progress_status_pending = None
+
+        # Emit this pending progress *AFTER* releasing this lock, preventing
+        # slots connected to these signals from blocking the parent worker.
+        if progress_range is not None:
+            self.progress_ranged.emit(*progress_range)
+        if progress is not None:
+            self.progressed.emit(progress)
+        if progress_status is not None:
+            self.progress_stated.emit(progress_status)
+
+
+    # ..................{ SLOTS ~ private                   }..................
+    @Slot()
+    def _stop_progress(self) -> None:
+        '''
+        Slot signalled on the parent worker finishing, halting the periodic
+        sampling of pending progress *after* emitting all remaining pending
+        progress.
+        '''
+
+        self._progress_timer.stop()
+        self.flush_progress()
+
     # ..................{ EMITTERS ~ progress               }..................
     @type_check
     def emit_progress_range(
         self, progress_min: int, progress_max: int) -> None:
         '''
-        Emit the :attr:`progress_ranged` signal with the passed range of all
-        possible **progress values** (i.e., integers subsequently emitted by
-        the :attr:`emit_progress` signal method) for the parent worker.
+        Coalescingly emit the :attr:`progress_ranged` signal with the passed
+        range of all possible **progress values** (i.e., integers subsequently
+        emitted by the :attr:`emit_progress` signal method) for the parent
+        worker.
+
+        This range is delivered on the next sampling of pending progress
+        *unless* overwritten by a subsequent call to this method beforehand.
 
         Parameters
         ----------
@@ -251,8 +421,23 @@ class QBetseeThreadPoolWorkerSignals(QObject):
             Further details.
         '''
 
-        # Signal all slots connected to this signal with these parameters.
-        self.progress_ranged.emit(progress_min, progress_max)
+        # Within a thread- and exception-safe context manager synchronizing
+        # access to this pending progress across multiple threads...
+        with QMutexLocker(self._progress_lock):
+            # If a prior progress range has yet to be sampled, drop that range.
+            if self._progress_range_pending is not None:
+                self._progress_dropped_count += 1
+
+            # Record this range for subsequent sampling.
+            self._progress_range_pending = (progress_min, progress_max)
+
+            # Drop any pending progress value, which pertains to the prior
+            # range and is obsoleted by this range. (Slots connected to the
+            # "progress_ranged" signal typically reset progress to the minimum
+            # value of the new range.)
+            if self._progress_pending is not None:
+                self._progress_dropped_count += 1
+                self._progress_pending = None
 
         # Temporarily or permanently halt all worker-specific business logic
         # when requested to do so by external callers in other threads *AFTER*
@@ -263,10 +448,13 @@ class QBetseeThreadPoolWorkerSignals(QObject):
     @type_check
     def emit_progress_state(self, status: str) -> None:
         '''
-        Emit the :attr:`progress_stated` signal with the passed **progress
-        status** (i.e., string subsequently emitted by the
+        Coalescingly emit the :attr:`progress_stated` signal with the passed
+        **progress status** (i.e., string subsequently emitted by the
         :attr:`emit_progress_state` signal method) for the parent worker.
 
+        This status is delivered on the next sampling of pending progress
+        *unless* overwritten by a subsequent call to this method beforehand.
+
         Parameters
         ----------
         status : str
@@ -278,8 +466,15 @@ class QBetseeThreadPoolWorkerSignals(QObject):
             Further details.
         '''
 
-        # Signal all slots connected to this signal with these parameters.
-        self.progress_stated.emit(status)
+        # Within a thread- and exception-safe context manager synchronizing
+        # access to this pending progress across multiple threads...
+        with QMutexLocker(self._progress_lock):
+            # If a prior progress status has yet to be sampled, drop that.
+            if self._progress_status_pending is not None:
+                self._progress_dropped_count += 1
+
+            # Record this status for subsequent sampling.
+            self._progress_status_pending = status
 
         # Temporarily or permanently halt all worker-specific business logic
         # when requested to do so by external callers in other threads *AFTER*
@@ -290,9 +485,12 @@ class QBetseeThreadPoolWorkerSignals(QObject):
     @type_check
     def emit_progress(self, progress: int) -> None:
         '''
-        Emit the :attr:`progressed` signal with the passed **progress value**
-        (i.e., integer signifying the progress of work completed) for the
-        parent worker.
+        Coalescingly emit the :attr:`progressed` signal with the passed
+        **progress value** (i.e., integer signifying the progress of work
+        completed) for the parent worker.
+
+        This value is delivered on the next sampling of pending progress
+        *unless* overwritten by a subsequent call to this method beforehand.
 
         Parameters
         ----------
@@ -305,8 +503,15 @@ class QBetseeThreadPoolWorkerSignals(QObject):
             Further details.
         '''
 
-        # Signal all slots connected to this signal with these parameters.
-        self.progressed.emit(progress)
+        # Within a thread- and exception-safe context manager synchronizing
+        # access to this pending progress across multiple threads...
+        with QMutexLocker(self._progress_lock):
+            # If a prior progress value has yet to be sampled, drop that value.
+            if self._progress_pending is not None:
+                self._progress_dropped_count += 1
+
+            # Record this value for subsequent sampling.
+            self._progress_pending = progress
 
         # Temporarily or permanently halt all worker-specific business logic
         # when requested to do so by external callers in other threads *AFTER*
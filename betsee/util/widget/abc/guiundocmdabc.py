@@ -99,8 +99,11 @@ class QBetseeWidgetUndoCommandABC(QUndoCommand):
         self._synopsis = synopsis
         self._widget = widget
 
-        # Integer uniquely identifying this concrete subclass.
-        self._id = id(type(self))
+        # Integer uniquely identifying this concrete subclass, truncated to a
+        # non-negative 32-bit integer. The superclass id() method returns a C++
+        # "int", into which the 64-bit address of this subclass overflows,
+        # silently preventing the parent undo stack from merging commands.
+        self._id = id(type(self)) & 0x7FFFFFFF
 
     # ..................{ SUPERCLASS ~ abstract             }..................
     # Abstract superclass methods required to be defined by each subclass.
@@ -9,16 +9,30 @@ aspect ratios of all images added to these widgets) facilities.
 '''
 
 # ....................{ IMPORTS                           }....................
-from PySide2.QtCore import Qt, QCoreApplication, QSize  #, Signal, Slot
-from PySide2.QtGui import QPixmap
+from PySide2.QtCore import Qt, QCoreApplication, QSize, Slot  #, Signal
+from PySide2.QtGui import QImage, QPixmap
 from PySide2.QtWidgets import QFrame, QLabel, QScrollArea
 from betse.lib.pil import pils
 from betse.util.io.log import logs
 from betse.util.path import pathnames, paths
 from betse.util.type.cls import classes
+from betse.util.type.decorator.decmemo import func_cached
 from betse.util.type.text import mls
-from betse.util.type.types import type_check
+from betse.util.type.types import type_check, SetType
+from betsee.util.thread.pool import guipoolthread
 from betsee.util.widget.mixin.guiwdgmixin import QBetseeObjectMixin
+from betsee.util.widget.stock.label.guilabelimagework import (
+    QBetseeLabelImageWorker)
+from collections import OrderedDict
+import os
+
+# ....................{ CONSTANTS                         }....................
+IMAGE_CACHE_BYTES_MAX = 64 * 1024 * 1024
+'''
+Maximum number of bytes consumed by all scaled images cached by the
+:class:`QBetseeLabelImage` class (i.e., 64MB), above which the least recently
+used such images are evicted.
+'''
 
 # ....................{ SUBCLASSES                        }....................
 #FIXME: Submit this class once working as a novel solution to:
@@ -107,19 +121,74 @@ class QBetseeLabelImage(QBetseeObjectMixin, QLabel):
     .. _recursion claim:
         https://stackoverflow.com/a/41403419/2809027
 
+    Asynchronicity
+    ----------
+    The :meth:`load_image` method decodes images in a non-blocking manner.
+    Specifically, that method starts a pooled worker decoding the passed image
+    scaled down to the current width of this label and returns immediately.
+    When that worker succeeds, the decoded image is set as this label's pixmap.
+    If that method is recalled before that worker succeeds (e.g., due to the
+    end user rapidly previewing multiple images), that worker is cancelled and
+    its result (if any) is silently ignored.
+
+    Decoded images are cached in a class-wide least recently used (LRU) cache
+    keyed by the filename *and* modification time of each image and bounded
+    by the :data:`IMAGE_CACHE_BYTES_MAX` constant. Repreviewing a previously
+    previewed (and unmodified) image thus reduces to a dictionary lookup.
+
     Attributes
     ----------
+    _image_width_decoded : (int, NoneType)
+        Width in pixels at which the image currently previewed by this label
+        was decoded if this label is previewing an image *or* ``None``
+        otherwise.
+    _image_width_full : (int, NoneType)
+        Unscaled width in pixels of the image currently previewed by this
+        label if this label is previewing an image *or* ``None`` otherwise.
+        If this width exceeds the :attr:`_image_width_decoded` width, this
+        image was downscaled on decoding and is redecodable at a larger width.
+    _image_key_pending : (tuple, NoneType)
+        2-tuple ``(filename, file_mtime_ns)`` uniquely identifying the image
+        most recently requested to be previewed by the :meth:`load_image`
+        method if that method has been called *or* ``None`` otherwise. Images
+        decoded by workers whose keys differ from this key are stale and hence
+        ignored.
+    _image_worker : (QBetseeLabelImageWorker, NoneType)
+        Pooled worker decoding the image most recently requested to be
+        previewed if that image is still being decoded *or* ``None``
+        otherwise.
+    _image_workers : set
+        Set of all pooled workers started by this label and yet to finish,
+        including both the current worker *and* all cancelled workers. Since
+        workers are *not* deletable until finished, these workers are
+        preserved here until finished.
     _pixmap : (QPixmap, NoneType)
         Pixmap added to this widget by an external call to the
         :meth:`setPixmap` method if that method has been called *or* ``None``
         otherwise.
 
+    Attributes (Class)
+    ----------
+    _image_cache : OrderedDict
+        Class-wide LRU cache mapping from the 2-tuple ``(filename,
+        file_mtime_ns)`` uniquely identifying each previously decoded image to
+        a 2-tuple ``(image, image_size_full)`` of that decoded :class:`QImage`
+        and the unscaled :class:`QSize` of that image, ordered from least to
+        most recently used. Since this cache is only accessed from the main
+        event thread, this cache requires no locking.
+    _image_cache_bytes : int
+        Number of bytes currently consumed by all images in this cache.
+
     See Also
     ----------
     https://stackoverflow.com/a/22618496/2809027
         StackOverflow answer inspiring this implementation.
     '''
 
+    # ..................{ CLASS VARIABLES                   }..................
+    _image_cache = OrderedDict()
+    _image_cache_bytes = 0
+
     # ..................{ INITIALIZERS                      }..................
     def __init__(self, *args, **kwargs) -> None:
 
@@ -127,6 +196,11 @@ class QBetseeLabelImage(QBetseeObjectMixin, QLabel):
         super().__init__(*args, **kwargs)
 
         # Nullify all instance variables for safety.
+        self._image_key_pending = None
+        self._image_width_decoded = None
+        self._image_width_full = None
+        self._image_worker = None
+        self._image_workers = set()
         self._pixmap = None
 
         # Lightly border this label's pixmap for aesthetics.
@@ -317,12 +391,32 @@ class QBetseeLabelImage(QBetseeObjectMixin, QLabel):
             # Rescale this pixmap to the desired size of this widget.
             self.setPixmap(self._pixmap)
 
+            # If this label has grown wider than the width the current image
+            # was decoded at, this image was downscaled on decoding (and is
+            # thus redecodable at a larger width), *AND* no image is currently
+            # being decoded, redecode this image at this label's new width.
+            # Shrinking this label or growing this label past the unscaled
+            # width of this image merely rescales the existing pixmap above.
+            if (
+                self._image_key_pending is not None and
+                self._image_worker is None and
+                self._image_width_decoded is not None and
+                self._image_width_decoded < self.width() and
+                self._image_width_decoded < self._image_width_full
+            ):
+                self.load_image(self._image_key_pending[0])
+
     # ..................{ LOADERS                           }..................
     @type_check
     def load_image(self, filename: str) -> None:
         '''
         Load the image with the passed filename as this label's pixmap in a
-        sensible manner preserving the aspect ratio of this image.
+        sensible, non-blocking manner preserving the aspect ratio of this image.
+
+        Specifically, this method synchronously validates this image *and*
+        then either immediately sets this label's pixmap to a previously
+        cached decoding of this image if any *or* asynchronously decodes this
+        image in a pooled worker otherwise. See the class docstring.
 
         For safety, this method preferentially displays otherwise fatal errors
         resulting from this loading process as non-fatal warnings set as this
@@ -366,14 +460,8 @@ class QBetseeLabelImage(QBetseeObjectMixin, QLabel):
                 return
             # Else, this image has a filetype.
 
-            # Set of all image filetypes readable by Pillow.
-            filetypes_pil = pils.get_filetypes()
-
-            # Set of all image filetypes readable by Qt.
-            filetypes_qt = guifiletype.get_image_read_filetypes()
-
             # If this image is unreadable by Pillow, show a warning and return.
-            if filetype not in filetypes_pil:
+            if filetype not in _get_image_read_filetypes_pil():
                 self._warn(QCoreApplication.translate('QBetseeLabelImage',
                     'Image filetype "{0}" unrecognized by Pillow.'.format(
                         filetype)))
@@ -384,21 +472,56 @@ class QBetseeLabelImage(QBetseeObjectMixin, QLabel):
             # If this image is unreadable by Qt, show a warning and return.
             # Since Qt reads fewer image filetypes than Pillow, this condition
             # is effectively ignorable from the perspective of the end user.
-            if filetype not in filetypes_qt:
+            if filetype not in guifiletype.get_image_read_filetypes():
                 self._warn(QCoreApplication.translate('QBetseeLabelImage',
                     'Image filetype "{0}" not previewable.'.format(
                         filetype)))
                 return
             # Else, this image is readable by both Pillow *AND* Qt.
 
-            # In-memory pixmap trivially loaded from this on-disk image.
-            pixmap = QPixmap(filename)
+            # 2-tuple uniquely identifying this image, invalidating cached
+            # decodings of this image on modifying this image.
+            image_key = (filename, os.stat(filename).st_mtime_ns)
+
+            # Cancel the prior decoding if any, which is now obsolete.
+            self._cancel_image_worker()
+
+            # Record this image as the most recently requested image.
+            self._image_key_pending = image_key
 
-            # Set this label's pixmap as this pixmap.
-            self.setPixmap(pixmap)
+            # Previously cached decoding of this image if any *OR* "None".
+            image_cached = self._get_image_cached(image_key)
 
-            # Resize this label to this message.
-            # self.adjustSize()
+            # If this decoding suffices, set this label's pixmap to a pixmap
+            # trivially converted from this decoding and return.
+            if image_cached is not None:
+                logs.log_debug('Previewing cached image "%s"...', basename)
+                self._set_pixmap_decoded(*image_cached)
+                return
+            # Else, this image has yet to be sufficiently decoded.
+
+            # Maximum size to decode this image at, constraining this image to
+            # the current width of this label (with unconstrained height).
+            image_size_max = QSize(max(self.width(), 1), 2**24)
+
+            # Pooled worker decoding this image at this size.
+            self._image_worker = QBetseeLabelImageWorker(
+                filename=filename,
+                file_mtime_ns=image_key[1],
+                image_size_max=image_size_max,
+            )
+
+            # Connect all relevant signals emitted by this worker to slots.
+            self._image_worker.signals.succeeded.connect(
+                self._handle_image_decoded)
+            self._image_worker.signals.failed.connect(
+                self._handle_image_failed)
+            self._image_worker.signals.finished.connect(
+                self._handle_image_worker_finished)
+
+            # Preserve this worker until finished *AND* start this worker.
+            self._image_workers.add(self._image_worker)
+            guipoolthread.start_worker(self._image_worker)
         # If doing so raises an exception...
         except Exception as exception:
             # Exception type.
@@ -415,6 +538,216 @@ class QBetseeLabelImage(QBetseeObjectMixin, QLabel):
                     exception_type,
                     exception_message)))
 
+    # ..................{ SLOTS                             }..................
+    @Slot(object)
+    def _handle_image_decoded(self, image_decoded: tuple) -> None:
+        '''
+        Slot signalled on a pooled worker started by the :meth:`load_image`
+        method successfully decoding an image, caching that image *and* setting
+        this label's pixmap to that image if that image is still the image most
+        recently requested to be previewed.
+
+        Parameters
+        ----------
+        image_decoded : tuple
+            4-tuple ``(filename, file_mtime_ns, image, image_size_full)``
+            returned by that worker. See :class:`QBetseeLabelImageWorker`.
+        '''
+
+        # Unpack this tuple.
+        filename, file_mtime_ns, image, image_size_full = image_decoded
+
+        # 2-tuple uniquely identifying this image.
+        image_key = (filename, file_mtime_ns)
+
+        # Cache this image regardless of whether this image is still pending,
+        # as the end user is likely to revisit recently previewed images.
+        self._set_image_cached(
+            image_key=image_key, image=image, image_size_full=image_size_full)
+
+        # If this image is no longer the image most recently requested to be
+        # previewed, silently ignore this image.
+        if image_key != self._image_key_pending:
+            return
+        # Else, this image is still pending.
+
+        # Set this label's pixmap to a pixmap converted from this image.
+        self._set_pixmap_decoded(image=image, image_size_full=image_size_full)
+
+
+    @Slot(Exception)
+    def _handle_image_failed(self, exception: Exception) -> None:
+        '''
+        Slot signalled on a pooled worker started by the :meth:`load_image`
+        method failing to decode an image, displaying this failure as a
+        non-fatal warning if that worker is still the current worker.
+
+        Parameters
+        ----------
+        exception : Exception
+            Exception raised by that worker.
+        '''
+
+        # If this worker is no longer the current worker, silently ignore this
+        # exception. Since cancelled workers only raise the stop exception
+        # internally caught by the superclass run() method, this should
+        # typically *NOT* happen.
+        if (
+            self._image_worker is None or
+            self.sender() is not self._image_worker.signals
+        ):
+            return
+
+        # Display this exception message as a non-fatal warning.
+        self._warn(QCoreApplication.translate(
+            'QBetseeLabelImage',
+            'Image "{0}" preview failed with "{1}": {2}'.format(
+                pathnames.get_basename(self._image_key_pending[0]),
+                classes.get_name_unqualified(exception),
+                str(exception))))
+
+
+    @Slot(bool)
+    def _handle_image_worker_finished(self, is_success: bool) -> None:
+        '''
+        Slot signalled on a pooled worker started by the :meth:`load_image`
+        method finishing (either successfully or not), releasing that worker.
+
+        Parameters
+        ----------
+        is_success : bool
+            ``True`` only if that worker successfully decoded its image.
+        '''
+
+        # Signals emitting this signal.
+        worker_signals = self.sender()
+
+        # For each unfinished worker, release the worker emitting this signal.
+        for worker in tuple(self._image_workers):
+            if worker.signals is worker_signals:
+                # If this is the current worker, this label no longer has a
+                # current worker.
+                if worker is self._image_worker:
+                    self._image_worker = None
+
+                # Schedule this worker for deletion *AND* release this worker.
+                worker.delete_later()
+                self._image_workers.discard(worker)
+                break
+
+    # ..................{ SETTERS                           }..................
+    @type_check
+    def _set_pixmap_decoded(
+        self, image: QImage, image_size_full: QSize) -> None:
+        '''
+        Set this label's pixmap to a pixmap converted from the passed decoding
+        of the image most recently requested to be previewed, recording the
+        width this image was decoded at and the passed unscaled size of this
+        image for subsequent use by the :meth:`resizeEvent` method.
+        '''
+
+        # Record these widths *BEFORE* setting this pixmap, which may resize
+        # this label and hence recursively call the resizeEvent() method.
+        self._image_width_decoded = image.width()
+        self._image_width_full = image_size_full.width()
+
+        # Set this label's pixmap to a pixmap converted from this image.
+        self.setPixmap(QPixmap.fromImage(image))
+
+    # ..................{ CANCELLERS                        }..................
+    def _cancel_image_worker(self) -> None:
+        '''
+        Cancel the pooled worker decoding the image most recently requested to
+        be previewed if any *or* reduce to a noop otherwise.
+
+        This worker is *not* released here, as the thread running this worker
+        may still be emitting signals owned by this worker. Instead, the
+        :meth:`_handle_image_worker_finished` slot subsequently releases this
+        worker on finishing.
+        '''
+
+        # If this label has a current worker, cancel and forget this worker.
+        if self._image_worker is not None:
+            self._image_worker.cancel()
+            self._image_worker = None
+
+    # ..................{ CACHERS                           }..................
+    def _get_image_cached(self, image_key: tuple) -> tuple:
+        '''
+        2-tuple ``(image, image_size_full)`` of the previously cached decoding
+        of the image uniquely identified by the passed key and the unscaled
+        size of that image if this decoding exists *and* suffices for this
+        label's current width *or* ``None`` otherwise.
+
+        A cached decoding suffices if either this decoding is at least as wide
+        as this label *or* this decoding is the unscaled image (in which case
+        a wider decoding is impossible).
+        '''
+
+        # 2-tuple "(image, image_size_full)" cached for this key if any *OR*
+        # "None" otherwise.
+        image_cached = self._image_cache.get(image_key, None)
+
+        # If no such decoding exists, return "None".
+        if image_cached is None:
+            return None
+        # Else, such a decoding exists.
+
+        # Unpack this tuple.
+        image, image_size_full = image_cached
+
+        # If this decoding is insufficient, return "None".
+        if (
+            image.width() < self.width() and
+            image.width() < image_size_full.width()
+        ):
+            return None
+        # Else, this decoding suffices.
+
+        # Mark this decoding as the most recently used *AND* return this tuple.
+        self._image_cache.move_to_end(image_key)
+        return image_cached
+
+
+    @type_check
+    def _set_image_cached(
+        self, image_key: tuple, image: QImage, image_size_full: QSize) -> None:
+        '''
+        Cache the passed decoding of the image uniquely identified by the
+        passed key, evicting the least recently used decodings until the total
+        size of all cached decodings is no greater than the
+        :data:`IMAGE_CACHE_BYTES_MAX` constant.
+        '''
+
+        # Class of this widget, whose class variables are modified below.
+        cls = type(self)
+
+        # Number of bytes consumed by this image.
+        image_bytes = image.bytesPerLine() * image.height()
+
+        # If this image alone exceeds the maximum size of this cache, avoid
+        # caching this image.
+        if image_bytes > IMAGE_CACHE_BYTES_MAX:
+            return
+
+        # If a prior decoding of this image is cached, remove that decoding.
+        image_cached_old = cls._image_cache.pop(image_key, None)
+        if image_cached_old is not None:
+            cls._image_cache_bytes -= (
+                image_cached_old[0].bytesPerLine() *
+                image_cached_old[0].height())
+
+        # Cache this decoding as the most recently used.
+        cls._image_cache[image_key] = (image, image_size_full)
+        cls._image_cache_bytes += image_bytes
+
+        # While this cache exceeds its maximum size, evict the least recently
+        # used decoding.
+        while cls._image_cache_bytes > IMAGE_CACHE_BYTES_MAX:
+            _, (image_evicted, _) = cls._image_cache.popitem(last=False)
+            cls._image_cache_bytes -= (
+                image_evicted.bytesPerLine() * image_evicted.height())
+
     # ..................{ WARNERS                           }..................
     @type_check
     def _warn(self, warning: str) -> None:
@@ -443,6 +776,14 @@ class QBetseeLabelImage(QBetseeObjectMixin, QLabel):
         # Log this warning.
         logs.log_warning(warning)
 
+        # Cancel the current decoding if any *AND* forget the most recently
+        # requested image, preventing this warning from being silently
+        # replaced by the result of that decoding.
+        self._cancel_image_worker()
+        self._image_key_pending = None
+        self._image_width_decoded = None
+        self._image_width_full = None
+
         # Remove this label's existing pixmap if any.
         self.clear()
 
@@ -452,10 +793,20 @@ class QBetseeLabelImage(QBetseeObjectMixin, QLabel):
 
         # Set this label's text to rich text embedding this message in a
         # visually distinctive manner indicative of a warning.
-        self._image_label.setText(QCoreApplication.translate(
+        self.setText(QCoreApplication.translate(
             'QBetseeLabelImage',
             '<span style="color: #aa0000;"><b>Warning:</b> {0}</span>'.format(
                 warning_escaped)))
 
         # Resize this label to this message.
         self.adjustSize()
+
+# ....................{ PRIVATE ~ getters                 }....................
+@func_cached
+def _get_image_read_filetypes_pil() -> SetType:
+    '''
+    Set of all image filetypes readable by Pillow, cached on the first call to
+    this getter to avoid repeatedly recomputing this set on each preview.
+    '''
+
+    return pils.get_filetypes()
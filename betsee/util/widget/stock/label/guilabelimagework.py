@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Image label worker** (i.e., pooled worker decoding images previewed by
+:class:`betsee.util.widget.stock.label.guilabelimage.QBetseeLabelImage`
+widgets in a non-blocking manner) facilities.
+'''
+
+# ....................{ IMPORTS                           }....................
+from PySide2.QtCore import QMutexLocker, QSize, Qt
+from PySide2.QtGui import QImageReader
+from betse.util.type.types import type_check
+from betsee.guiexception import BetseePySideThreadWorkerException
+from betsee.util.thread.pool.guipoolwork import QBetseeThreadPoolWorker
+
+# ....................{ CLASSES                           }....................
+class QBetseeLabelImageWorker(QBetseeThreadPoolWorker):
+    '''
+    **Image label worker** (i.e., pooled worker decoding a single on-disk
+    image into an in-memory :class:`QImage` scaled to fit within a passed
+    size, typically that of the image label previewing this image).
+
+    Unlike the :class:`QPixmap` constructor, which synchronously decodes the
+    entire image at full resolution in the GUI thread, this worker decodes
+    this image in a pooled thread via the :class:`QImageReader` class. Where
+    supported by the underlying image format plugin (e.g., JPEG), this reader
+    decodes this image directly at the scaled size, substantially reducing
+    both decoding time and memory consumption for large images.
+
+    Return Value
+    ----------
+    On success, this worker emits the :attr:`signals.succeeded` signal with a
+    4-tuple ``(filename, file_mtime_ns, image, image_size_full)``, where:
+
+    * ``filename`` and ``file_mtime_ns`` are the filename and modification time
+      of this image passed to the :meth:`__init__` method, uniquely
+      identifying the decoding request performed by this worker.
+    * ``image`` is the decoded :class:`QImage`.
+    * ``image_size_full`` is the unscaled :class:`QSize` of this image.
+
+    Caveats
+    ----------
+    **This worker returns a** :class:`QImage` **rather than**
+    :class:`QPixmap`. Pixmaps are backed by platform-specific graphical
+    resources and hence are safely creatable *only* in the GUI thread. The
+    caller is responsible for converting this image into a pixmap (e.g., via
+    the :meth:`QPixmap.fromImage` method) in that thread.
+
+    Attributes
+    ----------
+    _filename : str
+        Absolute filename of the image to be decoded.
+    _file_mtime_ns : int
+        Modification time in nanoseconds of this image.
+    _image_size_max : QSize
+        Maximum size to decode this image at, preserving the aspect ratio of
+        this image. Images smaller than this size are decoded at full size.
+    _is_cancelled : bool
+        ``True`` only if the :meth:`cancel` method has been called.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self, filename: str, file_mtime_ns: int, image_size_max: QSize) -> None:
+        '''
+        Initialize this image label worker.
+
+        Parameters
+        ----------
+        filename : str
+            Absolute filename of the image to be decoded.
+        file_mtime_ns : int
+            Modification time in nanoseconds of this image.
+        image_size_max : QSize
+            Maximum size to decode this image at, preserving the aspect ratio
+            of this image.
+        '''
+
+        # Initialize our superclass.
+        super().__init__()
+
+        # Classify all passed parameters.
+        self._filename = filename
+        self._file_mtime_ns = file_mtime_ns
+        self._image_size_max = image_size_max
+
+        # Default this worker to *NOT* being cancelled.
+        self._is_cancelled = False
+
+    # ..................{ SLOTS                             }..................
+    def cancel(self) -> None:
+        '''
+        Thread-safe psuedo-slot (i.e., non-slot method mimicking the
+        thread-safe push-based action of a genuine slot) permanently cancelling
+        the decoding performed by this worker.
+
+        Unlike the superclass :meth:`stop` method, this method also cancels
+        this worker if this worker has yet to be run (e.g., due to being queued
+        by a thread pool with no idle threads), in which case this worker
+        immediately stops on being run. Since :class:`QImageReader` decoding is
+        *not* interruptible, this worker otherwise stops at the next
+        interruptible point.
+        '''
+
+        # Within a thread- and exception-safe context manager synchronizing
+        # access to this state across multiple threads, record this request.
+        with QMutexLocker(self._state_lock):
+            self._is_cancelled = True
+
+        # Stop this worker if currently running.
+        self.stop()
+
+    # ..................{ WORKERS                           }..................
+    def _work(self) -> tuple:
+
+        # If this worker has already been cancelled (e.g., while queued), stop.
+        self._stop_work_if_cancelled()
+
+        # Image reader decoding this image.
+        image_reader = QImageReader(self._filename)
+
+        # Respect EXIF orientation metadata if any.
+        image_reader.setAutoTransform(True)
+
+        # Unscaled size of this image as reported by this image's header, which
+        # avoids decoding this image in its entirety.
+        image_size_full = image_reader.size()
+
+        # If this size is valid *AND* exceeds the maximum size, decode this
+        # image scaled down to fit within this size while preserving this
+        # image's aspect ratio. Else, decode this image at full size.
+        if (
+            image_size_full.isValid() and (
+                image_size_full.width()  > self._image_size_max.width() or
+                image_size_full.height() > self._image_size_max.height())
+        ):
+            image_reader.setScaledSize(image_size_full.scaled(
+                self._image_size_max, Qt.KeepAspectRatio))
+
+        # If this worker has been cancelled while reading this header, stop.
+        self._halt_work_if_requested()
+
+        # Decode this image.
+        image = image_reader.read()
+
+        # If decoding failed, raise an exception embedding the human-readable
+        # reason for this failure.
+        if image.isNull():
+            raise BetseePySideThreadWorkerException(
+                'Image "{}" undecodable: {}'.format(
+                    self._filename, image_reader.errorString()))
+
+        # If this worker has been cancelled while decoding this image, stop
+        # *BEFORE* needlessly emitting this image.
+        self._stop_work_if_cancelled()
+
+        # Return this image and metadata uniquely identifying this request.
+        return (self._filename, self._file_mtime_ns, image, image_size_full)
+
+    # ..................{ STOPPERS                          }..................
+    def _stop_work_if_cancelled(self) -> None:
+        '''
+        Gracefully stop this worker if the :meth:`cancel` method has been
+        called *or* defer to the superclass :meth:`_halt_work_if_requested`
+        method otherwise.
+        '''
+
+        # Within a thread- and exception-safe context manager synchronizing
+        # access to this state across multiple threads...
+        with QMutexLocker(self._state_lock):
+            # If this worker has been cancelled, stop.
+            if self._is_cancelled:
+                self._stop_work()
+
+        # Else, halt this worker if otherwise requested.
+        self._halt_work_if_requested()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Global test configuration for all tests.
+
+:mod:`pytest` implicitly imports all functionality defined by this module into
+all test modules. Fixtures defined here are thus usable by all tests *without*
+explicitly importing these fixtures.
+'''
+
+# ....................{ IMPORTS                           }....................
+import pytest
+
+# ....................{ FIXTURES                          }....................
+@pytest.fixture
+def betsee_app(monkeypatch) -> 'PySide2.QtCore.QCoreApplication':
+    '''
+    Fixture initializing this application (and hence both BETSE and the
+    cached :mod:`PySide2` submodules imported by this application) without a
+    display if this application has yet to be initialized by a prior test,
+    returning the Qt application singleton.
+
+    Since importing the :mod:`betse.science` package implicitly initializes
+    BETSE rather than this application, tests requiring this initialization
+    should request this fixture *before* importing that package. Tests
+    requesting this fixture are skipped if either :mod:`PySide2` or BETSE is
+    unimportable.
+    '''
+
+    # Skip the requesting test if optional dependencies are unimportable.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+
+    # Defer heavyweight imports requiring optional dependencies.
+    from PySide2.QtCore import QCoreApplication
+    from betse.util.app.meta import appmetaone
+    from betsee.guiappmeta import BetseeAppMeta
+    from betsee.lib.pyside2.cache.guipsdcache import CachePolicy
+
+    # Avoid requiring a display, both for this initialization *AND* for
+    # child processes spawned by the requesting test.
+    monkeypatch.setenv('QT_QPA_PLATFORM', 'offscreen')
+
+    # If this application has yet to be initialized, do so *AFTER*
+    # deinitializing any BETSE application initialized by prior tests having
+    # already imported the "betse.science" package.
+    if not (appmetaone.is_app_meta() and
+            isinstance(appmetaone.get_app_meta(), BetseeAppMeta)):
+        appmetaone.deinit()
+        BetseeAppMeta().init_libs(cache_policy=CachePolicy.USER)
+
+    # Return the Qt application singleton instantiated by this initialization.
+    return QCoreApplication.instance()
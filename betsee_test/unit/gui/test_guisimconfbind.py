@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the simulation configuration binder, repopulating editable
+simulation configuration widgets in time-sliced batches.
+'''
+
+# ....................{ TESTS                             }....................
+def test_binder_binds_visible_first(betsee_app, monkeypatch) -> None:
+    '''
+    Test that binding editable widgets binds all visible widgets in the
+    first batch (even when the time budget of each batch is exhausted),
+    prefers widgets made visible while binding is underway in subsequent
+    batches, *and* binds all remaining widgets on flushing.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betsee.gui.simconf import guisimconfbind
+
+    # Exhaust the time budget of each batch immediately, reducing each batch
+    # to binding only visible widgets.
+    monkeypatch.setattr(guisimconfbind, 'BIND_SLICE_MILLISECONDS', -1)
+
+    # Binder with three invisible widgets *AND* one visible widget.
+    binder = guisimconfbind.QBetseeSimConfBinder()
+    widgets = [
+        _EditWidgetFake(name=name, is_visible=(name == 'visible'))
+        for name in ('hidden_a', 'visible', 'hidden_b', 'hidden_c')
+    ]
+    for widget in widgets:
+        binder.register_widget(widget)
+    binder.register_widget(widgets[0])
+
+    # Assert binding a new configuration to bind only the visible widget in
+    # the first batch *AND* schedule the remainder.
+    binder.bind('/sims/sim_config.yaml')
+    assert _get_bound_names(widgets) == ['visible']
+    assert binder.is_binding
+    assert binder._bind_timer.isActive()
+
+    # Assert a widget made visible mid-bind to be bound in the next batch.
+    widgets[3].is_visible = True
+    binder._bind_batch()
+    assert _get_bound_names(widgets) == ['visible', 'hidden_c']
+
+    # Assert flushing to synchronously bind all remaining widgets to the
+    # same configuration *AND* cease scheduling batches.
+    binder.flush()
+    assert not binder.is_binding
+    assert not binder._bind_timer.isActive()
+    assert all(
+        widget.filenames == ['/sims/sim_config.yaml'] for widget in widgets)
+
+    # Assert closing this configuration to rebind all widgets exactly once
+    # to the empty string.
+    binder.bind('')
+    binder.flush()
+    assert all(
+        widget.filenames == ['/sims/sim_config.yaml', '']
+        for widget in widgets
+    )
+
+
+def test_radio_button_group_visible(betsee_app) -> None:
+    '''
+    Test that radio button groups, which are *not* widgets, report themselves
+    to be visible to the binder only when one or more of their radio buttons
+    are visible.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from PySide2.QtWidgets import QRadioButton, QWidget
+    from betsee.gui.simconf.stack.widget.guisimconfradiobtn import (
+        QBetseeSimConfEnumRadioButtonGroup)
+
+    # Radio button group containing a radio button in a hidden parent widget.
+    parent_widget = QWidget()
+    radio_btn = QRadioButton(parent_widget)
+    radio_btn_group = QBetseeSimConfEnumRadioButtonGroup(parent_widget)
+    radio_btn_group.addButton(radio_btn)
+
+    # Assert this group to be visible only while this parent widget is.
+    assert not radio_btn_group.isVisible()
+    parent_widget.show()
+    try:
+        assert radio_btn_group.isVisible()
+    finally:
+        parent_widget.hide()
+    assert not radio_btn_group.isVisible()
+
+# ....................{ PRIVATE ~ classes                 }....................
+class _EditWidgetFake(object):
+    '''
+    Fake editable simulation configuration widget recording each filename
+    this widget is bound to.
+    '''
+
+    def __init__(self, name: str, is_visible: bool) -> None:
+        self.name = name
+        self.is_visible = is_visible
+        self.filenames = []
+
+    def isVisible(self) -> bool:
+        return self.is_visible
+
+    def _set_filename(self, filename: str) -> None:
+        self.filenames.append(filename)
+
+# ....................{ PRIVATE ~ getters                 }....................
+def _get_bound_names(widgets: list) -> list:
+    '''
+    List of the names of all passed fake widgets bound at least once, in the
+    order passed.
+    '''
+
+    return [widget.name for widget in widgets if widget.filenames]
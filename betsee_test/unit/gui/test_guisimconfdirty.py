@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the dirty state of the simulation configurator, derived from
+the set of simulation configuration options changed since last saved.
+'''
+
+# ....................{ IMPORTS                           }....................
+from types import SimpleNamespace
+import time
+
+# ....................{ CONSTANTS                         }....................
+LOAD_TIMEOUT_SECONDS = 60.0
+'''
+Maximum number of seconds to wait for a simulation configuration to be loaded
+and bound, above which the current test fails.
+'''
+
+# ....................{ TESTS                             }....................
+def test_sim_conf_dirty_clean_on_restore(
+    betsee_app, monkeypatch, tmp_path) -> None:
+    '''
+    Test that editing an option marks the open simulation configuration dirty
+    *and* that either undoing that edit or manually restoring the saved value
+    of that option marks that configuration clean again, synchronizing the
+    clean state of the undo stack with that of this configuration.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from PySide2.QtWidgets import QDoubleSpinBox
+    from betse.science.parameters import Parameters
+    from betsee.gui.guimainsignaler import QBetseeSignaler
+    from betsee.gui.simconf.stack.widget.mixin import guisimconfwdgeditscalar
+    from betsee.gui.window.guiwindow import QBetseeMainWindow
+    from betsee.util.app import guiappwindow
+
+    # Replace the clock consulted when merging undo commands by a fake clock.
+    time_now = [0.0]
+    monkeypatch.setattr(guisimconfwdgeditscalar, 'time', SimpleNamespace(
+        monotonic=lambda: time_now[0]))
+
+    # Write the default simulation configuration.
+    conf_filename = str(tmp_path / 'sim_config.yaml')
+    p = Parameters()
+    p.load(p.conf_default_filename)
+    p.save(conf_filename)
+
+    # Main window, registered as the main window singleton required to
+    # display loading progress in the status bar of this window.
+    main_window = QBetseeMainWindow(
+        signaler=QBetseeSignaler(), sim_conf_filename=None)
+    sim_conf = main_window.sim_conf
+    guiappwindow.set_main_window(main_window)
+
+    try:
+        # Initialize the lazily initialized pager of the page containing the
+        # widget edited below, registering that widget to be bound on load.
+        main_window.sim_conf_stack._init_stack_page_pager_if_needed(
+            stack_page=main_window.sim_conf_stack_page_Space,
+            main_window=main_window)
+
+        # Load this configuration and wait for this load to be bound.
+        sim_conf.load(conf_filename)
+        time_timeout = time.monotonic() + LOAD_TIMEOUT_SECONDS
+        while (
+            not sim_conf.is_open or
+            sim_conf.binder.is_binding or
+            sim_conf._load_workers
+        ):
+            assert time.monotonic() < time_timeout
+            betsee_app.processEvents()
+            time.sleep(0.01)
+
+        # Widget editing the world length of this configuration.
+        world_len_widget = main_window.sim_conf_space_extra_world_len
+        world_len = sim_conf.p.world_len
+
+        def _edit_world_len(value: float) -> None:
+            '''
+            Edit the world length of this configuration to the passed value
+            as if the user had entered that value and then finished editing,
+            applying this edit *and* updating the dirty state immediately.
+            '''
+
+            QDoubleSpinBox.setValue(world_len_widget, value)
+            world_len_widget.editingFinished.emit()
+            sim_conf.flush_edits()
+
+        # Assert a newly opened configuration to be clean.
+        assert not sim_conf.is_dirty
+        assert sim_conf.undo_stack.isClean()
+
+        # Assert editing an option to mark this configuration dirty.
+        _edit_world_len(world_len * 2)
+        assert sim_conf.p.world_len == world_len * 2
+        assert sim_conf.is_dirty
+        assert not sim_conf.undo_stack.isClean()
+        assert sim_conf._action_save_sim.isEnabled()
+
+        # Assert undoing that edit to mark this configuration clean.
+        sim_conf.undo_stack.undo()
+        sim_conf.flush_edits()
+        assert sim_conf.p.world_len == world_len
+        assert not sim_conf.is_dirty
+        assert sim_conf.undo_stack.isClean()
+        assert not sim_conf._action_save_sim.isEnabled()
+
+        # Assert redoing that edit to mark this configuration dirty again.
+        sim_conf.undo_stack.redo()
+        sim_conf.flush_edits()
+        assert sim_conf.is_dirty
+
+        # Assert manually restoring the saved value of that option *WITHOUT*
+        # undoing (after the undo merge window has elapsed, preventing this
+        # edit from being merged into the prior undo command) to mark this
+        # configuration clean, marking the current index of the undo stack as
+        # clean despite that index differing from that of the last save.
+        time_now[0] += guisimconfwdgeditscalar.UNDO_MERGE_WINDOW_SECONDS * 2
+        _edit_world_len(world_len)
+        assert sim_conf.p.world_len == world_len
+        assert sim_conf.undo_stack.index() == 2
+        assert not sim_conf.is_dirty
+        assert sim_conf.undo_stack.isClean()
+
+        # Assert reentering the current value to push no undo command.
+        _edit_world_len(world_len)
+        assert sim_conf.undo_stack.count() == 2
+        assert not sim_conf.is_dirty
+
+        # Assert invalidating the set of changed options (e.g., on restoring
+        # unsaved edits from a journal) to mark this configuration dirty
+        # regardless of the values of these options.
+        sim_conf.patcher.invalidate()
+        sim_conf.set_dirty_deferred()
+        sim_conf.flush_edits()
+        assert sim_conf.is_dirty
+    finally:
+        guiappwindow.unset_main_window()
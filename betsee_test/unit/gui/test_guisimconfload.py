@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the asynchronous loading of simulation configurations by the
+simulation configurator.
+'''
+
+# ....................{ IMPORTS                           }....................
+import time
+
+# ....................{ CONSTANTS                         }....................
+LOAD_TIMEOUT_SECONDS = 60.0
+'''
+Maximum number of seconds to wait for a simulation configuration to be loaded
+and bound, above which the current test fails.
+'''
+
+# ....................{ TESTS                             }....................
+def test_sim_conf_load_supersedes(betsee_app, tmp_path) -> None:
+    '''
+    Test that requesting another simulation configuration be loaded while a
+    prior configuration is still being deserialized discards the result of
+    that prior deserialization, loads *only* the most recently requested
+    configuration, *and* then binds all editable widgets to that
+    configuration.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betse.science.parameters import Parameters
+    from betsee.gui.guimainsignaler import QBetseeSignaler
+    from betsee.gui.window.guiwindow import QBetseeMainWindow
+    from betsee.util.app import guiappwindow
+
+    # Write three simulation configurations differing only in world length.
+    p = Parameters()
+    p.load(p.conf_default_filename)
+    world_len = p.world_len
+    conf_filenames = []
+    for conf_index in range(3):
+        conf_filename = str(
+            tmp_path / 'sim_{}'.format(conf_index) / 'sim_config.yaml')
+        p.world_len = world_len * (conf_index + 1)
+        p.save(conf_filename)
+        conf_filenames.append(conf_filename)
+
+    # Main window, registered as the main window singleton required to
+    # display loading progress in the status bar of this window.
+    main_window = QBetseeMainWindow(
+        signaler=QBetseeSignaler(), sim_conf_filename=None)
+    sim_conf = main_window.sim_conf
+    guiappwindow.set_main_window(main_window)
+
+    # List of each filename signalled as the newly open configuration.
+    filenames_set = []
+
+    def _append_filename_set(filename: str) -> None:
+        filenames_set.append(filename)
+
+    sim_conf.set_filename_signal.connect(_append_filename_set)
+
+    try:
+        # Request all three configurations be loaded in rapid succession,
+        # each superseding the prior request.
+        for conf_filename in conf_filenames:
+            sim_conf.load(conf_filename)
+
+            # Assert the first load to be deserializing with all widgets
+            # accessing that configuration disabled *AND* subsequent loads
+            # to be deferred.
+            assert sim_conf.is_loading
+            assert not sim_conf.is_open
+            assert not sim_conf._sim_conf_stack.isEnabled()
+        assert sim_conf._load_filename_pending == conf_filenames[-1]
+
+        # Wait for the last requested configuration to be loaded and bound.
+        time_timeout = time.monotonic() + LOAD_TIMEOUT_SECONDS
+        while (
+            not sim_conf.is_open or
+            sim_conf.binder.is_binding or
+            sim_conf._load_workers
+        ):
+            assert time.monotonic() < time_timeout
+            betsee_app.processEvents()
+            time.sleep(0.01)
+    finally:
+        guiappwindow.unset_main_window()
+
+    # Assert only the last requested configuration to have been opened,
+    # silently discarding the superseded deserialization of the first.
+    assert filenames_set == [conf_filenames[-1]]
+    assert sim_conf.p.conf_filename == conf_filenames[-1]
+    assert sim_conf.p.world_len == world_len * 3
+    assert sim_conf._load_filename_pending is None
+
+    # Assert all widgets accessing this configuration to have been enabled.
+    assert sim_conf._sim_conf_stack.isEnabled()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the simulation configuration writer, including the
+coalescing of queued write jobs.
+'''
+
+# ....................{ IMPORTS                           }....................
+import os, pytest, time
+
+# ....................{ CONSTANTS                         }....................
+LOAD_TIMEOUT_SECONDS = 60.0
+'''
+Maximum number of seconds to wait for a simulation configuration to be loaded
+and bound, above which the current test fails.
+'''
+
+# ....................{ TESTS                             }....................
+def test_is_write_job_superseded() -> None:
+    '''
+    Test that queued write jobs are superseded only by subsequent jobs that
+    write the same file *and* preserve all changes of the queued jobs.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from betsee.gui.simconf.guisimconfsave import (
+        SimConfWriteJob, SimConfWriteKind, is_write_job_superseded)
+
+    def make_job(**kwargs) -> SimConfWriteJob:
+        '''
+        Save of a full snapshot to the same file, overridden by the passed
+        keyword arguments.
+        '''
+
+        job_kwargs = dict(
+            kind=SimConfWriteKind.SAVE,
+            filename='/sim/sim_config.yaml',
+            container={},
+            src_filename='/sim/sim_config.yaml',
+            subdir_basenames=(),
+            patches=None,
+        )
+        job_kwargs.update(kwargs)
+        return SimConfWriteJob(**job_kwargs)
+
+    # Patching job, whose patches are opaque to this function.
+    job_patching = make_job(container=None, patches=(object(),))
+
+    # Assert full snapshots to supersede all jobs writing the same file
+    # *EXCEPT* saves copying subdirectories.
+    assert is_write_job_superseded(make_job(), make_job())
+    assert is_write_job_superseded(job_patching, make_job())
+    assert not is_write_job_superseded(
+        make_job(subdir_basenames=('geo',)), make_job())
+    assert not is_write_job_superseded(
+        make_job(filename='/sim/other.yaml'), make_job())
+
+    # Assert patching jobs to supersede full snapshots but *NOT* patching
+    # jobs, whose patches assume the file written by the queued job.
+    assert is_write_job_superseded(make_job(), job_patching)
+    assert not is_write_job_superseded(job_patching, job_patching)
+    assert not is_write_job_superseded(
+        job_patching._replace(kind=SimConfWriteKind.JOURNAL),
+        job_patching._replace(kind=SimConfWriteKind.JOURNAL),
+    )
+
+
+def test_sim_conf_save_as_copying(betsee_app, monkeypatch, tmp_path) -> None:
+    '''
+    Test that saving the open simulation configuration to a file in another
+    directory ("Save As...") reports copying the requisite subdirectories of
+    that configuration until that copy completes *and* that waiting for all
+    queued writes guarantees these subdirectories to have been copied.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betse.science.parameters import Parameters
+    from betsee.util.app import guiappwindow
+    from betsee.util.path import guifile
+
+    # Main window whose simulation configuration is the default
+    # configuration, saved into a subdirectory of this temporary directory.
+    main_window = _make_main_window(
+        betsee_app, str(tmp_path / 'sim_src' / 'sim_config.yaml'))
+    sim_conf = main_window.sim_conf
+
+    # Basenames of all requisite subdirectories of this configuration.
+    subdir_basenames = tuple(sim_conf.p._iter_conf_subdir_basenames())
+    assert subdir_basenames
+
+    # Filename of the file to save this configuration as, selected by a
+    # "Save As..." dialog emulated below.
+    conf_filename_trg = str(tmp_path / 'sim_trg' / 'sim_config.yaml')
+    monkeypatch.setattr(
+        guifile, 'select_file_yaml_save', lambda **kwargs: conf_filename_trg)
+
+    # List of each boolean signalled as the copying state.
+    is_copyings = []
+    sim_conf.set_copying_signal.connect(is_copyings.append)
+
+    try:
+        # Save this configuration as this file.
+        sim_conf._save_sim_as()
+
+        # Assert this configuration to be associated with this file *AND* the
+        # requisite subdirectories to still be reported as being copied.
+        assert sim_conf.p.conf_filename == conf_filename_trg
+        assert sim_conf.is_copying
+        assert is_copyings == [True]
+
+        # Wait for all queued writes to be performed.
+        sim_conf.wait_writes()
+    finally:
+        guiappwindow.unset_main_window()
+
+    # Assert these subdirectories to have been copied *AND* to no longer be
+    # reported as being copied.
+    assert not sim_conf.is_copying
+    assert is_copyings == [True, False]
+    for subdir_basename in subdir_basenames:
+        assert os.path.isdir(os.path.join(
+            os.path.dirname(conf_filename_trg), subdir_basename))
+    assert Parameters.make(conf_filename_trg).world_len == (
+        sim_conf.p.world_len)
+
+
+def test_sim_conf_new_copying(betsee_app, monkeypatch, tmp_path) -> None:
+    '''
+    Test that creating a new simulation configuration ("New...") reports
+    copying the requisite subdirectories of the default configuration until
+    that copy completes *and* that waiting for all queued writes guarantees
+    these subdirectories to have been copied.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betsee.util.app import guiappwindow
+    from betsee.util.path import guifile
+
+    # Main window whose simulation configuration is the default
+    # configuration, saved into a subdirectory of this temporary directory.
+    main_window = _make_main_window(
+        betsee_app, str(tmp_path / 'sim_src' / 'sim_config.yaml'))
+    sim_conf = main_window.sim_conf
+
+    # Filename of the new configuration, selected by a "New..." dialog
+    # emulated below.
+    conf_filename_new = str(tmp_path / 'sim_new' / 'sim_config.yaml')
+    monkeypatch.setattr(
+        guifile, 'select_file_yaml_save', lambda **kwargs: conf_filename_new)
+
+    try:
+        # Create this configuration.
+        sim_conf._make_sim()
+
+        # Assert this configuration to be associated with this file *AND*
+        # the requisite subdirectories to still be reported as being copied.
+        assert sim_conf.p.conf_filename == conf_filename_new
+        assert sim_conf.is_copying
+
+        # Wait for all queued writes to be performed.
+        sim_conf.wait_writes()
+    finally:
+        guiappwindow.unset_main_window()
+
+    # Assert this configuration to remain open *AND* these subdirectories to
+    # have been copied.
+    assert sim_conf.is_open
+    assert not sim_conf.is_copying
+    assert os.path.isfile(conf_filename_new)
+    for subdir_basename in sim_conf.p._iter_conf_subdir_basenames():
+        assert os.path.isdir(os.path.join(
+            os.path.dirname(conf_filename_new), subdir_basename))
+
+# ....................{ PRIVATE ~ makers                  }....................
+def _make_main_window(betsee_app, conf_filename: str) -> object:
+    '''
+    New main window registered as the main window singleton, whose open
+    simulation configuration is the default configuration saved to the passed
+    filename.
+
+    Callers are responsible for unregistering this singleton by calling the
+    :func:`guiappwindow.unset_main_window` function.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betse.science.parameters import Parameters
+    from betsee.gui.guimainsignaler import QBetseeSignaler
+    from betsee.gui.window.guiwindow import QBetseeMainWindow
+    from betsee.util.app import guiappwindow
+
+    # Write the default simulation configuration to this file.
+    p = Parameters()
+    p.load(p.conf_default_filename)
+    p.save(conf_filename)
+
+    # Main window, registered as the main window singleton required to
+    # display write progress in the status bar of this window.
+    main_window = QBetseeMainWindow(
+        signaler=QBetseeSignaler(), sim_conf_filename=None)
+    sim_conf = main_window.sim_conf
+    guiappwindow.set_main_window(main_window)
+
+    # Open this configuration *AND* wait for this configuration to be loaded
+    # and bound.
+    sim_conf.load(conf_filename)
+    time_timeout = time.monotonic() + LOAD_TIMEOUT_SECONDS
+    while (
+        not sim_conf.is_open or
+        sim_conf.binder.is_binding or
+        sim_conf._load_workers
+    ):
+        assert time.monotonic() < time_timeout
+        betsee_app.processEvents()
+        time.sleep(0.01)
+
+    # Return this window.
+    return main_window
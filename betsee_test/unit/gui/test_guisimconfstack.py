@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the simulation configuration stack widget, lazily initializing
+the pager controlling each page of that widget.
+'''
+
+# ....................{ IMPORTS                           }....................
+import json
+
+# ....................{ TESTS                             }....................
+def test_stack_pagers_lazy(betsee_app, tmp_path) -> None:
+    '''
+    Test that generating the main window initializes *only* the pager
+    controlling the stack page displayed at startup, profiled as a distinct
+    startup phase, *and* that switching to another page initializes the pager
+    controlling that page on demand.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betsee.gui.guimainsignaler import QBetseeSignaler
+    from betsee.gui.window.guiwindow import QBetseeMainWindow
+    from betsee.util.app import guiappstartup, guiappwindow
+
+    # Generate the main window while profiling startup.
+    report_filename = str(tmp_path / 'startup.json')
+    guiappstartup.init(report_filename=report_filename)
+    try:
+        main_window = QBetseeMainWindow(
+            signaler=QBetseeSignaler(), sim_conf_filename=None)
+    finally:
+        guiappstartup.deinit()
+    sim_conf_stack = main_window.sim_conf_stack
+
+    # Assert only the pager controlling the current page to be initialized.
+    stack_page_name_startup = sim_conf_stack.currentWidget().objectName()
+    assert sim_conf_stack._stack_page_names_initted == {
+        stack_page_name_startup}
+    assert len(sim_conf_stack._stack_page_name_to_pager) > 1
+
+    # Assert this initialization to have been profiled as a startup phase.
+    with open(report_filename) as report_file:
+        phase_names = list(_iter_phase_names(json.load(report_file)['phase']))
+    assert [
+        phase_name
+        for phase_name in phase_names
+        if phase_name.startswith('pager:')
+    ] == ['pager:' + stack_page_name_startup]
+
+    # Static tree item associated with a page controlled by an uninitialized
+    # pager.
+    tree_item, stack_page = next(
+        (tree_item, stack_page)
+        for tree_item, stack_page in (
+            sim_conf_stack._tree_item_static_to_stack_page.items())
+        if stack_page.objectName() != stack_page_name_startup and
+           stack_page.objectName() in sim_conf_stack._stack_page_name_to_pager
+    )
+
+    # Assert switching to this page to initialize this pager, registering
+    # this window as the main window singleton required to do so.
+    guiappwindow.set_main_window(main_window)
+    try:
+        sim_conf_stack.switch_page_to_tree_item(tree_item, tree_item)
+    finally:
+        guiappwindow.unset_main_window()
+    assert sim_conf_stack.currentWidget() is stack_page
+    assert stack_page.objectName() in sim_conf_stack._stack_page_names_initted
+
+# ....................{ PRIVATE ~ iterators               }....................
+def _iter_phase_names(phase: dict) -> 'GeneratorType':
+    '''
+    Generator recursively yielding the name of the passed startup phase
+    dictionary (as written by the startup profiler) and all child phases of
+    that phase.
+    '''
+
+    yield phase['name']
+    for phase_child in phase['children']:
+        yield from _iter_phase_names(phase_child)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for editable scalar simulation configuration widgets, debouncing
+user edits into merged undo commands.
+'''
+
+# ....................{ IMPORTS                           }....................
+from types import SimpleNamespace
+import time
+
+# ....................{ CONSTANTS                         }....................
+LOAD_TIMEOUT_SECONDS = 60.0
+'''
+Maximum number of seconds to wait for a simulation configuration to be loaded
+and bound *or* for a debounced edit to be applied, above which the current
+test fails.
+'''
+
+# ....................{ TESTS                             }....................
+def test_scalar_widget_debounces_edits(
+    betsee_app, monkeypatch, tmp_path) -> None:
+    '''
+    Test that rapid successive edits of a scalar widget are deferred and
+    coalesced into a single alias write *and* a single undo command, that
+    subsequent edits within the undo merge window are merged into that
+    command, *and* that edits outside that window are preserved as distinct
+    undo commands.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from PySide2.QtWidgets import QDoubleSpinBox
+    from betse.science.parameters import Parameters
+    from betsee.gui.guimainsignaler import QBetseeSignaler
+    from betsee.gui.simconf.stack.widget.mixin import guisimconfwdgeditscalar
+    from betsee.gui.window.guiwindow import QBetseeMainWindow
+    from betsee.util.app import guiappwindow
+
+    # Replace the clock consulted when merging undo commands by a fake clock.
+    time_now = [0.0]
+    monkeypatch.setattr(guisimconfwdgeditscalar, 'time', SimpleNamespace(
+        monotonic=lambda: time_now[0]))
+
+    # Write the default simulation configuration.
+    conf_filename = str(tmp_path / 'sim_config.yaml')
+    p = Parameters()
+    p.load(p.conf_default_filename)
+    p.save(conf_filename)
+
+    # Main window, registered as the main window singleton required to
+    # display loading progress in the status bar of this window.
+    main_window = QBetseeMainWindow(
+        signaler=QBetseeSignaler(), sim_conf_filename=None)
+    sim_conf = main_window.sim_conf
+    guiappwindow.set_main_window(main_window)
+
+    try:
+        # Initialize the lazily initialized pager of the page containing the
+        # widget edited below, registering that widget to be bound on load.
+        main_window.sim_conf_stack._init_stack_page_pager_if_needed(
+            stack_page=main_window.sim_conf_stack_page_Space,
+            main_window=main_window)
+
+        # Load this configuration and wait for this load to be bound.
+        sim_conf.load(conf_filename)
+        _process_events_until(betsee_app, lambda: (
+            sim_conf.is_open and
+            not sim_conf.binder.is_binding and
+            not sim_conf._load_workers
+        ))
+
+        # Widget editing the world length of this configuration.
+        world_len_widget = main_window.sim_conf_space_extra_world_len
+        world_len = sim_conf.p.world_len
+        undo_stack = sim_conf.undo_stack
+
+        def _edit_world_len(value: float) -> None:
+            '''
+            Edit the world length of this configuration to the passed value
+            as if the user had entered that value and then finished editing.
+            '''
+
+            QDoubleSpinBox.setValue(world_len_widget, value)
+            world_len_widget.editingFinished.emit()
+
+        # Assert rapid successive edits to be deferred *WITHOUT* writing the
+        # alias or pushing undo commands.
+        _edit_world_len(world_len * 2)
+        _edit_world_len(world_len * 3)
+        assert world_len_widget._alias_set_timer.isActive()
+        assert sim_conf.p.world_len == world_len
+        assert undo_stack.count() == 0
+
+        # Assert these edits to be coalesced into a single alias write *AND*
+        # a single undo command on the debounce delay elapsing.
+        _process_events_until(
+            betsee_app,
+            lambda: not world_len_widget._alias_set_timer.isActive())
+        assert sim_conf.p.world_len == world_len * 3
+        assert undo_stack.count() == 1
+
+        # Assert a subsequent edit within the undo merge window to be merged
+        # into that undo command, undoing all such edits at once.
+        time_now[0] += guisimconfwdgeditscalar.UNDO_MERGE_WINDOW_SECONDS / 2
+        _edit_world_len(world_len * 4)
+        sim_conf.flush_edits()
+        assert sim_conf.p.world_len == world_len * 4
+        assert undo_stack.count() == 1
+        undo_stack.undo()
+        assert sim_conf.p.world_len == world_len
+        undo_stack.redo()
+        assert sim_conf.p.world_len == world_len * 4
+
+        # Assert a subsequent edit outside that window to push a distinct
+        # undo command, undoing only that edit.
+        time_now[0] += guisimconfwdgeditscalar.UNDO_MERGE_WINDOW_SECONDS * 2
+        _edit_world_len(world_len * 5)
+        sim_conf.flush_edits()
+        assert undo_stack.count() == 2
+        undo_stack.undo()
+        assert sim_conf.p.world_len == world_len * 4
+    finally:
+        guiappwindow.unset_main_window()
+
+# ....................{ PRIVATE ~ waiters                 }....................
+def _process_events_until(betsee_app, predicate) -> None:
+    '''
+    Process events until the passed predicate returns ``True``, failing the
+    current test if :data:`LOAD_TIMEOUT_SECONDS` elapse first.
+    '''
+
+    time_timeout = time.monotonic() + LOAD_TIMEOUT_SECONDS
+    while not predicate():
+        assert time.monotonic() < time_timeout
+        betsee_app.processEvents()
+        time.sleep(0.01)
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the simulator proactor snapshotting the simulation
+configuration run by each queue of simulator workers.
+'''
+
+# ....................{ IMPORTS                           }....................
+import pickle, pytest
+
+# ....................{ TESTS                             }....................
+def test_proactor_start_workers_saves_edits(
+    betsee_app, monkeypatch, tmp_path) -> None:
+    '''
+    Test that starting a run of a simulation configuration with unsaved
+    changes (including an edit made immediately beforehand and hence still
+    deferred by the edited widget) prompts the user to save these changes,
+    that canceling this prompt silently avoids starting that run, *and* that
+    confirming this prompt snapshots the file to which these changes were
+    saved rather than the in-memory configuration.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from PySide2.QtWidgets import QAction, QDoubleSpinBox, QMessageBox
+    from betse.science.parameters import Parameters
+    from betsee.gui.simconf.guisimconf import QBetseeSimConf
+    from betsee.gui.simconf.stack.widget.guisimconfspinbox import (
+        QBetseeSimConfDoubleSpinBox)
+    from betsee.gui.simtab.run.guisimrunact import QBetseeSimmerProactor
+    from betsee.gui.simtab.run.work.guisimrunworkconf import hash_conf_file
+    from betsee.util.app import guiappstatus
+    from betsee.util.io import guimessage
+
+    # Write the default simulation configuration.
+    conf_filename = str(tmp_path / 'sim_config.yaml')
+    p = Parameters()
+    p.load(p.conf_default_filename)
+    p.save(conf_filename)
+
+    # Open this configuration *WITHOUT* a main window, manually finalizing
+    # the undo stack otherwise finalized by that window and ignoring status
+    # bar updates otherwise displayed by that window.
+    sim_conf = QBetseeSimConf()
+    sim_conf.p.load(conf_filename)
+    sim_conf.undo_stack._sim_conf = sim_conf
+    monkeypatch.setattr(guiappstatus, 'show_status', lambda text: None)
+
+    # Spin box editing a setting of this configuration.
+    spin_box = QBetseeSimConfDoubleSpinBox()
+    spin_box.init(sim_conf=sim_conf, sim_conf_alias=Parameters.world_len)
+    sim_conf.set_filename_signal.emit(conf_filename)
+    world_len_saved = sim_conf.p.world_len
+    world_len_edited = world_len_saved * 2
+
+    # Interactively edit this spin box, bypassing the setValue() override
+    # programmatically applying this edit immediately.
+    QDoubleSpinBox.setValue(spin_box, world_len_edited)
+    spin_box.editingFinished.emit()
+
+    # Assert this edit to still be deferred.
+    assert sim_conf.p.world_len == world_len_saved
+
+    # Proactor snapshotting this configuration, manually finalized with the
+    # subset of the main window required to do so.
+    proactor = QBetseeSimmerProactor()
+    proactor._p = sim_conf.p
+    proactor._sim_conf = sim_conf
+    proactor._action_toggle_work = QAction(None)
+    proactor._action_toggle_work.setCheckable(True)
+
+    # Buttons clicked by the user on each prompt displayed below.
+    buttons_clicked = [QMessageBox.Cancel, QMessageBox.Save]
+    monkeypatch.setattr(
+        guimessage, 'show_warning', lambda **kwargs: buttons_clicked.pop(0))
+
+    # Assert starting a run as the user and then canceling this prompt to
+    # apply this edit *WITHOUT* saving this edit or starting this run.
+    proactor._action_toggle_work.setChecked(True)
+    proactor._start_workers()
+    assert not proactor._action_toggle_work.isChecked()
+    assert proactor._workers_queued is None
+    assert sim_conf.p.world_len == world_len_edited
+    assert sim_conf.is_dirty
+
+    # Assert confirming this prompt to save this edit.
+    assert sim_conf.save_if_dirty_before_run() is True
+    assert buttons_clicked == []
+    assert not sim_conf.is_dirty
+
+    # Snapshot this configuration as on starting a run.
+    proactor._snapshot_conf()
+
+    # Assert this snapshot to include this edit in both the cloned and
+    # pickled configurations passed to thread- and process-backed workers,
+    # deserialized from the file to which this edit was saved.
+    assert proactor._conf_snapshot.make_p().world_len == world_len_edited
+    p_unpickled = pickle.loads(proactor._conf_snapshot.make_p_pickled())
+    assert p_unpickled.world_len == world_len_edited
+    assert proactor._conf_hash == hash_conf_file(conf_filename)
+    p_saved = Parameters()
+    p_saved.load(conf_filename)
+    assert p_saved.world_len == world_len_edited
+
+    # Assert starting a run of an unmodified configuration to *NOT* prompt.
+    assert sim_conf.save_if_dirty_before_run() is True
+
+
+def test_proactor_loop_worker_schedules(betsee_app, monkeypatch) -> None:
+    '''
+    Test that iterating the simulator proactor concurrently starts each
+    enqueued worker dependent on no incomplete prior worker (e.g., modelling
+    a phase while exporting the prior phase), serializes exporters, caps the
+    number of working workers, *and* starts no workers while paused.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from collections import deque
+    from betsee.gui.simtab.run.guisimrunact import QBetseeSimmerProactor
+    from betsee.util.thread.pool import guipoolthread
+
+    # Proactor whose workers are merely moved onto the working queue on being
+    # started rather than actually run in the thread pool.
+    proactor = QBetseeSimmerProactor()
+    monkeypatch.setattr(
+        proactor, '_start_worker', lambda worker: _start_worker(
+            proactor, worker))
+    monkeypatch.setattr(
+        guipoolthread, 'get_worker_count_max', lambda thread_pool=None: 4)
+
+    # Modelling and exporting workers for each of three phases, enqueued in
+    # phase order as by the QBetseeSimmerPhaser.enqueue_phase_workers() method.
+    workers = _make_workers(('seed', 'init', 'sim'))
+    proactor._workers_queued = deque(workers.values())
+
+    # Assert only the seed modeller to be initially startable.
+    proactor._loop_worker()
+    assert _get_working_names(proactor) == ['seed model']
+
+    # Assert completing the seed modeller to start both the seed exporter and
+    # the initialization modeller concurrently.
+    _complete_worker(proactor, workers['seed model'])
+    assert _get_working_names(proactor) == ['seed export', 'init model']
+
+    # Assert completing the initialization modeller to start the simulation
+    # modeller concurrently with the seed exporter *WITHOUT* starting the
+    # initialization exporter, serialized after the seed exporter.
+    _complete_worker(proactor, workers['init model'])
+    assert _get_working_names(proactor) == ['seed export', 'sim model']
+
+    # Assert no workers to be started while paused.
+    proactor._is_pause_requested = True
+    _complete_worker(proactor, workers['seed export'])
+    assert _get_working_names(proactor) == ['sim model']
+
+    # Assert no more than the maximum number of workers to be started.
+    proactor._is_pause_requested = False
+    monkeypatch.setattr(
+        guipoolthread, 'get_worker_count_max', lambda thread_pool=None: 1)
+    proactor._loop_worker()
+    assert _get_working_names(proactor) == ['sim model']
+
+    # Assert the remaining exporters to be serialized.
+    _complete_worker(proactor, workers['sim model'])
+    assert _get_working_names(proactor) == ['init export']
+    _complete_worker(proactor, workers['init export'])
+    assert _get_working_names(proactor) == ['sim export']
+
+
+def test_proactor_dequeue_workers_releases_snapshot(betsee_app) -> None:
+    '''
+    Test that dequeueing the workers of a finished run releases the
+    simulation configuration snapshot shared by these workers *and* that
+    dequeueing the workers of a run still working raises an exception.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from collections import deque
+    from betsee.guiexception import BetseeSimmerException
+    from betsee.gui.simtab.run.guisimrunact import QBetseeSimmerProactor
+
+    # Proactor whose last run has yet to release its snapshot.
+    proactor = QBetseeSimmerProactor()
+    proactor._conf_snapshot = object()
+
+    # Assert dequeueing while a worker is still working to fail.
+    worker = object()
+    proactor._workers_queued = deque()
+    proactor._workers_working.append(worker)
+    with pytest.raises(BetseeSimmerException):
+        proactor._dequeue_workers()
+    assert proactor._conf_snapshot is not None
+
+    # Assert dequeueing after that worker finishes to release that snapshot.
+    proactor._workers_working.remove(worker)
+    proactor._dequeue_workers()
+    assert proactor._conf_snapshot is None
+    assert proactor._workers_queued is None
+
+
+def test_proactor_start_workers_ignores_gui_pool(
+    betsee_app, monkeypatch) -> None:
+    '''
+    Test that starting the simulator while short-lived workers occupy the
+    singleton thread pool (e.g., saving a simulation configuration) succeeds,
+    that simulator workers are scheduled against the distinct compute thread
+    pool, *and* that starting the simulator while simulator workers are
+    already working raises an exception.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from collections import deque
+    from types import SimpleNamespace
+    from betsee.guiexception import BetseeSimmerException
+    from betsee.gui.simtab.run.guisimrunact import QBetseeSimmerProactor
+    from betsee.util.thread.pool import guipoolthread
+
+    # Assert the compute thread pool to be a singleton distinct from the
+    # singleton thread pool.
+    thread_pool_compute = guipoolthread.get_thread_pool_compute()
+    assert thread_pool_compute is guipoolthread.get_thread_pool_compute()
+    assert thread_pool_compute is not guipoolthread.get_thread_pool()
+
+    # Proactor enqueueing one fake worker on starting *WITHOUT* running that
+    # worker, recording the thread pool against which workers are scheduled.
+    worker = object()
+    thread_pools_scheduled = []
+    proactor = QBetseeSimmerProactor()
+    proactor._sim_conf = SimpleNamespace(save_if_dirty_before_run=lambda: True)
+    monkeypatch.setattr(proactor, '_die_unless_queued', lambda: None)
+    monkeypatch.setattr(
+        proactor, '_enqueue_workers',
+        lambda: setattr(proactor, '_workers_queued', deque((worker,))))
+    monkeypatch.setattr(
+        proactor, '_start_worker', lambda worker: _start_worker(
+            proactor, worker))
+    monkeypatch.setattr(
+        guipoolthread, 'get_worker_count_max',
+        lambda thread_pool=None: thread_pools_scheduled.append(
+            thread_pool) or 1)
+
+    # Emulate a short-lived worker occupying the singleton thread pool.
+    monkeypatch.setattr(
+        guipoolthread, 'get_worker_count', lambda thread_pool=None: 1)
+
+    # Assert starting the simulator to start this worker in the compute pool.
+    proactor._start_workers()
+    assert list(proactor._workers_working) == [worker]
+    assert thread_pools_scheduled == [thread_pool_compute]
+
+    # Assert starting the simulator again while this worker works to fail.
+    with pytest.raises(BetseeSimmerException):
+        proactor._start_workers()
+
+# ....................{ PRIVATE ~ workers                 }....................
+def _make_workers(phase_names: tuple) -> 'collections.OrderedDict':
+    '''
+    Ordered dictionary mapping from the name of each fake simulator worker
+    modelling and then exporting each phase with the passed names (e.g.,
+    ``seed model``, ``seed export``) to that worker, in enqueued order.
+    '''
+
+    from collections import OrderedDict
+    from types import SimpleNamespace
+    from betsee.gui.simtab.run.work.guisimrunwork import (
+        QBetseeSimmerPhaseWorker)
+    from betsee.gui.simtab.run.work.guisimrunworkenum import (
+        SimmerPhaseSubkind)
+
+    class _SimmerPhaseWorkerFake(SimpleNamespace):
+        '''
+        Fake simulator worker deciding its dependencies exactly as real
+        simulator phase workers do.
+        '''
+
+        is_dependent_on = QBetseeSimmerPhaseWorker.is_dependent_on
+
+    workers = OrderedDict()
+    for phase_name in phase_names:
+        for subkind_name, phase_subkind in (
+            ('model', SimmerPhaseSubkind.MODELLING),
+            ('export', SimmerPhaseSubkind.EXPORTING),
+        ):
+            worker_name = '{} {}'.format(phase_name, subkind_name)
+            workers[worker_name] = _SimmerPhaseWorkerFake(
+                name=worker_name, phase_subkind=phase_subkind)
+    return workers
+
+
+def _start_worker(proactor, worker) -> None:
+    '''
+    Move the passed enqueued worker onto the working queue of the passed
+    proactor *without* running this worker.
+    '''
+
+    proactor._workers_queued.remove(worker)
+    proactor._workers_working.append(worker)
+
+
+def _complete_worker(proactor, worker) -> None:
+    '''
+    Remove the passed working worker from the working queue of the passed
+    proactor *and* iterate that proactor, as on completing this worker.
+    '''
+
+    proactor._workers_working.remove(worker)
+    proactor._loop_worker()
+
+
+def _get_working_names(proactor) -> list:
+    '''
+    List of the names of all workers on the working queue of the passed
+    proactor, in start order.
+    '''
+
+    return [worker.name for worker in proactor._workers_working]
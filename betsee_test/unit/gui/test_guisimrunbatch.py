@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the simulator batch headlessly running simulation phases of
+one or more simulation configurations.
+'''
+
+# ....................{ IMPORTS                           }....................
+import io, json, pytest, subprocess, sys
+
+# ....................{ TESTS                             }....................
+def test_batch_loop_worker_schedules(betsee_app, monkeypatch) -> None:
+    '''
+    Test that iterating the simulator batch concurrently starts workers
+    running different configurations, serializes workers running the same
+    configuration exactly as the simulator proactor does, *and* skips all
+    subsequent workers running a configuration on a worker running that
+    configuration failing.
+    '''
+
+    # Simulator batch running two configurations, whose workers are merely
+    # moved onto the working queue on being started.
+    batch, workers = _make_batch(monkeypatch, conf_names=('a', 'b'))
+    monkeypatch.setattr(batch, '_worker_count_max', 4)
+
+    # Assert only the seed modeller of each configuration to be initially
+    # startable.
+    batch._loop_worker()
+    assert _get_working_names(batch) == ['a seed model', 'b seed model']
+
+    # Assert completing the seed modeller of the first configuration to start
+    # both its seed exporter *AND* its initialization modeller.
+    _complete_worker(monkeypatch, batch, workers['a seed model'])
+    assert _get_working_names(batch) == [
+        'b seed model', 'a seed export', 'a init model']
+
+    # Assert failing the seed modeller of the second configuration to skip
+    # all subsequent workers running that configuration.
+    _complete_worker(
+        monkeypatch, batch, workers['b seed model'], is_success=False)
+    assert _get_working_names(batch) == ['a seed export', 'a init model']
+    assert [worker.name for worker in batch._workers_queued] == [
+        'a init export']
+    assert batch.conf_filenames_failed == {_get_conf_filename('b')}
+
+    # Assert the remaining exporters to be serialized.
+    _complete_worker(monkeypatch, batch, workers['a init model'])
+    assert _get_working_names(batch) == ['a seed export']
+    _complete_worker(monkeypatch, batch, workers['a seed export'])
+    assert _get_working_names(batch) == ['a init export']
+
+
+def test_batch_phase_child_imports_no_window(betsee_app) -> None:
+    '''
+    Test that importing the submodule defining the entry point of child
+    processes running simulation phases imports neither the simulator phase
+    controller nor the main window, both of which require widgets.
+    '''
+
+    # Names of all modules imported by a fresh interpreter importing this
+    # submodule, one per line.
+    module_names = subprocess.run(
+        (sys.executable, '-c', (
+            'import sys; '
+            'import betsee.gui.simtab.run.work.guisimrunworkphase; '
+            'print(*sys.modules, sep=chr(10))'
+        )),
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout.splitlines()
+
+    # Assert this entry point to be importable without the main window.
+    assert 'betsee.gui.simtab.run.phase.guisimrunphase' not in module_names
+    assert 'betsee.gui.window.guiwindow' not in module_names
+
+
+@pytest.mark.parametrize(
+    ('conf_names_failing', 'is_success'), (
+        ((), True),
+        (('b',), False),
+    ))
+def test_batch_run_exit_status(
+    betsee_app,
+    monkeypatch,
+    conf_names_failing: tuple,
+    is_success: bool,
+) -> None:
+    '''
+    Test that running the simulator batch to completion reports the number of
+    workers that succeeded, failed, and were skipped as the last progress
+    event *and* returns an exit status signifying success only if no worker
+    failed or was skipped.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from PySide2.QtCore import QTimer
+    from betse.util.os.command.cmdexit import FAILURE_DEFAULT, SUCCESS
+    from betsee.util.thread.pool import guipoolthread
+
+    # Simulator batch running two configurations.
+    progress_stream = io.StringIO()
+    batch, _ = _make_batch(
+        monkeypatch, conf_names=('a', 'b'), progress_stream=progress_stream)
+
+    # Complete each worker on the next iteration of the event loop after
+    # this worker is started, failing the seed modeller of each
+    # configuration requested to fail.
+    def _start_worker(worker, thread_pool=None) -> None:
+        QTimer.singleShot(0, lambda: _complete_worker(
+            monkeypatch, batch, worker,
+            is_success=worker.name not in {
+                '{} seed model'.format(conf_name)
+                for conf_name in conf_names_failing
+            },
+        ))
+
+    monkeypatch.setattr(guipoolthread, 'start_worker', _start_worker)
+
+    # Run this batch to completion.
+    exit_status = batch.run()
+
+    # Assert this batch to have reported and returned the expected outcome.
+    event_done = json.loads(progress_stream.getvalue().splitlines()[-1])
+    if is_success:
+        assert exit_status == SUCCESS
+        assert event_done == {
+            'event': 'done', 'succeeded': 8, 'failed': 0, 'skipped': 0}
+        assert batch.conf_filenames_failed == set()
+    else:
+        assert exit_status == FAILURE_DEFAULT
+        assert event_done == {
+            'event': 'done', 'succeeded': 4, 'failed': 1, 'skipped': 3}
+        assert batch.conf_filenames_failed == {_get_conf_filename('b')}
+
+# ....................{ PRIVATE ~ makers                  }....................
+def _make_batch(
+    monkeypatch, conf_names: tuple, progress_stream: object = None) -> tuple:
+    '''
+    2-tuple ``(batch, workers)`` of a simulator batch *and* an ordered
+    dictionary mapping from the name of each fake simulator worker enqueued
+    by this batch (e.g., ``a seed model``) to that worker, modelling and then
+    exporting the seed and initialization phases of each configuration with
+    the passed names in enqueued order.
+
+    Workers started by this batch are merely moved onto its working queue
+    rather than actually run in the thread pool.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from collections import OrderedDict
+    from types import SimpleNamespace
+    from betsee.gui.simtab.run.guisimrunbatch import QBetseeSimmerBatch
+    from betsee.gui.simtab.run.work.guisimrunwork import (
+        QBetseeSimmerPhaseWorker)
+    from betsee.gui.simtab.run.work.guisimrunworkenum import (
+        SimmerPhaseSubkind)
+    from betsee.util.thread.pool import guipoolthread
+
+    class _SimmerPhaseWorkerFake(SimpleNamespace):
+        '''
+        Fake simulator worker deciding its dependencies exactly as real
+        simulator phase workers do.
+        '''
+
+        is_dependent_on = QBetseeSimmerPhaseWorker.is_dependent_on
+
+        # Hash by identity, as the batch maps each worker to a configuration.
+        __hash__ = object.__hash__
+
+        def delete_later(self) -> None:
+            pass
+
+    # Batch running no configurations, into which fake workers are enqueued.
+    batch = QBetseeSimmerBatch(
+        conf_filenames=(),
+        phase_kinds=(),
+        phase_subkinds=(),
+        progress_stream=(
+            progress_stream if progress_stream is not None else
+            io.StringIO()),
+    )
+    monkeypatch.setattr(
+        guipoolthread, 'start_worker', lambda worker, thread_pool=None: None)
+
+    workers = OrderedDict()
+    for conf_name in conf_names:
+        for phase_name in ('seed', 'init'):
+            for subkind_name, phase_subkind in (
+                ('model', SimmerPhaseSubkind.MODELLING),
+                ('export', SimmerPhaseSubkind.EXPORTING),
+            ):
+                worker_name = '{} {} {}'.format(
+                    conf_name, phase_name, subkind_name)
+                worker = _SimmerPhaseWorkerFake(
+                    name=worker_name,
+                    phase=SimpleNamespace(name=phase_name),
+                    phase_subkind=phase_subkind,
+                )
+                workers[worker_name] = worker
+                batch._workers_queued.append(worker)
+                batch._worker_to_conf_filename[worker] = _get_conf_filename(
+                    conf_name)
+
+    return batch, workers
+
+# ....................{ PRIVATE ~ workers                 }....................
+def _complete_worker(
+    monkeypatch, batch, worker, is_success: bool = True) -> None:
+    '''
+    Complete the passed working worker of the passed simulator batch, as if
+    this worker had emitted the signal signifying its completion.
+    '''
+
+    monkeypatch.setattr(batch, '_get_worker_signalling', lambda: worker)
+    batch._handle_worker_completion(is_success)
+
+
+def _get_conf_filename(conf_name: str) -> str:
+    '''
+    Fake absolute filename of the simulation configuration with the passed
+    name.
+    '''
+
+    return '/sims/{}/sim_config.yaml'.format(conf_name)
+
+
+def _get_working_names(batch) -> list:
+    '''
+    List of the names of all workers on the working queue of the passed
+    simulator batch, in start order.
+    '''
+
+    return [worker.name for worker in batch._workers_working]
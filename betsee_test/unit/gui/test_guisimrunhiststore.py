@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the simulator run history, persistently recording the outcome
+and performance of each simulator worker previously run.
+'''
+
+# ....................{ IMPORTS                           }....................
+import sqlite3, time
+
+# ....................{ TESTS                             }....................
+def test_run_history_skips_locked(betsee_app, tmp_path) -> None:
+    '''
+    Test that recording a run while the run history database is locked by
+    another application instance skips that run promptly *without* disabling
+    that history, which continues recording runs once unlocked.
+    '''
+
+    # Defer importing submodules requiring application initialization.
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betsee.gui.simtab.run.guisimrunenum import SimmerRunOutcome
+    from betsee.gui.simtab.run.hist.guisimrunhiststore import (
+        RUN_HISTORY_LOCK_TIMEOUT_SECONDS, SimmerRunHistory)
+    from betsee.gui.simtab.run.work.guisimrunworkenum import (
+        SimmerPhaseSubkind)
+    from betsee.gui.simtab.run.work.guisimrunworkmetric import (
+        SimmerWorkerTelemetry)
+
+    # Run history, opened and migrated to the current schema by a query.
+    history_filename = str(tmp_path / 'history.sqlite')
+    history = SimmerRunHistory(filename=history_filename)
+    assert history.get_runs() == ()
+
+    # Telemetry of a finished worker seeding a cell cluster.
+    telemetry = SimmerWorkerTelemetry(
+        phase_kind=SimPhaseKind.SEED,
+        phase_subkind=SimmerPhaseSubkind.MODELLING,
+        time_started=time.time(),
+        wall_seconds=2.0,
+        paused_seconds=0.0,
+        cpu_seconds=None,
+        rss_peak_bytes=None,
+        progress_min=0,
+        progress_max=10,
+        progress=10,
+        steps_per_second=5.0,
+        steps_per_second_prior=None,
+        eta_seconds=0.0,
+        is_success=True,
+    )
+
+    def _record_run() -> object:
+        '''
+        Record a run of that worker in this history.
+        '''
+
+        return history.record_run(
+            conf_filename=str(tmp_path / 'sim_config.yaml'),
+            conf_hash='hash',
+            telemetry=telemetry,
+            outcome=SimmerRunOutcome.SUCCEEDED,
+        )
+
+    # Connection emulating another application instance holding a lock on
+    # this database.
+    conn_other = sqlite3.connect(history_filename)
+    try:
+        conn_other.execute('BEGIN EXCLUSIVE')
+
+        # Assert recording a run while this database is locked to skip that
+        # run within a small multiple of the lock timeout.
+        time_start = time.monotonic()
+        assert _record_run() is None
+        assert time.monotonic() - time_start < (
+            RUN_HISTORY_LOCK_TIMEOUT_SECONDS * 20)
+        assert not history._is_disabled
+    finally:
+        conn_other.rollback()
+        conn_other.close()
+
+    # Assert recording a run after this database is unlocked to succeed.
+    assert _record_run() is not None
+    assert len(history.get_runs()) == 1
+    history.close()
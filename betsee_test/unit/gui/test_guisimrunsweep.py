@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for simulator sweeps, deriving one simulation configuration per
+parameter tuple and indexing the runs of these configurations.
+'''
+
+# ....................{ IMPORTS                           }....................
+import json, os, pytest
+
+# ....................{ TESTS                             }....................
+def test_sweep_param_values_grid() -> None:
+    '''
+    Test that swept parameters parse explicit values and discretized ranges
+    *and* reject malformed specifications.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from betsee.guiexception import BetseeSimmerSweepException
+    from betsee.gui.simtab.run.guisimrunsweep import SimmerSweepParam
+
+    # Assert explicit values to be parsed as Python literals if feasible.
+    param = SimmerSweepParam(spec='cell_lattice_type=hexagonal, square')
+    assert param.alias_name == 'cell_lattice_type'
+    assert param.get_values_grid() == ['hexagonal', 'square']
+
+    # Assert discretized ranges to be evenly spaced.
+    param = SimmerSweepParam(spec='sim_time_total=1:10:4')
+    assert param.get_values_grid() == [1.0, 4.0, 7.0, 10.0]
+
+    # Assert undiscretized ranges to be rejected by Cartesian sampling.
+    with pytest.raises(BetseeSimmerSweepException):
+        SimmerSweepParam(spec='sim_time_total=1:10').get_values_grid()
+
+    # Assert malformed specifications to be rejected.
+    for spec in ('sim_time_total', 'sim_time_total=1:10:0', '=1,2'):
+        with pytest.raises(BetseeSimmerSweepException):
+            SimmerSweepParam(spec=spec)
+
+
+def test_sweep_set_alias_value_bool() -> None:
+    '''
+    Test that setting a boolean alias accepts *only* recognized true and false
+    tokens, rejecting all other values rather than coercing them to ``False``.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from betsee.guiexception import BetseeSimmerSweepException
+    from betsee.gui.simtab.run.guisimrunsweep import _set_alias_value
+    from types import SimpleNamespace
+
+    # Object declaring a nested boolean alias.
+    p = SimpleNamespace(anim=SimpleNamespace(is_enabled=False))
+
+    # Assert recognized tokens to be coerced case-insensitively.
+    for value, value_bool in (
+        ('Yes', True), ('on', True), (1, True), (True, True),
+        ('FALSE', False), ('off', False), (0, False), (False, False),
+    ):
+        _set_alias_value(p=p, alias_name='anim.is_enabled', value=value)
+        assert p.anim.is_enabled is value_bool
+
+    # Assert unrecognized tokens to be rejected.
+    for value in ('ture', 'maybe', 2, 0.5):
+        with pytest.raises(BetseeSimmerSweepException):
+            _set_alias_value(p=p, alias_name='anim.is_enabled', value=value)
+
+
+def test_sweep_make_confs(betsee_app, tmp_path) -> None:
+    '''
+    Test that sweeps ignore duplicate Latin hypercube samples, derive one
+    configuration per unique parameter tuple into its own subdirectory,
+    remove stale subdirectories derived by prior sweeps, *and* index each run
+    by its parameter tuple.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betse.science.parameters import Parameters
+    from betsee.gui.simtab.run.guisimrunenum import SweepSampling
+    from betsee.gui.simtab.run.guisimrunsweep import (
+        SimmerSweep, SimmerSweepParam, get_point_key)
+
+    # Write the default simulation configuration.
+    conf_filename = str(tmp_path / 'sim_config.yaml')
+    p = Parameters()
+    p.load(p.conf_default_filename)
+    p.save(conf_filename)
+
+    # Sweep directory containing a stale subdirectory derived by a prior
+    # sweep *AND* an unrelated user-defined subdirectory.
+    sweep_dirname = str(tmp_path / 'sweep')
+    os.makedirs(os.path.join(sweep_dirname, 'run_0005'))
+    os.makedirs(os.path.join(sweep_dirname, 'notes'))
+
+    # Sweep sampling more Latin hypercube samples than swept values.
+    world_lens = [100e-6, 200e-6]
+    sweep = SimmerSweep(
+        conf_filename=conf_filename,
+        params=[SimmerSweepParam(spec='world_len=100e-6,200e-6')],
+        sampling=SweepSampling.LATIN_HYPERCUBE,
+        sample_count=6,
+        sweep_dirname=sweep_dirname,
+    )
+
+    # Assert each swept value to be run exactly once.
+    assert sorted(sweep.points) == [(world_len,) for world_len in world_lens]
+
+    # Assert one configuration to be derived per tuple into its own
+    # subdirectory *AND* the stale subdirectory alone to be removed.
+    conf_filenames = sweep.make_confs()
+    assert len(set(os.path.dirname(conf_filename)
+                   for conf_filename in conf_filenames)) == 2
+    assert sorted(os.listdir(sweep_dirname)) == [
+        'notes', 'run_0000', 'run_0001', 'sweep.json']
+
+    # Assert each derived configuration to set its swept value.
+    for point in sweep.points:
+        p_point = Parameters.make(sweep.get_conf_filename(point))
+        assert p_point.world_len == point[0]
+
+    # Assert the sweep index to be keyed by parameter tuple.
+    sweep.write_index(conf_filenames_failed=(
+        sweep.get_conf_filename((world_lens[1],)),))
+    with open(sweep.index_filename) as index_file:
+        runs = json.load(index_file)['runs']
+    assert runs[get_point_key((world_lens[0],))]['status'] == 'succeeded'
+    assert runs[get_point_key((world_lens[1],))]['status'] == 'failed'
+    assert sorted(
+        os.path.join(sweep_dirname, run['conf']) for run in runs.values()
+    ) == sorted(conf_filenames)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the simulator phase cache, keyed in part by the contents of
+external files referenced by the simulation configuration.
+'''
+
+# ....................{ IMPORTS                           }....................
+import copy, os, pickle, pytest, time
+
+# ....................{ TESTS                             }....................
+def test_hash_conf_files(tmp_path) -> None:
+    '''
+    Test that the hashes of external files referenced by a simulation
+    configuration subtree track the contents of those files *and* ignore
+    strings *not* referencing existing files.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from betsee.gui.simtab.run.work.guisimrunworkcache import (
+        _hash_conf_files)
+
+    # External geometry mask referenced by a relative pathname.
+    geo_dirname = tmp_path / 'geo'
+    geo_dirname.mkdir()
+    geo_filename = geo_dirname / 'circle.png'
+    geo_filename.write_bytes(b'circle')
+
+    # Simulation configuration subtree referencing that file.
+    conf_subtree = {
+        'world options': {'cell cluster boundary': 'geo/circle.png'},
+        'tissue profiles': [{'name': 'base', 'image': 'geo/circle.png'}],
+        'general options': {'simulate extracellular spaces': 'yes\0'},
+        'ignored': ['geo/missing.png', 'geo', '', 1.0, None],
+    }
+
+    # Hashes of all files referenced by that subtree.
+    conf_file_hashes = _hash_conf_files(
+        conf_value=conf_subtree,
+        conf_dirname=str(tmp_path),
+        conf_str_to_file_hash={},
+    )
+    assert list(conf_file_hashes.keys()) == ['geo/circle.png']
+
+    # Edit that file in-place *WITHOUT* changing its pathname.
+    geo_filename.write_bytes(b'square')
+
+    # Hashes of all files referenced by that subtree after that edit.
+    conf_file_hashes_edited = _hash_conf_files(
+        conf_value=conf_subtree,
+        conf_dirname=str(tmp_path),
+        conf_str_to_file_hash={},
+    )
+    assert conf_file_hashes_edited != conf_file_hashes
+
+
+def test_phase_cache_store_restore(betsee_app, tmp_path) -> None:
+    '''
+    Test that storing the result of a phase caches that result under the key
+    of that phase *and* that restoring that result copies that result back to
+    the pathname at which that phase writes that result.
+    '''
+
+    # Defer importing submodules requiring application initialization.
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betsee.gui.simtab.run.work.guisimrunworkcache import SimmerPhaseCache
+
+    # Phase cache for a minimal simulation configuration.
+    p = _make_p(tmp_path)
+    phase_cache = SimmerPhaseCache(p)
+
+    # Assert no result to be cached *AND* storing a nonexistent result to
+    # silently reduce to a noop.
+    assert not phase_cache.is_cached(SimPhaseKind.SEED)
+    phase_cache.store(SimPhaseKind.SEED)
+    assert not phase_cache.is_cached(SimPhaseKind.SEED)
+
+    # Assert storing the result of the seed phase to cache only that result.
+    _write_result(p.seed_pickle_filename, b'seed')
+    phase_cache.store(SimPhaseKind.SEED)
+    assert phase_cache.is_cached(SimPhaseKind.SEED)
+    assert not phase_cache.is_cached(SimPhaseKind.INIT)
+
+    # Assert restoring that result to replace a since-removed result.
+    os.remove(p.seed_pickle_filename)
+    assert phase_cache.restore(SimPhaseKind.SEED) is True
+    with open(p.seed_pickle_filename, 'rb') as seed_file:
+        assert seed_file.read() == b'seed'
+
+    # Assert restoring an uncached result to report failure.
+    assert phase_cache.restore(SimPhaseKind.INIT) is False
+
+    # Assert invalidating this cache to remove all cached results.
+    phase_cache.invalidate()
+    assert not phase_cache.is_cached(SimPhaseKind.SEED)
+
+
+def test_phase_cache_keys(betsee_app, tmp_path) -> None:
+    '''
+    Test that the key of each phase changes on changing either a
+    configuration setting that phase depends on *or* the contents of an
+    external file referenced by that configuration, but *not* on changing a
+    configuration setting ignored by that phase.
+    '''
+
+    # Defer importing submodules requiring application initialization.
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betsee.gui.simtab.run.work.guisimrunworkcache import SimmerPhaseCache
+
+    # Cache the result of the seed phase of a minimal simulation
+    # configuration, which references an external bitmap.
+    p = _make_p(tmp_path)
+    image_filename = os.path.join(p.conf_dirname, 'profile.png')
+    with open(image_filename, 'wb') as image_file:
+        image_file.write(b'circle')
+    p.conf['tissue profile definition']['tissue']['default']['image'] = (
+        'profile.png')
+    _write_result(p.seed_pickle_filename, b'seed')
+    SimmerPhaseCache(p).store(SimPhaseKind.SEED)
+    assert SimmerPhaseCache(p).is_cached(SimPhaseKind.SEED)
+
+    # Assert changing settings ignored by the seed phase to preserve its key.
+    p.conf['results options']['plot networks'] = (
+        not p.conf['results options']['plot networks'])
+    p.conf['sim time settings']['total time'] *= 2
+    assert SimmerPhaseCache(p).is_cached(SimPhaseKind.SEED)
+
+    # Assert changing a setting depended on by the seed phase to change its
+    # key *AND* restoring that setting to restore that key.
+    world_size = p.conf['world options']['world size']
+    p.conf['world options']['world size'] = world_size * 2
+    assert not SimmerPhaseCache(p).is_cached(SimPhaseKind.SEED)
+    p.conf['world options']['world size'] = world_size
+    assert SimmerPhaseCache(p).is_cached(SimPhaseKind.SEED)
+
+    # Assert editing that bitmap in-place to change that key.
+    with open(image_filename, 'wb') as image_file:
+        image_file.write(b'square')
+    assert not SimmerPhaseCache(p).is_cached(SimPhaseKind.SEED)
+
+
+def test_phase_cache_keys_lazy(betsee_app, tmp_path, monkeypatch) -> None:
+    '''
+    Test that instantiating and invalidating a phase cache computes no keys,
+    that the first test of that cache computes keys exactly once, *and* that
+    pickling that cache pickles those keys rather than that configuration.
+    '''
+
+    # Defer importing submodules requiring application initialization.
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betsee.gui.simtab.run.work import guisimrunworkcache
+    from betsee.gui.simtab.run.work.guisimrunworkcache import SimmerPhaseCache
+
+    # Count all calls to the function keying phase caches.
+    key_phases = guisimrunworkcache._key_phases
+    key_phases_calls = []
+    def _key_phases_counted(*args, **kwargs) -> dict:
+        key_phases_calls.append(None)
+        return key_phases(*args, **kwargs)
+    monkeypatch.setattr(
+        guisimrunworkcache, '_key_phases', _key_phases_counted)
+
+    # Assert instantiating and invalidating a cache to key nothing.
+    p = _make_p(tmp_path)
+    SimmerPhaseCache(p).invalidate()
+    phase_cache = SimmerPhaseCache(p)
+    assert not key_phases_calls
+
+    # Assert testing this cache to key this cache exactly once.
+    assert not phase_cache.is_cached(SimPhaseKind.SEED)
+    assert not phase_cache.is_cached(SimPhaseKind.INIT)
+    assert len(key_phases_calls) == 1
+
+    # Assert an unpickled copy of this cache to share these keys *WITHOUT*
+    # rekeying or retaining this configuration.
+    _write_result(p.seed_pickle_filename, b'seed')
+    phase_cache.store(SimPhaseKind.SEED)
+    phase_cache_unpickled = pickle.loads(pickle.dumps(phase_cache))
+    assert phase_cache_unpickled.is_cached(SimPhaseKind.SEED)
+    assert phase_cache_unpickled._conf is None
+    assert len(key_phases_calls) == 1
+
+
+def test_phase_cache_evict(betsee_app, tmp_path) -> None:
+    '''
+    Test that storing results beyond the maximum cache size evicts the least
+    recently used results *except* the result just stored.
+    '''
+
+    # Defer importing submodules requiring application initialization.
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betsee.gui.simtab.run.work.guisimrunworkcache import SimmerPhaseCache
+
+    # Minimal simulation configuration and the results of its seed phase.
+    p = _make_p(tmp_path)
+    _write_result(p.seed_pickle_filename, b'x' * 10)
+
+    # Phase caches for three distinct configurations, each admitting at most
+    # two 10-byte results. Since each cache keys its configuration lazily,
+    # each cache is passed a distinct copy of that configuration.
+    phase_caches = []
+    for world_size_index in range(3):
+        p.conf['world options']['world size'] = 100e-6 * (world_size_index + 1)
+        phase_caches.append(SimmerPhaseCache(copy.deepcopy(p), size_max=25))
+
+    # Cache the results of the first two configurations, rendering the second
+    # the least recently used. Since recency is recorded by directory
+    # modification time, explicitly age each result rather than depending on
+    # the resolution of filesystem timestamps.
+    phase_caches[0].store(SimPhaseKind.SEED)
+    _age_entry(phase_caches[0], age=20)
+    phase_caches[1].store(SimPhaseKind.SEED)
+    _age_entry(phase_caches[1], age=30)
+
+    # Assert caching the result of the third configuration to evict only the
+    # least recently used result.
+    phase_caches[2].store(SimPhaseKind.SEED)
+    assert phase_caches[0].is_cached(SimPhaseKind.SEED)
+    assert not phase_caches[1].is_cached(SimPhaseKind.SEED)
+    assert phase_caches[2].is_cached(SimPhaseKind.SEED)
+
+    # Assert caching a result larger than the maximum cache size to evict all
+    # other results but *NOT* that result.
+    p.conf['world options']['world size'] = 400e-6
+    phase_cache_tiny = SimmerPhaseCache(p, size_max=0)
+    phase_cache_tiny.store(SimPhaseKind.SEED)
+    assert not phase_caches[0].is_cached(SimPhaseKind.SEED)
+    assert not phase_caches[2].is_cached(SimPhaseKind.SEED)
+    assert phase_cache_tiny.is_cached(SimPhaseKind.SEED)
+
+# ....................{ PRIVATE ~ utilities               }....................
+def _make_p(tmp_path) -> 'betse.science.parameters.Parameters':
+    '''
+    Minimal simulation configuration saved to a file in the passed temporary
+    directory and reloaded from that file, resolving all relative pathnames
+    against that directory.
+    '''
+
+    from betse.science.parameters import Parameters
+
+    conf_filename = str(tmp_path / 'sim_config.yaml')
+    p = Parameters()
+    p.load(p.conf_default_filename)
+    p.save(conf_filename)
+    return Parameters.make(conf_filename)
+
+
+def _write_result(filename: str, result: bytes) -> None:
+    '''
+    Write the passed bytes as the pickled result of some phase to the file
+    with the passed filename.
+    '''
+
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, 'wb') as result_file:
+        result_file.write(result)
+
+
+def _age_entry(phase_cache, age: int) -> None:
+    '''
+    Set the last usage of the cached seed phase result of the passed phase
+    cache to the passed number of seconds ago.
+    '''
+
+    from betse.science.enum.enumphase import SimPhaseKind
+
+    entry_dirname = os.path.dirname(
+        phase_cache._get_entry_filename(SimPhaseKind.SEED))
+    entry_mtime = time.time() - age
+    os.utime(entry_dirname, (entry_mtime, entry_mtime))
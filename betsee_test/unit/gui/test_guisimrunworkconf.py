@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the in-memory reconfiguration of simulation configurations
+modelled by the simulator.
+'''
+
+# ....................{ IMPORTS                           }....................
+import pytest
+
+# ....................{ TESTS                             }....................
+@pytest.mark.parametrize('is_live_supported', (False, True))
+@pytest.mark.parametrize('is_while_sim_save', (False, True))
+def test_reconfigure_p(
+    betsee_app,
+    monkeypatch,
+    is_live_supported: bool,
+    is_while_sim_save: bool,
+) -> None:
+    '''
+    Test that reconfiguring a simulation configuration for the simulator
+    disables all interactive display, enables all exports after modelling,
+    *and* either preserves the user's choice of exporting animations while
+    modelling if the live view is supported *or* enables these exports
+    otherwise.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    from betse.science.parameters import Parameters
+    from betsee.gui.simtab.run.live import guisimrunlivering
+    from betsee.gui.simtab.run.work.guisimrunworkconf import reconfigure_p
+
+    # Emulate whether or not the active Python interpreter supports the live
+    # view, regardless of whether it actually does.
+    monkeypatch.setattr(
+        guisimrunlivering, 'is_live_supported', lambda: is_live_supported)
+
+    # Default simulation configuration exporting animations while modelling
+    # only if requested.
+    p = Parameters()
+    p.load(p.conf_default_filename)
+    p.anim.is_while_sim_show = True
+    p.anim.is_while_sim_save = is_while_sim_save
+    p.anim.is_after_sim_save = False
+    p.plot.is_after_sim_save = False
+
+    # Reconfigure this configuration for the simulator.
+    reconfigure_p(p)
+
+    # Assert this reconfiguration to have behaved as expected.
+    assert p.anim.is_while_sim_show is False
+    assert p.anim.is_after_sim_show is False
+    assert p.plot.is_after_sim_show is False
+    assert p.anim.is_while_sim_save is (
+        is_while_sim_save or not is_live_supported)
+    assert p.anim.is_after_sim_save is True
+    assert p.plot.is_after_sim_save is True
+
+
+def test_conf_snapshot_deserializes_once(
+    betsee_app, monkeypatch, tmp_path) -> None:
+    '''
+    Test that snapshotting a simulation configuration file deserializes that
+    file at most once per genuine change to that file, regardless of the
+    number of simulator workers requesting that configuration, *and* that
+    each such worker receives an independent copy of that configuration.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    import os, pickle
+    from betse.science.parameters import Parameters
+    from betse.util.path.dirs import DirOverwritePolicy
+    from betsee.gui.simtab.run.work.guisimrunworkconf import (
+        SimmerConfSnapshot)
+
+    # Write the default simulation configuration.
+    conf_filename = str(tmp_path / 'sim_config.yaml')
+    p = Parameters()
+    p.load(p.conf_default_filename)
+    p.save(conf_filename)
+    world_len = p.world_len
+
+    # Count all subsequent deserializations of simulation configurations.
+    conf_filenames_made = []
+    make_p = Parameters.make
+    def _make_p_counted(conf_filename: str) -> Parameters:
+        conf_filenames_made.append(conf_filename)
+        return make_p(conf_filename)
+    monkeypatch.setattr(Parameters, 'make', _make_p_counted)
+
+    # Snapshot this file, deferring deserialization to the first worker.
+    conf_snapshot = SimmerConfSnapshot(conf_filename=conf_filename)
+    assert not conf_filenames_made
+
+    # Assert repeatedly requesting this configuration from either thread- or
+    # process-backed workers to deserialize this file only once, yielding
+    # independent copies of the same configuration.
+    p_first = conf_snapshot.make_p()
+    p_first.world_len = world_len * 2
+    p_second = conf_snapshot.make_p()
+    assert p_second is not p_first
+    assert p_second.world_len == world_len
+    p_pickled = conf_snapshot.make_p_pickled()
+    assert conf_snapshot.make_p_pickled() is p_pickled
+    assert pickle.loads(p_pickled).world_len == world_len
+    assert conf_filenames_made == [conf_filename]
+
+    # Assert touching this file *WITHOUT* changing its contents to avoid
+    # redeserializing this file.
+    conf_stat = os.stat(conf_filename)
+    os.utime(conf_filename, ns=(
+        conf_stat.st_atime_ns, conf_stat.st_mtime_ns + 10**9))
+    assert conf_snapshot.make_p().world_len == world_len
+    assert len(conf_filenames_made) == 1
+
+    # Assert genuinely changing this file to redeserialize this file *AND*
+    # invalidate the prior pickle.
+    p.world_len = world_len * 3
+    p.save(
+        conf_filename=conf_filename,
+        is_conf_file_overwritable=True,
+        conf_subdir_overwrite_policy=DirOverwritePolicy.OVERWRITE,
+    )
+    assert conf_snapshot.make_p().world_len == world_len * 3
+    assert pickle.loads(conf_snapshot.make_p_pickled()).world_len == (
+        world_len * 3)
+    assert len(conf_filenames_made) == 2
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests exporting a real simulation phase through the process-backed
+simulator phase worker and hence the simulator export pool.
+'''
+
+# ....................{ IMPORTS                           }....................
+import json, os
+
+# ....................{ TESTS                             }....................
+def test_phase_process_worker_export(betsee_app, tmp_path) -> None:
+    '''
+    Test that exporting the initialization phase of a minimal simulation
+    through a :class:`QBetseeSimmerPhaseProcessWorker` worker succeeds *and*
+    exports that phase via a :class:`SimPipesExportPool` pool spawned from the
+    child process performing that worker's business logic.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from PySide2.QtCore import QEventLoop, QTimer
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betse.science.parameters import Parameters
+    from betse.science.simrunner import SimRunner
+    from betsee.gui.simtab.run.work.guisimrunwork import (
+        QBetseeSimmerPhaseProcessWorker)
+    from betsee.gui.simtab.run.work.guisimrunworkconf import (
+        SimmerConfSnapshot)
+    from betsee.gui.simtab.run.work.guisimrunworkenum import (
+        ExportItemFreshness, SimmerPhaseSubkind)
+    from betsee.gui.simtab.run.work.guisimrunworkexpman import (
+        SimmerExportManifest)
+    from betsee.gui.simtab.run.work.guisimrunworkphase import (
+        SimmerPhaseHeadless)
+    from betsee.util.thread.pool import guipoolthread
+
+    # Qt application running the event loop delivering worker signals.
+    app = betsee_app
+
+    # Write a minimal simulation configuration exporting exactly one item.
+    conf_filename = str(tmp_path / 'sim_config.yaml')
+    p = Parameters()
+    p.load(p.conf_default_filename)
+    p.conf['world options']['world size'] = 60e-6
+    p.conf['init time settings']['time step'] = 1.0e-2
+    p.conf['init time settings']['total time'] = 3.0e-2
+    p.conf['init time settings']['sampling rate'] = 1.0e-2
+    p.conf['results options']['plot networks'] = False
+    p.conf['results options']['plot networks single cell'] = False
+    p.conf['results options']['while solving']['animations']['save'] = False
+    results_after = p.conf['results options']['after solving']
+    results_after['plots']['save'] = False
+    results_after['animations']['save'] = False
+    results_after['csvs']['pipeline'] = results_after['csvs']['pipeline'][:1]
+    p.save(conf_filename)
+
+    # Model the seed and initialization phases in this process, reloading
+    # this configuration from that file to resolve all relative pathnames
+    # against that file's directory.
+    p = Parameters.make(conf_filename)
+    sim_runner = SimRunner(p=p)
+    sim_runner.seed()
+    sim_runner.init()
+
+    # Worker exporting the initialization phase in a child process.
+    worker = QBetseeSimmerPhaseProcessWorker(
+        phase=SimmerPhaseHeadless(kind=SimPhaseKind.INIT),
+        phase_subkind=SimmerPhaseSubkind.EXPORTING,
+    )
+
+    # Exceptions raised by that worker, if any.
+    exceptions = []
+
+    def handle_failed(exception: Exception) -> None:
+        exceptions.append(exception)
+
+    def handle_finished(is_success: bool) -> None:
+        loop.quit()
+
+    # Event loop to be run until that worker finishes or times out.
+    loop = QEventLoop()
+    worker.init(
+        conf_snapshot=SimmerConfSnapshot(conf_filename=conf_filename),
+        handler_failed=handle_failed,
+        handler_finished=handle_finished,
+    )
+    QTimer.singleShot(300000, loop.quit)
+
+    # Run that worker to completion.
+    guipoolthread.start_worker(worker)
+    loop.exec_()
+    assert guipoolthread.get_thread_pool().waitForDone(10000)
+    app.processEvents()
+
+    # Assert that worker to have succeeded *AND* exported that item.
+    assert not exceptions
+    assert any(
+        filename.endswith('.csv')
+        for _, _, filenames in os.walk(p.init_export_dirname)
+        for filename in filenames
+    )
+
+    # Assert the export manifest to record the files exported by each item,
+    # all of which exist.
+    with open(os.path.join(
+        p.init_export_dirname, '.betsee_export_init.json')) as manifest_file:
+        item_records = json.load(manifest_file)['items']
+    assert item_records
+    for item_record in item_records.values():
+        assert item_record['outputs']
+        for filename in item_record['outputs']:
+            assert os.path.isfile(
+                os.path.join(p.init_export_dirname, filename))
+
+    # Assert no export staging directories to remain.
+    assert not any(
+        basename.startswith('.betsee_staging_')
+        for basename in os.listdir(p.init_export_dirname)
+    )
+
+    # Assert the exported CSV file item to be fresh *UNTIL* the files exported
+    # by that item are removed, after which that item is stale.
+    csv_conf = p.csv.csvs_after_sim[0]
+    manifest = SimmerExportManifest(p=p, phase_kind=SimPhaseKind.INIT)
+    assert manifest.get_item_freshness(csv_conf) is ExportItemFreshness.FRESH
+    for item_key, item_record in item_records.items():
+        if item_key.endswith(':' + csv_conf.name):
+            for filename in item_record['outputs']:
+                os.remove(os.path.join(p.init_export_dirname, filename))
+    assert manifest.get_item_freshness(csv_conf) is ExportItemFreshness.STALE
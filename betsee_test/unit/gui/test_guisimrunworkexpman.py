@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the simulator export manifest, recording the files exported by
+each export item.
+'''
+
+# ....................{ IMPORTS                           }....................
+import os, pytest
+
+# ....................{ TESTS                             }....................
+def test_move_export_files_staged(tmp_path) -> None:
+    '''
+    Test that the files exported into an export staging directory are moved
+    into the export directory containing that staging directory *and* that
+    only these files are reported, ignoring files concurrently exported into
+    that export directory by other items.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from betsee.gui.simtab.run.work.guisimrunworkexpman import (
+        make_export_staging_dir, move_export_files_staged)
+
+    # Nonexistent export directory to be created by staging an item.
+    export_dirname = str(tmp_path / 'export')
+    staging_dirname = make_export_staging_dir(export_dirname)
+    assert os.path.dirname(staging_dirname) == export_dirname
+    assert os.listdir(staging_dirname) == []
+
+    # Export an item overwriting one previously exported file and creating
+    # another in a subdirectory, while another item concurrently exports a
+    # file directly into the export directory.
+    (tmp_path / 'export' / 'old.csv').write_text('old')
+    (tmp_path / 'export' / 'other.csv').write_text('other')
+    staging_path = tmp_path / 'export' / os.path.basename(staging_dirname)
+    (staging_path / 'old.csv').write_text('new')
+    (staging_path / 'Vmem').mkdir()
+    (staging_path / 'Vmem' / 'Vmem_0.png').write_bytes(b'png')
+
+    # Assert exactly these files to have been exported by this item.
+    assert sorted(move_export_files_staged(
+        staging_dirname=staging_dirname, export_dirname=export_dirname,
+    )) == [os.path.join('Vmem', 'Vmem_0.png'), 'old.csv']
+
+    # Assert these files to have been moved *AND* this staging directory to
+    # have been removed.
+    assert (tmp_path / 'export' / 'old.csv').read_text() == 'new'
+    assert (tmp_path / 'export' / 'Vmem' / 'Vmem_0.png').read_bytes() == (
+        b'png')
+    assert sorted(os.listdir(export_dirname)) == [
+        'Vmem', 'old.csv', 'other.csv']
+
+
+def test_export_shared_hash_cached(betsee_app, monkeypatch) -> None:
+    '''
+    Test that the simulation configuration tree rehashes the shared export
+    settings of the open simulation configuration only when the revision of
+    the patcher of that configuration changes.
+    '''
+
+    # Defer importing submodules requiring application initialization.
+    from betsee.gui.simconf.guisimconfpatch import SimConfPatcher
+    from betsee.gui.simconf.tree import guisimconftree
+    from betsee.gui.simconf.tree.guisimconftree import (
+        QBetseeSimConfTreeWidget)
+    from types import SimpleNamespace
+
+    # Replace the hasher of shared export settings by a counting fake.
+    hash_calls = []
+    def _hash_conf_shared(p: object) -> str:
+        hash_calls.append(p)
+        return 'hash{}'.format(len(hash_calls))
+    monkeypatch.setattr(guisimconftree, 'hash_conf_shared', _hash_conf_shared)
+
+    # Minimal stand-in for the tree, exposing only the attributes required by
+    # the method under test.
+    patcher = SimConfPatcher()
+    tree = SimpleNamespace(
+        _sim_conf=SimpleNamespace(p=object(), patcher=patcher),
+        _export_shared_hash=None,
+        _export_shared_hash_revision=None,
+    )
+
+    # Assert repeated refreshes of an unchanged configuration to hash once.
+    get_hash = QBetseeSimConfTreeWidget._get_export_shared_hash
+    assert get_hash(tree) == 'hash1'
+    assert get_hash(tree) == 'hash1'
+    assert len(hash_calls) == 1
+
+    # Assert changing that configuration to rehash exactly once.
+    patcher.invalidate()
+    assert get_hash(tree) == 'hash2'
+    assert get_hash(tree) == 'hash2'
+    assert len(hash_calls) == 2
+
+    # Assert reloading or saving that configuration to rehash.
+    patcher.reset(is_patchable=True)
+    assert get_hash(tree) == 'hash3'
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the performance telemetry collected for each simulator worker,
+including the smoothed throughput and estimated time remaining.
+'''
+
+# ....................{ IMPORTS                           }....................
+from types import SimpleNamespace
+import math, pytest, time
+
+# ....................{ TESTS                             }....................
+def test_metrics_telemetry_eta(betsee_app, monkeypatch) -> None:
+    '''
+    Test that the telemetry snapshotted from simulator worker metrics
+    smooths throughput by a time-weighted exponentially weighted moving
+    average, extrapolates the time remaining from that throughput, and
+    excludes time spent paused from both.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betsee.gui.simtab.run.work import guisimrunworkmetric
+    from betsee.gui.simtab.run.work.guisimrunworkenum import (
+        SimmerPhaseSubkind)
+
+    # Replace the monotonic clock sampled by these metrics with a fake clock.
+    clock = _patch_clock(monkeypatch, guisimrunworkmetric)
+
+    # Metrics of a worker whose prior runs progressed 5 steps per second.
+    metrics = guisimrunworkmetric.SimmerWorkerMetrics(
+        phase_kind=SimPhaseKind.SIM,
+        phase_subkind=SimmerPhaseSubkind.MODELLING,
+        steps_per_second_prior=5.0,
+    )
+
+    # Assert the time remaining to be inestimable before any progress range.
+    assert metrics.get_telemetry().eta_seconds is None
+
+    # Assert the time remaining to be extrapolated from the baseline
+    # throughput before this worker progresses.
+    metrics.record_progress_range(progress_min=0, progress_max=100)
+    assert metrics.get_telemetry().eta_seconds == pytest.approx(20.0)
+
+    # Progress 10 steps in one second, measuring this throughput exactly.
+    clock.seconds += 1.0
+    metrics.record_progress(10)
+    telemetry = metrics.get_telemetry()
+    assert telemetry.steps_per_second == pytest.approx(10.0)
+    assert telemetry.eta_seconds == pytest.approx(9.0)
+
+    # Progress 40 steps in two seconds, smoothing this throughput by a weight
+    # dependent only on the time elapsed since the prior sample.
+    clock.seconds += 2.0
+    metrics.record_progress(50)
+    weight = 1.0 - math.exp(
+        -2.0 / guisimrunworkmetric.METRICS_RATE_SMOOTHING_SECONDS)
+    steps_per_second = 10.0 + weight * (20.0 - 10.0)
+    telemetry = metrics.get_telemetry()
+    assert telemetry.steps_per_second == pytest.approx(steps_per_second)
+    assert telemetry.eta_seconds == pytest.approx(50 / steps_per_second)
+
+    # Pause for an hour, progressing *BEFORE* resuming.
+    metrics.record_paused()
+    clock.seconds += 3600.0
+    metrics.record_progress(60)
+    metrics.record_resumed()
+
+    # Assert this pause to be recorded but excluded from throughput.
+    telemetry = metrics.get_telemetry()
+    assert telemetry.paused_seconds == pytest.approx(3600.0)
+    assert telemetry.steps_per_second == pytest.approx(steps_per_second)
+
+    # Assert the time remaining to be inestimable after finishing.
+    clock.seconds += 1.0
+    metrics.record_finished(is_success=True)
+    telemetry = metrics.get_telemetry()
+    assert telemetry.eta_seconds is None
+    assert telemetry.is_success is True
+    assert telemetry.wall_seconds == pytest.approx(3604.0)
+
+
+def test_metrics_format_duration(betsee_app) -> None:
+    '''
+    Test that durations are abbreviated to their two most significant units.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betsee.gui.simtab.run.work.guisimrunworkmetric import format_duration
+
+    assert format_duration(None) == '?'
+    assert format_duration(42.4) == '42s'
+    assert format_duration(187) == '3m 07s'
+    assert format_duration(3900) == '1h 05m'
+
+# ....................{ PRIVATE ~ patchers                }....................
+def _patch_clock(monkeypatch, module) -> SimpleNamespace:
+    '''
+    Replace the :mod:`time` module imported by the passed module with a fake
+    module whose :func:`time.monotonic` function returns the ``seconds``
+    attribute of the returned object, manually advanced by the caller.
+    '''
+
+    clock = SimpleNamespace(seconds=1000.0)
+    monkeypatch.setattr(module, 'time', SimpleNamespace(
+        monotonic=lambda: clock.seconds, time=time.time))
+    return clock
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the startup profiler timing each phase of this application's
+startup.
+'''
+
+# ....................{ IMPORTS                           }....................
+import builtins, json, pytest, sys
+
+# ....................{ TESTS                             }....................
+def test_startup_profiler_disabled(tmp_path) -> None:
+    '''
+    Test that the startup profiler reduces to a noop unless enabled.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('betse')
+    from betsee.util.app import guiappstartup
+
+    # Assert profiling a phase while disabled to neither write a report nor
+    # replace the builtin importer.
+    import_func = builtins.__import__
+    assert not guiappstartup.is_enabled()
+    with guiappstartup.profiling_phase('ignored'):
+        assert builtins.__import__ is import_func
+    guiappstartup.deinit()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_startup_profiler_json(monkeypatch, tmp_path) -> None:
+    '''
+    Test that the startup profiler writes a versioned JSON report nesting
+    each profiled phase in its parent phase, recording the modules newly
+    imported by each phase, *and* restoring the builtin importer.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('betse')
+    from betsee.util.app import guiappstartup
+
+    # Module yet to be imported, imported by the phase profiled below.
+    _make_module(monkeypatch, tmp_path, 'betsee_test_startup_module')
+
+    # Profile a phase importing this module nested in another phase.
+    import_func = builtins.__import__
+    report_filename = str(tmp_path / 'startup.json')
+    guiappstartup.init(report_filename=report_filename)
+    try:
+        assert guiappstartup.is_enabled()
+        assert builtins.__import__ is not import_func
+        with guiappstartup.profiling_phase('main_window'):
+            with guiappstartup.profiling_phase('import module'):
+                import betsee_test_startup_module
+                assert betsee_test_startup_module.__name__ == (
+                    'betsee_test_startup_module')
+    finally:
+        guiappstartup.deinit()
+
+    # Assert this profiler to have been disabled *AND* restored this importer.
+    assert not guiappstartup.is_enabled()
+    assert builtins.__import__ is import_func
+
+    # Assert this report to nest these phases as expected.
+    with open(report_filename) as report_file:
+        report = json.load(report_file)
+    assert report['format'] == guiappstartup.REPORT_FORMAT_VERSION
+    phase_root = report['phase']
+    assert phase_root['name'] == 'startup'
+    phase_main_window, = phase_root['children']
+    assert phase_main_window['name'] == 'main_window'
+    phase_import, = phase_main_window['children']
+    assert phase_import['name'] == 'import module'
+    assert phase_import['children'] == []
+
+    # Assert this import to have been recorded by all enclosing phases.
+    for phase in (phase_root, phase_main_window, phase_import):
+        assert phase['module_count'] >= 1
+        assert phase['import_seconds'] > 0
+        assert phase['wall_seconds'] >= phase['import_seconds']
+        assert phase['self_seconds'] >= 0
+
+
+def test_startup_profiler_started_phase(tmp_path) -> None:
+    '''
+    Test that a startup phase started outside a context (e.g., the time to
+    first paint of the main window) is implicitly stopped when the startup
+    profiler is disabled.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('betse')
+    from betsee.util.app import guiappstartup
+
+    # Start a phase stopped only by disabling this profiler.
+    report_filename = str(tmp_path / 'startup.json')
+    guiappstartup.init(report_filename=report_filename)
+    try:
+        with guiappstartup.profiling_phase('main_window'):
+            pass
+        guiappstartup.start_phase('first_paint')
+    finally:
+        guiappstartup.deinit()
+
+    # Assert this phase to have been recorded as a sibling of the prior phase.
+    with open(report_filename) as report_file:
+        phase_root = json.load(report_file)['phase']
+    assert [phase['name'] for phase in phase_root['children']] == [
+        'main_window', 'first_paint']
+    assert phase_root['children'][1]['wall_seconds'] >= 0
+
+    # Assert starting a phase while this profiler is disabled to be a noop.
+    guiappstartup.start_phase('ignored')
+    assert not guiappstartup.is_enabled()
+
+
+def test_startup_profiler_folded(tmp_path) -> None:
+    '''
+    Test that the startup profiler writes a report in the folded stack format
+    consumed by flame graph generators when the report filename has the
+    corresponding filetype.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('betse')
+    from betsee.util.app import guiappstartup
+
+    # Profile two sibling phases, one containing a nested phase.
+    report_filename = str(
+        tmp_path / ('startup.' + guiappstartup.REPORT_FOLDED_FILETYPE))
+    guiappstartup.init(report_filename=report_filename)
+    try:
+        with guiappstartup.profiling_phase('init_libs'):
+            with guiappstartup.profiling_phase('pager:page Cell;Tissue'):
+                pass
+        with guiappstartup.profiling_phase('restore_settings'):
+            pass
+    finally:
+        guiappstartup.deinit()
+
+    # Assert each line of this report to be a semicolon-delimited stack of
+    # phase names sanitized of delimiters suffixed by an integer self time.
+    with open(report_filename) as report_file:
+        report_lines = report_file.read().splitlines()
+    assert [
+        report_line.rsplit(' ', 1)[0] for report_line in report_lines] == [
+        'startup',
+        'startup;init_libs',
+        'startup;init_libs;pager:page_Cell_Tissue',
+        'startup;restore_settings',
+    ]
+    for report_line in report_lines:
+        assert int(report_line.rsplit(' ', 1)[1]) >= 0
+
+
+def test_cli_profile_startup(betsee_app, monkeypatch, tmp_path) -> None:
+    '''
+    Test that passing the ``--profile-startup`` command-line option enables
+    the startup profiler, writing its report to the passed file.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betse.util.cli.cliabc import CLIABC
+    from betsee.cli.guicli import BetseeCLI
+    from betsee.util.app import guiappstartup
+
+    # Avoid reconfiguring global logging while parsing default options.
+    monkeypatch.setattr(CLIABC, '_parse_options_top', lambda self: None)
+
+    # Parse this option.
+    report_filename = str(tmp_path / 'startup.json')
+    cli = BetseeCLI()
+    cli._arg_list = ['--profile-startup', report_filename]
+    cli._init_arg_parsers()
+    cli._args = cli._arg_parser_top.parse_args(cli._arg_list)
+    try:
+        cli._parse_options_top()
+        assert guiappstartup.is_enabled()
+    finally:
+        guiappstartup.deinit()
+
+    # Assert this report to have been written.
+    with open(report_filename) as report_file:
+        assert json.load(report_file)['phase']['name'] == 'startup'
+
+# ....................{ PRIVATE ~ makers                  }....................
+def _make_module(monkeypatch, tmp_path, module_name: str) -> None:
+    '''
+    Create a new empty module with the passed name in the passed temporary
+    directory, importable only for the duration of the current test.
+    '''
+
+    (tmp_path / (module_name + '.py')).write_text('')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
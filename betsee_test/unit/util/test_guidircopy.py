@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the directory copier.
+'''
+
+# ....................{ IMPORTS                           }....................
+import os, pytest, shutil
+
+# ....................{ TESTS                             }....................
+def test_copy_file_unwritable(tmp_path) -> None:
+    '''
+    Test that copying a source file the current user cannot write produces an
+    independent copy whose permissions are changeable *without* changing the
+    permissions of that source file.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('betse')
+    from betsee.util.path.guidircopy import FileCopyKind, copy_file
+
+    # Read-only source file.
+    src_filename = tmp_path / 'src.png'
+    src_filename.write_bytes(b'png')
+    os.chmod(str(src_filename), 0o444)
+
+    # Copy this file.
+    trg_filename = tmp_path / 'trg.png'
+    assert copy_file(str(src_filename), str(trg_filename)) in FileCopyKind
+    assert trg_filename.read_bytes() == b'png'
+
+    # Assert this copy to be a distinct file whose permissions are
+    # changeable independently of the source file.
+    assert not os.path.samefile(str(src_filename), str(trg_filename))
+    os.chmod(str(trg_filename), 0o644)
+    assert os.stat(str(src_filename)).st_mode & 0o777 == 0o444
+
+
+def test_copy_file_hardlinked(tmp_path) -> None:
+    '''
+    Test that copying over a target file hardlinked to the source file
+    replaces that hardlink by an independent copy *and* that copying a file
+    onto itself fails without removing that file.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('betse')
+    from betsee.util.path.guidircopy import copy_file
+
+    # Source file and a hardlink to that file.
+    src_filename = tmp_path / 'src.png'
+    src_filename.write_bytes(b'png')
+    trg_filename = tmp_path / 'trg.png'
+    try:
+        os.link(str(src_filename), str(trg_filename))
+    except OSError:
+        pytest.skip('Hardlinks unsupported.')
+
+    # Assert copying over this hardlink to replace it by a distinct file.
+    copy_file(str(src_filename), str(trg_filename))
+    assert not os.path.samefile(str(src_filename), str(trg_filename))
+    assert trg_filename.read_bytes() == b'png'
+
+    # Assert copying this file onto itself to fail *AND* preserve this file.
+    with pytest.raises(shutil.SameFileError):
+        copy_file(str(src_filename), str(src_filename))
+    assert src_filename.read_bytes() == b'png'
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the atomic file writer.
+'''
+
+# ....................{ IMPORTS                           }....................
+import os, pytest
+
+# ....................{ TESTS                             }....................
+def test_writing_file_atomic(tmp_path) -> None:
+    '''
+    Test that atomically writing a file replaces that file *and* preserves its
+    permissions on success, preserves that file on failure, and never leaves
+    temporary files behind.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('betse')
+    from betsee.util.path.guifileatomic import writing_file_atomic
+
+    # Existing file with non-default permissions.
+    filename = tmp_path / 'index.json'
+    filename.write_text('old')
+    os.chmod(str(filename), 0o600)
+
+    # Assert a successful write to replace this file *AND* its permissions.
+    with writing_file_atomic(str(filename)) as filename_temp:
+        assert os.path.dirname(filename_temp) == str(tmp_path)
+        assert filename_temp.endswith('.json')
+        with open(filename_temp, 'w') as file_temp:
+            file_temp.write('new')
+    assert filename.read_text() == 'new'
+    assert os.stat(str(filename)).st_mode & 0o777 == 0o600
+
+    # Assert a failed write to preserve this file.
+    with pytest.raises(ValueError):
+        with writing_file_atomic(str(filename)) as filename_temp:
+            with open(filename_temp, 'w') as file_temp:
+                file_temp.write('partial')
+            raise ValueError('Write failed.')
+    assert filename.read_text() == 'new'
+
+    # Assert no temporary files to remain.
+    assert os.listdir(str(tmp_path)) == ['index.json']
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for image labels, including the asynchronous decoding, caching, and
+redecoding of the images previewed by these labels.
+'''
+
+# ....................{ IMPORTS                           }....................
+import time
+
+# ....................{ CONSTANTS                         }....................
+DECODE_TIMEOUT_SECONDS = 10.0
+'''
+Maximum number of seconds to wait for an image label to decode an image,
+above which the current test fails.
+'''
+
+# ....................{ TESTS                             }....................
+def test_label_image_resize_redecodes(
+    betsee_app, monkeypatch, tmp_path) -> None:
+    '''
+    Test that resizing an image label redecodes the previewed image only when
+    that label grows wider than the width that image was decoded at *and*
+    that image was downscaled on decoding.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    from betsee.util.widget.stock.label.guilabelimage import QBetseeLabelImage
+
+    # Image label previewing an image four times wider than that label.
+    QBetseeLabelImage._image_cache.clear()
+    QBetseeLabelImage._image_cache_bytes = 0
+    label = QBetseeLabelImage()
+    label.resize(100, 50)
+    _load_image(label=label, filename=_make_image(tmp_path, 400, 100))
+    assert label._image_width_decoded == 100
+    assert label._image_width_full == 400
+
+    # Record all subsequent redecodings of this image.
+    filenames_reloaded = []
+    load_image = label.load_image
+    def _load_image_recorded(filename: str) -> None:
+        filenames_reloaded.append(filename)
+        load_image(filename)
+    monkeypatch.setattr(label, 'load_image', _load_image_recorded)
+
+    # Assert shrinking this label to merely rescale the existing pixmap.
+    _resize_label(label=label, width=50)
+    assert filenames_reloaded == []
+
+    # Assert growing this label past the decoded width to redecode this image
+    # at the new width of this label.
+    _resize_label(label=label, width=200)
+    assert len(filenames_reloaded) == 1
+    _wait_image_decoded(label)
+    assert label._image_width_decoded == 200
+
+    # Assert growing this label past the unscaled width of this image to
+    # redecode this image at most once at that unscaled width.
+    _resize_label(label=label, width=800)
+    _wait_image_decoded(label)
+    assert label._image_width_decoded == 400
+    _resize_label(label=label, width=1000)
+    assert len(filenames_reloaded) == 2
+
+
+def test_label_image_cache(betsee_app, monkeypatch, tmp_path) -> None:
+    '''
+    Test that image labels reuse cached decodings sufficing for their current
+    widths *and* evict the least recently used decodings on exceeding the
+    maximum size of this cache.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    from betsee.util.widget.stock.label import guilabelimage
+    from betsee.util.widget.stock.label.guilabelimage import QBetseeLabelImage
+
+    # Empty cache large enough to contain exactly one 100x100 decoding.
+    QBetseeLabelImage._image_cache.clear()
+    QBetseeLabelImage._image_cache_bytes = 0
+    monkeypatch.setattr(guilabelimage, 'IMAGE_CACHE_BYTES_MAX', 100*100*4)
+
+    # Image label previewing two images of that size.
+    label = QBetseeLabelImage()
+    label.resize(100, 50)
+    filename_a = _make_image(tmp_path, 100, 100, basename='a.png')
+    filename_b = _make_image(tmp_path, 100, 100, basename='b.png')
+    _load_image(label=label, filename=filename_a)
+
+    # Assert repreviewing that image to reuse its cached decoding.
+    label.load_image(filename_a)
+    assert label._image_worker is None
+
+    # Assert previewing another image to evict the former decoding.
+    _load_image(label=label, filename=filename_b)
+    assert [image_key[0] for image_key in label._image_cache] == [filename_b]
+    label.load_image(filename_a)
+    assert label._image_worker is not None
+    _wait_image_decoded(label)
+
+# ....................{ PRIVATE ~ makers                  }....................
+def _make_image(
+    tmp_path, width: int, height: int, basename: str = 'image.png') -> str:
+    '''
+    Write a PNG-formatted image of the passed size to a file with the passed
+    basename in the passed temporary directory and return that filename.
+    '''
+
+    from PySide2.QtGui import QColor, QImage
+
+    filename = str(tmp_path / basename)
+    image = QImage(width, height, QImage.Format_ARGB32)
+    image.fill(QColor(255, 0, 0))
+    assert image.save(filename)
+    return filename
+
+# ....................{ PRIVATE ~ waiters                 }....................
+def _load_image(label: 'QBetseeLabelImage', filename: str) -> None:
+    '''
+    Preview the image with the passed filename in the passed image label and
+    wait for that label to finish decoding that image.
+    '''
+
+    label.load_image(filename)
+    _wait_image_decoded(label)
+
+
+def _resize_label(label: 'QBetseeLabelImage', width: int) -> None:
+    '''
+    Resize the passed image label to the passed width, synchronously handling
+    the resulting resize event regardless of whether that label is visible.
+    '''
+
+    from PySide2.QtGui import QResizeEvent
+
+    size_old = label.size()
+    label.resize(width, size_old.height())
+    label.resizeEvent(QResizeEvent(label.size(), size_old))
+
+
+def _wait_image_decoded(label: 'QBetseeLabelImage') -> None:
+    '''
+    Wait for the passed image label to finish decoding the image most
+    recently requested to be previewed, if that label is still doing so.
+    '''
+
+    from PySide2.QtCore import QCoreApplication
+
+    time_timeout = time.monotonic() + DECODE_TIMEOUT_SECONDS
+    while label._image_worker is not None:
+        assert time.monotonic() < time_timeout
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
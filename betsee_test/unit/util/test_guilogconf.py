@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`PySide2`-specific logging configuration.
+'''
+
+# ....................{ IMPORTS                           }....................
+from types import SimpleNamespace
+import io, logging, pytest, sys
+
+# ....................{ TESTS                             }....................
+def test_log_stdout_to_stderr(monkeypatch) -> None:
+    '''
+    Test that redirecting the standard output log handler to standard error
+    replaces its stream without calling the
+    :meth:`logging.StreamHandler.setStream` method unavailable under Python
+    3.6.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from betse.util.io.log.conf import logconf
+    from betsee.util.io.log import guilogconf
+
+    # Standard output handler printing to an in-memory stream, whose
+    # "setStream" method is removed as under Python 3.6.
+    stdout = io.StringIO()
+    handler_stdout = logging.StreamHandler(stdout)
+    monkeypatch.setattr(handler_stdout, 'setStream', None, raising=False)
+    log_conf = SimpleNamespace(handler_stdout=handler_stdout)
+    monkeypatch.setattr(logconf, 'get_log_conf', lambda: log_conf)
+
+    # Assert this redirection to replace this stream by standard error.
+    guilogconf.log_stdout_to_stderr()
+    assert handler_stdout.stream is sys.stderr
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the buffered :class:`Signal`-based logging handler forwarding
+batches of log records to the log text widget.
+'''
+
+# ....................{ IMPORTS                           }....................
+import logging, pytest
+
+# ....................{ TESTS                             }....................
+def test_log_handler_buffered_batches() -> None:
+    '''
+    Test that the buffered logging handler forwards all log records sent to
+    this handler since the prior flush as a single batch, drops the oldest
+    such records on overload while noting these drops, *and* reduces to a
+    noop after being closed.
+    '''
+
+    # Handler buffering at most three log records between flushes, whose
+    # timer never flushes this handler during this test.
+    handler, batches = _make_handler(record_count_max=3)
+
+    # Assert flushing an empty buffer to emit nothing.
+    handler.flush()
+    assert batches == []
+
+    # Assert flushing two log records to emit a single batch.
+    _log_messages(handler, ('eyes', 'of'))
+    assert batches == []
+    handler.flush()
+    assert batches == ['eyes\nof']
+
+    # Assert flushing five log records to emit only the newest three,
+    # prefixed by a synopsis of the oldest two dropped on overload.
+    _log_messages(handler, ('the', 'world', 'wheel', 'turning', 'by'))
+    handler.flush()
+    assert batches[1] == (
+        '[2 log record(s) dropped.]\nwheel\nturning\nby')
+
+    # Assert closing this handler to flush all remaining log records *AND*
+    # ignore all subsequent log records.
+    _log_messages(handler, ('last',))
+    handler.close()
+    _log_messages(handler, ('ignored',))
+    handler.flush()
+    assert batches[2:] == ['last']
+
+
+def test_log_handler_buffered_signal_deleted() -> None:
+    '''
+    Test that flushing the buffered logging handler *after* the object owning
+    the signal this handler forwards to has been destroyed (e.g., when
+    :func:`logging.shutdown` flushes this handler at application exit)
+    silently reduces this handler to a noop rather than raising an exception.
+    '''
+
+    # Handler with a buffered log record.
+    handler, batches = _make_handler()
+    _log_messages(handler, ('orphaned',))
+
+    # Defer heavyweight imports requiring optional dependencies *AFTER*
+    # skipping this test if these dependencies are unimportable above.
+    from shiboken2 import delete
+
+    # Destroy the object owning this signal *BEFORE* flushing this handler.
+    delete(handler.signaller)
+
+    # Assert flushing and closing this handler to raise no exception.
+    handler.flush()
+    handler.close()
+    assert batches == []
+
+# ....................{ PRIVATE ~ makers                  }....................
+def _make_handler(**kwargs) -> tuple:
+    '''
+    2-tuple ``(handler, batches)`` of a new buffered logging handler whose
+    flush timer never fires during a test *and* the list of all batches of
+    log messages forwarded by this handler, appended to on each flush.
+
+    All passed keyword arguments are passed as is to the
+    :class:`LogHandlerSignalBuffered` initializer.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from PySide2.QtCore import QCoreApplication, QObject, Signal
+    from betsee.util.io.log.guiloghandle import LogHandlerSignalBuffered
+
+    # Qt application required by the flush timer of this handler.
+    QCoreApplication.instance() or QCoreApplication([])
+
+    class _QObjectSignaller(QObject):
+        '''
+        Object owning the signal this handler forwards to.
+        '''
+
+        append_text_signal = Signal(str)
+
+    # List of all batches of log messages forwarded by this handler.
+    batches = []
+
+    def _append_batch(batch: str) -> None:
+        batches.append(batch)
+
+    # Object owning this signal, connected to the above slot.
+    signaller = _QObjectSignaller()
+    signaller.append_text_signal.connect(_append_batch)
+
+    # Handler forwarding to this signal, flushed only on demand.
+    handler = LogHandlerSignalBuffered(
+        signal=signaller.append_text_signal,
+        timer_parent=signaller,
+        flush_interval=3600000,
+        **kwargs
+    )
+
+    # Preserve this object for the lifetime of this handler.
+    handler.signaller = signaller
+
+    # Return this handler and these batches.
+    return handler, batches
+
+# ....................{ PRIVATE ~ loggers                 }....................
+def _log_messages(handler: logging.Handler, messages: tuple) -> None:
+    '''
+    Send a log record for each passed message to the passed handler.
+    '''
+
+    for message in messages:
+        handler.handle(logging.makeLogRecord({'msg': message}))
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for pooled workers, including the latencies of all transitions
+requested of these workers.
+'''
+
+# ....................{ IMPORTS                           }....................
+import pytest, threading, time
+
+# ....................{ CONSTANTS                         }....................
+TRANSITION_TIMEOUT_SECONDS = 10.0
+'''
+Maximum number of seconds to wait for a pooled worker to acknowledge each
+requested transition, above which the current test fails.
+'''
+
+# ....................{ TESTS ~ latencies                 }....................
+def test_latencies(monkeypatch) -> None:
+    '''
+    Test that pooled worker latencies record the time elapsed between the
+    first of each coalesced request and its acknowledgement *and* ignore
+    unrequested acknowledgements and discarded requests.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from betsee.util.thread.guithreadenum import ThreadWorkerTransition
+    from betsee.util.thread.pool import guipoolworklat
+    from betsee.util.thread.pool.guipoolworklat import ThreadWorkerLatencies
+
+    # Replace the monotonic clock by a deterministic clock.
+    time_now = [0.0]
+    monkeypatch.setattr(guipoolworklat.time, 'monotonic', lambda: time_now[0])
+
+    # Record of latencies to be tested.
+    latencies = ThreadWorkerLatencies()
+    pause = ThreadWorkerTransition.PAUSE
+    stop = ThreadWorkerTransition.STOP
+
+    # Assert acknowledging an unrequested transition to record nothing.
+    assert latencies.acknowledge(pause) is None
+    assert latencies.get_latencies(pause) == ()
+    assert latencies.get_latency_max(pause) is None
+    assert latencies.get_latency_mean(pause) is None
+
+    # Assert coalesced requests to be timed from the first such request.
+    latencies.request(pause)
+    time_now[0] = 1.0
+    latencies.request(pause)
+    time_now[0] = 3.0
+    assert latencies.acknowledge(pause) == 3.0
+    assert latencies.acknowledge(pause) is None
+
+    # Assert a second request to record a second latency.
+    latencies.request(pause)
+    time_now[0] = 4.0
+    assert latencies.acknowledge(pause) == 1.0
+    assert latencies.get_latencies(pause) == (3.0, 1.0)
+    assert latencies.get_latency_max(pause) == 3.0
+    assert latencies.get_latency_mean(pause) == 2.0
+
+    # Assert discarded requests to record nothing.
+    latencies.request(stop)
+    latencies.discard_pending()
+    time_now[0] = 100.0
+    assert latencies.acknowledge(stop) is None
+    assert latencies.get_latencies(stop) == ()
+
+    # Assert only the most recent latencies to be retained.
+    for _ in range(guipoolworklat.LATENCY_SAMPLES_MAX + 1):
+        latencies.request(stop)
+        assert latencies.acknowledge(stop) == 0.0
+    assert len(latencies.get_latencies(stop)) == (
+        guipoolworklat.LATENCY_SAMPLES_MAX)
+
+    # Assert clearing to discard all latencies.
+    latencies.clear()
+    assert latencies.get_latencies(pause) == ()
+    assert latencies.get_latencies(stop) == ()
+
+# ....................{ TESTS ~ worker                    }....................
+def test_worker_halt_fast_path() -> None:
+    '''
+    Test that halting an idle pooled worker *not* requested to transition
+    reduces to a noop *without* acquiring the lock guarding that worker.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from betsee.util.thread.pool.guipoolwork import (
+        QBetseeThreadPoolWorker)
+
+    # Pooled worker whose lock is held by this test.
+    worker = QBetseeThreadPoolWorker()
+    assert worker._state_lock.tryLock()
+
+    # Assert halting this worker to return *WITHOUT* blocking on this lock.
+    try:
+        worker._halt_work_if_requested()
+    finally:
+        worker._state_lock.unlock()
+
+
+def test_worker_halt_thread_amortized(monkeypatch) -> None:
+    '''
+    Test that halting a pooled worker *not* requested to transition tests
+    whether the thread running that worker has been requested to halt only
+    once every :data:`guipoolwork.THREAD_HALT_CHECK_CALLS` calls.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from betsee.util.thread import guithread
+    from betsee.util.thread.pool import guipoolwork
+    from betsee.util.thread.pool.guipoolwork import (
+        QBetseeThreadPoolWorker)
+
+    # Number of tests of whether the current thread has been requested to
+    # halt, each reporting that thread to *NOT* have been requested to halt.
+    thread_halt_checks = []
+    def should_halt_thread_work() -> bool:
+        thread_halt_checks.append(True)
+        return False
+    monkeypatch.setattr(
+        guithread, 'should_halt_thread_work', should_halt_thread_work)
+
+    # Assert halting this worker to test this thread only once per window of
+    # calls, beginning with the first call of each run of this worker.
+    worker = QBetseeThreadPoolWorker()
+    worker._state_thread_countdown = 1
+    for _ in range(2 * guipoolwork.THREAD_HALT_CHECK_CALLS):
+        worker._halt_work_if_requested()
+    assert len(thread_halt_checks) == 2
+
+
+def test_worker_pause_resume_stop() -> None:
+    '''
+    Test that a pooled worker periodically halting on request acknowledges
+    pausing, resuming, and stopping that worker *and* records the latency of
+    each such transition.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from betsee.util.thread import guithread
+    from betsee.util.thread.guithreadenum import ThreadWorkerTransition
+    from betsee.util.thread.pool import guipoolthread
+    from betsee.util.thread.pool.guipoolwork import (
+        QBetseeThreadPoolWorker)
+
+    # Initialize multithreading facilities identifying the main thread, which
+    # pooled workers refuse to run in. Since this test polls this worker
+    # rather than processing its signals, no Qt event loop is required.
+    guithread.init()
+
+    # Event set by this worker on starting its business logic.
+    is_working = threading.Event()
+
+    class _ThreadPoolWorkerLooping(QBetseeThreadPoolWorker):
+        '''
+        Pooled worker halting on request every millisecond until stopped.
+        '''
+
+        def _work(self) -> None:
+            is_working.set()
+            while True:
+                self._halt_work_if_requested()
+                time.sleep(0.001)
+
+    def wait_latency(transition: ThreadWorkerTransition) -> None:
+        '''
+        Wait until this worker acknowledges one request of this transition.
+        '''
+
+        time_timeout = time.monotonic() + TRANSITION_TIMEOUT_SECONDS
+        while not worker.latencies.get_latencies(transition):
+            assert time.monotonic() < time_timeout
+            time.sleep(0.001)
+
+    # Start this worker *AND* wait for its business logic to begin.
+    worker = _ThreadPoolWorkerLooping()
+    guipoolthread.start_worker(worker)
+    assert is_working.wait(TRANSITION_TIMEOUT_SECONDS)
+
+    # Pause, resume, and stop this worker, waiting for each acknowledgement.
+    worker.pause()
+    wait_latency(ThreadWorkerTransition.PAUSE)
+    worker.resume()
+    wait_latency(ThreadWorkerTransition.RESUME)
+    worker.stop()
+    wait_latency(ThreadWorkerTransition.STOP)
+    assert guipoolthread.get_thread_pool().waitForDone(
+        int(TRANSITION_TIMEOUT_SECONDS * 1000))
+
+    # Assert exactly one latency to have been recorded for each transition.
+    for transition in ThreadWorkerTransition:
+        latencies = worker.latencies.get_latencies(transition)
+        assert len(latencies) == 1
+        assert 0.0 <= latencies[0] < TRANSITION_TIMEOUT_SECONDS
+
+# ....................{ TESTS ~ progress                  }....................
+def test_worker_progress_coalesced() -> None:
+    '''
+    Test that a pooled worker coalesces rapidly emitted progress *and*
+    delivers all progress still pending on finishing before signalling that
+    worker to have succeeded.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from PySide2.QtCore import QCoreApplication
+    from betsee.guiexception import BetseePySideThreadWorkerException
+    from betsee.util.thread import guithread
+    from betsee.util.thread.pool import guipoolthread
+    from betsee.util.thread.pool.guipoolwork import (
+        QBetseeThreadPoolWorker)
+
+    # Qt application owning the thread pool running this worker *AND*
+    # multithreading facilities identifying the main thread, which pooled
+    # workers refuse to run in.
+    app = QCoreApplication.instance() or QCoreApplication([])
+    guithread.init()
+
+    # Assert non-positive progress frame rates to be rejected.
+    with pytest.raises(BetseePySideThreadWorkerException):
+        QBetseeThreadPoolWorker(progress_frame_rate=0)
+
+    class _ThreadPoolWorkerProgressing(QBetseeThreadPoolWorker):
+        '''
+        Pooled worker emitting one progress value per step far more rapidly
+        than its progress frame rate.
+        '''
+
+        def _work(self) -> None:
+            self.signals.emit_progress_range(progress_min=0, progress_max=100)
+            for progress in range(101):
+                self.signals.emit_progress(progress=progress)
+
+    # Progress values delivered by this worker *AND* the most recent such
+    # value delivered when this worker is signalled to have succeeded.
+    progresses = []
+    progresses_succeeded = []
+
+    def handle_progress(progress: int) -> None:
+        progresses.append(progress)
+
+    def handle_success(return_value: object) -> None:
+        progresses_succeeded.append(progresses[-1])
+
+    # Start a worker delivering progress at most once per second, far longer
+    # than that worker runs, *AND* wait for that worker to finish.
+    worker = _ThreadPoolWorkerProgressing(progress_frame_rate=1)
+    worker.signals.progressed.connect(handle_progress)
+    worker.signals.succeeded.connect(handle_success)
+    guipoolthread.start_worker(worker)
+    assert guipoolthread.get_thread_pool().waitForDone(
+        int(TRANSITION_TIMEOUT_SECONDS * 1000))
+    app.processEvents()
+
+    # Assert intermediate progress to have been dropped *AND* the final
+    # progress to have been delivered before that worker succeeded.
+    assert progresses_succeeded == [100]
+    assert progresses[-1] == 100
+    assert len(progresses) < 101
+    assert worker.signals.progress_dropped_count > 0
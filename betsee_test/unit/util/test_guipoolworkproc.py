@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for process-backed pooled workers, including the graceful stopping
+of the child processes performing the business logic of these workers.
+'''
+
+# ....................{ IMPORTS                           }....................
+import os, pytest, time
+
+# ....................{ CONSTANTS                         }....................
+STOP_TIMEOUT_SECONDS = 30.0
+'''
+Maximum number of seconds to wait for a process-backed worker to stop, above
+which the current test fails.
+'''
+
+# ....................{ TESTS                             }....................
+def test_process_worker_stop_waits(monkeypatch, tmp_path) -> None:
+    '''
+    Test that stopping a process-backed worker whose child process is busy
+    between stop points waits for that process to reach its next stop point
+    rather than terminating that process after a fixed grace period.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+    from betsee.util.thread.pool import guipoolworkproc
+
+    # Guarantee the grace period formerly applied to these processes to be
+    # exceeded by the busy work performed below.
+    monkeypatch.setattr(guipoolworkproc, 'CHILD_STOP_TIMEOUT_SECONDS', 0.0)
+
+    # Run a worker whose child process is busy for one second *AND* stop
+    # that worker once that process is busy.
+    worker = _run_worker_stopped(
+        child_args=(str(tmp_path), 1.0), stop_count=1)
+
+    # Assert that process to have finished its busy work *BEFORE* stopping.
+    assert os.path.isfile(str(tmp_path / 'done'))
+    assert worker._child_process is None
+
+
+def test_process_worker_stop_twice_kills(tmp_path) -> None:
+    '''
+    Test that stopping a process-backed worker twice non-gracefully
+    terminates a child process failing to reach its next stop point.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('PySide2')
+    pytest.importorskip('betse')
+
+    # Run a worker whose child process is busy far longer than this test
+    # waits *AND* stop that worker twice once that process is busy.
+    worker = _run_worker_stopped(
+        child_args=(str(tmp_path), STOP_TIMEOUT_SECONDS * 10), stop_count=2)
+
+    # Assert that process to have been terminated *BEFORE* finishing.
+    assert not os.path.isfile(str(tmp_path / 'done'))
+    assert worker._child_process is None
+
+# ....................{ PRIVATE ~ runners                 }....................
+def _run_worker_stopped(child_args: tuple, stop_count: int) -> object:
+    '''
+    Start a process-backed worker whose child process calls the
+    :func:`_work_busy` function with the passed arguments, stop that worker
+    the passed number of times once that process is busy, and return that
+    worker after waiting for that worker to finish.
+    '''
+
+    from PySide2.QtCore import QCoreApplication
+    from betsee.util.thread import guithread
+    from betsee.util.thread.pool import guipoolthread
+    from betsee.util.thread.pool.guipoolworkproc import (
+        QBetseeProcessPoolWorker)
+
+    # Qt application owning the thread pool running this worker *AND*
+    # multithreading facilities identifying the main thread, which pooled
+    # workers refuse to run in.
+    app = QCoreApplication.instance() or QCoreApplication([])
+    guithread.init()
+
+    class _ProcessPoolWorkerBusy(QBetseeProcessPoolWorker):
+        '''
+        Process-backed worker whose child process is busy between stop points.
+        '''
+
+        def _make_child_work(self) -> tuple:
+            return (_work_busy, child_args)
+
+    # Start this worker *AND* wait for its child process to become busy.
+    worker = _ProcessPoolWorkerBusy()
+    guipoolthread.start_worker(worker)
+    busy_filename = os.path.join(child_args[0], 'busy')
+    time_timeout = time.monotonic() + STOP_TIMEOUT_SECONDS
+    while not os.path.isfile(busy_filename):
+        assert time.monotonic() < time_timeout
+        time.sleep(0.01)
+
+    # Stop this worker the passed number of times.
+    for _ in range(stop_count):
+        worker.stop()
+        time.sleep(0.1)
+
+    # Wait for this worker to finish.
+    assert guipoolthread.get_thread_pool().waitForDone(
+        int(STOP_TIMEOUT_SECONDS * 1000))
+    app.processEvents()
+
+    # Return this worker.
+    return worker
+
+# ....................{ PRIVATE ~ children                }....................
+def _work_busy(channel, dirname: str, busy_seconds: float) -> None:
+    '''
+    Business logic of the child process spawned by each process-backed worker
+    tested above, busy for the passed number of seconds *without* reaching a
+    stop point (e.g., as when pickling simulation phase results) and then
+    recording this completion before reaching its next stop point.
+    '''
+
+    # Reach a stop point *BEFORE* becoming busy.
+    channel.emit_progress_range(progress_min=0, progress_max=1)
+
+    # Signal the parent process that this process is now busy.
+    with open(os.path.join(dirname, 'busy'), 'w'):
+        pass
+
+    # Perform busy work *WITHOUT* reaching a stop point.
+    time.sleep(busy_seconds)
+
+    # Record the completion of this busy work.
+    with open(os.path.join(dirname, 'done'), 'w'):
+        pass
+
+    # Reach a stop point, which stops this process if requested.
+    channel.emit_progress(progress=1)
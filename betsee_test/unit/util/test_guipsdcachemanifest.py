@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the content-hash based cache manifests deciding whether cached
+:mod:`PySide2` submodules require regeneration.
+'''
+
+# ....................{ IMPORTS                           }....................
+import os, pytest
+
+# ....................{ TESTS                             }....................
+def test_cache_manifest_staleness(monkeypatch, tmp_path) -> None:
+    '''
+    Test that a cache manifest reports the cached file it describes to be
+    stale *only* when the contents of its source paths or the version of its
+    tool genuinely change, rehashing *only* source files touched since last
+    hashed.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('betse')
+    from betsee.lib.pyside2.cache import guipsdcachemanifest
+
+    # Source directory containing a source file *AND* a bytecode cache.
+    src_dirname = tmp_path / 'src'
+    src_dirname.mkdir()
+    src_filename = src_dirname / 'betsee.ui'
+    src_filename.write_text('<ui/>')
+    (src_dirname / '__pycache__').mkdir()
+    trg_filename = str(tmp_path / 'betsee_ui.py')
+
+    # Count all source files subsequently hashed.
+    filenames_hashed = []
+    hash_file = guipsdcachemanifest._hash_file
+    def _hash_file_counted(filename: str) -> str:
+        filenames_hashed.append(filename)
+        return hash_file(filename)
+    monkeypatch.setattr(
+        guipsdcachemanifest, '_hash_file', _hash_file_counted)
+
+    # Assert this cached file to be stale before being generated.
+    assert _make_manifest(src_dirname, trg_filename).is_stale()
+
+    # Generate this cached file *AND* its manifest.
+    with _make_manifest(
+        src_dirname, trg_filename).writing_trg_file() as trg_filename_temp:
+        with open(trg_filename_temp, 'w') as trg_file_temp:
+            trg_file_temp.write('generated')
+    assert os.path.isfile(guipsdcachemanifest.get_manifest_filename(
+        trg_filename))
+
+    # Assert this cached file to be fresh *WITHOUT* rehashing.
+    del filenames_hashed[:]
+    assert not _make_manifest(src_dirname, trg_filename).is_stale()
+    assert filenames_hashed == []
+
+    # Assert touching this source file *WITHOUT* changing its contents to
+    # rehash this file once *WITHOUT* rendering this cached file stale, nor
+    # rehashing this file again on the next inspection.
+    _touch(str(src_filename))
+    assert not _make_manifest(src_dirname, trg_filename).is_stale()
+    assert filenames_hashed == [str(src_filename)]
+    assert not _make_manifest(src_dirname, trg_filename).is_stale()
+    assert filenames_hashed == [str(src_filename)]
+
+    # Assert modifying bytecode to *NOT* render this cached file stale.
+    (src_dirname / '__pycache__' / 'betsee.pyc').write_bytes(b'\0')
+    assert not _make_manifest(src_dirname, trg_filename).is_stale()
+
+    # Assert upgrading this tool to render this cached file stale.
+    assert _make_manifest(
+        src_dirname, trg_filename, tool_version='PySide2 5.14.0').is_stale()
+
+    # Assert adding a source file to render this cached file stale.
+    added_filename = src_dirname / 'betsee.qrc'
+    added_filename.write_text('<RCC/>')
+    assert _make_manifest(src_dirname, trg_filename).is_stale()
+    added_filename.unlink()
+
+    # Assert modifying this source file to render this cached file stale.
+    src_filename.write_text('<ui version="4.0"/>')
+    _touch(str(src_filename))
+    assert _make_manifest(src_dirname, trg_filename).is_stale()
+
+
+def test_cache_manifest_writing_trg_file_failure(tmp_path) -> None:
+    '''
+    Test that failing to regenerate a cached file preserves both that file
+    *and* its manifest as is.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('betse')
+    from betsee.lib.pyside2.cache import guipsdcachemanifest
+
+    # Source directory containing a source file.
+    src_dirname = tmp_path / 'src'
+    src_dirname.mkdir()
+    (src_dirname / 'betsee.ui').write_text('<ui/>')
+    trg_filename = tmp_path / 'betsee_ui.py'
+    trg_filename.write_text('old')
+
+    # Assert failing to regenerate this cached file to raise the original
+    # exception, preserve this file, *AND* write no manifest.
+    with pytest.raises(ValueError):
+        with _make_manifest(
+            src_dirname, str(trg_filename)).writing_trg_file() as (
+            trg_filename_temp):
+            with open(trg_filename_temp, 'w') as trg_file_temp:
+                trg_file_temp.write('partial')
+            raise ValueError('Regeneration failed.')
+    assert trg_filename.read_text() == 'old'
+    assert not os.path.exists(guipsdcachemanifest.get_manifest_filename(
+        str(trg_filename)))
+    assert sorted(os.listdir(str(tmp_path))) == ['betsee_ui.py', 'src']
+
+
+def test_copy_cache_file(tmp_path) -> None:
+    '''
+    Test that copying a cached file also copies its manifest if any *or*
+    removes the stale manifest of the target file otherwise.
+    '''
+
+    # Defer heavyweight imports requiring optional dependencies.
+    pytest.importorskip('betse')
+    from betsee.lib.pyside2.cache.guipsdcachemanifest import (
+        copy_cache_file, get_manifest_filename)
+
+    # Source cached file with a manifest.
+    src_filename = tmp_path / 'data_betsee_ui.py'
+    src_filename.write_text('data')
+    src_manifest_filename = tmp_path / get_manifest_filename(
+        src_filename.name)
+    src_manifest_filename.write_text('{}')
+
+    # Assert copying this file to also copy this manifest.
+    trg_filename = str(tmp_path / 'dot_betsee_ui.py')
+    trg_manifest_filename = get_manifest_filename(trg_filename)
+    copy_cache_file(str(src_filename), trg_filename)
+    with open(trg_filename) as trg_file:
+        assert trg_file.read() == 'data'
+    with open(trg_manifest_filename) as trg_manifest_file:
+        assert trg_manifest_file.read() == '{}'
+
+    # Assert copying this file *WITHOUT* a manifest to remove the prior
+    # target manifest, rendering the target file stale.
+    src_manifest_filename.unlink()
+    copy_cache_file(str(src_filename), trg_filename)
+    assert os.path.isfile(trg_filename)
+    assert not os.path.exists(trg_manifest_filename)
+
+# ....................{ PRIVATE ~ makers                  }....................
+def _make_manifest(
+    src_dirname, trg_filename: str, tool_version: str = 'PySide2 5.13.2',
+) -> 'betsee.lib.pyside2.cache.guipsdcachemanifest.CacheManifest':
+    '''
+    Cache manifest describing the cached file with the passed filename
+    generated from the source directory with the passed dirname by the tool
+    with the passed version.
+    '''
+
+    from betsee.lib.pyside2.cache.guipsdcachemanifest import CacheManifest
+
+    return CacheManifest(
+        trg_filename=trg_filename,
+        src_pathnames=(str(src_dirname),),
+        tool_version=tool_version,
+    )
+
+# ....................{ PRIVATE ~ touchers                }....................
+def _touch(filename: str) -> None:
+    '''
+    Advance the modification time of the file with the passed filename by one
+    second *without* modifying the contents of this file, guaranteeing this
+    file to be detected as touched regardless of filesystem time resolution.
+    '''
+
+    file_stat = os.stat(filename)
+    os.utime(filename, ns=(
+        file_stat.st_atime_ns, file_stat.st_mtime_ns + 10**9))
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2017-2020 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the registration of this application's binary resources (e.g.,
+icons) with the Qt resource system.
+'''
+
+# ....................{ IMPORTS                           }....................
+from types import SimpleNamespace
+import pytest
+
+# ....................{ TESTS                             }....................
+def test_register_rcc_file_malformed(betsee_app, tmp_path) -> None:
+    '''
+    Test that registering a malformed binary Qt resource collection (RCC) file
+    raises the expected exception.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betsee.guiexception import BetseeCacheException
+    from betsee.lib.pyside2.cache.guipsdcacheqrc import register_rcc_file
+
+    # Malformed binary resource collection.
+    rcc_filename = str(tmp_path / 'betsee.rcc')
+    with open(rcc_filename, 'wb') as rcc_file:
+        rcc_file.write(b'qres but not really')
+
+    # Assert registering this collection to raise this exception.
+    with pytest.raises(BetseeCacheException):
+        register_rcc_file(rcc_filename)
+
+
+@pytest.mark.parametrize(
+    ('rcc_state', 'is_rcc_registered'), (
+        ('registrable', True),
+        ('unregistrable', False),
+        ('nonexistent', False),
+    ))
+def test_register_resources_prefers_rcc(
+    betsee_app,
+    monkeypatch,
+    tmp_path,
+    rcc_state: str,
+    is_rcc_registered: bool,
+) -> None:
+    '''
+    Test that registering this application's resources registers the binary
+    Qt resource collection (RCC) file if this file exists *and* is
+    registrable, in which case the pure-Python resource submodule is *not*
+    imported, *or* falls back to importing that submodule otherwise.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betse.util.app.meta import appmetaone
+    from betsee import guimetadata
+    from betsee.guiexception import BetseeCacheException
+    from betsee.lib.pyside2.cache import guipsdcache, guipsdcacheqrc
+
+    # Binary resource collection existing only if requested.
+    rcc_filename = str(tmp_path / 'betsee.rcc')
+    if rcc_state != 'nonexistent':
+        with open(rcc_filename, 'wb'):
+            pass
+    monkeypatch.setattr(
+        type(appmetaone.get_app_meta()), 'dot_rcc_filename',
+        property(lambda self: rcc_filename))
+
+    # Record all attempts to register this collection *AND* import modules,
+    # raising an exception on the former only if requested.
+    rcc_filenames_registered = []
+    module_names_imported = []
+
+    def _register_rcc_file(rcc_filename: str) -> None:
+        if rcc_state == 'unregistrable':
+            raise BetseeCacheException('Unregistrable.')
+        rcc_filenames_registered.append(rcc_filename)
+
+    monkeypatch.setattr(
+        guipsdcacheqrc, 'register_rcc_file', _register_rcc_file)
+    monkeypatch.setattr(
+        guipsdcache, 'importlib',
+        SimpleNamespace(import_module=module_names_imported.append))
+
+    # Register these resources.
+    guipsdcache._register_resources()
+
+    # Assert exactly one of these two approaches to have been performed.
+    if is_rcc_registered:
+        assert rcc_filenames_registered == [rcc_filename]
+        assert module_names_imported == []
+    else:
+        assert rcc_filenames_registered == []
+        assert module_names_imported == [
+            guimetadata.MAIN_WINDOW_QRC_MODULE_NAME]
+
+
+def test_convert_qrc_to_rcc_file_binary(
+    betsee_app, monkeypatch, tmp_path) -> None:
+    '''
+    Test that compiling a Qt resource collection (QRC) file runs the ``rcc``
+    command with options producing an uncompressed binary collection
+    directly memory-mappable by Qt.
+    '''
+
+    # Defer importing submodules requiring this initialization.
+    from betsee.lib.pyside2.cache import guipsdcacheqrc
+
+    # Input resource collection and output binary resource collection.
+    qrc_filename = str(tmp_path / 'betsee.qrc')
+    rcc_filename = str(tmp_path / 'betsee.rcc')
+    with open(qrc_filename, 'w') as qrc_file:
+        qrc_file.write('<RCC/>\n')
+
+    # Record all commands run *WITHOUT* requiring the "rcc" command.
+    commands_words = []
+    monkeypatch.setattr(
+        guipsdcacheqrc.cmds, 'die_unless_command', lambda **kwargs: None)
+    monkeypatch.setattr(
+        guipsdcacheqrc.cmdrun, 'log_output_or_die',
+        lambda command_words: commands_words.append(command_words))
+
+    # Compile this collection.
+    guipsdcacheqrc.convert_qrc_to_rcc_file(
+        qrc_filename=qrc_filename, rcc_filename=rcc_filename)
+
+    # Assert this command to have compiled an uncompressed binary collection.
+    assert len(commands_words) == 1
+    command_words = commands_words[0]
+    assert command_words[0] == 'rcc'
+    assert '--binary' in command_words
+    assert command_words[command_words.index('--compress-algo') + 1] == 'none'
+    assert command_words[command_words.index('--output') + 1] == rcc_filename
+    assert command_words[-1] == qrc_filename